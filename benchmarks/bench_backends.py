@@ -0,0 +1,122 @@
+"""قياس التشغيل المتحوط والترتيب المتكيف لمصادر معلومات الفيديو (HedgedBackends)
+
+يشغل خادم الوسائط المحلي مع تأخير أو فشل مصطنع على youtubei/v1/player، ثم يستدعي
+get_complete_video_info لفيديوهات مختلفة بالكود الحقيقي للبوت في وضعين:
+- sequential: METADATA_HEDGE=false (بالترتيب، كل طريقة تنتظر مهلة السابقة كما كان سابقاً)
+- hedged: الطريقة التالية تبدأ إذا تأخرت الحالية عن p90 زمنها، والترتيب يتكيف مع النتائج
+
+السيناريوهات:
+- tail: youtubei/v1/player يتأخر --tail-delay ثانية باحتمال --tail-rate، وصفحة المشاهدة أبطأ عادةً
+- outage: youtubei/v1/player يرد 503 دائماً (يجب أن تنتقل صفحة المشاهدة إلى الأول)
+
+ويعرض لكل وضع: p50/p95/max لزمن التحليل، الطلبات الإضافية على الخادم، والترتيب والإحصائيات النهائية.
+
+الاستخدام:
+    python benchmarks/bench_backends.py
+    python benchmarks/bench_backends.py --calls 100 --tail-rate 0.2 --tail-delay 3 --json results.jsonl
+"""
+import argparse
+import asyncio
+import json
+import shutil
+import sys
+import time
+from typing import Dict
+
+from common import load_bot, route_requests_to, summarize
+from fake_servers import fetch_stats, start_in_subprocess
+
+bot_module = load_bot()
+
+PLAYER_PATH = '/youtubei/v1/player'
+
+
+async def run_mode(hedge: bool, calls: int) -> Dict:
+    shutil.rmtree(bot_module.PLAYER_CACHE_PATH, ignore_errors=True)
+    bot = bot_module.YouTubeTelegramBot()
+    bot.info_backends.hedge = hedge
+    await bot.workers.start()
+    latencies = []
+    errors = 0
+    for i in range(calls):
+        start = time.perf_counter()
+        info = await bot.get_complete_video_info(f"hedge{i:06d}")
+        latencies.append(time.perf_counter() - start)
+        if not info or 'error' in info:
+            errors += 1
+    bot.workers.shutdown()
+    return {
+        'mode': 'hedged' if hedge else 'sequential',
+        'latency': {k: round(v, 3) for k, v in summarize(latencies).items()},
+        'errors': errors,
+        'order': bot.info_backends.order(),
+        'backends': bot.info_backends.snapshot(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='قياس التشغيل المتحوط لمصادر معلومات الفيديو')
+    parser.add_argument('--calls', type=int, default=100, help='عدد الفيديوهات لكل وضع')
+    parser.add_argument('--tail-rate', type=float, default=0.15, help='احتمال تأخر youtubei/v1/player')
+    parser.add_argument('--tail-delay', type=float, default=3.0, help='مدة التأخير بالثواني')
+    parser.add_argument('--watch-latency', type=float, default=0.3, help='زمن صفحة المشاهدة بالثواني')
+    parser.add_argument('--scenario', choices=['tail', 'outage', 'all'], default='all')
+    parser.add_argument('--json', help='إلحاق النتائج بملف JSON lines')
+    parser.add_argument('-v', '--verbose', action='store_true', help='إظهار سجلات البوت')
+    args = parser.parse_args()
+
+    if not args.verbose:
+        bot_module.logging.getLogger().setLevel(bot_module.logging.WARNING)
+        bot_module.logger.disabled = True
+
+    scenarios = {
+        'tail': {'path_delay': {PLAYER_PATH: (args.tail_rate, args.tail_delay),
+                                '/watch': (1.0, args.watch_latency)}},
+        'outage': {'path_fail': {PLAYER_PATH: 1.0},
+                   'path_delay': {'/watch': (1.0, args.watch_latency)}},
+    }
+    selected = list(scenarios) if args.scenario == 'all' else [args.scenario]
+
+    print(f"{'scenario':<10}{'mode':<12}{'p50 s':>8}{'p95 s':>8}{'max s':>8}{'err':>5}"
+          f"{'player':>8}{'watch':>7}  order")
+    results = []
+    for scenario in selected:
+        for hedge in (False, True):
+            # خادم جديد لكل وضع حتى تكون عدادات /stats خاصة به
+            urls, server = start_in_subprocess(with_api=False, seed=1, **scenarios[scenario])
+            restore = route_requests_to(urls['media'])
+            try:
+                result = asyncio.run(run_mode(hedge, args.calls))
+                stats = fetch_stats(urls['media_stats'])
+            finally:
+                restore()
+                server.terminate()
+            result['scenario'] = scenario
+            result['requests'] = {'player': stats.get(f'path:{PLAYER_PATH}', 0), 'watch': stats.get('path:/watch', 0)}
+            results.append(result)
+            latency = result['latency']
+            print(f"{scenario:<10}{result['mode']:<12}{latency['p50']:>8.3f}{latency['p95']:>8.3f}"
+                  f"{latency['max']:>8.3f}{result['errors']:>5}{result['requests']['player']:>8}"
+                  f"{result['requests']['watch']:>7}  {' > '.join(result['order'])}")
+            if args.verbose:
+                print(json.dumps(result['backends'], indent=1))
+
+    if args.json:
+        with open(args.json, 'a', encoding='utf-8') as f:
+            for result in results:
+                f.write(json.dumps({'time': time.time(), 'calls': args.calls, **result}) + '\n')
+
+    failed = False
+    for scenario in selected:
+        sequential, hedged = [r for r in results if r['scenario'] == scenario]
+        print(f"\n⚡ {scenario}: p95 {sequential['latency']['p95']:.2f} ث ← {hedged['latency']['p95']:.2f} ث")
+        if hedged['errors'] or hedged['latency']['p95'] > sequential['latency']['p95']:
+            failed = True
+        if scenario == 'outage' and hedged['order'][0] != 'watch_page':
+            print("❌ الترتيب لم يتكيف مع فشل youtubei/v1/player")
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,171 @@
+"""قياس زمن إلغاء التحميلات الجارية لكل مرحلة
+
+يرسل رابطاً ويضغط زر الجودة عبر Application الحقيقي مقابل Bot API وخادم وسائط محليين،
+ثم يضغط زر "❌ إلغاء التحميل" أثناء إحدى المراحل:
+- connect: قبل وصول أول بايت (الخادم يؤخر الرد بـ --slow-start)
+- download: أثناء تدفق الملف (الخادم مقيد بـ --bandwidth)
+- upload: أثناء رفع الملف إلى Bot API (يتأخر الرد بـ --upload-latency)
+
+ويعرض لكل مرحلة زمن انتهاء المهمة بعد الضغط وزمن حذف الملف المؤقت، ويفشل
+إذا بقي ملف في مجلد التحميل أو لم تنته المهمة خلال --max-latency.
+
+الاستخدام:
+    python benchmarks/bench_cancel.py
+    python benchmarks/bench_cancel.py --stage download -n 20 --bandwidth 200000
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from typing import Dict, List
+
+from common import load_bot, route_requests_to, summarize
+from fake_servers import fetch_stats, start_in_subprocess
+
+bot_module = load_bot()
+
+from telegram import Update  # noqa: E402
+from telegram.ext import Application  # noqa: E402
+
+FAKE_TOKEN = '123456:FAKE-TOKEN-FOR-CANCEL'
+STAGES = ['connect', 'download', 'upload']
+
+
+class CancelBench:
+    def __init__(self, application: Application, bot):
+        self.application = application
+        self.bot = bot
+        self.ids = iter(range(1, 10**9))
+
+    def _user(self, user_id: int) -> Dict:
+        return {'id': user_id, 'is_bot': False, 'first_name': f'User{user_id}'}
+
+    def message_update(self, user_id: int, text: str) -> Update:
+        return Update.de_json({
+            'update_id': next(self.ids),
+            'message': {
+                'message_id': next(self.ids), 'date': int(time.time()),
+                'chat': {'id': user_id, 'type': 'private'}, 'from': self._user(user_id), 'text': text,
+            },
+        }, self.application.bot)
+
+    def callback_update(self, user_id: int, message_id: int, data: str) -> Update:
+        return Update.de_json({
+            'update_id': next(self.ids),
+            'callback_query': {
+                'id': str(next(self.ids)), 'from': self._user(user_id), 'chat_instance': str(user_id), 'data': data,
+                'message': {
+                    'message_id': message_id, 'date': int(time.time()),
+                    'chat': {'id': user_id, 'type': 'private'},
+                    'from': {'id': 42, 'is_bot': True, 'first_name': 'FakeBot'}, 'text': '...',
+                },
+            },
+        }, self.application.bot)
+
+    async def wait_for(self, predicate, timeout: float = 30.0, interval: float = 0.005):
+        deadline = time.perf_counter() + timeout
+        while not predicate():
+            if time.perf_counter() > deadline:
+                raise asyncio.TimeoutError
+            await asyncio.sleep(interval)
+
+    async def run_once(self, user_id: int, stage: str, delay: float) -> Dict:
+        video_id = f"c{user_id:010d}"[:11]
+        await self.application.update_queue.put(
+            self.message_update(user_id, f"https://www.youtube.com/watch?v={video_id}")
+        )
+        await self.wait_for(lambda: user_id in self.bot.user_sessions)
+        message_id = self.bot.user_sessions[user_id]['message_id']
+        key = (user_id, message_id)
+
+        await self.application.update_queue.put(self.callback_update(user_id, message_id, 'video_360'))
+        await self.wait_for(lambda: key in self.bot.active_jobs)
+        job = self.bot.active_jobs[key]
+        if stage == 'upload':
+            await self.wait_for(lambda: job['stage'] == 'upload')
+        await asyncio.sleep(delay)
+        if job['task'].done() or job['stage'] != ('upload' if stage == 'upload' else 'download'):
+            return {'missed': True}
+
+        start = time.perf_counter()
+        await self.application.update_queue.put(self.callback_update(user_id, message_id, 'cancel_job'))
+        await self.wait_for(lambda: job['task'].done())
+        task_done = time.perf_counter() - start
+        # الملفات المؤقتة على القرص ومخازن الملفات الصغيرة في الذاكرة كلها يجب أن تعود
+        buffers = self.bot.buffers
+        await self.wait_for(lambda: not os.listdir(bot_module.DOWNLOAD_PATH)
+                            and len(buffers.free) == buffers.allocated, timeout=10)
+        spool_released = time.perf_counter() - start
+        await self.wait_for(lambda: key not in self.bot.active_jobs)
+        return {'missed': False, 'task_done': task_done, 'spool_released': spool_released}
+
+
+async def run_stage(args, stage: str, urls: Dict[str, str]) -> List[Dict]:
+    bot = bot_module.YouTubeTelegramBot()
+    builder = Application.builder().token(FAKE_TOKEN).base_url(urls['api']).base_file_url(urls['api_files'])
+    application = bot_module.build_application(bot, builder)
+    bench = CancelBench(application, bot)
+    delay = {'connect': args.slow_start / 4, 'download': args.delay, 'upload': args.upload_latency / 4}[stage]
+    await application.initialize()
+    await application.start()
+    try:
+        return [await bench.run_once(20_000 + i, stage, delay) for i in range(args.iterations)]
+    finally:
+        await application.stop()
+        await application.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='قياس زمن إلغاء التحميلات الجارية لكل مرحلة')
+    parser.add_argument('--stage', choices=STAGES, action='append', help='مرحلة محددة (يمكن تكراره)')
+    parser.add_argument('-n', '--iterations', type=int, default=10)
+    parser.add_argument('--bandwidth', type=int, default=500_000, help='سرعة الاتصال أثناء مرحلة download بايت/ث')
+    parser.add_argument('--delay', type=float, default=0.5, help='زمن الانتظار داخل مرحلة download قبل الإلغاء (ث)')
+    parser.add_argument('--slow-start', type=float, default=2.0, help='تأخير أول بايت في مرحلة connect (ث)')
+    parser.add_argument('--upload-latency', type=float, default=2.0, help='تأخير رد الرفع في مرحلة upload (ث)')
+    parser.add_argument('--max-latency', type=float, default=1.0, help='أقصى زمن مقبول لانتهاء المهمة (ث)')
+    parser.add_argument('-v', '--verbose', action='store_true', help='إظهار سجلات البوت')
+    args = parser.parse_args()
+
+    if not args.verbose:
+        bot_module.logging.getLogger().setLevel(bot_module.logging.WARNING)
+        bot_module.logger.disabled = True
+
+    failures = 0
+    print(f"⏹️ قياس زمن الإلغاء: {args.iterations} تكرار لكل مرحلة\n")
+    print(f"{'stage':<10}{'ok':>5}{'task p50 ms':>14}{'task max ms':>14}{'spool p50 ms':>15}{'spool max ms':>15}")
+    for stage in args.stage or STAGES:
+        options = {
+            # ملف كبير بسرعة محدودة حتى يبقى التدفق جارياً، وصغير وسريع عند قياس الرفع
+            'size_scale': 1.0 if stage == 'download' else 0.02,
+            'bandwidth': args.bandwidth if stage == 'download' else 0,
+            'slow_start': args.slow_start if stage == 'connect' else 0.0,
+            'upload_latency': args.upload_latency if stage == 'upload' else 0.0,
+        }
+        urls, server = start_in_subprocess(**options)
+        restore = route_requests_to(urls['media'])
+        try:
+            results = asyncio.run(run_stage(args, stage, urls))
+            media_stats = fetch_stats(urls['media_stats'])
+        finally:
+            restore()
+            server.terminate()
+
+        measured = [r for r in results if not r['missed']]
+        task = summarize([r['task_done'] for r in measured])
+        spool = summarize([r['spool_released'] for r in measured])
+        print(f"{stage:<10}{len(measured):>5}{task['p50'] * 1000:>14.1f}{task['max'] * 1000:>14.1f}"
+              f"{spool['p50'] * 1000:>15.1f}{spool['max'] * 1000:>15.1f}")
+        if args.verbose:
+            print(f"{'':<10}🎬 {json.dumps(media_stats)}")
+        if not measured or task['max'] > args.max_latency or os.listdir(bot_module.DOWNLOAD_PATH):
+            failures += 1
+            print(f"{'':<10}❌ الإلغاء بطيء أو بقيت ملفات مؤقتة")
+
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
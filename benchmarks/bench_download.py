@@ -0,0 +1,220 @@
+"""قياس أداء محرك التحميل مقابل خادم Range محلي يحاكي googlevideo
+
+يشغل download_direct_video و download_direct_audio الحقيقيين على روابط محلية مع:
+- تقييد السرعة لكل اتصال (--bandwidth)
+- قطع الاتصال في منتصف التدفق (--reset-rate) وردود 503 (--fail-rate)
+- تأخير أول بايت (--slow-start)
+
+ويعرض لكل تشغيل: MB/s و CPU لكل MB و syscalls (قراءة/كتابة) لكل MB و
+الذاكرة المحجوزة (tracemalloc مع --alloc) وتأخر حلقة الأحداث (event-loop lag).
+
+الاستخدام:
+    python benchmarks/bench_download.py --size-mb 20 --jobs 4
+    python benchmarks/bench_download.py --bandwidth 1000000 --jobs 8 --kind audio
+    python benchmarks/bench_download.py --label "chunk-64k" --json results.jsonl
+
+لمقارنة تغييرات المحرك شغّل نفس الأمر قبل وبعد التغيير على نفس الجهاز مع --json.
+"""
+import argparse
+import asyncio
+import json
+import os
+import resource
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+from common import load_bot, summarize
+from fake_servers import PATTERN, PATTERN_SIZE, fetch_stats, start_in_subprocess
+
+bot_module = load_bot()
+
+
+def read_proc_io() -> Dict[str, int]:
+    """عدادات syscalls للقراءة والكتابة من /proc/self/io (لينكس فقط)"""
+    counters = {}
+    try:
+        with open('/proc/self/io') as f:
+            for line in f:
+                key, _, value = line.partition(':')
+                counters[key.strip()] = int(value)
+    except (OSError, ValueError):
+        pass
+    return counters
+
+
+def cpu_seconds() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+class LoopLagMonitor:
+    """قياس تأخر حلقة الأحداث: الفرق بين موعد الاستيقاظ المطلوب والفعلي"""
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.samples: List[float] = []
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, loop.time() - start - self.interval))
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+
+def verify_file(path: str, expected_size: int) -> bool:
+    """التحقق من الحجم ومن بداية ونهاية المحتوى مقابل النمط الذي يرسله الخادم"""
+    if not path or not os.path.exists(path) or os.path.getsize(path) != expected_size:
+        return False
+    probe = min(64 * 1024, expected_size)
+    with open(path, 'rb') as f:
+        head = f.read(probe)
+        f.seek(expected_size - probe)
+        tail = f.read(probe)
+    tail_offset = (expected_size - probe) % PATTERN_SIZE
+    expected_tail = (PATTERN[tail_offset:] + PATTERN)[:probe]
+    return head == PATTERN[:probe] and tail == expected_tail
+
+
+def make_video_info(media_url: str, job: int, kind: str, size: int) -> Dict:
+    """معلومات فيديو بتنسيق واحد يشير إلى الخادم المحلي"""
+    video_id = f"bench{job:06d}"[:11]
+    if kind == 'audio':
+        fmt = {'itag': 140, 'type': 'audio', 'ext': 'm4a', 'abr': 129502, 'vcodec': 'none', 'acodec': 'mp4a.40.2'}
+    else:
+        fmt = {'itag': 18, 'type': 'video', 'ext': 'mp4', 'height': 360, 'width': 640}
+    fmt['url'] = f"{media_url}/videoplayback?itag={fmt['itag']}&clen={size}&id=o-{video_id}"
+    fmt['filesize'] = str(size)
+    return {'id': video_id, 'title': f'bench {job}', 'duration': 60, 'formats': [fmt]}
+
+
+async def run_jobs(bot, args, media_url: str, size: int) -> Dict:
+    progress_updates = 0
+
+    async def progress_callback(message: str):
+        nonlocal progress_updates
+        progress_updates += 1
+
+    async def one(job: int):
+        info = make_video_info(media_url, job, args.kind, size)
+        start = time.perf_counter()
+        if args.kind == 'audio':
+            path = await bot.download_direct_audio(info, progress_callback)
+        else:
+            path = await bot.download_direct_video(info, '360', progress_callback)
+        elapsed = time.perf_counter() - start
+        ok = verify_file(path, size)
+        if path and os.path.exists(path):
+            os.remove(path)
+        return ok, elapsed
+
+    lag = LoopLagMonitor()
+    lag.start()
+    try:
+        results = await asyncio.gather(*(one(job) for job in range(args.jobs)))
+    finally:
+        await lag.stop()
+    return {'results': results, 'lag': lag.samples, 'progress_updates': progress_updates}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='قياس أداء محرك التحميل مقابل خادم Range محلي')
+    parser.add_argument('--size-mb', type=float, default=20.0, help='حجم كل ملف بالميجابايت')
+    parser.add_argument('--jobs', type=int, default=4, help='عدد التحميلات المتزامنة')
+    parser.add_argument('--kind', choices=['video', 'audio'], default='video')
+    parser.add_argument('--bandwidth', type=int, default=0, help='سرعة كل اتصال بايت/ث (0 = بدون حد)')
+    parser.add_argument('--fail-rate', type=float, default=0.0)
+    parser.add_argument('--reset-rate', type=float, default=0.0)
+    parser.add_argument('--slow-start', type=float, default=0.0)
+    parser.add_argument('--alloc', action='store_true', help='قياس الذاكرة المحجوزة (أبطأ)')
+    parser.add_argument('--label', default='', help='وسم التشغيل في التقرير')
+    parser.add_argument('--json', help='إضافة النتيجة كسطر JSON إلى هذا الملف')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    bot_module.logging.getLogger().setLevel(bot_module.logging.WARNING)
+    bot_module.logger.disabled = True
+
+    size = int(args.size_mb * 1024 * 1024)
+    urls, server = start_in_subprocess(
+        with_api=False, bandwidth=args.bandwidth, fail_rate=args.fail_rate,
+        reset_rate=args.reset_rate, slow_start=args.slow_start, seed=args.seed,
+    )
+    try:
+        bot = bot_module.YouTubeTelegramBot()
+        if args.alloc:
+            tracemalloc.start()
+        io_before = read_proc_io()
+        cpu_before = cpu_seconds()
+        wall_start = time.perf_counter()
+        outcome = asyncio.run(run_jobs(bot, args, urls['media'], size))
+        wall = time.perf_counter() - wall_start
+        cpu = cpu_seconds() - cpu_before
+        io_after = read_proc_io()
+        alloc_peak = tracemalloc.get_traced_memory()[1] if args.alloc else None
+        if args.alloc:
+            tracemalloc.stop()
+        media_stats = fetch_stats(urls['media_stats'])
+    finally:
+        server.terminate()
+
+    ok_jobs = [elapsed for ok, elapsed in outcome['results'] if ok]
+    total_mb = size * len(ok_jobs) / (1024 * 1024)
+    syscalls = (io_after.get('syscr', 0) - io_before.get('syscr', 0)) + (io_after.get('syscw', 0) - io_before.get('syscw', 0))
+    lag = summarize(outcome['lag'])
+    job_times = summarize(ok_jobs)
+
+    result = {
+        'label': args.label,
+        'kind': args.kind,
+        'jobs': args.jobs,
+        'ok': len(ok_jobs),
+        'size_mb': args.size_mb,
+        'bandwidth': args.bandwidth,
+        'wall_s': round(wall, 3),
+        'mb_per_s': round(total_mb / wall, 2) if wall else 0,
+        'cpu_ms_per_mb': round(cpu * 1000 / total_mb, 2) if total_mb else None,
+        'syscalls_per_mb': round(syscalls / total_mb, 1) if total_mb and syscalls else None,
+        'alloc_peak_mb': round(alloc_peak / (1024 * 1024), 2) if alloc_peak is not None else None,
+        'job_p50_s': round(job_times['p50'], 3),
+        'job_p95_s': round(job_times['p95'], 3),
+        'loop_lag_p50_ms': round(lag['p50'] * 1000, 2),
+        'loop_lag_p99_ms': round(lag['p99'] * 1000, 2),
+        'loop_lag_max_ms': round(lag['max'] * 1000, 2),
+        'progress_updates': outcome['progress_updates'],
+        'server': media_stats,
+    }
+
+    print(f"📥 محرك التحميل {args.label and f'[{args.label}] '}— {args.kind} × {args.jobs} × {args.size_mb} MB")
+    print(f"   ✅ نجح: {len(ok_jobs)}/{args.jobs}   ⏱️ {wall:.2f} ث")
+    print(f"   🚀 {result['mb_per_s']} MB/s   🧮 CPU {result['cpu_ms_per_mb']} ms/MB   "
+          f"🔁 syscalls {result['syscalls_per_mb']} /MB")
+    if alloc_peak is not None:
+        print(f"   🧠 ذروة الذاكرة المحجوزة: {result['alloc_peak_mb']} MB")
+    print(f"   ⏳ زمن المهمة p50/p95: {result['job_p50_s']} / {result['job_p95_s']} ث")
+    print(f"   🔄 تأخر حلقة الأحداث p50/p99/max: {result['loop_lag_p50_ms']} / "
+          f"{result['loop_lag_p99_ms']} / {result['loop_lag_max_ms']} ms")
+    print(f"   🎬 الخادم: {json.dumps(media_stats)}")
+
+    if args.json:
+        with open(args.json, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(result, ensure_ascii=False) + '\n')
+    return 0 if ok_jobs else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,347 @@
+"""قياس أداء وانحدار استخراج المعلومات من صفحات المشاهدة المحفوظة
+
+يمرر صفحات HTML المحفوظة في benchmarks/fixtures/watch عبر get_complete_video_info
+مع إيقاف الشبكة بالكامل (requests.get يرجع محتوى الملف، وملف المشغل من
+benchmarks/fixtures/player)، ثم يعرض:
+- زمن كل مرحلة: get_complete_video_info و extract_formats_from_html و
+  get_player_data و extract_alternative_formats و process_format
+- الذاكرة المحجوزة لكل مرحلة (tracemalloc)، وذروة الذاكرة لكل استخراج (الوسيط)
+- عدد البايتات المقروءة فعلاً لكل استخراج (مع WATCH_PAGE_STREAMING تتوقف القراءة بعد ytInitialPlayerResponse)
+- صحة الناتج مقارنة بملفات *.expected.json
+
+--backend innertube يشغل مسار youtubei/v1/player بدل صفحة المشاهدة: requests.post يرجع
+ytInitialPlayerResponse من نفس الصفحة، والصفحة تبقى للرجوع الاحتياطي. يجب أن يطابق الناتج
+نفس الملفات المتوقعة.
+
+الاستخدام:
+    python benchmarks/bench_extraction.py                # قياس + تحقق
+    python benchmarks/bench_extraction.py -n 200         # عدد التكرارات
+    python benchmarks/bench_extraction.py --update       # تحديث النتائج المتوقعة بعد تغيير مقصود
+    python benchmarks/bench_extraction.py -k normal      # صفحة واحدة فقط
+    python benchmarks/bench_extraction.py --backend innertube
+    python benchmarks/bench_extraction.py --workers 2     # التحليل في عمليات منفصلة كما في البوت
+    python benchmarks/bench_extraction.py --full-page     # قراءة الصفحة كاملة (WATCH_PAGE_STREAMING=false) للمقارنة
+
+يرجع رمز خروج 1 إذا اختلف أي ناتج عن المتوقع.
+"""
+import argparse
+import asyncio
+import glob
+import json
+import os
+import re
+import shutil
+import sys
+import time
+import tracemalloc
+import urllib.parse
+from typing import Dict, List, Optional
+from unittest import mock
+
+from common import FIXTURES_DIR, Stopwatch, load_bot, summarize
+from make_fixtures import build_iframe_api, extract_player_response
+
+bot_module = load_bot()
+
+WATCH_DIR = os.path.join(FIXTURES_DIR, 'watch')
+PLAYER_DIR = os.path.join(FIXTURES_DIR, 'player')
+STAGES = [
+    'get_complete_video_info',
+    'get_video_info_innertube',
+    'get_video_info_watch_page',
+    'extract_formats_from_html',
+    'extract_formats_from_player_response',
+    'get_player_data',
+    'extract_alternative_formats',
+    'process_format',
+]
+
+
+class FakeResponse:
+    """استجابة requests مبسطة تكفي لمسار الاستخراج"""
+
+    def __init__(self, body: bytes, status_code: int = 200, headers: Optional[Dict] = None,
+                 read_counter: Optional[List[int]] = None):
+        self.content = body
+        self.read_counter = read_counter  # يضاف إلى آخر عنصر ما يقرأ فعلاً عبر iter_content
+        self.status_code = status_code
+        self.headers = headers or {'content-type': 'text/html; charset=utf-8', 'content-length': str(len(body))}
+        self.encoding = 'utf-8'
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors='replace')
+
+    def json(self):
+        return json.loads(self.content)
+
+    def iter_content(self, chunk_size: int = 8192):
+        for i in range(0, len(self.content), chunk_size):
+            chunk = self.content[i:i + chunk_size]
+            if self.read_counter is not None:
+                self.read_counter[-1] += len(chunk)
+            yield chunk
+
+    def close(self):
+        pass
+
+
+def load_fixtures(selected: Optional[List[str]] = None) -> Dict[str, bytes]:
+    fixtures = {}
+    for path in sorted(glob.glob(os.path.join(WATCH_DIR, '*.html'))):
+        name = os.path.splitext(os.path.basename(path))[0]
+        if selected and name not in selected:
+            continue
+        with open(path, 'rb') as f:
+            fixtures[name] = f.read()
+    return fixtures
+
+
+def summarize_result(result: Optional[Dict]) -> Dict:
+    """تحويل ناتج الاستخراج إلى شكل ثابت قابل للمقارنة (بدون الروابط المتغيرة)"""
+    if not result:
+        return {'result': None}
+    if 'error' in result:
+        return {'error': result.get('error')}
+    formats = []
+    for fmt in result.get('formats', []):
+        query = urllib.parse.parse_qs(urllib.parse.urlsplit(fmt.get('url') or '').query)
+        formats.append({
+            'itag': fmt.get('itag'),
+            'type': fmt.get('type'),
+            'ext': fmt.get('ext'),
+            'height': fmt.get('height'),
+            'has_url': bool(fmt.get('url')),
+            # التوقيع الناتج (بعد فك signatureCipher إن وجد)
+            'sig': (query.get('sig') or query.get('signature') or [None])[0],
+            # قيمة n بعد التحويل بدالة المشغل (المرجع محسوب بـ node في make_fixtures.N_TRANSFORMS)
+            'n': (query.get('n') or [None])[0],
+        })
+    return {
+        'title': result.get('title'),
+        'uploader': result.get('uploader'),
+        'duration': result.get('duration'),
+        'thumbnail': result.get('thumbnail'),
+        'no_direct_download': bool(result.get('no_direct_download')),
+        'formats': formats,
+    }
+
+
+def instrument(bot, watch: Stopwatch, allocations: Optional[Dict[str, List[int]]] = None):
+    """تغليف مراحل الاستخراج على مستوى الكائن لقياس الزمن والذاكرة لكل مرحلة"""
+
+    def record_alloc(name: str, before: int):
+        if allocations is not None:
+            _, peak = tracemalloc.get_traced_memory()
+            allocations.setdefault(name, []).append(max(0, peak - before))
+
+    def wrap_async(name: str):
+        original = getattr(bot, name)
+
+        async def wrapper(*args, **kwargs):
+            before = tracemalloc.get_traced_memory()[0] if allocations is not None else 0
+            if allocations is not None:
+                tracemalloc.reset_peak()
+            start = time.perf_counter()
+            try:
+                return await original(*args, **kwargs)
+            finally:
+                watch.add(name, time.perf_counter() - start)
+                record_alloc(name, before)
+
+        setattr(bot, name, wrapper)
+
+    def wrap_sync(name: str):
+        original = getattr(bot, name)
+
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                watch.add(name, time.perf_counter() - start)
+
+        setattr(bot, name, wrapper)
+
+    wrap_async('get_video_info_innertube')
+    wrap_async('get_video_info_watch_page')
+    wrap_async('extract_formats_from_html')
+    wrap_async('extract_formats_from_player_response')
+    wrap_async('get_player_data')
+    wrap_async('extract_alternative_formats')
+    wrap_sync('process_format')
+    # سجل الطرق يحتفظ بالدوال الأصلية من __init__
+    for name in list(bot.info_backends.backends):
+        bot.info_backends.backends[name] = getattr(bot, f'get_video_info_{name}')
+
+
+async def run_fixture(name: str, body: bytes, iterations: int, trace: bool, workers: int = 0) -> Dict:
+    bot = bot_module.YouTubeTelegramBot()
+    bot.workers = bot_module.CPUWorkers(workers)
+    watch = Stopwatch()
+    allocations: Optional[Dict[str, List[int]]] = {} if trace else None
+    instrument(bot, watch, allocations)
+    await bot.workers.start()
+    try:
+        return await _run_iterations(bot, name, body, iterations, watch, allocations)
+    finally:
+        bot.workers.shutdown()
+
+
+async def _run_iterations(bot, name: str, body: bytes, iterations: int, watch: Stopwatch,
+                          allocations: Optional[Dict[str, List[int]]]) -> Dict:
+    trace = allocations is not None
+    player_response = extract_player_response(body.decode('utf-8'))
+    transferred: List[int] = []
+
+    def fake_get(url, *args, **kwargs):
+        player = re.search(r'/s/player/([\w-]+)/', url)
+        if player:
+            path = os.path.join(PLAYER_DIR, player.group(1), 'base.js')
+            if not os.path.exists(path):
+                return FakeResponse(b'', status_code=404)
+            with open(path, 'rb') as f:
+                return FakeResponse(f.read(), headers={'content-type': 'text/javascript'})
+        if '/iframe_api' in url:
+            return FakeResponse(build_iframe_api().encode(), headers={'content-type': 'text/javascript'})
+        if kwargs.get('stream'):
+            return FakeResponse(body, read_counter=transferred)
+        transferred[-1] += len(body)
+        # نسخة جديدة لكل طلب كما يحدث عند القراءة من الشبكة، حتى يحسبها tracemalloc
+        return FakeResponse(bytes(memoryview(body)))
+
+    def fake_post(url, *args, **kwargs):
+        if '/youtubei/v1/player' not in url:
+            return FakeResponse(b'', status_code=404)
+        # صفحة consent لا تحتوي ردا للمشغل: رد بدون playabilityStatus
+        payload = json.dumps(player_response or {'responseContext': {}}, ensure_ascii=False).encode('utf-8')
+        transferred[-1] += len(payload)
+        return FakeResponse(payload, headers={'content-type': 'application/json'})
+
+    result = None
+    with mock.patch.object(bot_module.requests, 'get', fake_get), \
+            mock.patch.object(bot_module.requests, 'post', fake_post):
+        for _ in range(iterations):
+            transferred.append(0)
+            before = tracemalloc.get_traced_memory()[0] if trace else 0
+            if trace:
+                tracemalloc.reset_peak()
+            start = time.perf_counter()
+            result = await bot.get_complete_video_info(name)
+            watch.add('get_complete_video_info', time.perf_counter() - start)
+            if trace:
+                allocations.setdefault('get_complete_video_info', []).append(
+                    max(0, tracemalloc.get_traced_memory()[1] - before)
+                )
+
+    return {'result': result, 'watch': watch, 'allocations': allocations, 'transferred': transferred}
+
+
+def compare(expected: Dict, actual: Dict) -> List[str]:
+    """إرجاع قائمة الفروقات بين الناتج المتوقع والفعلي"""
+    problems = []
+    for key in sorted(set(expected) | set(actual)):
+        if key == 'formats':
+            exp_itags = [f['itag'] for f in expected.get('formats', [])]
+            act_itags = [f['itag'] for f in actual.get('formats', [])]
+            if exp_itags != act_itags:
+                problems.append(f"formats: متوقع {exp_itags} / فعلي {act_itags}")
+            elif expected.get('formats') != actual.get('formats'):
+                problems.append("formats: نفس itags لكن تفاصيل مختلفة")
+        elif expected.get(key) != actual.get(key):
+            problems.append(f"{key}: متوقع {expected.get(key)!r} / فعلي {actual.get(key)!r}")
+    return problems
+
+
+def format_ms(seconds: float) -> str:
+    return f"{seconds * 1000:8.3f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='قياس أداء وانحدار استخراج صفحات المشاهدة')
+    parser.add_argument('-n', '--iterations', type=int, default=50, help='عدد التكرارات لكل صفحة')
+    parser.add_argument('-k', '--fixture', action='append', help='تشغيل صفحة محددة فقط (يمكن تكراره)')
+    parser.add_argument('--update', action='store_true', help='كتابة النتائج المتوقعة من الناتج الحالي')
+    parser.add_argument('--no-alloc', action='store_true', help='تخطي قياس الذاكرة (tracemalloc)')
+    parser.add_argument('--workers', type=int, default=0,
+                        help='عمليات CPUWorkers لقياس الزمن (0 = خيوط في نفس العملية؛ قياس الذاكرة دائماً في نفس العملية)')
+    parser.add_argument('--backend', choices=['html', 'innertube'], default='html',
+                        help='مسار الاستخراج: صفحة المشاهدة أو youtubei/v1/player')
+    parser.add_argument('--full-page', action='store_true',
+                        help='قراءة صفحة المشاهدة كاملة ثم تحليلها (WATCH_PAGE_STREAMING=false)')
+    args = parser.parse_args()
+    bot_module.INNERTUBE_PLAYER = args.backend == 'innertube'
+    bot_module.WATCH_PAGE_STREAMING = not args.full_page
+
+    # كتم سجلات البوت حتى لا تطغى على التقرير
+    bot_module.logger.disabled = True
+
+    fixtures = load_fixtures(args.fixture)
+    if not fixtures:
+        print(f"❌ لا توجد صفحات محفوظة في {WATCH_DIR} (شغل make_fixtures.py)")
+        return 1
+
+    failures = 0
+    mode = 'full page' if args.full_page else 'streaming'
+    print(f"📊 قياس الاستخراج ({args.backend}, {mode}): {len(fixtures)} صفحة × {args.iterations} تكرار\n")
+    print(f"{'fixture':<16}{'stage':<38}{'calls':>7}{'mean ms':>10}{'p95 ms':>10}{'alloc KB':>11}")
+    print('-' * 92)
+
+    for name, body in fixtures.items():
+        # كل صفحة تبدأ بكاش مشغل فارغ على القرص (التحليل الأول ثم الكاش في الذاكرة)
+        shutil.rmtree(bot_module.PLAYER_CACHE_PATH, ignore_errors=True)
+        # جولة التوقيت بدون tracemalloc لأنه يبطئ التنفيذ بشكل كبير
+        timing = asyncio.run(run_fixture(name, body, args.iterations, trace=False, workers=args.workers))
+        allocations = {}
+        if not args.no_alloc:
+            tracemalloc.start()
+            traced = asyncio.run(run_fixture(name, body, max(5, args.iterations // 10), trace=True))
+            tracemalloc.stop()
+            allocations = traced['allocations']
+
+        for stage in STAGES:
+            samples = timing['watch'].samples.get(stage)
+            if not samples:
+                continue
+            stats = summarize(samples)
+            alloc = allocations.get(stage)
+            alloc_text = f"{max(alloc) / 1024:11.1f}" if alloc else f"{'-':>11}"
+            print(f"{name:<16}{stage:<38}{stats['count']:>7}{format_ms(stats['mean']):>10}"
+                  f"{format_ms(stats['p95']):>10}{alloc_text}")
+
+        print(f"{name:<16}{'bytes/extraction':<38}{max(timing['transferred']) / 1024:>26.1f} KB")
+        peaks = allocations.get('get_complete_video_info')
+        if peaks:
+            # الوسيط: التكرار الأول وحده يحمل ملف المشغل ويحلله
+            print(f"{name:<16}{'peak memory/extraction':<38}{summarize(peaks)['p50'] / 1024:>26.1f} KB")
+
+        actual = summarize_result(timing['result'])
+        expected_path = os.path.join(WATCH_DIR, f'{name}.expected.json')
+        if args.update:
+            with open(expected_path, 'w', encoding='utf-8') as f:
+                json.dump(actual, f, ensure_ascii=False, indent=2)
+                f.write('\n')
+            print(f"{'':<16}📝 تم تحديث {os.path.basename(expected_path)}")
+        elif os.path.exists(expected_path):
+            with open(expected_path, encoding='utf-8') as f:
+                expected = json.load(f)
+            problems = compare(expected, actual)
+            if problems:
+                failures += 1
+                for problem in problems:
+                    print(f"{'':<16}❌ {problem}")
+            else:
+                print(f"{'':<16}✅ الناتج مطابق للمتوقع")
+        else:
+            print(f"{'':<16}⚠️ لا يوجد ملف متوقع (شغل مع --update)")
+        print()
+
+    if failures:
+        print(f"❌ {failures} صفحة لا تطابق الناتج المتوقع")
+        return 1
+    print("✅ جميع الصفحات مطابقة")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,168 @@
+"""قياس وانحدار تحليل روابط يوتيوب (normalize_youtube_url) مع اختبار fuzz
+
+1. صحة: كل رابط في benchmarks/fixtures/links/corpus.json يقارن بالناتج المتوقع
+   [video_id, playlist_id, start_time] أو null للروابط المرفوضة، مع عدد ما كان يخطئ فيه
+   التحقق القديم (بحث نصي عن النطاق + خمسة regex متتالية) للمقارنة.
+2. fuzz: روابط مولدة عشوائياً من روابط المجموعة بتغييرات لا تغير المعنى (حالة الأحرف، معاملات إضافية،
+   ترتيب المعاملات، نقطة في آخر النطاق، منفذ) يجب أن تعطي نفس الناتج، وتغييرات على النطاق
+   (بادئة، لاحقة، userinfo) يجب أن ترفض. أي استثناء يعتبر فشلاً.
+3. السرعة: ميكروثانية لكل رابط للطريقتين (بدون كاش lru_cache ومعه).
+
+الاستخدام:
+    python benchmarks/bench_links.py
+    python benchmarks/bench_links.py --fuzz 100000 --seed 7
+    python benchmarks/bench_links.py --update     # تحديث النتائج المتوقعة بعد تغيير مقصود
+
+يرجع رمز خروج 1 عند أي اختلاف أو استثناء.
+"""
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import time
+import urllib.parse
+from typing import List, Optional
+
+from common import FIXTURES_DIR, load_bot
+
+bot_module = load_bot()
+
+CORPUS_PATH = os.path.join(FIXTURES_DIR, 'links', 'corpus.json')
+
+LEGACY_PATTERNS = [
+    r'(?:youtube\.com\/watch\?v=|youtu\.be\/|youtube\.com\/embed\/|youtube\.com\/v\/)([a-zA-Z0-9_-]{11})',
+    r'youtube\.com\/watch\?.*v=([a-zA-Z0-9_-]{11})',
+    r'youtu\.be\/([a-zA-Z0-9_-]{11})',
+    r'youtube\.com\/embed\/([a-zA-Z0-9_-]{11})',
+    r'youtube\.com\/v\/([a-zA-Z0-9_-]{11})',
+]
+EVIL_HOSTS = ['evil.com', 'youtube.com.evil', 'notyoutube.com', 'youtu.be.evil.com', 'youtube.co']
+
+
+def legacy_normalize(url: str) -> Optional[List]:
+    """التحقق والاستخراج كما كانا قبل normalize_youtube_url (للمقارنة فقط)"""
+    if not any(domain in url for domain in ('youtube.com', 'youtu.be', 'www.youtube.com', 'm.youtube.com')):
+        return None
+    video_id = next((m.group(1) for p in LEGACY_PATTERNS for m in [re.search(p, url)] if m), None)
+    playlist = re.search(r'[?&]list=([a-zA-Z0-9_-]{2,64})', url)
+    if not video_id and not playlist:
+        return None
+    return [video_id, playlist.group(1) if playlist else None, None]
+
+
+def normalize(url: str) -> Optional[List]:
+    link = bot_module.normalize_youtube_url.__wrapped__(url)
+    return list(link) if link else None
+
+
+def mutate_benign(rng: random.Random, url: str) -> str:
+    """تغيير لا يغير الفيديو أو القائمة أو وقت البداية"""
+    parts = urllib.parse.urlsplit(url if '://' in url else 'https://' + url.lstrip('/'))
+    choice = rng.randrange(6)
+    if choice == 0:
+        return parts._replace(scheme=parts.scheme.upper(), netloc=parts.netloc.upper()).geturl()
+    if choice == 1 and parts.hostname and ':' not in parts.netloc:
+        return parts._replace(netloc=parts.netloc + '.').geturl()
+    if choice == 2 and ':' not in parts.netloc:
+        return parts._replace(netloc=parts.netloc + ':443').geturl()
+    query = urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+    if choice == 3:
+        query.insert(rng.randrange(len(query) + 1), ('si', ''.join(rng.choices('abcXYZ019_-', k=16))))
+    elif choice == 4:
+        rng.shuffle(query)
+    else:
+        query.append(('feature', rng.choice(['share', 'youtu.be', 'em-uploademail'])))
+    return parts._replace(query=urllib.parse.urlencode(query)).geturl()
+
+
+def mutate_hostile(rng: random.Random, url: str) -> str:
+    """تغيير النطاق إلى نطاق غير يوتيوب يشبهه"""
+    parts = urllib.parse.urlsplit(url if '://' in url else 'https://' + url.lstrip('/'))
+    host = parts.hostname or 'youtube.com'
+    domain = '.'.join(host.split('.')[-2:])  # notwww.youtube.com نطاق فرعي صحيح، لذلك البادئة على النطاق نفسه
+    evil = rng.choice(EVIL_HOSTS)
+    netloc = rng.choice([
+        f"{host}.{evil}",
+        f"not{domain}",
+        f"{host}@{evil}",
+        f"{evil}",
+        f"{host.replace('.', '-')}.{evil}",
+    ])
+    if netloc == evil:
+        return parts._replace(netloc=evil, path='/' + host + parts.path).geturl()
+    return parts._replace(netloc=netloc).geturl()
+
+
+def per_url_us(func, urls: List[str], rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for url in urls:
+            func(url)
+    return (time.perf_counter() - start) / (rounds * len(urls)) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description='قياس وانحدار تحليل روابط يوتيوب')
+    parser.add_argument('--fuzz', type=int, default=20000, help='عدد الروابط المولدة عشوائياً')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('-n', '--rounds', type=int, default=200, help='تكرارات قياس السرعة')
+    parser.add_argument('--update', action='store_true', help='كتابة النواتج الحالية كنتائج متوقعة')
+    args = parser.parse_args()
+    bot_module.logger.disabled = True
+
+    with open(CORPUS_PATH, encoding='utf-8') as f:
+        corpus = json.load(f)
+
+    if args.update:
+        for entry in corpus:
+            entry['expected'] = normalize(entry['url'])
+        with open(CORPUS_PATH, 'w', encoding='utf-8') as f:
+            json.dump(corpus, f, indent=1, ensure_ascii=False)
+        print(f"📝 تم تحديث {len(corpus)} رابط")
+        return 0
+
+    failures = 0
+    legacy_wrong = 0
+    for entry in corpus:
+        result = normalize(entry['url'])
+        if result != entry['expected']:
+            failures += 1
+            print(f"❌ {entry['url']!r}: {result} != {entry['expected']}")
+        legacy = legacy_normalize(entry['url'])
+        expected_key = entry['expected'][:2] if entry['expected'] else None
+        if (legacy[:2] if legacy else None) != expected_key:
+            legacy_wrong += 1
+    print(f"📋 المجموعة: {len(corpus) - failures}/{len(corpus)} مطابقة  "
+          f"(التحقق القديم يخطئ في {legacy_wrong})")
+
+    rng = random.Random(args.seed)
+    seeds = [entry for entry in corpus if entry['expected']]
+    fuzz_failures = 0
+    for i in range(args.fuzz):
+        entry = rng.choice(seeds)
+        hostile = i % 3 == 0
+        url = mutate_hostile(rng, entry['url']) if hostile else mutate_benign(rng, entry['url'])
+        try:
+            result = normalize(url)
+        except Exception as e:
+            result = e
+        expected = None if hostile else entry['expected']
+        if result != expected:
+            fuzz_failures += 1
+            if fuzz_failures <= 10:
+                print(f"❌ fuzz {url!r}: {result!r} != {expected}")
+    print(f"🎲 fuzz: {args.fuzz - fuzz_failures}/{args.fuzz} صحيحة (seed={args.seed})")
+
+    urls = [entry['url'] for entry in corpus]
+    new_us = per_url_us(bot_module.normalize_youtube_url.__wrapped__, urls, args.rounds)
+    cached_us = per_url_us(bot_module.normalize_youtube_url, urls, args.rounds)
+    old_us = per_url_us(legacy_normalize, urls, args.rounds)
+    print(f"⏱️ normalize_youtube_url: {new_us:.2f} µs/رابط (من الكاش {cached_us:.2f})   القديم: {old_us:.2f} µs/رابط")
+
+    return 1 if failures or fuzz_failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,175 @@
+"""قياس تحميل البث وإعادة البث من قوائم HLS/DASH (download_manifest)
+
+يشغل خادم الوسائط المحلي بقوائم وهمية (معرفات live.../rply...، انظر fake_servers) بسرعة --bandwidth
+لكل اتصال وتأخير --segment-latency قبل أول بايت من كل مقطع، ثم يحلل الفيديو بالكود الحقيقي للبوت
+(youtubei/v1/player بدون formats) ويحمل لكل قيمة في --concurrency (MANIFEST_CONCURRENCY):
+- hls-replay:  إعادة بث من HLS بجودة 480
+- dash-replay: إعادة بث من DASH بجودة 480 (فيديو + صوت منفصل)
+- dash-audio:  الصوت فقط من DASH
+- hls-live:    بث جارٍ، آخر --live-minutes دقيقة فقط من نافذة الخادم
+
+الدمج بـ ffmpeg مستبدل هنا بتسجيل المسارات كما كُتبت، فيقارن كل مسار (الفيديو وصوت DASH) بايتاً ببايت
+مع المقاطع المتوقعة بالترتيب (أي خطأ في إعادة الترتيب أو مقطع ناقص يظهر). يعرض عدد المقاطع و MB/s
+وطلبات الخادم.
+
+الاستخدام:
+    python benchmarks/bench_manifest.py
+    python benchmarks/bench_manifest.py --concurrency 1,4,8 --segment-latency 0.1 --json results.jsonl
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from typing import Dict, List
+
+from common import load_bot, route_requests_to
+from fake_servers import HLS_VARIANTS, LIVE_FIRST_SEQUENCE, fetch_stats, manifest_segment, \
+    start_in_subprocess
+
+bot_module = load_bot()
+
+# (السيناريو، المعرف، النوع، itag المسارات المتوقعة بالترتيب)
+SCENARIOS = [
+    ('hls-replay', 'rplyh000000', 'video', (94,)),
+    ('dash-replay', 'rplyd000000', 'video', (135, 140)),
+    ('dash-audio', 'rplyd000000', 'audio', (140,)),
+    ('hls-live', 'liveh000000', 'video', (94,)),
+]
+
+
+def expected_bytes(itag: int, sequences: List[int], args) -> bytes:
+    init = b'' if itag in HLS_VARIANTS else manifest_segment(itag, 'init', args.segment_seconds, args.size_scale)
+    return init + b''.join(manifest_segment(itag, str(n), args.segment_seconds, args.size_scale) for n in sequences)
+
+
+def capture_tracks(bot, captured: List[bytes]):
+    """استبدال _join_tracks بتسجيل محتوى المسارات قبل الدمج وإرجاع الأول كما هو"""
+    async def join(track_paths, file_path, exts):
+        for path in track_paths:
+            with open(path, 'rb') as f:
+                captured.append(f.read())
+        return track_paths[0]
+    bot._join_tracks = join
+
+
+async def run_scenario(bot, name: str, video_id: str, kind: str, itags, args) -> Dict:
+    info = await bot.get_video_info_innertube(video_id)
+    if not info or not info.get('formats'):
+        return {'scenario': name, 'error': 'no formats'}
+    live = video_id.startswith('live')
+    if live:
+        window = min(args.segments, int(args.live_minutes * 60 / args.segment_seconds + 0.999))
+        first = LIVE_FIRST_SEQUENCE + args.segments - window
+    else:
+        window, first = args.segments, 0
+    expected = [expected_bytes(itag, list(range(first, first + window)), args) for itag in itags]
+    captured: List[bytes] = []
+    capture_tracks(bot, captured)
+
+    job = {'user_id': 1}
+    start = time.perf_counter()
+    if kind == 'audio':
+        path = await bot.download_direct_audio(info, job=job)
+    else:
+        path = await bot.download_direct_video(info, '480', job=job)
+    elapsed = time.perf_counter() - start
+    if path and os.path.exists(path):
+        os.remove(path)
+    content = b''.join(captured)
+    leftovers = [name for name in os.listdir(bot_module.DOWNLOAD_PATH) if video_id in name]
+    return {
+        'scenario': name,
+        'formats': len(info['formats']),
+        'segments': window,
+        'bytes': len(content),
+        'seconds': round(elapsed, 3),
+        'mb_per_s': round(len(content) / elapsed / (1024 * 1024), 2) if elapsed and content else 0.0,
+        'exact': captured == expected,
+        'duration': info.get('duration'),
+        'leftover_files': leftovers,
+    }
+
+
+async def run_concurrency(concurrency: int, args) -> List[Dict]:
+    bot_module.MANIFEST_CONCURRENCY = concurrency
+    bot = bot_module.YouTubeTelegramBot()
+    await bot.workers.start()
+    try:
+        return [await run_scenario(bot, *scenario, args) for scenario in SCENARIOS
+                if args.scenario in ('all', scenario[0])]
+    finally:
+        bot.workers.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='قياس تحميل البث وإعادة البث من قوائم HLS/DASH')
+    parser.add_argument('--concurrency', default='1,4,8', help='قيم MANIFEST_CONCURRENCY مفصولة بفواصل')
+    parser.add_argument('--bandwidth', type=int, default=2_000_000, help='سرعة الخادم لكل اتصال بايت/ث')
+    parser.add_argument('--segment-latency', type=float, default=0.05, help='تأخير أول بايت لكل مقطع بالثواني')
+    parser.add_argument('--segments', type=int, default=60, help='عدد المقاطع في قوائم الخادم')
+    parser.add_argument('--segment-seconds', type=float, default=2.0, help='مدة المقطع بالثواني')
+    parser.add_argument('--size-scale', type=float, default=0.25, help='نسبة حجم المقطع من معدل البت')
+    parser.add_argument('--live-minutes', type=float, default=1.0, help='LIVE_WINDOW_MINUTES للبث الجاري')
+    parser.add_argument('--fail-rate', type=float, default=0.0, help='احتمال رد 503 على المقطع (إعادة المحاولة)')
+    parser.add_argument('--scenario', choices=['all'] + [s[0] for s in SCENARIOS], default='all')
+    parser.add_argument('--json', help='إلحاق النتائج بملف JSON lines')
+    parser.add_argument('-v', '--verbose', action='store_true', help='إظهار سجلات البوت')
+    args = parser.parse_args()
+
+    if not args.verbose:
+        bot_module.logging.getLogger().setLevel(bot_module.logging.WARNING)
+        bot_module.logger.disabled = True
+    bot_module.LIVE_WINDOW_MINUTES = args.live_minutes
+
+    print(f"📡 {args.segments} مقطع × {args.segment_seconds:g} ث، {args.bandwidth / 1e6:.1f} MB/s لكل اتصال، "
+          f"تأخير {args.segment_latency * 1000:.0f} ms لكل مقطع، نافذة البث {args.live_minutes:g} دقيقة\n")
+    print(f"{'conc':<6}{'scenario':<13}{'ok':>3}{'segs':>6}{'MB':>8}{'sec':>8}{'MB/s':>8}")
+    results = []
+    for concurrency in [int(value) for value in args.concurrency.split(',')]:
+        # خادم جديد لكل قيمة حتى تكون عدادات /stats خاصة بها
+        urls, server = start_in_subprocess(
+            with_api=False, bandwidth=args.bandwidth, slow_start=args.segment_latency, size_scale=args.size_scale,
+            manifest_segments=args.segments, segment_seconds=args.segment_seconds, fail_rate=args.fail_rate,
+        )
+        restore = route_requests_to(urls['media'])
+        try:
+            scenario_results = asyncio.run(run_concurrency(concurrency, args))
+            stats = fetch_stats(urls['media_stats'])
+        finally:
+            restore()
+            server.terminate()
+        for result in scenario_results:
+            result['concurrency'] = concurrency
+            results.append(result)
+            if 'error' in result:
+                print(f"{concurrency:<6}{result['scenario']:<13}❌ {result['error']}")
+                continue
+            ok = result['exact'] and not result['leftover_files']
+            print(f"{concurrency:<6}{result['scenario']:<13}{'✅' if ok else '❌':>3}{result['segments']:>6}"
+                  f"{result['bytes'] / (1024 * 1024):>8.2f}{result['seconds']:>8.2f}{result['mb_per_s']:>8.2f}")
+        print(f"{'':<6}الخادم: {stats.get('path:/videoplayback/sq', 0)} طلب مقطع، "
+              f"{stats.get('injected_503', 0)} خطأ 503 محقون")
+
+    if args.json:
+        with open(args.json, 'a', encoding='utf-8') as f:
+            for result in results:
+                f.write(json.dumps({'time': time.time(), 'bandwidth': args.bandwidth,
+                                    'segment_latency': args.segment_latency, **result}) + '\n')
+
+    failed = [r for r in results if 'error' in r or not r['exact'] or r['leftover_files']]
+    by_scenario: Dict[str, List[Dict]] = {}
+    for result in results:
+        by_scenario.setdefault(result['scenario'], []).append(result)
+    for name, runs in by_scenario.items():
+        speeds = [r['mb_per_s'] for r in runs if r.get('mb_per_s')]
+        if len(speeds) > 1:
+            print(f"⚡ {name}: {max(speeds) / min(speeds):.1f}x بين أبطأ وأسرع قيمة")
+    if failed:
+        print(f"❌ {len(failed)} تحميل لا يطابق المقاطع المتوقعة")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
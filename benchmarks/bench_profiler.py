@@ -0,0 +1,170 @@
+"""قياس تكلفة تشخيص الأداء أثناء التشغيل (Profiler: /profile و SIGUSR1/SIGUSR2)
+
+يشغل حملاً على المعالج من دوال البوت الحقيقية (parse_watch_page على صفحات fixtures/watch و
+parse_player_js على ملف المشغل) لمدة --duration ثانية في كل وضع، بجولات متناوبة (--rounds، تؤخذ
+أفضل نتيجة لكل وضع)، وبجانبه --idle-threads خيطاً منتظراً يحاكي خيوط to_thread الخاملة. الأوضاع:
+- off:        بدون تشخيص (التكلفة يجب أن تكون صفراً لأن لا شيء يعمل)
+- cpu@N:      عينات المعالج كل N ثانية لكل قيمة في --intervals
+- tracemalloc: تتبع الذاكرة بين لقطتين
+
+ويعرض: عمليات/ثانية والتباطؤ مقابل off، عدد العينات، زمن كتابة التقرير، ويتحقق من أن التقرير
+يحتوي دوال الحمل (parse_watch_page / parse_player_js) ضمن دوال البوت الأعلى.
+
+الاستخدام:
+    python benchmarks/bench_profiler.py
+    python benchmarks/bench_profiler.py --duration 5 --rounds 5 --intervals 0.01,0.001 --idle-threads 64 --json results.jsonl
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from typing import Dict, List, Tuple
+
+from common import FIXTURES_DIR, load_bot
+
+bot_module = load_bot()
+
+WATCH_DIR = os.path.join(FIXTURES_DIR, 'watch')
+PLAYER_DIR = os.path.join(FIXTURES_DIR, 'player')
+
+
+def load_workload() -> Tuple[List[bytes], List[Tuple[str, str]]]:
+    pages = []
+    for name in sorted(os.listdir(WATCH_DIR)):
+        if name.endswith('.html'):
+            with open(os.path.join(WATCH_DIR, name), 'rb') as f:
+                pages.append(f.read())
+    players = []
+    for version in sorted(os.listdir(PLAYER_DIR)):
+        with open(os.path.join(PLAYER_DIR, version, 'base.js'), encoding='utf-8') as f:
+            players.append((f.read(), version))
+    return pages, players
+
+
+def run_workload(pages, players, duration: float) -> float:
+    """عمليات/ثانية من الحمل خلال duration ثانية"""
+    operations = 0
+    deadline = time.perf_counter() + duration
+    started = time.perf_counter()
+    while time.perf_counter() < deadline:
+        for page in pages:
+            bot_module.parse_watch_page(page, 'dQw4w9WgXcQ')
+            operations += 1
+        for player_js, version in players:
+            bot_module.parse_player_js(player_js, version)
+            operations += 1
+    return operations / (time.perf_counter() - started)
+
+
+def run_mode(mode: str, interval: float, workload, args, profiler) -> Dict:
+    result = {'mode': mode}
+    if mode.startswith('cpu'):
+        profiler.interval = interval
+        profiler.start_cpu()
+        result['ops_per_s'] = run_workload(*workload, args.duration)
+        started = time.perf_counter()
+        report = profiler.stop_cpu()
+        result['report_ms'] = round((time.perf_counter() - started) * 1000, 1)
+        result['samples'] = report['samples']
+        result['stacks'] = len(set(profiler.stacks) | set(profiler.main_stacks))
+        labels = [label for label, _ in report['bot'][:5]]
+        result['found'] = any('parse_watch_page' in label or 'parse_player_js' in label for label in labels)
+        result['report'] = report
+    elif mode == 'tracemalloc':
+        profiler.memory_snapshot()
+        result['ops_per_s'] = run_workload(*workload, args.duration)
+        started = time.perf_counter()
+        report = profiler.memory_snapshot()
+        result['report_ms'] = round((time.perf_counter() - started) * 1000, 1)
+        profiler.stop_memory()
+        result['found'] = any(where.startswith(('bot.py', 'jsinterp.py'))
+                              for where in [top[0] for top in report['top']] + [diff[0] for diff in report['diff']])
+        result['report'] = report
+    else:
+        result['ops_per_s'] = run_workload(*workload, args.duration)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='قياس تكلفة تشخيص الأداء أثناء التشغيل')
+    parser.add_argument('--duration', type=float, default=2.0, help='ثوانٍ لكل وضع في كل جولة')
+    parser.add_argument('--rounds', type=int, default=3, help='جولات متناوبة بين الأوضاع، تؤخذ أفضل نتيجة لكل وضع')
+    parser.add_argument('--intervals', default='0.01,0.001', help='قيم PROFILE_INTERVAL مفصولة بفواصل')
+    parser.add_argument('--idle-threads', type=int, default=64, help='خيوط منتظرة مثل خيوط to_thread الخاملة')
+    parser.add_argument('--max-overhead', type=float, default=0.1,
+                        help='أقصى تباطؤ مقبول لعينات المعالج بالفاصل الافتراضي (0.1 = 10%%)')
+    parser.add_argument('--json', help='إلحاق النتائج بملف JSON lines')
+    parser.add_argument('-v', '--verbose', action='store_true', help='إظهار سجلات البوت وتقرير القياس')
+    args = parser.parse_args()
+
+    if not args.verbose:
+        bot_module.logging.getLogger().setLevel(bot_module.logging.WARNING)
+        bot_module.logger.disabled = True
+
+    stop = threading.Event()
+    for index in range(args.idle_threads):
+        threading.Thread(target=stop.wait, name=f'bot-worker_{index}', daemon=True).start()
+
+    workload = load_workload()
+    path = tempfile.mkdtemp(prefix='ytbot-bench-profile-')
+    profiler = bot_module.Profiler(path)
+    modes = [('off', 0.0)] + [(f'cpu@{value}', float(value)) for value in args.intervals.split(',')] + \
+        [('tracemalloc', 0.0)]
+
+    print(f"⚙️ حمل {len(workload[0])} صفحة + {len(workload[1])} ملف مشغل، "
+          f"{args.rounds} جولات × {args.duration:g} ث لكل وضع، {args.idle_threads} خيط منتظر\n")
+    print(f"{'mode':<14}{'ops/s':>9}{'slowdown':>10}{'samples':>9}{'stacks':>8}{'report ms':>11}{'found':>7}")
+    run_workload(*workload, 0.5)  # تسخين
+    # الأوضاع تتناوب في كل جولة حتى لا يحسب تذبذب الجهاز كتكلفة لوضع واحد
+    best: Dict[str, Dict] = {}
+    for _ in range(args.rounds):
+        for mode, interval in modes:
+            result = run_mode(mode, interval, workload, args, profiler)
+            if mode not in best or result['ops_per_s'] > best[mode]['ops_per_s']:
+                best[mode] = result
+    results = []
+    baseline = best['off']['ops_per_s']
+    for mode, _ in modes:
+        result = best[mode]
+        result['slowdown'] = round(1 - result['ops_per_s'] / baseline, 3)
+        result['ops_per_s'] = round(result['ops_per_s'], 1)
+        results.append(result)
+        found = result.get('found')
+        print(f"{mode:<14}{result['ops_per_s']:>9.1f}{result['slowdown']:>10.1%}{result.get('samples', '-'):>9}"
+              f"{result.get('stacks', '-'):>8}{result.get('report_ms', '-'):>11}"
+              f"{'-' if found is None else '✅' if found else '❌':>7}")
+    stop.set()
+
+    bot = bot_module.YouTubeTelegramBot()
+    for result in results:
+        report = result.pop('report', None)
+        if report and args.verbose:
+            text = bot.format_cpu_report(report) if 'samples' in report else bot.format_memory_report(report)
+            print(f"\n{result['mode']}:\n{text}")
+        if report:
+            result['report_path'] = report['path']
+
+    if args.json:
+        with open(args.json, 'a', encoding='utf-8') as f:
+            for result in results:
+                f.write(json.dumps({'time': time.time(), 'duration': args.duration,
+                                    'idle_threads': args.idle_threads, **result}) + '\n')
+
+    shutil.rmtree(path, ignore_errors=True)
+    default = next((r for r in results if r['mode'] == f'cpu@{bot_module.PROFILE_INTERVAL:g}'), None)
+    failed = [r for r in results if r.get('found') is False]
+    if default and default['slowdown'] > args.max_overhead:
+        print(f"❌ تباطؤ العينات بالفاصل الافتراضي {default['slowdown']:.1%} أكبر من {args.max_overhead:.0%}")
+        return 1
+    if failed:
+        print("❌ التقرير لا يحتوي دوال الحمل")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
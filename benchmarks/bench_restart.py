@@ -0,0 +1,240 @@
+"""قياس الاستعادة بعد توقف البوت أثناء التحميل (JobJournal + recover_jobs + drain)
+
+لكل سيناريو يبدأ تحميل فيديو 360p (9.5 MB) في عملية فرعية تشغل البوت الحقيقي مقابل خوادم وهمية
+بسرعة محدودة، ثم يوقفها في منتصف التحميل:
+- crash:    kill -9 (بدون أي فرصة للتنظيف)؛ يستأنف من حجم الملف الجزئي على القرص
+- sigterm:  drain بمهلة أقصر من باقي التحميل؛ الملف الجزئي يحفظ والحالة interrupted
+- graceful: drain بمهلة تكفي لإكمال التحميل؛ المهمة تنتهي قبل الخروج ولا يبقى شيء للاستعادة
+
+ثم يشغل بوتاً جديداً بنفس السجل ومجلد التحميل وينفذ recover_jobs، ويعرض: حالة المهمة في السجل
+بعد التوقف، بايتات الملف الجزئي، زمن الاستعادة، البايتات المحملة مرة أخرى (يجب أن تكون الباقي فقط)،
+تطابق محتوى الملف المرسل مع المحتوى الأصلي، وعدم بقاء ملفات في DOWNLOAD_PATH.
+
+الاستخدام:
+    python benchmarks/bench_restart.py
+    python benchmarks/bench_restart.py --scenario crash --bandwidth 1000000 --stop-at 0.5
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import signal
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict
+
+# البوت يقرأ الإعدادات عند الاستيراد، والعملية الفرعية تحتاج نفس السجل ونفس مجلد التحميل
+os.environ.setdefault('JOB_JOURNAL_PATH', os.path.join(tempfile.mkdtemp(prefix='ytbot-bench-journal-'), 'jobs.sqlite3'))
+os.environ.setdefault('DOWNLOAD_PATH', tempfile.mkdtemp(prefix='ytbot-bench-') + os.sep)
+os.environ['MEMORY_FILE_MAX_MB'] = '0'  # الملفات في الذاكرة لا تستأنف، القياس لمسار القرص
+
+from telegram import Update  # noqa: E402
+from telegram.ext import Application  # noqa: E402
+
+from common import load_bot, route_requests_to  # noqa: E402
+from fake_servers import fetch_stats, media_bytes, start_in_subprocess  # noqa: E402
+
+bot_module = load_bot()
+
+FAKE_TOKEN = '123456:FAKE-TOKEN'
+USER_ID = 4242
+VIDEO_ID = 'rst00000001'
+CHOICE = 'video_360'
+EXPECTED_SIZE = 9542317  # clen لتنسيق 360p في الصفحة المحفوظة
+
+
+def make_application(bot, urls: Dict[str, str]) -> Application:
+    builder = Application.builder().token(FAKE_TOKEN).base_url(urls['api']).base_file_url(urls['api_files'])
+    return bot_module.build_application(bot, builder)
+
+
+def message_update(application: Application, update_id: int, text: str) -> Update:
+    return Update.de_json({
+        'update_id': update_id,
+        'message': {
+            'message_id': update_id, 'date': int(time.time()), 'text': text,
+            'chat': {'id': USER_ID, 'type': 'private'},
+            'from': {'id': USER_ID, 'is_bot': False, 'first_name': 'User'},
+        },
+    }, application.bot)
+
+
+def callback_update(application: Application, update_id: int, message_id: int, data: str) -> Update:
+    return Update.de_json({
+        'update_id': update_id,
+        'callback_query': {
+            'id': str(update_id), 'chat_instance': str(USER_ID), 'data': data,
+            'from': {'id': USER_ID, 'is_bot': False, 'first_name': 'User'},
+            'message': {
+                'message_id': message_id, 'date': int(time.time()), 'text': '📊 اختر جودة التحميل:',
+                'chat': {'id': USER_ID, 'type': 'private'},
+                'from': {'id': 42, 'is_bot': True, 'first_name': 'FakeBot'},
+            },
+        },
+    }, application.bot)
+
+
+async def child(scenario: str, urls: Dict[str, str], stop_at: float, drain_timeout: float):
+    """العملية التي ستوقف: تبدأ التحميل ثم تنتظر kill -9 أو تنفذ drain"""
+    restore = route_requests_to(urls['media'])
+    bot = bot_module.YouTubeTelegramBot()
+    application = make_application(bot, urls)
+    await application.initialize()
+    await application.start()
+    await bot.workers.start()
+    try:
+        await application.update_queue.put(message_update(application, 1, f"https://youtu.be/{VIDEO_ID}"))
+        while USER_ID not in bot.user_sessions:
+            await asyncio.sleep(0.02)
+        message_id = bot.user_sessions[USER_ID]['message_id']
+        await application.update_queue.put(callback_update(application, 2, message_id, CHOICE))
+        while True:
+            job = next(iter(bot.active_jobs.values()), None)
+            if job and job.get('bytes_total') and job['bytes_done'] >= job['bytes_total'] * stop_at:
+                break
+            await asyncio.sleep(0.01)
+        print(json.dumps({'bytes_done': job['bytes_done']}), flush=True)
+        if scenario == 'crash':
+            await asyncio.sleep(3600)  # العملية الأم ترسل SIGKILL
+        await bot.drain(timeout=drain_timeout)
+    finally:
+        bot.workers.shutdown()
+        await application.stop()
+        await application.shutdown()
+        restore()
+
+
+async def recover(urls: Dict[str, str]) -> Dict:
+    """بوت جديد بنفس السجل: استئناف المهام غير المكتملة حتى تنتهي"""
+    restore = route_requests_to(urls['media'])
+    bot = bot_module.YouTubeTelegramBot()
+    uploaded = []
+    original_upload = bot.upload_file
+
+    async def upload_file(message, file_path, *args, **kwargs):
+        with open(file_path, 'rb') as f:
+            uploaded.append(hashlib.sha256(f.read()).hexdigest())
+        return await original_upload(message, file_path, *args, **kwargs)
+
+    bot.upload_file = upload_file
+    application = make_application(bot, urls)
+    await application.initialize()
+    await application.start()
+    await bot.workers.start()
+    start = time.perf_counter()
+    try:
+        await bot.recover_jobs(application.bot)
+        while bot.recovery_tasks or bot.active_jobs:
+            await asyncio.sleep(0.02)
+    finally:
+        bot.workers.shutdown()
+        await application.stop()
+        await application.shutdown()
+        restore()
+    return {'seconds': time.perf_counter() - start, 'uploaded': uploaded}
+
+
+def journal_rows():
+    with sqlite3.connect(os.environ['JOB_JOURNAL_PATH']) as db:
+        return [dict(zip(('id', 'state', 'attempts', 'partial_path', 'itag'), row)) for row in db.execute(
+            'SELECT id, state, attempts, partial_path, itag FROM jobs ORDER BY id')]
+
+
+def run_scenario(scenario: str, args) -> Dict:
+    # سجل ومجلد تحميل فارغان لكل سيناريو
+    if os.path.exists(os.environ['JOB_JOURNAL_PATH']):
+        with sqlite3.connect(os.environ['JOB_JOURNAL_PATH']) as db:
+            db.execute('DELETE FROM jobs')
+    for name in os.listdir(bot_module.DOWNLOAD_PATH):
+        os.remove(os.path.join(bot_module.DOWNLOAD_PATH, name))
+
+    urls, server = start_in_subprocess(bandwidth=args.bandwidth, seed=1)
+    try:
+        drain_timeout = 60.0 if scenario == 'graceful' else args.drain_timeout
+        process = subprocess.Popen(
+            [sys.executable, __file__, '--child', scenario, '--urls', json.dumps(urls),
+             '--stop-at', str(args.stop_at), '--drain-timeout', str(drain_timeout)],
+            stdout=subprocess.PIPE, text=True, env=os.environ.copy(),
+            start_new_session=True,  # مجموعة عمليات خاصة حتى يشمل kill -9 عمليات المعالجة أيضاً
+        )
+        stopped_at = json.loads(process.stdout.readline() or '{}').get('bytes_done', 0)
+        stop_start = time.perf_counter()
+        if scenario == 'crash':
+            os.killpg(process.pid, signal.SIGKILL)
+        process.wait(timeout=120)
+        stop_seconds = time.perf_counter() - stop_start
+        # الخادم يحسب bytes_out عند انتهاء الرد، فننتظر حتى يلاحظ انقطاع الاتصال الأول
+        deadline = time.monotonic() + 10
+        while (scenario != 'graceful' and not fetch_stats(urls['media_stats']).get('client_aborted')
+               and time.monotonic() < deadline):
+            time.sleep(0.05)
+        before = fetch_stats(urls['media_stats']).get('bytes_out', 0)
+        after_stop = journal_rows()
+        partial = after_stop[-1]['partial_path'] if after_stop else None
+        partial_bytes = os.path.getsize(partial) if partial and os.path.exists(partial) else 0
+
+        recovery = asyncio.run(recover(urls))
+        media_stats = fetch_stats(urls['media_stats'])
+        api_stats = fetch_stats(urls['api_stats'])
+    finally:
+        server.terminate()
+
+    expected = hashlib.sha256(media_bytes(0, EXPECTED_SIZE - 1)).hexdigest()
+    return {
+        'scenario': scenario,
+        'stopped_at': stopped_at,
+        'stop_seconds': round(stop_seconds, 2),
+        'state_after_stop': after_stop[-1]['state'] if after_stop else None,
+        'partial_bytes': partial_bytes,
+        'recovery_seconds': round(recovery['seconds'], 2),
+        'refetched_bytes': media_stats.get('bytes_out', 0) - before,
+        'sent_videos': api_stats.get('method:sendVideo', 0),
+        'content_ok': all(digest == expected for digest in recovery['uploaded']),
+        'final_states': [row['state'] for row in journal_rows()],
+        'leftover_files': sorted(os.listdir(bot_module.DOWNLOAD_PATH)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='قياس الاستعادة بعد توقف البوت أثناء التحميل')
+    parser.add_argument('--scenario', choices=['crash', 'sigterm', 'graceful', 'all'], default='all')
+    parser.add_argument('--bandwidth', type=int, default=2_000_000, help='سرعة خادم الوسائط بايت/ث')
+    parser.add_argument('--stop-at', type=float, default=0.4, help='نسبة التحميل عند الإيقاف')
+    parser.add_argument('--drain-timeout', type=float, default=1.0, help='مهلة drain في سيناريو sigterm (ث)')
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    parser.add_argument('--urls', help=argparse.SUPPRESS)
+    parser.add_argument('-v', '--verbose', action='store_true', help='إظهار سجلات البوت')
+    args = parser.parse_args()
+
+    if not args.verbose:
+        bot_module.logging.getLogger().setLevel(bot_module.logging.WARNING)
+        bot_module.logger.disabled = True
+
+    if args.child:
+        asyncio.run(child(args.child, json.loads(args.urls), args.stop_at, args.drain_timeout))
+        return 0
+
+    scenarios = ['crash', 'sigterm', 'graceful'] if args.scenario == 'all' else [args.scenario]
+    print(f"{'scenario':<10}{'state':<13}{'stop s':>7}{'partial MB':>11}{'recover s':>10}{'refetch MB':>11}"
+          f"{'sent':>5}{'ok':>4}  final / leftovers")
+    failed = False
+    for scenario in scenarios:
+        result = run_scenario(scenario, args)
+        print(f"{scenario:<10}{str(result['state_after_stop']):<13}{result['stop_seconds']:>7.2f}"
+              f"{result['partial_bytes'] / 1e6:>11.2f}{result['recovery_seconds']:>10.2f}"
+              f"{result['refetched_bytes'] / 1e6:>11.2f}{result['sent_videos']:>5}"
+              f"{'✅' if result['content_ok'] else '❌':>4}  {result['final_states']} {result['leftover_files']}")
+        delivered = result['sent_videos'] == 1 and result['content_ok']
+        resumed_tail_only = scenario == 'graceful' or result['refetched_bytes'] <= EXPECTED_SIZE - result['partial_bytes'] + 65536
+        terminal = all(state in bot_module.JobJournal.TERMINAL for state in result['final_states'])
+        if not (delivered and resumed_tail_only and terminal) or result['leftover_files']:
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
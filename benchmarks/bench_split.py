@@ -0,0 +1,178 @@
+"""قياس إرسال الملفات الأكبر من الحد كأجزاء (split_to_fit + upload_parts)
+
+يولد فيديو اختبار (نفس مصدر bench_transcode) ويخفض TELEGRAM_FILE_LIMIT إلى --limit-mb، ثم يرسله
+عبر send_file مقابل Bot API وهمي يستقبل الرفع بسرعة --upload-bandwidth لكل اتصال. وضعان:
+- storage: مع INLINE_CACHE_CHAT_ID، الأجزاء ترفع بالتوازي إلى محادثة التخزين ثم ترسل المجموعة بالـ file_id
+- single:  بدون محادثة تخزين، كل الأجزاء في طلب sendMediaGroup واحد
+
+ويعرض: عدد الأجزاء وأكبرها مقابل الحد، زمن التقسيم وزمن المعالج لـ ffmpeg (يجب أن يكون صغيراً
+مقارنة بإعادة الترميز)، زمن الرفع، طلبات Bot API، وإعادة الإرسال من الكاش (بدون بايتات رفع).
+
+الاستخدام:
+    python benchmarks/bench_split.py
+    python benchmarks/bench_split.py --duration 120 --limit-mb 4 --upload-bandwidth 1000000 --mode storage
+"""
+import argparse
+import asyncio
+import json
+import os
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from typing import Dict
+
+from bench_transcode import bot_module, make_source
+from fake_servers import fetch_stats, start_in_subprocess
+
+from telegram import Bot, Update  # noqa: E402
+from telegram.request import HTTPXRequest  # noqa: E402
+
+FAKE_TOKEN = '123456:FAKE-TOKEN-FOR-SPLIT'
+USER_ID = 4242
+STORAGE_CHAT_ID = '-1001234567890'
+
+
+def children_cpu() -> float:
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def callback_query(telegram_bot: Bot):
+    return Update.de_json({
+        'update_id': 1,
+        'callback_query': {
+            'id': '1', 'chat_instance': str(USER_ID), 'data': 'video_720',
+            'from': {'id': USER_ID, 'is_bot': False, 'first_name': 'User'},
+            'message': {
+                'message_id': 10, 'date': int(time.time()), 'text': '...',
+                'chat': {'id': USER_ID, 'type': 'private'},
+                'from': {'id': 42, 'is_bot': True, 'first_name': 'FakeBot'},
+            },
+        },
+    }, telegram_bot).callback_query
+
+
+async def run_mode(mode: str, source: str, args) -> Dict:
+    bot_module.INLINE_CACHE_CHAT_ID = STORAGE_CHAT_ID if mode == 'storage' else ''
+    urls, server = start_in_subprocess(upload_bandwidth=args.upload_bandwidth)
+    try:
+        bot = bot_module.YouTubeTelegramBot()
+        path = os.path.join(bot_module.DOWNLOAD_PATH, f'split{mode}.mp4')
+        shutil.copyfile(source, path)
+        cache_key = f'split{mode}:video_720'
+        # مجمع اتصالات Bot وحده اتصال واحد، والتطبيق الحقيقي (ApplicationBuilder) يستخدم 256
+        request = HTTPXRequest(connection_pool_size=32)
+        async with Bot(FAKE_TOKEN, base_url=urls['api'], base_file_url=urls['api_files'],
+                       request=request) as telegram_bot:
+            query = callback_query(telegram_bot)
+
+            split_time = 0.0
+            original_split = bot.split_to_fit
+
+            async def split_to_fit(*call_args):
+                nonlocal split_time
+                started = time.perf_counter()
+                try:
+                    return await original_split(*call_args)
+                finally:
+                    split_time = time.perf_counter() - started
+
+            bot.split_to_fit = split_to_fit
+            part_sizes = []
+            original_upload = bot.upload_parts
+
+            async def upload_parts(message, parts, *call_args, **kwargs):
+                part_sizes.extend(os.path.getsize(part) for part in parts)
+                return await original_upload(message, parts, *call_args, **kwargs)
+
+            bot.upload_parts = upload_parts
+            cpu_before = children_cpu()
+            started = time.perf_counter()
+            ok = await bot.send_file(query, path, cache_key=cache_key, kind='video', duration=args.duration)
+            elapsed = time.perf_counter() - started
+            cpu = children_cpu() - cpu_before
+            os.remove(path)
+            sent_stats = fetch_stats(urls['api_stats'])
+
+            # إعادة الإرسال من الكاش: مجموعة بنفس الترتيب بدون رفع
+            cached = bot._get_cached_file(f'split{mode}', 'video_720')
+            resend_start = time.perf_counter()
+            resent = await bot.send_cached_file(query.message, cached) if cached else []
+            resend = time.perf_counter() - resend_start
+            final_stats = fetch_stats(urls['api_stats'])
+    finally:
+        server.terminate()
+
+    return {
+        'mode': mode,
+        'ok': ok,
+        'parts': len(part_sizes),
+        'largest_mb': round(max(part_sizes, default=0) / 1e6, 2),
+        'parts_total_mb': round(sum(part_sizes) / 1e6, 2),
+        'fit': bool(part_sizes) and max(part_sizes) <= bot_module.TELEGRAM_FILE_LIMIT,
+        'split_s': round(split_time, 2),
+        'split_cpu_s': round(cpu, 2),
+        'upload_s': round(elapsed - split_time, 2),
+        'send_video': sent_stats.get('method:sendVideo', 0),
+        'send_media_group': sent_stats.get('method:sendMediaGroup', 0),
+        'cached_parts': len(cached['parts']) if cached else 0,
+        'resend_items': len(resent),
+        'resend_s': round(resend, 3),
+        'resend_upload_bytes': final_stats.get('bytes_in', 0) - sent_stats.get('bytes_in', 0),
+        'leftover_files': sorted(os.listdir(bot_module.DOWNLOAD_PATH)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='قياس إرسال الملفات الكبيرة كأجزاء')
+    parser.add_argument('--duration', type=int, default=60, help='مدة فيديو الاختبار بالثواني')
+    parser.add_argument('--source-kbps', type=int, default=3000, help='معدل بت فيديو الاختبار')
+    parser.add_argument('--limit-mb', type=float, default=4, help='الحد المستخدم بدل 50 MB')
+    parser.add_argument('--upload-bandwidth', type=int, default=2_000_000, help='سرعة الرفع لكل اتصال بايت/ث')
+    parser.add_argument('--mode', choices=['storage', 'single', 'all'], default='all')
+    parser.add_argument('--json', help='إلحاق النتائج بملف JSON lines')
+    parser.add_argument('-v', '--verbose', action='store_true', help='إظهار سجلات البوت')
+    args = parser.parse_args()
+
+    if not args.verbose:
+        bot_module.logging.getLogger().setLevel(bot_module.logging.WARNING)
+        bot_module.logger.disabled = True
+    bot_module.TELEGRAM_FILE_LIMIT = int(args.limit_mb * 1024 * 1024)
+
+    source = os.path.join(tempfile.mkdtemp(prefix='ytbot-bench-split-'), 'source.mp4')
+    try:
+        make_source(source, args.duration, args.source_kbps)
+    except Exception as e:
+        print(f"❌ تعذر توليد فيديو الاختبار بـ {bot_module.FFMPEG_PATH}: {e}")
+        return 1
+    print(f"⚙️ مصدر {os.path.getsize(source) / 1e6:.1f} MB ({args.duration} ث)، الحد {args.limit_mb} MB، "
+          f"رفع {args.upload_bandwidth / 1e6:.1f} MB/s لكل اتصال\n")
+    print(f"{'mode':<9}{'ok':>3}{'parts':>6}{'max MB':>8}{'split s':>8}{'cpu s':>7}{'upload s':>9}"
+          f"{'sendVideo':>10}{'group':>6}{'cached':>7}{'resend s':>9}{'resend B':>9}")
+
+    modes = ['storage', 'single'] if args.mode == 'all' else [args.mode]
+    results = []
+    for mode in modes:
+        result = asyncio.run(run_mode(mode, source, args))
+        results.append(result)
+        print(f"{mode:<9}{'✅' if result['ok'] and result['fit'] else '❌':>3}{result['parts']:>6}"
+              f"{result['largest_mb']:>8.2f}{result['split_s']:>8.2f}{result['split_cpu_s']:>7.2f}"
+              f"{result['upload_s']:>9.2f}{result['send_video']:>10}{result['send_media_group']:>6}"
+              f"{result['cached_parts']:>7}{result['resend_s']:>9.3f}{result['resend_upload_bytes']:>9}")
+
+    if args.json:
+        with open(args.json, 'a', encoding='utf-8') as f:
+            for result in results:
+                f.write(json.dumps({'time': time.time(), 'duration': args.duration, 'limit_mb': args.limit_mb,
+                                    **result}) + '\n')
+
+    shutil.rmtree(os.path.dirname(source), ignore_errors=True)
+    failed = any(not (r['ok'] and r['fit'] and r['cached_parts'] == r['parts'] == r['resend_items'])
+                 or r['leftover_files'] for r in results)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
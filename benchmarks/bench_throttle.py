@@ -0,0 +1,120 @@
+"""قياس أثر تحويل المعامل n على سرعة التحميل مقابل خادم يخنق الروابط غير المحولة
+
+يشغل خادم الوسائط المحلي مع --n-throttle: أي رابط videoplayback يحمل قيمة n الأصلية
+يُخنق إلى هذه السرعة كما يفعل googlevideo، بينما يمر الرابط المحول بالسرعة الكاملة.
+ثم يحلل الفيديو (من الصفحة المحفوظة) ويحمل نفس التنسيق مرتين بالكود الحقيقي للبوت:
+- raw: مع N_TRANSFORM=false (الروابط كما في الصفحة)
+- transformed: مع تحويل n بدالة ملف المشغل (fixtures/player)
+
+ويعرض لكل وضع: زمن التحليل (بارد يشمل تحميل المشغل وتجميع الدالة، ودافئ من الكاش)
+و MB/s للتحميل وعدادات الخادم، ويفشل إذا لم يكن الوضع المحول أسرع بـ --min-speedup.
+
+الاستخدام:
+    python benchmarks/bench_throttle.py
+    python benchmarks/bench_throttle.py --n-throttle 100000 --size-scale 0.05 --json results.jsonl
+"""
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import sys
+import time
+from typing import Dict
+
+from common import load_bot, route_requests_to
+from fake_servers import fetch_stats, start_in_subprocess
+
+bot_module = load_bot()
+
+VIDEO_ID = 'dQw4w9WgXcQ'
+
+
+async def run_mode(transform: bool) -> Dict:
+    bot_module.N_TRANSFORM = transform
+    # التحليل البارد يشمل تحميل المشغل وتحليله، وليس قراءته من كاش القرص الذي تركه الوضع السابق
+    shutil.rmtree(bot_module.PLAYER_CACHE_PATH, ignore_errors=True)
+    bot = bot_module.YouTubeTelegramBot()
+    await bot.workers.start()
+
+    start = time.perf_counter()
+    info = await bot.get_complete_video_info(VIDEO_ID)
+    analysis_cold = time.perf_counter() - start
+    if not info or not info.get('formats'):
+        return {'mode': 'transformed' if transform else 'raw', 'error': 'no formats'}
+
+    # تحليل ثانٍ لنفس الفيديو: المشغل والدالة المجمعة ونتيجة n من الذاكرة
+    bot.video_info_cache.clear()
+    start = time.perf_counter()
+    await bot.get_complete_video_info(VIDEO_ID)
+    analysis_warm = time.perf_counter() - start
+
+    start = time.perf_counter()
+    path = await bot.download_direct_video(info, '360')
+    elapsed = time.perf_counter() - start
+    size = os.path.getsize(path) if path and os.path.exists(path) else 0
+    if path and os.path.exists(path):
+        os.remove(path)
+    return {
+        'mode': 'transformed' if transform else 'raw',
+        'analysis_cold_ms': round(analysis_cold * 1000, 1),
+        'analysis_warm_ms': round(analysis_warm * 1000, 1),
+        'bytes': size,
+        'seconds': round(elapsed, 3),
+        'mb_per_s': round(size / elapsed / (1024 * 1024), 2) if elapsed and size else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='قياس أثر تحويل المعامل n على سرعة التحميل')
+    parser.add_argument('--n-throttle', type=int, default=200_000, help='سرعة الروابط غير المحولة بايت/ث')
+    parser.add_argument('--size-scale', type=float, default=0.1, help='نسبة حجم الملف من clen في الصفحة')
+    parser.add_argument('--min-speedup', type=float, default=2.0, help='أقل تسريع مقبول للوضع المحول')
+    parser.add_argument('--json', help='إلحاق النتائج بملف JSON lines')
+    parser.add_argument('-v', '--verbose', action='store_true', help='إظهار سجلات البوت')
+    args = parser.parse_args()
+
+    if not args.verbose:
+        bot_module.logging.getLogger().setLevel(bot_module.logging.WARNING)
+        bot_module.logger.disabled = True
+
+    print(f"🐢 خنق الروابط غير المحولة إلى {args.n_throttle / 1024:.0f} KB/s\n")
+    print(f"{'mode':<13}{'cold ms':>10}{'warm ms':>10}{'MB':>8}{'sec':>8}{'MB/s':>8}  server")
+    results = []
+    for transform in (False, True):
+        # خادم جديد لكل وضع حتى تكون عدادات /stats خاصة به
+        urls, server = start_in_subprocess(with_api=False, n_throttle=args.n_throttle, size_scale=args.size_scale)
+        restore = route_requests_to(urls['media'])
+        try:
+            result = asyncio.run(run_mode(transform))
+            stats = fetch_stats(urls['media_stats'])
+        finally:
+            restore()
+            server.terminate()
+        result['server'] = {k: v for k, v in stats.items() if k.startswith('n_') or k.startswith('path:/s/')}
+        results.append(result)
+        if 'error' in result:
+            print(f"{result['mode']:<13}❌ {result['error']}")
+            continue
+        print(f"{result['mode']:<13}{result['analysis_cold_ms']:>10.1f}{result['analysis_warm_ms']:>10.1f}"
+              f"{result['bytes'] / (1024 * 1024):>8.2f}{result['seconds']:>8.2f}{result['mb_per_s']:>8.2f}"
+              f"  {json.dumps(result['server'])}")
+
+    if args.json:
+        with open(args.json, 'a', encoding='utf-8') as f:
+            for result in results:
+                f.write(json.dumps({'time': time.time(), 'n_throttle': args.n_throttle, **result}) + '\n')
+
+    raw, transformed = results
+    if 'error' in raw or 'error' in transformed or not raw['mb_per_s']:
+        return 1
+    speedup = transformed['mb_per_s'] / raw['mb_per_s']
+    print(f"\n⚡ التسريع: {speedup:.1f}x")
+    if speedup < args.min_speedup or not transformed['server'].get('n_transformed'):
+        print("❌ الروابط المحولة لم تتجاوز الخنق")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
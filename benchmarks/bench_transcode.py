@@ -0,0 +1,137 @@
+"""قياس الضغط لحد تلجرام (transcode_to_fit) وضبط TRANSCODE_WORKERS
+
+يولد فيديو اختبار بـ ffmpeg (testsrc2 + نغمة) بمعدل --source-kbps ومدة --duration، ثم يخفض
+TELEGRAM_FILE_LIMIT إلى --limit-mb حتى يكون الملف أكبر منه (نفس الحساب لملف حقيقي أكبر من 50 MB
+ومدة أطول)، ويشغل --jobs مهمة ضغط متزامنة لكل قيمة في --workers. يعرض لكل مهمة: عدد المرورات، معدل
+البت المحسوب، الحجم الناتج مقابل الحد، زمن الانتظار والتنفيذ وزمن المعالج (من -benchmark)، ثم
+لكل قيمة: الزمن الكلي، مهام/دقيقة، واستخدام المعالج (زمن المعالج ÷ (الزمن × الأنوية)).
+
+يحتاج ffmpeg مع libx264؛ يستخدم FFMPEG_PATH أو ffmpeg من imageio-ffmpeg إذا كان مثبتاً.
+
+الاستخدام:
+    python benchmarks/bench_transcode.py
+    python benchmarks/bench_transcode.py --jobs 4 --workers 1,2,4 --preset ultrafast --json results.jsonl
+"""
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+try:
+    import imageio_ffmpeg
+    os.environ.setdefault('FFMPEG_PATH', imageio_ffmpeg.get_ffmpeg_exe())
+except ImportError:
+    pass
+
+from common import load_bot, summarize  # noqa: E402
+
+bot_module = load_bot()
+
+
+def make_source(path: str, duration: int, kbps: int):
+    """فيديو 854x480 بحركة مستمرة (testsrc2) وصوت، بمعدل بت ثابت تقريباً"""
+    subprocess.run([
+        bot_module.FFMPEG_PATH, '-hide_banner', '-loglevel', 'error', '-y',
+        '-f', 'lavfi', '-i', f'testsrc2=size=854x480:rate=30:duration={duration}',
+        '-f', 'lavfi', '-i', f'sine=frequency=440:sample_rate=44100:duration={duration}',
+        '-c:v', 'libx264', '-preset', 'ultrafast', '-b:v', f'{kbps}k', '-maxrate', f'{kbps}k',
+        '-bufsize', f'{kbps}k', '-c:a', 'aac', '-b:a', '128k', '-shortest', path,
+    ], check=True)
+
+
+async def run_workers(workers: int, source: str, args) -> Dict:
+    bot_module.TRANSCODE_WORKERS = workers
+    bot = bot_module.YouTubeTelegramBot()
+    paths = []
+    for i in range(args.jobs):
+        path = os.path.join(bot_module.DOWNLOAD_PATH, f'bench_{workers}_{i}.mp4')
+        shutil.copyfile(source, path)
+        paths.append(path)
+
+    start = time.perf_counter()
+    outputs = await asyncio.gather(*(
+        bot.transcode_to_fit(path, {'id': f'bench{i}', 'duration': args.duration}, 'video')
+        for i, path in enumerate(paths)
+    ))
+    elapsed = time.perf_counter() - start
+    jobs: List[Dict] = list(bot.transcode_stats)
+    for output in outputs:
+        if os.path.exists(output):
+            os.remove(output)
+    cpu = sum(job['cpu_s'] for job in jobs)
+    return {
+        'workers': workers,
+        'elapsed_s': round(elapsed, 2),
+        'jobs_per_min': round(len(jobs) / elapsed * 60, 2),
+        'cpu_s': round(cpu, 2),
+        'cpu_utilisation': round(cpu / (elapsed * (os.cpu_count() or 1)), 2),
+        'wall_s': summarize([job['wall_s'] for job in jobs]),
+        'queue_s': summarize([job['queue_s'] for job in jobs]),
+        'fit': all(job['output_bytes'] and job['output_bytes'] <= bot_module.TELEGRAM_FILE_LIMIT for job in jobs),
+        'jobs': jobs,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='قياس الضغط لحد تلجرام')
+    parser.add_argument('--duration', type=int, default=30, help='مدة فيديو الاختبار بالثواني')
+    parser.add_argument('--source-kbps', type=int, default=3000, help='معدل بت فيديو الاختبار')
+    parser.add_argument('--limit-mb', type=float, default=4, help='الحد المستخدم بدل 50 MB')
+    parser.add_argument('--jobs', type=int, default=3, help='مهام الضغط المتزامنة لكل قيمة')
+    parser.add_argument('--workers', default='1,2', help='قيم TRANSCODE_WORKERS مفصولة بفواصل')
+    parser.add_argument('--preset', default=bot_module.TRANSCODE_PRESET, help='preset لـ libx264')
+    parser.add_argument('--two-pass-max', type=int, default=bot_module.TRANSCODE_TWO_PASS_MAX_SECONDS,
+                        help='TRANSCODE_TWO_PASS_MAX_SECONDS (0 = مرور واحد دائماً)')
+    parser.add_argument('--json', help='إلحاق النتائج بملف JSON lines')
+    parser.add_argument('-v', '--verbose', action='store_true', help='إظهار سجلات البوت')
+    args = parser.parse_args()
+
+    if not args.verbose:
+        bot_module.logging.getLogger().setLevel(bot_module.logging.WARNING)
+        bot_module.logger.disabled = True
+    bot_module.TELEGRAM_FILE_LIMIT = int(args.limit_mb * 1024 * 1024)
+    bot_module.TRANSCODE_PRESET = args.preset
+    bot_module.TRANSCODE_TWO_PASS_MAX_SECONDS = args.two_pass_max
+
+    source = os.path.join(tempfile.mkdtemp(prefix='ytbot-bench-transcode-'), 'source.mp4')
+    try:
+        make_source(source, args.duration, args.source_kbps)
+    except (OSError, subprocess.CalledProcessError) as e:
+        print(f"❌ تعذر توليد فيديو الاختبار بـ {bot_module.FFMPEG_PATH}: {e}")
+        return 1
+    plan = bot_module.plan_transcode('video', args.duration, bot_module.TELEGRAM_FILE_LIMIT)
+    print(f"⚙️ مصدر {os.path.getsize(source) / 1e6:.1f} MB ({args.duration} ث، {args.source_kbps} kbps)، "
+          f"الحد {args.limit_mb} MB، الخطة {plan}، preset {args.preset}، {args.jobs} مهام، أنوية {os.cpu_count()}\n")
+
+    results = []
+    for workers in [int(value) for value in args.workers.split(',')]:
+        result = asyncio.run(run_workers(workers, source, args))
+        results.append(result)
+        print(f"TRANSCODE_WORKERS={workers}")
+        print(f"  {'#':<3}{'pass':>5}{'v kbps':>8}{'height':>8}{'out MB':>8}{'queue s':>9}{'wall s':>8}{'cpu s':>7}")
+        for i, job in enumerate(result['jobs']):
+            out = job['output_bytes'] / 1e6 if job['output_bytes'] else 0
+            print(f"  {i:<3}{job['passes']:>5}{job['video_kbps']:>8}{str(job['max_height']):>8}{out:>8.2f}"
+                  f"{job['queue_s']:>9.1f}{job['wall_s']:>8.1f}{job['cpu_s']:>7.1f}")
+        print(f"  الزمن {result['elapsed_s']:.1f} ث، {result['jobs_per_min']:.1f} مهمة/دقيقة، "
+              f"معالج {result['cpu_s']:.1f} ث ({result['cpu_utilisation']:.0%})، "
+              f"{'✅ كل الملفات ضمن الحد' if result['fit'] else '❌ ملفات أكبر من الحد'}\n")
+
+    if args.json:
+        with open(args.json, 'a', encoding='utf-8') as f:
+            for result in results:
+                f.write(json.dumps({'time': time.time(), 'duration': args.duration, 'limit_mb': args.limit_mb,
+                                    'preset': args.preset, **result}) + '\n')
+
+    shutil.rmtree(os.path.dirname(source), ignore_errors=True)
+    return 0 if all(result['fit'] for result in results) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
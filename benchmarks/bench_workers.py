@@ -0,0 +1,182 @@
+"""قياس عزل الواجهة عن المعالجة الثقيلة (CPUWorkers)
+
+يشغل --extractions استخراجاً من صفحات المشاهدة المحفوظة (مسار watch_page، الشبكة موقوفة كما في
+bench_extraction) بتوازي --concurrency. الصفحات المحفوظة مختصرة، لذلك تُكبر إلى --page-kb بسكربتات
+JSON في بداية body (الصفحات الحقيقية 1-2 MB)، وبجانبها "واجهة" تحاكي معالجة تحديثات تلجرام: مؤقت كل 10ms
+يقيس تأخر حلقة الأحداث. ثلاثة أوضاع:
+- inline:    التحليل داخل حلقة الأحداث نفسها (كما كان قبل CPUWorkers)
+- threads:   WORKER_PROCESSES=0، نفس الدوال في خيوط to_thread (تتنافس على GIL مع الحلقة)
+- processes: عمليات منفصلة (--processes، الافتراضي عدد الأنوية)
+
+ويعرض: تأخر الحلقة p50/p99/max، استخراجات/ثانية، وزمن المعالج في العملية الرئيسية مقابل العمليات.
+مع نواة واحدة لا يزيد معدل الاستخراج، لكن تأخر الواجهة يجب أن ينخفض.
+
+الاستخدام:
+    python benchmarks/bench_workers.py
+    python benchmarks/bench_workers.py --extractions 400 --concurrency 16 --processes 4 --json results.jsonl
+"""
+import argparse
+import asyncio
+import json
+import os
+import re
+import resource
+import shutil
+import sys
+import time
+from typing import Dict
+from unittest import mock
+
+from common import summarize
+from bench_download import LoopLagMonitor
+from bench_extraction import PLAYER_DIR, FakeResponse, bot_module, load_fixtures
+
+
+# أسطر منفصلة: regex الطريقة البديلة ("url" ثم "itag" حتى نهاية السطر) تصبح تربيعية على سطر واحد
+# بعدة ميجابايت (دقيقة لكل صفحة بدون تنسيقات)، والمطلوب هنا تكلفة التحليل العادية وليس تلك الحالة
+FILLER = (b'{"webCommandMetadata":{"url":"/feed/trending","webPageType":"WEB_PAGE_TYPE_BROWSE","rootVe":6827},'
+          b'"clickTrackingParams":"CBQQ8JMBGAEiEwjO9eHd2dSJAxVXTXoFHUm0NPE=","icon":{"iconType":"TRENDING"}},\n')
+
+
+def pad_page(body: bytes, size: int) -> bytes:
+    """تكبير الصفحة بسكربت JSON قبل محتواها كما في ytInitialData وبقية سكربتات الصفحة الحقيقية"""
+    missing = size - len(body)
+    if missing <= 0:
+        return body
+    script = b'\n<script>var ytcfgFiller = [\n' + FILLER * (missing // len(FILLER) + 1) + b'];</script>\n'
+    index = body.find(b'<body')
+    index = body.find(b'>', index) + 1 if index >= 0 else 0
+    return body[:index] + script + body[index:]
+
+
+def cpu_seconds(who: int) -> float:
+    usage = resource.getrusage(who)
+    return usage.ru_utime + usage.ru_stime
+
+
+def workers_cpu_seconds(workers) -> float:
+    """زمن المعالج للعمليات الجارية من /proc (بدون زمن بدئها واستيراد البوت قبل القياس)"""
+    total = 0
+    ticks = os.sysconf('SC_CLK_TCK')
+    for pid in list((workers.executor._processes if workers.executor else {}) or {}):
+        try:
+            with open(f'/proc/{pid}/stat') as f:
+                fields = f.read().rsplit(')', 1)[1].split()
+            total += int(fields[11]) + int(fields[12])
+        except (OSError, IndexError, ValueError):
+            pass
+    return total / ticks
+
+
+def fake_get(pages: Dict[str, bytes]):
+    def get(url, *args, **kwargs):
+        player = re.search(r'/s/player/([\w-]+)/', url)
+        if player:
+            path = os.path.join(PLAYER_DIR, player.group(1), 'base.js')
+            if not os.path.exists(path):
+                return FakeResponse(b'', status_code=404)
+            with open(path, 'rb') as f:
+                return FakeResponse(f.read(), headers={'content-type': 'text/javascript'})
+        # معرف الفيديو "<الصفحة>-<رقم>" حتى لا تتكرر نفس القيم
+        video_id = re.search(r'[?&]v=([^&]+)', url).group(1)
+        return FakeResponse(pages[video_id.split('-')[0]])
+    return get
+
+
+async def run_mode(mode: str, pages: Dict[str, bytes], args) -> Dict:
+    shutil.rmtree(bot_module.PLAYER_CACHE_PATH, ignore_errors=True)
+    bot = bot_module.YouTubeTelegramBot()
+    bot.workers = bot_module.CPUWorkers(args.processes if mode == 'processes' else 0)
+    if mode == 'inline':
+        async def inline(func, *call_args):
+            return func(*call_args)
+        bot.workers.run = inline
+    names = sorted(pages)
+    failures = 0
+
+    with mock.patch.object(bot_module.requests, 'get', fake_get(pages)):
+        await bot.workers.start()
+        # تحميل المشغل وتحليله مرة واحدة قبل القياس
+        for name in names:
+            await bot.get_video_info_watch_page(name)
+
+        queue = asyncio.Queue()
+        for i in range(args.extractions):
+            queue.put_nowait(f"{names[i % len(names)]}-{i}")
+
+        async def worker():
+            nonlocal failures
+            while not queue.empty():
+                video_id = queue.get_nowait()
+                info = await bot.get_video_info_watch_page(video_id)
+                if not info or 'error' in info and info['error'] not in ('private', 'unavailable'):
+                    failures += 1
+
+        lag = LoopLagMonitor()
+        parent_before = cpu_seconds(resource.RUSAGE_SELF)
+        workers_before = workers_cpu_seconds(bot.workers)
+        lag.start()
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+        elapsed = time.perf_counter() - start
+        await lag.stop()
+        parent_cpu = cpu_seconds(resource.RUSAGE_SELF) - parent_before
+        children_cpu = workers_cpu_seconds(bot.workers) - workers_before
+        bot.workers.shutdown()
+    samples = summarize(lag.samples)
+    return {
+        'mode': mode,
+        'processes': bot.workers.processes if mode == 'processes' else 0,
+        'lag_ms': {k: round(samples[k] * 1000, 2) for k in ('p50', 'p99', 'max')},
+        'extractions_per_s': round(args.extractions / elapsed, 1),
+        'parent_cpu_s': round(parent_cpu, 2),
+        'workers_cpu_s': round(children_cpu, 2),
+        'failures': failures,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='قياس عزل الواجهة عن المعالجة الثقيلة')
+    parser.add_argument('--extractions', type=int, default=200, help='عدد الاستخراجات لكل وضع')
+    parser.add_argument('--concurrency', type=int, default=8, help='الاستخراجات المتزامنة')
+    parser.add_argument('--page-kb', type=int, default=1500, help='حجم الصفحة بعد التكبير (0 = كما هي)')
+    parser.add_argument('--processes', type=int, default=os.cpu_count() or 1, help='عدد العمليات في وضع processes')
+    parser.add_argument('--mode', choices=['inline', 'threads', 'processes', 'all'], default='all')
+    parser.add_argument('--json', help='إلحاق النتائج بملف JSON lines')
+    parser.add_argument('-v', '--verbose', action='store_true', help='إظهار سجلات البوت')
+    args = parser.parse_args()
+
+    if not args.verbose:
+        bot_module.logging.getLogger().setLevel(bot_module.logging.WARNING)
+        bot_module.logger.disabled = True
+
+    pages = {name: pad_page(body, args.page_kb * 1024) for name, body in load_fixtures().items()}
+    modes = ['inline', 'threads', 'processes'] if args.mode == 'all' else [args.mode]
+    print(f"⚙️ {args.extractions} استخراج × {len(pages)} صفحة ({args.page_kb} KB)، توازي {args.concurrency}، "
+          f"أنوية {os.cpu_count()}\n")
+    print(f"{'mode':<11}{'proc':>5}{'lag p50 ms':>12}{'p99 ms':>9}{'max ms':>9}{'extr/s':>9}"
+          f"{'main cpu s':>12}{'workers cpu s':>15}{'fail':>6}")
+    results = []
+    for mode in modes:
+        result = asyncio.run(run_mode(mode, pages, args))
+        results.append(result)
+        lag = result['lag_ms']
+        print(f"{mode:<11}{result['processes']:>5}{lag['p50']:>12.2f}{lag['p99']:>9.2f}{lag['max']:>9.2f}"
+              f"{result['extractions_per_s']:>9.1f}{result['parent_cpu_s']:>12.2f}{result['workers_cpu_s']:>15.2f}"
+              f"{result['failures']:>6}")
+
+    if args.json:
+        with open(args.json, 'a', encoding='utf-8') as f:
+            for result in results:
+                f.write(json.dumps({'time': time.time(), 'extractions': args.extractions,
+                                    'concurrency': args.concurrency, **result}) + '\n')
+
+    by_mode = {r['mode']: r for r in results}
+    if 'inline' in by_mode and 'processes' in by_mode:
+        print(f"\n⚡ تأخر الواجهة p99: {by_mode['inline']['lag_ms']['p99']:.1f} ms ← "
+              f"{by_mode['processes']['lag_ms']['p99']:.1f} ms")
+    return 1 if any(r['failures'] for r in results) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
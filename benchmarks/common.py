@@ -0,0 +1,118 @@
+"""أدوات مشتركة لسكربتات قياس الأداء"""
+import math
+import os
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+FIXTURES_DIR = os.path.join(BENCH_DIR, 'fixtures')
+
+
+def load_bot():
+    """استيراد bot.py مع مجلدي تحميل وكاش مؤقتين حتى لا تلوث القياسات مجلدات البوت الحقيقية"""
+    os.environ.setdefault('DOWNLOAD_PATH', tempfile.mkdtemp(prefix='ytbot-bench-') + os.sep)
+    os.environ.setdefault('USE_PROXY', 'false')
+    os.environ.setdefault('PLAYER_CACHE_PATH', tempfile.mkdtemp(prefix='ytbot-bench-player-') + os.sep)
+    # سجل المهام في مجلد مؤقت حتى لا تستأنف مهام القياس عند تشغيل البوت الحقيقي
+    os.environ.setdefault('JOB_JOURNAL_PATH', os.path.join(tempfile.mkdtemp(prefix='ytbot-bench-journal-'), 'jobs.sqlite3'))
+    if REPO_DIR not in sys.path:
+        sys.path.insert(0, REPO_DIR)
+    import bot
+    return bot
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """حساب النسبة المئوية (nearest-rank) بدون الاعتماد على numpy"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def summarize(values: List[float]) -> Dict[str, float]:
+    return {
+        'count': len(values),
+        'mean': sum(values) / len(values) if values else 0.0,
+        'p50': percentile(values, 50),
+        'p95': percentile(values, 95),
+        'p99': percentile(values, 99),
+        'max': max(values) if values else 0.0,
+    }
+
+
+class Stopwatch:
+    """مؤقت بسيط يجمع أزمنة المراحل (بالثواني) حسب الاسم"""
+
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = {}
+
+    def add(self, name: str, seconds: float):
+        self.samples.setdefault(name, []).append(seconds)
+
+    def time(self, name: str):
+        watch = self
+
+        class _Ctx:
+            def __enter__(self):
+                self.start = time.perf_counter()
+                return self
+
+            def __exit__(self, *exc):
+                watch.add(name, time.perf_counter() - self.start)
+                return False
+
+        return _Ctx()
+
+
+ROUTED_HOSTS = ('youtube.com', 'youtu.be', 'googlevideo.com', 'youtube-nocookie.com')
+
+
+def route_requests_to(base_url: str):
+    """توجيه كل طلبات requests الموجهة ليوتيوب/googlevideo إلى خادم محلي
+
+    يرجع دالة لإلغاء التوجيه. يعمل على مستوى Session.request حتى يشمل
+    requests.get و requests.post وأي جلسة ينشئها البوت.
+    """
+    import urllib.parse
+
+    import requests
+
+    original = requests.sessions.Session.request
+
+    def routed(session, method, url, *args, **kwargs):
+        parts = urllib.parse.urlsplit(url)
+        host = parts.hostname or ''
+        if any(host == h or host.endswith('.' + h) for h in ROUTED_HOSTS):
+            url = urllib.parse.urlunsplit(urllib.parse.urlsplit(base_url)[:2] + (parts.path, parts.query, ''))
+            kwargs.pop('proxies', None)
+        return original(session, method, url, *args, **kwargs)
+
+    requests.sessions.Session.request = routed
+
+    def restore():
+        requests.sessions.Session.request = original
+
+    return restore
+
+
+def peak_rss_mb() -> float:
+    """أعلى استهلاك للذاكرة المقيمة للعملية الحالية (ميجابايت)"""
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # على لينكس القيمة بالكيلوبايت، وعلى macOS بالبايت
+    return peak / 1024 / (1024 if sys.platform == 'darwin' else 1)
+
+
+def current_rss_mb() -> float:
+    """الذاكرة المقيمة الحالية (ميجابايت) من /proc إن توفر"""
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError):
+        return peak_rss_mb()
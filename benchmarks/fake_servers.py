@@ -0,0 +1,754 @@
+"""خوادم محلية وهمية لاختبارات التحميل: Bot API وخادم وسائط يحاكي youtube/googlevideo
+
+FakeBotAPI يقبل طلبات python-telegram-bot (getMe و sendMessage و editMessageText و
+sendVideo و sendAudio ...) ويرجع ردوداً صالحة مع زمن استجابة اختياري.
+
+FakeMediaServer يقدم:
+- /watch?v=ID      صفحة مشاهدة من fixtures/watch/normal.html بعد استبدال المعرف
+- /youtubei/v1/player  رد JSON المختصر (ytInitialPlayerResponse من نفس الصفحة) بعد استبدال المعرف
+- /iframe_api      ملف صغير يحدد إصدار المشغل الحالي
+- /oembed          رد oEmbed بسيط
+- /playlist?list=  صفحة قائمة تشغيل وهمية (PL<عدد العناصر>) مع صفحات متابعة عبر /youtubei/v1/browse
+- /s/player/...    ملف المشغل من fixtures/player
+- /videoplayback   بايتات الوسائط مع دعم Range وتقييد السرعة لكل اتصال وحقن الأعطال، وخنق الروابط
+                   التي لم يُحوَّل فيها المعامل n كما يفعل googlevideo (n_throttle)
+- /api/manifest/   قوائم HLS (رئيسية ولكل جودة) وملف DASH للمعرفات التي تبدأ بـ live (بث جارٍ) أو rply
+                   (إعادة بث)، ومقاطعها من /videoplayback/id/ID/itag/N/sq/M بنفس تقييد السرعة والأعطال
+- /stats           عدادات الطلبات بصيغة JSON
+
+يمكن تشغيلهما كعملية مستقلة:
+    python benchmarks/fake_servers.py --bot-port 8081 --media-port 8082 --bandwidth 2000000
+"""
+import argparse
+import json
+import os
+import random
+import re
+import socket
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+
+from common import FIXTURES_DIR
+from make_fixtures import N_TRANSFORMS, build_iframe_api, extract_player_response
+
+TEMPLATE_VIDEO_ID = 'dQw4w9WgXcQ'
+PLAYLIST_PAGE_SIZE = 100
+PATTERN_SIZE = 1024 * 1024
+# معرفات البث: live.... بث جارٍ و rply.... إعادة بث؛ الحرف الخامس يحدد القوائم: h = HLS، d = DASH، b = الاثنتان
+MANIFEST_PREFIXES = ('live', 'rply')
+LIVE_FIRST_SEQUENCE = 5000
+# itag: (الارتفاع، معدل البت)
+HLS_VARIANTS = {91: (144, 290_000), 92: (240, 546_000), 93: (360, 1_209_000), 94: (480, 1_568_000),
+                95: (720, 2_969_000), 96: (1080, 5_420_000)}
+DASH_VIDEO = {160: (144, 110_000), 133: (240, 250_000), 134: (360, 650_000), 135: (480, 1_100_000),
+              136: (720, 2_300_000), 137: (1080, 4_300_000)}
+DASH_AUDIO = {140: ('audio/mp4', 'mp4a.40.2', 130_000), 251: ('audio/webm', 'opus', 160_000)}
+SEGMENT_INIT_SIZE = 2048
+
+
+def _pattern_block() -> bytes:
+    """كتلة بايتات ثابتة تتكرر لتكوين محتوى الوسائط (قابلة للتحقق حسب الإزاحة)"""
+    return bytes((i * 31 + 7) & 0xFF for i in range(PATTERN_SIZE))
+
+
+PATTERN = _pattern_block()
+
+
+def media_bytes(start: int, end: int) -> bytes:
+    """البايتات من start حتى end (شامل) للمحتوى الوهمي"""
+    out = bytearray()
+    pos = start
+    while pos <= end:
+        offset = pos % PATTERN_SIZE
+        take = min(PATTERN_SIZE - offset, end - pos + 1)
+        out += PATTERN[offset:offset + take]
+        pos += take
+    return bytes(out)
+
+
+def manifest_bandwidth(itag: int) -> int:
+    if itag in HLS_VARIANTS:
+        return HLS_VARIANTS[itag][1]
+    if itag in DASH_VIDEO:
+        return DASH_VIDEO[itag][1]
+    return DASH_AUDIO.get(itag, ('', '', 128_000))[2]
+
+
+def manifest_segment(itag: int, sequence: str, seconds: float, size_scale: float = 1.0) -> bytes:
+    """محتوى مقطع (أو مقطع التهيئة init) لجودة itag؛ كل مقطع إزاحة مختلفة من النمط حتى يظهر أي خطأ في الترتيب"""
+    size = max(1, int(manifest_bandwidth(itag) / 8 * seconds * size_scale))
+    if sequence == 'init':
+        return media_bytes(itag, itag + SEGMENT_INIT_SIZE - 1)
+    start = int(sequence) * size + itag
+    return media_bytes(start, start + size - 1)
+
+
+class _QuietServer(ThreadingHTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 1024
+
+    def handle_error(self, request, client_address):
+        # انقطاع الاتصال من العميل متوقع أثناء اختبارات الإلغاء وحقن الأعطال
+        pass
+
+
+class _Stats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counters: Dict[str, int] = {}
+
+    def incr(self, key: str, amount: int = 1):
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def snapshot(self) -> Dict[str, int]:
+        with self.lock:
+            return dict(self.counters)
+
+
+class FakeBotAPI:
+    """محاكي Telegram Bot API يكفي لمسارات البوت"""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, latency: float = 0.0, upload_latency: float = 0.0,
+                 upload_bandwidth: int = 0):
+        self.latency = latency
+        self.upload_latency = upload_latency  # تأخير إضافي لطلبات رفع الملفات (send* متعدد الأجزاء)
+        self.upload_bandwidth = upload_bandwidth  # سرعة قراءة جسم الطلب لكل اتصال بالبايت/ثانية (0 = بدون حد)
+        self.stats = _Stats()
+        self._message_ids = iter(range(1000, 10**9))
+        self._ids_lock = threading.Lock()
+        self.server = _QuietServer((host, port), self._handler_class())
+        self.port = self.server.server_address[1]
+        self.thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}/bot"
+
+    @property
+    def base_file_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}/file/bot"
+
+    def next_message_id(self) -> int:
+        with self._ids_lock:
+            return next(self._message_ids)
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, name='fake-bot-api', daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _handler_class(self):
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                if self.path == '/stats':
+                    return self._reply(api.stats.snapshot(), raw=True)
+                self._handle()
+
+            def do_POST(self):
+                self._handle()
+
+            def _params(self) -> Tuple[Dict[str, str], int]:
+                length = int(self.headers.get('Content-Length', 0) or 0)
+                if api.upload_bandwidth and length:
+                    # القراءة على دفعات بالسرعة المحددة كما يستقبل خادم تلجرام الرفع على اتصال واحد
+                    chunks, received, started = [], 0, time.monotonic()
+                    while received < length:
+                        chunk = self.rfile.read(min(65536, length - received))
+                        if not chunk:
+                            break
+                        chunks.append(chunk)
+                        received += len(chunk)
+                        delay = received / api.upload_bandwidth - (time.monotonic() - started)
+                        if delay > 0:
+                            time.sleep(delay)
+                    body = b''.join(chunks)
+                else:
+                    body = self.rfile.read(length) if length else b''
+                content_type = self.headers.get('Content-Type', '')
+                params: Dict[str, str] = {}
+                if 'multipart/form-data' in content_type:
+                    # يكفي استخراج الحقول النصية الصغيرة، محتوى الملف يُقرأ ويُهمل
+                    for name, value in re.findall(rb'name="([^"]+)"\r\n\r\n([^\r]{0,4096})\r\n', body):
+                        params[name.decode()] = value.decode(errors='replace')
+                elif body:
+                    if 'json' in content_type:
+                        params = {k: v if isinstance(v, str) else json.dumps(v) for k, v in json.loads(body).items()}
+                    else:
+                        params = {k: v[0] for k, v in urllib.parse.parse_qs(body.decode()).items()}
+                return params, len(body)
+
+            def _handle(self):
+                method = self.path.rsplit('/', 1)[-1].split('?')[0]
+                params, size = self._params()
+                api.stats.incr(f'method:{method}')
+                api.stats.incr('bytes_in', size)
+                if api.latency:
+                    time.sleep(api.latency)
+                if api.upload_latency and 'multipart/form-data' in self.headers.get('Content-Type', ''):
+                    time.sleep(api.upload_latency)
+                self._reply(self._result(method, params))
+
+            def _message(self, params: Dict[str, str], **extra) -> Dict:
+                try:
+                    chat_id = int(params.get('chat_id', 1))
+                except ValueError:
+                    chat_id = 1
+                message = {
+                    'message_id': int(params.get('message_id') or api.next_message_id()),
+                    'date': int(time.time()),
+                    'chat': {'id': chat_id, 'type': 'private'},
+                    'from': {'id': 42, 'is_bot': True, 'first_name': 'FakeBot', 'username': 'fake_bot'},
+                }
+                if 'text' in params:
+                    message['text'] = params['text']
+                message.update(extra)
+                return message
+
+            def _result(self, method: str, params: Dict[str, str]):
+                file_id = f"FAKE{api.next_message_id()}"
+                if method == 'getMe':
+                    return {'id': 42, 'is_bot': True, 'first_name': 'FakeBot', 'username': 'fake_bot',
+                            'can_join_groups': True, 'can_read_all_group_messages': False,
+                            'supports_inline_queries': True}
+                if method in ('sendMessage', 'editMessageText', 'editMessageReplyMarkup', 'editMessageCaption'):
+                    if 'inline_message_id' in params:
+                        return True
+                    return self._message(params)
+                if method == 'sendVideo':
+                    return self._message(params, video={'file_id': file_id, 'file_unique_id': file_id[4:],
+                                                        'width': 640, 'height': 360, 'duration': 1})
+                if method == 'sendAudio':
+                    return self._message(params, audio={'file_id': file_id, 'file_unique_id': file_id[4:],
+                                                        'duration': 1})
+                if method == 'sendDocument':
+                    return self._message(params, document={'file_id': file_id, 'file_unique_id': file_id[4:]})
+                if method == 'sendMediaGroup':
+                    # رسالة لكل عنصر بنوعه (الملفات المرفوعة تظهر في media كـ attach://)
+                    try:
+                        items = json.loads(params.get('media') or '[{}]')
+                    except ValueError:
+                        items = [{}]
+                    messages = []
+                    for item in items:
+                        file_id = f"FAKE{api.next_message_id()}"
+                        media = {'file_id': file_id, 'file_unique_id': file_id[4:], 'duration': 1}
+                        if item.get('type') == 'audio':
+                            messages.append(self._message(params, audio=media))
+                        else:
+                            messages.append(self._message(params, video={**media, 'width': 640, 'height': 360}))
+                    return messages
+                if method == 'sendPhoto':
+                    return self._message(params, photo=[{'file_id': file_id, 'file_unique_id': file_id[4:],
+                                                         'width': 320, 'height': 180}])
+                # answerCallbackQuery و answerInlineQuery و deleteMessage ...
+                return True
+
+            def _reply(self, result, raw: bool = False):
+                payload = json.dumps(result if raw else {'ok': True, 'result': result}).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        return Handler
+
+
+class FakeMediaServer:
+    """خادم يحاكي صفحات يوتيوب و googlevideo مع تقييد السرعة وحقن الأعطال
+
+    bandwidth: الحد الأقصى لكل اتصال بالبايت/ثانية (0 = بدون حد)
+    size_scale: نسبة حجم المحتوى الفعلي من clen الموجود في الرابط (لتصغير الملفات في الاختبارات)
+    fail_rate: احتمال رد 503 على طلب videoplayback
+    reset_rate: احتمال قطع الاتصال في منتصف التدفق
+    slow_start: تأخير بالثواني قبل إرسال أول بايت
+    n_throttle: سرعة الروابط التي يحمل فيها المعامل n قيمته الأصلية بدون تحويل (0 = بدون خنق)
+    path_delay: {مسار: (احتمال، ثوانٍ)} تأخير بعض الردود على مسار معين (مثل /youtubei/v1/player)
+    path_fail: {مسار: احتمال} رد 503 على مسار معين
+    manifest_segments: عدد المقاطع المتاحة في قوائم البث (نافذة DVR للبث الجاري، وكامل إعادة البث)
+    segment_seconds: مدة كل مقطع بالثواني
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, bandwidth: int = 0,
+                 size_scale: float = 1.0, fail_rate: float = 0.0, reset_rate: float = 0.0,
+                 slow_start: float = 0.0, chunk_size: int = 16 * 1024, seed: Optional[int] = None,
+                 n_throttle: int = 0, path_delay: Optional[Dict[str, Tuple[float, float]]] = None,
+                 path_fail: Optional[Dict[str, float]] = None, manifest_segments: int = 60,
+                 segment_seconds: float = 2.0):
+        self.bandwidth = bandwidth
+        self.manifest_segments = manifest_segments
+        self.segment_seconds = segment_seconds
+        self.path_delay = path_delay or {}
+        self.path_fail = path_fail or {}
+        self.n_throttle = n_throttle
+        self.size_scale = size_scale
+        self.fail_rate = fail_rate
+        self.reset_rate = reset_rate
+        self.slow_start = slow_start
+        self.chunk_size = chunk_size
+        self.random = random.Random(seed)
+        self.stats = _Stats()
+        with open(os.path.join(FIXTURES_DIR, 'watch', 'normal.html'), encoding='utf-8') as f:
+            self.watch_template = f.read()
+        self.player_template = json.dumps(extract_player_response(self.watch_template), ensure_ascii=False)
+        self.server = _QuietServer((host, port), self._handler_class())
+        self.port = self.server.server_address[1]
+        self.thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, name='fake-media', daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def watch_page(self, video_id: str) -> bytes:
+        if video_id.startswith(MANIFEST_PREFIXES):
+            return (
+                f'<html><head><title>Fake stream {video_id} - YouTube</title></head><body><script nonce="x">'
+                f'var ytInitialPlayerResponse = {self.player_response(video_id).decode("utf-8")};</script></body></html>'
+            ).encode('utf-8')
+        return self.watch_template.replace(TEMPLATE_VIDEO_ID, video_id).encode('utf-8')
+
+    def player_response(self, video_id: str) -> bytes:
+        if video_id.startswith(MANIFEST_PREFIXES):
+            return json.dumps(self.manifest_player_response(video_id)).encode('utf-8')
+        return self.player_template.replace(TEMPLATE_VIDEO_ID, video_id).encode('utf-8')
+
+    def manifest_player_response(self, video_id: str) -> Dict:
+        """رد مشغل لبث بدون formats، فقط hlsManifestUrl و/أو dashManifestUrl كما يرجع يوتيوب للبث"""
+        live = video_id.startswith('live')
+        kinds = video_id[4:5]
+        streaming = {'expiresInSeconds': '21540'}
+        if kinds in ('h', 'b'):
+            streaming['hlsManifestUrl'] = \
+                f'https://manifest.googlevideo.com/api/manifest/hls_variant/id/{video_id}/file/index.m3u8'
+        if kinds in ('d', 'b'):
+            streaming['dashManifestUrl'] = f'https://manifest.googlevideo.com/api/manifest/dash/id/{video_id}'
+        return {
+            'playabilityStatus': {'status': 'OK', 'playableInEmbed': True},
+            'streamingData': streaming,
+            'videoDetails': {
+                'videoId': video_id,
+                'title': f'Fake stream {video_id}',
+                'author': 'Fake Channel',
+                'lengthSeconds': '0' if live else str(int(self.manifest_segments * self.segment_seconds)),
+                'viewCount': '1000',
+                'isLiveContent': True,
+                'isLive': live,
+                'thumbnail': {'thumbnails': [{'url': f'https://i.ytimg.com/vi/{video_id}/hqdefault.jpg',
+                                              'width': 480, 'height': 360}]},
+            },
+        }
+
+    def manifest_sequences(self, video_id: str) -> range:
+        first = LIVE_FIRST_SEQUENCE if video_id.startswith('live') else 0
+        return range(first, first + self.manifest_segments)
+
+    @staticmethod
+    def segment_base(video_id: str, itag: int) -> str:
+        return f'https://rr1---sn-fake.googlevideo.com/videoplayback/id/{video_id}/itag/{itag}/'
+
+    def hls_master(self, video_id: str) -> bytes:
+        lines = ['#EXTM3U', '#EXT-X-INDEPENDENT-SEGMENTS']
+        for itag, (height, bandwidth) in HLS_VARIANTS.items():
+            lines.append(f'#EXT-X-STREAM-INF:BANDWIDTH={bandwidth},CODECS="avc1.4d401f,mp4a.40.2",'
+                         f'RESOLUTION={height * 16 // 9}x{height},FRAME-RATE=30')
+            lines.append(f'https://manifest.googlevideo.com/api/manifest/hls_playlist/id/{video_id}'
+                         f'/itag/{itag}/file/index.m3u8')
+        return ('\n'.join(lines) + '\n').encode('utf-8')
+
+    def hls_playlist(self, video_id: str, itag: int) -> bytes:
+        sequences = self.manifest_sequences(video_id)
+        lines = ['#EXTM3U', '#EXT-X-VERSION:3', f'#EXT-X-TARGETDURATION:{int(self.segment_seconds + 0.999)}',
+                 f'#EXT-X-MEDIA-SEQUENCE:{sequences.start}']
+        for sequence in sequences:
+            lines.append(f'#EXTINF:{self.segment_seconds:.3f},')
+            lines.append(f'{self.segment_base(video_id, itag)}sq/{sequence}/file/seg.ts')
+        if not video_id.startswith('live'):
+            lines.append('#EXT-X-ENDLIST')
+        return ('\n'.join(lines) + '\n').encode('utf-8')
+
+    def dash_manifest(self, video_id: str) -> bytes:
+        """MPD بأسلوب يوتيوب: فيديو بـ SegmentList و BaseURL لكل تمثيل، وصوت بـ SegmentTemplate + SegmentTimeline"""
+        live = video_id.startswith('live')
+        sequences = self.manifest_sequences(video_id)
+        seconds = self.segment_seconds
+        total = len(sequences) * seconds
+        if live:
+            header = (f'type="dynamic" availabilityStartTime="1970-01-01T00:00:00Z" '
+                      f'timeShiftBufferDepth="PT{total:g}S" minimumUpdatePeriod="PT{seconds:g}S"')
+        else:
+            header = f'type="static" mediaPresentationDuration="PT{total:g}S"'
+        video = []
+        for itag, (height, bandwidth) in DASH_VIDEO.items():
+            segment_urls = ''.join(f'<SegmentURL media="sq/{sequence}"/>' for sequence in sequences)
+            video.append(
+                f'<Representation id="{itag}" codecs="avc1.4d401f" width="{height * 16 // 9}" height="{height}" '
+                f'bandwidth="{bandwidth}" frameRate="30"><BaseURL>{self.segment_base(video_id, itag)}</BaseURL>'
+                f'<SegmentList><Initialization sourceURL="sq/init"/>{segment_urls}</SegmentList></Representation>'
+            )
+        audio = []
+        timeline = f'<S t="{int(sequences.start * seconds * 1000)}" d="{int(seconds * 1000)}" r="{len(sequences) - 1}"/>'
+        for itag, (mime, codecs, bandwidth) in DASH_AUDIO.items():
+            audio.append(
+                f'<AdaptationSet mimeType="{mime}" contentType="audio">'
+                f'<Representation id="{itag}" codecs="{codecs}" bandwidth="{bandwidth}" audioSamplingRate="48000">'
+                f'<BaseURL>{self.segment_base(video_id, itag)}</BaseURL>'
+                f'<SegmentTemplate timescale="1000" startNumber="{sequences.start}" initialization="sq/init" '
+                f'media="sq/$Number$"><SegmentTimeline>{timeline}</SegmentTimeline></SegmentTemplate>'
+                f'</Representation></AdaptationSet>'
+            )
+        return (
+            f'<?xml version="1.0" encoding="UTF-8"?>\n<MPD xmlns="urn:mpeg:dash:schema:mpd:2011" {header} '
+            f'minBufferTime="PT1.5S" profiles="urn:mpeg:dash:profile:isoff-live:2011"><Period start="PT0S">'
+            f'<AdaptationSet mimeType="video/mp4" contentType="video" subsegmentAlignment="true">{"".join(video)}'
+            f'</AdaptationSet>{"".join(audio)}</Period></MPD>'
+        ).encode('utf-8')
+
+    @staticmethod
+    def playlist_items(playlist_id: str, start: int) -> Dict:
+        """عناصر صفحة من قائمة التشغيل الوهمية؛ عدد العناصر مأخوذ من المعرف (PL25 = 25 فيديو)"""
+        match = re.match(r'PL(\d+)', playlist_id)
+        total = int(match.group(1)) if match else 10
+        items = [
+            {'playlistVideoRenderer': {
+                'videoId': f"p{abs(hash(playlist_id)) % 1000:03d}{i:07d}"[:11],
+                'title': {'runs': [{'text': f'Playlist item {i}'}]},
+                'lengthSeconds': '60',
+                'isPlayable': True,
+            }}
+            for i in range(start, min(total, start + PLAYLIST_PAGE_SIZE))
+        ]
+        if start + PLAYLIST_PAGE_SIZE < total:
+            items.append({'continuationItemRenderer': {'continuationEndpoint': {
+                'continuationCommand': {'token': f'{playlist_id}:{start + PLAYLIST_PAGE_SIZE}'},
+            }}})
+        return items
+
+    def playlist_page(self, playlist_id: str) -> bytes:
+        data = {
+            'metadata': {'playlistMetadataRenderer': {'title': f'Fake playlist {playlist_id}'}},
+            'contents': {'playlistVideoListRenderer': {'contents': self.playlist_items(playlist_id, 0)}},
+        }
+        return (
+            '<html><script>ytcfg.set({"INNERTUBE_CLIENT_VERSION":"2.20241010.00.00"});</script>'
+            '<script nonce="x">var ytInitialData = ' + json.dumps(data) + ';</script></html>'
+        ).encode('utf-8')
+
+    def _handler_class(self):
+        media = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                parsed = urllib.parse.urlsplit(self.path)
+                query = {k: v[0] for k, v in urllib.parse.parse_qs(parsed.query).items()}
+                segment = re.match(r'/videoplayback/id/([\w-]+)/itag/(\d+)/sq/(\w+)', parsed.path)
+                manifest = re.match(r'/api/manifest/(\w+)/id/([\w-]+)(?:/itag/(\d+))?', parsed.path)
+                # مسارات المقاطع والقوائم تختلف لكل طلب؛ تعد تحت اسم واحد
+                stats_path = '/videoplayback/sq' if segment else \
+                    f'/api/manifest/{manifest.group(1)}' if manifest else parsed.path
+                media.stats.incr(f'path:{stats_path}')
+                if not self._inject(stats_path):
+                    return
+                if segment:
+                    return self._segment(int(segment.group(2)), segment.group(3))
+                if manifest:
+                    kind, video_id, itag = manifest.groups()
+                    if kind == 'hls_variant':
+                        return self._send(200, media.hls_master(video_id), 'application/x-mpegURL')
+                    if kind == 'hls_playlist' and itag:
+                        return self._send(200, media.hls_playlist(video_id, int(itag)), 'application/x-mpegURL')
+                    if kind == 'dash':
+                        return self._send(200, media.dash_manifest(video_id), 'application/dash+xml')
+                if parsed.path == '/stats':
+                    return self._send(200, json.dumps(media.stats.snapshot()).encode(), 'application/json')
+                if parsed.path == '/watch':
+                    return self._send(200, media.watch_page(query.get('v', TEMPLATE_VIDEO_ID)),
+                                      'text/html; charset=utf-8')
+                if parsed.path == '/iframe_api':
+                    return self._send(200, build_iframe_api().encode(), 'text/javascript')
+                if parsed.path == '/oembed':
+                    video_id = re.search(r'v=([\w-]{11})', query.get('url', '')) if query.get('url') else None
+                    vid = video_id.group(1) if video_id else TEMPLATE_VIDEO_ID
+                    body = json.dumps({
+                        'title': f'Fake video {vid}', 'author_name': 'Fake Channel',
+                        'thumbnail_url': f'https://i.ytimg.com/vi/{vid}/hqdefault.jpg',
+                    }).encode()
+                    return self._send(200, body, 'application/json')
+                if parsed.path == '/playlist':
+                    return self._send(200, media.playlist_page(query.get('list', 'PL10')), 'text/html; charset=utf-8')
+                if parsed.path.startswith('/s/player/'):
+                    version = parsed.path.split('/')[3]
+                    path = os.path.join(FIXTURES_DIR, 'player', os.path.basename(version), 'base.js')
+                    if not os.path.exists(path):
+                        return self._send(404, b'not found', 'text/plain')
+                    with open(path, 'rb') as f:
+                        return self._send(200, f.read(), 'text/javascript')
+                if parsed.path == '/videoplayback':
+                    return self._media(query)
+                self._send(404, b'not found', 'text/plain')
+
+            def do_POST(self):
+                parsed = urllib.parse.urlsplit(self.path)
+                media.stats.incr(f'path:{parsed.path}')
+                length = int(self.headers.get('Content-Length', 0) or 0)
+                payload = json.loads(self.rfile.read(length) or b'{}')
+                if not self._inject(parsed.path):
+                    return
+                if parsed.path == '/youtubei/v1/player':
+                    video_id = payload.get('videoId') or TEMPLATE_VIDEO_ID
+                    return self._send(200, media.player_response(video_id), 'application/json')
+                if parsed.path == '/youtubei/v1/browse' and payload.get('continuation'):
+                    playlist_id, _, start = payload['continuation'].rpartition(':')
+                    body = {'onResponseReceivedActions': [{'appendContinuationItemsAction': {
+                        'continuationItems': media.playlist_items(playlist_id, int(start)),
+                    }}]}
+                    return self._send(200, json.dumps(body).encode(), 'application/json')
+                self._send(404, b'not found', 'text/plain')
+
+            def _inject(self, path: str) -> bool:
+                """تأخير أو فشل مصطنع حسب path_delay و path_fail؛ False إذا تم الرد بخطأ"""
+                probability, delay = media.path_delay.get(path, (0.0, 0.0))
+                if delay and media.random.random() < probability:
+                    media.stats.incr(f'delayed:{path}')
+                    time.sleep(delay)
+                if media.random.random() < media.path_fail.get(path, 0.0):
+                    media.stats.incr(f'failed:{path}')
+                    self._send(503, b'unavailable', 'text/plain')
+                    return False
+                return True
+
+            def _send(self, status: int, body: bytes, content_type: str):
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _range(self, total: int, query: Dict[str, str]) -> Optional[Tuple[int, int]]:
+                spec = None
+                header = self.headers.get('Range', '')
+                match = re.match(r'bytes=(\d*)-(\d*)', header)
+                if match:
+                    spec = match.groups()
+                elif 'range' in query:
+                    # googlevideo يقبل أيضاً range=a-b في الرابط
+                    spec = tuple(query['range'].split('-', 1))
+                if not spec:
+                    return None
+                start_s, end_s = spec
+                if start_s == '':
+                    length = int(end_s)
+                    return max(0, total - length), total - 1
+                start = int(start_s)
+                end = int(end_s) if end_s else total - 1
+                return start, min(end, total - 1)
+
+            def _segment(self, itag: int, sequence: str):
+                if media.random.random() < media.fail_rate:
+                    media.stats.incr('injected_503')
+                    return self._send(503, b'injected failure', 'text/plain')
+                body = manifest_segment(itag, sequence, media.segment_seconds, media.size_scale)
+                self.send_response(200)
+                self.send_header('Content-Type', 'video/mp2t')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                if media.slow_start:
+                    time.sleep(media.slow_start)
+
+                sent = 0
+                began = time.perf_counter()
+                try:
+                    for pos in range(0, len(body), media.chunk_size):
+                        chunk = body[pos:pos + media.chunk_size]
+                        self.wfile.write(chunk)
+                        sent += len(chunk)
+                        if media.bandwidth:
+                            expected = sent / media.bandwidth
+                            elapsed = time.perf_counter() - began
+                            if expected > elapsed:
+                                time.sleep(expected - elapsed)
+                except (BrokenPipeError, ConnectionResetError):
+                    media.stats.incr('client_aborted')
+                finally:
+                    media.stats.incr('bytes_out', sent)
+                    media.stats.incr('segments_out')
+
+            def _media(self, query: Dict[str, str]):
+                total = max(1, int(int(query.get('clen', 1024 * 1024)) * media.size_scale))
+                if media.random.random() < media.fail_rate:
+                    media.stats.incr('injected_503')
+                    return self._send(503, b'injected failure', 'text/plain')
+
+                byte_range = self._range(total, query)
+                if byte_range and byte_range[0] >= total:
+                    self.send_response(416)
+                    self.send_header('Content-Range', f'bytes */{total}')
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                start, end = byte_range if byte_range else (0, total - 1)
+                length = end - start + 1
+
+                # googlevideo يخنق الروابط التي بقي فيها n بدون تحويل إلى قرابة سرعة التشغيل
+                bandwidth = media.bandwidth
+                if media.n_throttle and 'n' in query:
+                    if query['n'] in N_TRANSFORMS.values():
+                        media.stats.incr('n_transformed')
+                    else:
+                        media.stats.incr('n_throttled')
+                        bandwidth = min(bandwidth or media.n_throttle, media.n_throttle)
+
+                self.send_response(206 if byte_range else 200)
+                self.send_header('Content-Type', 'video/mp4')
+                self.send_header('Accept-Ranges', 'bytes')
+                self.send_header('Content-Length', str(length))
+                if byte_range:
+                    self.send_header('Content-Range', f'bytes {start}-{end}/{total}')
+                self.end_headers()
+
+                if media.slow_start:
+                    time.sleep(media.slow_start)
+
+                reset_at = None
+                if media.random.random() < media.reset_rate:
+                    reset_at = start + int(length * media.random.uniform(0.1, 0.9))
+
+                sent = 0
+                began = time.perf_counter()
+                pos = start
+                try:
+                    while pos <= end:
+                        chunk_end = min(end, pos + media.chunk_size - 1)
+                        if reset_at is not None and chunk_end >= reset_at:
+                            media.stats.incr('injected_reset')
+                            # قطع الاتصال فوراً بدون إغلاق نظيف (RST)
+                            self.connection.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, b'\x01\x00\x00\x00\x00\x00\x00\x00')
+                            self.close_connection = True
+                            self.connection.close()
+                            return
+                        chunk = media_bytes(pos, chunk_end)
+                        self.wfile.write(chunk)
+                        sent += len(chunk)
+                        pos = chunk_end + 1
+                        if bandwidth:
+                            expected = sent / bandwidth
+                            elapsed = time.perf_counter() - began
+                            if expected > elapsed:
+                                time.sleep(expected - elapsed)
+                except (BrokenPipeError, ConnectionResetError):
+                    media.stats.incr('client_aborted')
+                finally:
+                    media.stats.incr('bytes_out', sent)
+
+        return Handler
+
+
+def _serve(ready, options: Dict):
+    """تشغيل الخوادم داخل عملية فرعية وإرسال عناوينها عبر ready"""
+    urls = {}
+    if options.get('with_api', True):
+        api = FakeBotAPI(latency=options.get('api_latency', 0.0),
+                         upload_latency=options.get('upload_latency', 0.0),
+                         upload_bandwidth=options.get('upload_bandwidth', 0)).start()
+        urls.update(api=api.base_url, api_files=api.base_file_url, api_stats=f"http://127.0.0.1:{api.port}/stats")
+    media = FakeMediaServer(
+        bandwidth=options.get('bandwidth', 0),
+        size_scale=options.get('size_scale', 1.0),
+        fail_rate=options.get('fail_rate', 0.0),
+        reset_rate=options.get('reset_rate', 0.0),
+        slow_start=options.get('slow_start', 0.0),
+        seed=options.get('seed'),
+        n_throttle=options.get('n_throttle', 0),
+        path_delay=options.get('path_delay'),
+        path_fail=options.get('path_fail'),
+        manifest_segments=options.get('manifest_segments', 60),
+        segment_seconds=options.get('segment_seconds', 2.0),
+    ).start()
+    urls.update(media=media.base_url, media_stats=f"{media.base_url}/stats")
+    ready.put(urls)
+    while True:
+        time.sleep(3600)
+
+
+def start_in_subprocess(**options):
+    """تشغيل الخوادم الوهمية في عملية منفصلة (حتى لا تدخل في قياسات CPU/RSS للبوت)
+
+    يرجع (urls, process). أوقف العملية بـ process.terminate().
+    """
+    import multiprocessing
+
+    ready = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_serve, args=(ready, options), daemon=True)
+    process.start()
+    return ready.get(timeout=30), process
+
+
+def fetch_stats(url: str) -> Dict:
+    """قراءة عدادات /stats من أحد الخوادم"""
+    import urllib.request
+
+    try:
+        with urllib.request.urlopen(url, timeout=5) as response:
+            return json.loads(response.read())
+    except Exception:
+        return {}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='تشغيل خوادم Bot API والوسائط الوهمية')
+    parser.add_argument('--bot-port', type=int, default=8081)
+    parser.add_argument('--media-port', type=int, default=8082)
+    parser.add_argument('--api-latency', type=float, default=0.0, help='زمن استجابة Bot API بالثواني')
+    parser.add_argument('--bandwidth', type=int, default=0, help='بايت/ثانية لكل اتصال (0 = بدون حد)')
+    parser.add_argument('--size-scale', type=float, default=1.0)
+    parser.add_argument('--fail-rate', type=float, default=0.0)
+    parser.add_argument('--reset-rate', type=float, default=0.0)
+    parser.add_argument('--slow-start', type=float, default=0.0)
+    parser.add_argument('--n-throttle', type=int, default=0, help='سرعة الروابط بدون تحويل n (0 = بدون خنق)')
+    args = parser.parse_args()
+
+    api = FakeBotAPI(port=args.bot_port, latency=args.api_latency).start()
+    media = FakeMediaServer(port=args.media_port, bandwidth=args.bandwidth, size_scale=args.size_scale,
+                            fail_rate=args.fail_rate, reset_rate=args.reset_rate,
+                            slow_start=args.slow_start, n_throttle=args.n_throttle).start()
+    print(f"🤖 Bot API: {api.base_url}")
+    print(f"🎬 Media:   {media.base_url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        api.stop()
+        media.stop()
+
+
+if __name__ == '__main__':
+    main()
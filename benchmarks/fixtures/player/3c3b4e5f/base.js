@@ -0,0 +1,4524 @@
+var _yt_player={};(function(g){var window=this;/*
+ Copyright The Closure Library Authors.
+ SPDX-License-Identifier: Apache-2.0
+*/
+g.k.fmf=function(){var a=this.Ij.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+pGB=function(a){return a?a.iz||null:void 0};
+TXK=function(a){return a?a.nh||null:void 0};
+g.k.B6f=function(){var a=this.HQ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.ojv=function(){var a=this.Ve.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.Ogg=function(){var a=this.D9.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var bb5={hE:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var MCG={sT:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var jEP={jZ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.XTl=function(a,b){this.w6=a;this.Xa=b||0;return this};
+Df4=function(a){return a?a.lL||null:void 0};
+ZdC=function(a){return a?a.f1||null:void 0};
+var BUf={Jj:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+oFH=function(a){return a?a.D$||null:void 0};
+g.nV0=function(a,b){this.Ye=a;this.Xa=b||0;return this};
+g.k.QnT=function(){var a=this.GX.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var vT4={Kc:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.ASb=function(a,b){this.sz=a;this.Xa=b||0;return this};
+g.CNF=function(a,b){this.GU=a;this.Xa=b||0;return this};
+g.Mc0=function(a,b){this.kY=a;this.Xa=b||0;return this};
+var m1M={dx:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var gRz={vs:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.rN9=function(){var a=this.Ps.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.gx7=function(a,b){this.YJ=a;this.Xa=b||0;return this};
+lyQ=function(a){return a?a.CR||null:void 0};
+g.qyt=function(a,b){this.qd=a;this.Xa=b||0;return this};
+jQ7=function(a){return a?a.AM||null:void 0};
+var rxW={C9:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+UYD=function(a){return a?a.Ul||null:void 0};
+g.k.mHc=function(){var a=this.HM.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+JLg=function(a){return a?a.Bb||null:void 0};
+S4h=function(a){return a?a.PM||null:void 0};
+g.nZn=function(a,b){this.Lr=a;this.Xa=b||0;return this};
+g.D1Y=function(a,b){this.rT=a;this.Xa=b||0;return this};
+rhX=function(a){return a?a.H$||null:void 0};
+var nDC={y3:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.JoD=function(a,b){this.BX=a;this.Xa=b||0;return this};
+g.k.jhI=function(){var a=this.t_.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+rWj=function(a){return a?a.kn||null:void 0};
+var Ubj={g3:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.jsu=function(){var a=this.uV.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.D07=function(a,b){this.WX=a;this.Xa=b||0;return this};
+g.Nze=function(a,b){this.cH=a;this.Xa=b||0;return this};
+var cF9={HK:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+tPj=function(a){return a?a.TH||null:void 0};
+var Fjw={TU:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+IEr=function(a){return a?a.cv||null:void 0};
+g.Idn=function(a,b){this.qA=a;this.Xa=b||0;return this};
+g.xk$=function(a,b){this.Pv=a;this.Xa=b||0;return this};
+var y7M={aR:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k._rG=function(){var a=this.i5.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.QkB=function(){var a=this.iX.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.uCJ=function(){var a=this.ey.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var opN={rn:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var n5$={o0:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.vtR=function(){var a=this.tm.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+T_n=function(a){return a?a.YM||null:void 0};
+ZX4=function(a){return a?a.LP||null:void 0};
+g.d_u=function(a,b){this.PG=a;this.Xa=b||0;return this};
+var JVZ={o8:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+zh5=function(a){return a?a.KL||null:void 0};
+n0l=function(a){return a?a.CW||null:void 0};
+g.k.Hr5=function(){var a=this.Hh.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.lzB=function(a,b){this.lI=a;this.Xa=b||0;return this};
+g.nGA=function(a,b){this.iD=a;this.Xa=b||0;return this};
+var v77={AA:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.vyp=function(a,b){this.lR=a;this.Xa=b||0;return this};
+var t0k={kz:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.GzS=function(a,b){this.ez=a;this.Xa=b||0;return this};
+var NEh={YR:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.aW_=function(a,b){this.k7=a;this.Xa=b||0;return this};
+var gog={Rz:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.e8m=function(){var a=this.eJ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.QaL=function(a,b){this.SR=a;this.Xa=b||0;return this};
+g.k.CyO=function(){var a=this.ip.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.zSM=function(){var a=this.QK.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var n1P={AJ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var aPB={NX:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.wsb=function(a,b){this._w=a;this.Xa=b||0;return this};
+g.k.kqd=function(){var a=this.HP.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var myl={XU:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.o1g=function(){var a=this.Li.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+$Il=function(a){return a?a.Sc||null:void 0};
+N4w=function(a){return a?a.V0||null:void 0};
+g.sy_=function(a,b){this.Np=a;this.Xa=b||0;return this};
+eLj=function(a){return a?a.sy||null:void 0};
+var QHW={Ix:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.A2k=function(a,b){this.Zy=a;this.Xa=b||0;return this};
+O6$=function(a){return a?a.jY||null:void 0};
+_Bx=function(a){return a?a.O6||null:void 0};
+g.YJG=function(a,b){this.Wq=a;this.Xa=b||0;return this};
+g.k.N1K=function(){var a=this.bh.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.PO8=function(a,b){this.vI=a;this.Xa=b||0;return this};
+eXx=function(a){return a?a.Bb||null:void 0};
+g.zmV=function(a,b){this.zB=a;this.Xa=b||0;return this};
+YLT=function(a){return a?a.Hp||null:void 0};
+g.k.DhH=function(){var a=this.P9.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.hIZ=function(a,b){this.ZZ=a;this.Xa=b||0;return this};
+g.k.IYQ=function(){var a=this.mV.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.KNn=function(a,b){this.Bq=a;this.Xa=b||0;return this};
+g.Rha=function(a,b){this.ji=a;this.Xa=b||0;return this};
+g.k.woR=function(){var a=this.aM.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.uxf=function(){var a=this.ZA.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.SOo=function(){var a=this.VO.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var _Ea={xs:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+QG6=function(a){return a?a.Po||null:void 0};
+G9b=function(a){return a?a.NL||null:void 0};
+g.fuk=function(a,b){this.SJ=a;this.Xa=b||0;return this};
+g.k.Icv=function(){var a=this.wy.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.jFZ=function(){var a=this.gw.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.SQ1=function(){var a=this.Gs.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.wno=function(a,b){this.ks=a;this.Xa=b||0;return this};
+g.ply=function(a,b){this.ru=a;this.Xa=b||0;return this};
+g.mlF=function(a,b){this.u_=a;this.Xa=b||0;return this};
+MtB=function(a){return a?a.oS||null:void 0};
+g.NXB=function(a,b){this.Yb=a;this.Xa=b||0;return this};
+g.kvE=function(a,b){this.cD=a;this.Xa=b||0;return this};
+g.k.nXi=function(){var a=this.xn.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+XpE=function(a){return a?a.qn||null:void 0};
+g.Fzp=function(a,b){this.FD=a;this.Xa=b||0;return this};
+ZrA=function(a){return a?a.I8||null:void 0};
+var xgK={Dr:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.JGC=function(a,b){this.dC=a;this.Xa=b||0;return this};
+g.p0N=function(a,b){this.sJ=a;this.Xa=b||0;return this};
+g.k.ds_=function(){var a=this.ZV.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.tlu=function(){var a=this.N1.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.RJr=function(a,b){this.tF=a;this.Xa=b||0;return this};
+g.k.vRH=function(){var a=this.rE.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.Xec=function(a,b){this.ea=a;this.Xa=b||0;return this};
+var tBG={I7:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+vTo=function(a){return a?a.sw||null:void 0};
+g.W89=function(a,b){this.u$=a;this.Xa=b||0;return this};
+var MgO={hr:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.bf6=function(){var a=this.pn.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+u45=function(a){return a?a.qL||null:void 0};
+g.k.Drr=function(){var a=this.ua.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.p$Q=function(){var a=this.SS.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.ZpD=function(a,b){this.He=a;this.Xa=b||0;return this};
+g.k.llj=function(){var a=this.n0.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.Km1=function(a,b){this.oU=a;this.Xa=b||0;return this};
+g.bv8=function(a,b){this.El=a;this.Xa=b||0;return this};
+g.jG4=function(a,b){this.bi=a;this.Xa=b||0;return this};
+g.hKB=function(a,b){this.JC=a;this.Xa=b||0;return this};
+g.k.WUf=function(){var a=this.pu.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.CJQ=function(a,b){this.JX=a;this.Xa=b||0;return this};
+g.OFI=function(a,b){this.KZ=a;this.Xa=b||0;return this};
+gpo=function(a){return a?a.GD||null:void 0};
+g.dEs=function(a,b){this.lz=a;this.Xa=b||0;return this};
+g.j5i=function(a,b){this.MZ=a;this.Xa=b||0;return this};
+g.cqs=function(a,b){this.Sj=a;this.Xa=b||0;return this};
+g.k.oVt=function(){var a=this.RU.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k._Ms=function(){var a=this.Nj.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.$bY=function(a,b){this.Ye=a;this.Xa=b||0;return this};
+g.k.ggu=function(){var a=this.nu.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var Oyo={cJ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.g52=function(a,b){this.yU=a;this.Xa=b||0;return this};
+g.x7X=function(a,b){this.ic=a;this.Xa=b||0;return this};
+var pNI={jX:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var mdu={ya:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.KnB=function(a,b){this.q5=a;this.Xa=b||0;return this};
+g.k.PTh=function(){var a=this.f8.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+RIF=function(a){return a?a.jb||null:void 0};
+var RYk={$e:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+NQV=function(a){return a?a.wQ||null:void 0};
+g.k.lAh=function(){var a=this.$7.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var Yue={W3:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+m68=function(a){return a?a.zF||null:void 0};
+g.k.$6j=function(){var a=this.KH.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.Bq2=function(a,b){this.RS=a;this.Xa=b||0;return this};
+g.k.f$5=function(){var a=this.ae.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.LHq=function(a,b){this.jH=a;this.Xa=b||0;return this};
+g.lAl=function(a,b){this._8=a;this.Xa=b||0;return this};
+g.k.Nk4=function(){var a=this.lP.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var BWy={xq:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var OpH={ss:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var pGA={F5:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var ESR={kQ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+W6t=function(a){return a?a.Jn||null:void 0};
+g.k.Amz=function(){var a=this.KV.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+jkg=function(a){return a?a.IO||null:void 0};
+oyp=function(a){return a?a.ks||null:void 0};
+g.RiR=function(a,b){this.fE=a;this.Xa=b||0;return this};
+m19=function(a){return a?a.uG||null:void 0};
+g.k.eUE=function(){var a=this.rk.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.zYe=function(a,b){this.f3=a;this.Xa=b||0;return this};
+g.k.V_M=function(){var a=this.YE.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.Xew=function(a,b){this.f6=a;this.Xa=b||0;return this};
+g.gaj=function(a,b){this.ZG=a;this.Xa=b||0;return this};
+g.k.tzH=function(){var a=this.BB.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.WG7=function(a,b){this.jy=a;this.Xa=b||0;return this};
+g.WlN=function(a,b){this.of=a;this.Xa=b||0;return this};
+g.OsB=function(a,b){this.Ps=a;this.Xa=b||0;return this};
+g.TC4=function(a,b){this.oj=a;this.Xa=b||0;return this};
+var wxv={Wn:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.UMp=function(a,b){this.DW=a;this.Xa=b||0;return this};
+var MfP={Jg:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var Ohf={Qj:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var fuY={gT:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+TmV=function(a){return a?a.iY||null:void 0};
+g.pYA=function(a,b){this.x1=a;this.Xa=b||0;return this};
+g.qPp=function(a,b){this.h_=a;this.Xa=b||0;return this};
+g.rtE=function(a,b){this.wa=a;this.Xa=b||0;return this};
+var bLb={Qo:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.we_=function(a,b){this.cR=a;this.Xa=b||0;return this};
+CUw=function(a){return a?a.TU||null:void 0};
+g.k.nVv=function(){var a=this.u$.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.rA$=function(a,b){this.gF=a;this.Xa=b||0;return this};
+TPI=function(a){return a?a.N7||null:void 0};
+var NHj={y5:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.s0G=function(){var a=this.g3.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.PQo=function(){var a=this.it.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+WAb=function(a){return a?a.Ws||null:void 0};
+g.KUx=function(a,b){this.xz=a;this.Xa=b||0;return this};
+g.k.QE7=function(){var a=this.iJ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.jwC=function(a,b){this.D7=a;this.Xa=b||0;return this};
+g.k.zT3=function(){var a=this.RH.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.mtG=function(){var a=this.lQ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.i_$=function(){var a=this.sr.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+H0A=function(a){return a?a.zH||null:void 0};
+g.Yer=function(a,b){this.JK=a;this.Xa=b||0;return this};
+g.k.Obg=function(){var a=this.Br.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var RVh={mF:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var wCV={PP:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+IOg=function(a){return a?a.BF||null:void 0};
+var nFw={zB:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.GKj=function(a,b){this.jw=a;this.Xa=b||0;return this};
+vDA=function(a){return a?a.jE||null:void 0};
+var w$f={mH:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+LjD=function(a){return a?a.hH||null:void 0};
+g.pNU=function(a,b){this.sd=a;this.Xa=b||0;return this};
+var gQu={Cd:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.HKz=function(a,b){this.fq=a;this.Xa=b||0;return this};
+g.k.XC6=function(){var a=this.o0.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.go1=function(a,b){this.IM=a;this.Xa=b||0;return this};
+g.k.Pz6=function(){var a=this.Fx.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.JnV=function(){var a=this.b8.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.UpF=function(a,b){this.ar=a;this.Xa=b||0;return this};
+g.k.Nk6=function(){var a=this.KV.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.jHC=function(a,b){this.fp=a;this.Xa=b||0;return this};
+WxV=function(a){return a?a.UA||null:void 0};
+g.k.YYB=function(){var a=this.Es.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+_yV=function(a){return a?a.lt||null:void 0};
+g.PR1=function(a,b){this.mo=a;this.Xa=b||0;return this};
+HsB=function(a){return a?a.CA||null:void 0};
+g.k.$Z8=function(){var a=this.qs.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.Cu7=function(){var a=this.ur.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.IkY=function(){var a=this.ln.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.cS_=function(a,b){this.$V=a;this.Xa=b||0;return this};
+g.k.zdC=function(){var a=this.Dl.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.RWd=function(a,b){this.oF=a;this.Xa=b||0;return this};
+g.jsM=function(a,b){this.y9=a;this.Xa=b||0;return this};
+var Cs0={_2:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.N44=function(a,b){this._5=a;this.Xa=b||0;return this};
+g.k.GaX=function(){var a=this.n3.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+w6O=function(a){return a?a.LW||null:void 0};
+var mvE={bU:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.Y2V=function(){var a=this.Kp.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+yoY=function(a){return a?a.kK||null:void 0};
+F4P=function(a){return a?a.el||null:void 0};
+g.k.cGh=function(){var a=this.gR.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.fCY=function(a,b){this.Vr=a;this.Xa=b||0;return this};
+g.n2q=function(a,b){this.NJ=a;this.Xa=b||0;return this};
+var igI={RK:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+wbA=function(a){return a?a.iX||null:void 0};
+g.bD5=function(a,b){this.WX=a;this.Xa=b||0;return this};
+g.k.gJ_=function(){var a=this.a9.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.Je9=function(a,b){this.uC=a;this.Xa=b||0;return this};
+g._2L=function(a,b){this.KE=a;this.Xa=b||0;return this};
+YY4=function(a){return a?a._O||null:void 0};
+g.k.Lyz=function(){var a=this.sK.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+kG8=function(a){return a?a.ne||null:void 0};
+g.k.xr_=function(){var a=this.b7.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+_EF=function(a){return a?a.WV||null:void 0};
+__7=function(a){return a?a.KA||null:void 0};
+Ch1=function(a){return a?a.SY||null:void 0};
+g.k.LzK=function(){var a=this.Ld.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var fw8={Rx:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+oPG=function(a){return a?a.Ct||null:void 0};
+g.k.$66=function(){var a=this.e3.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+T22=function(a){return a?a.Fb||null:void 0};
+g.k.$7J=function(){var a=this.$V.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.lbu=function(){var a=this.Gz.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+idp=function(a){return a?a.GW||null:void 0};
+g.k.jQS=function(){var a=this.Rd.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var w0z={Qx:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var rnH={Zu:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var Lau={Gb:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var CUd={FU:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var OZW={Uo:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.AMx=function(a,b){this.Z0=a;this.Xa=b||0;return this};
+g.k.q_r=function(){var a=this.e1.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+YuC=function(a){return a?a.wL||null:void 0};
+var hKF={$c:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.muf=function(){var a=this.sZ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+$Lz=function(a){return a?a.kg||null:void 0};
+g.Cfc=function(a,b){this.ed=a;this.Xa=b||0;return this};
+Bri=function(a){return a?a.CT||null:void 0};
+g.k.Qhe=function(){var a=this.c$.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.miB=function(a,b){this.SE=a;this.Xa=b||0;return this};
+g.Kio=function(a,b){this.cr=a;this.Xa=b||0;return this};
+var _G3={GO:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var J5T={OZ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+mJq=function(a){return a?a.uA||null:void 0};
+g.D4D=function(a,b){this.Xj=a;this.Xa=b||0;return this};
+g.Q48=function(a,b){this.G6=a;this.Xa=b||0;return this};
+g.k.Xse=function(){var a=this.Q$.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var Ezh={X9:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+Rmf=function(a){return a?a.HF||null:void 0};
+g.k.ADf=function(){var a=this.YF.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.TyD=function(){var a=this.t$.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.pBv=function(a,b){this.Vh=a;this.Xa=b||0;return this};
+inP=function(a){return a?a.wg||null:void 0};
+g.$TI=function(a,b){this.to=a;this.Xa=b||0;return this};
+g.i19=function(a,b){this.st=a;this.Xa=b||0;return this};
+g.dq5=function(a,b){this.NG=a;this.Xa=b||0;return this};
+g.k.Ile=function(){var a=this.Fr.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.xvj=function(){var a=this.G0.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var Zjq={_g:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+T19=function(a){return a?a.jV||null:void 0};
+var I5j={kA:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.HDP=function(){var a=this.Bm.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+D3T=function(a){return a?a.Dw||null:void 0};
+var Rin={GK:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var sym={iu:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.tAP=function(a,b){this.GG=a;this.Xa=b||0;return this};
+g.k.nun=function(){var a=this.ox.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.YGC=function(a,b){this.l6=a;this.Xa=b||0;return this};
+w4Y=function(a){return a?a.br||null:void 0};
+g.v4p=function(a,b){this.RU=a;this.Xa=b||0;return this};
+XkU=function(a){return a?a.VF||null:void 0};
+g.q0Y=function(a,b){this.L2=a;this.Xa=b||0;return this};
+g.k.Hjn=function(){var a=this.of.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.KgM=function(){var a=this.vg.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.WP9=function(a,b){this.Jw=a;this.Xa=b||0;return this};
+g.k.PpW=function(){var a=this.He.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var GXl={L8:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+Zr_=function(a){return a?a.Ym||null:void 0};
+peA=function(a){return a?a.kb||null:void 0};
+g.k.Kk2=function(){var a=this.os.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var SEI={Ka:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var rJi={sc:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.mU7=function(a,b){this.QO=a;this.Xa=b||0;return this};
+g.k.Sc6=function(){var a=this.el.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.oGQ=function(a,b){this.yG=a;this.Xa=b||0;return this};
+var Ncs={Cm:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.oan=function(a,b){this.G8=a;this.Xa=b||0;return this};
+var bBJ={XE:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.Wg1=function(){var a=this.C2.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var r5Z={z0:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var flA={ia:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var $Bl={er:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var S64={i0:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var V2S={oR:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var nsN={uC:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var il1={Uk:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+zFY=function(a){return a?a.L2||null:void 0};
+g.wqT=function(a,b){this.JR=a;this.Xa=b||0;return this};
+g.k._Tm=function(){var a=this.Vj.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+qYJ=function(a){return a?a.Ru||null:void 0};
+g.k.cbL=function(){var a=this.Cx.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var wF1={VH:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.ir4=function(){var a=this.f3.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var MMD={Hq:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.iBD=function(){var a=this.Ug.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.pGf=function(){var a=this.WR.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+u9P=function(a){return a?a.md||null:void 0};
+g.k.Vqv=function(){var a=this.zy.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var $2N={M2:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+Rkz=function(a){return a?a.eD||null:void 0};
+var V8m={Yu:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+cwh=function(a){return a?a.Gh||null:void 0};
+nGx=function(a){return a?a.gj||null:void 0};
+g.bRu=function(a,b){this.Hr=a;this.Xa=b||0;return this};
+g.wcR=function(a,b){this.$l=a;this.Xa=b||0;return this};
+g.L35=function(a,b){this.sI=a;this.Xa=b||0;return this};
+var rpR={zE:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.l_R=function(){var a=this.oM.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+yfV=function(a){return a?a.o8||null:void 0};
+g.Vpr=function(a,b){this.pN=a;this.Xa=b||0;return this};
+g.k.c8L=function(){var a=this.fG.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var yqK={uJ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var pBk={mQ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.T9R=function(a,b){this.e8=a;this.Xa=b||0;return this};
+HJU=function(a){return a?a.GQ||null:void 0};
+g.Xhd=function(a,b){this.jv=a;this.Xa=b||0;return this};
+g.k.UWP=function(){var a=this.X2.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var UWi={Az:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.TNS=function(a,b){this.M9=a;this.Xa=b||0;return this};
+var rXt={lf:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.chQ=function(a,b){this.dz=a;this.Xa=b||0;return this};
+g.k.ijG=function(){var a=this.Yv.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var _hE={Bj:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.rru=function(){var a=this.K1.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+Z8e=function(a){return a?a.Lm||null:void 0};
+TUu=function(a){return a?a.T0||null:void 0};
+g.LtQ=function(a,b){this.UK=a;this.Xa=b||0;return this};
+pac=function(a){return a?a.xa||null:void 0};
+g.KIK=function(a,b){this.vF=a;this.Xa=b||0;return this};
+var zO$={YP:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.QsE=function(){var a=this.w3.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var SU3={db:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.pcc=function(){var a=this.vP.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+cYT=function(a){return a?a.P_||null:void 0};
+yW7=function(a){return a?a.qz||null:void 0};
+g.k.XiX=function(){var a=this.KB.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.m0u=function(){var a=this.Us.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var WgF={IF:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var lV0={w7:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+XSD=function(a){return a?a.MQ||null:void 0};
+var E3A={kJ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.rsk=function(a,b){this.hH=a;this.Xa=b||0;return this};
+g.O5S=function(a,b){this.hw=a;this.Xa=b||0;return this};
+var q_Q={aY:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+$gi=function(a){return a?a.U1||null:void 0};
+g.wJH=function(a,b){this.jB=a;this.Xa=b||0;return this};
+Xqs=function(a){return a?a.EE||null:void 0};
+g.DA_=function(a,b){this.nk=a;this.Xa=b||0;return this};
+g.YD5=function(a,b){this.KQ=a;this.Xa=b||0;return this};
+var jEE={Ok:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var rq8={zw:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.BUt=function(a,b){this.VL=a;this.Xa=b||0;return this};
+IJN=function(a){return a?a.ep||null:void 0};
+g.I3t=function(a,b){this.aI=a;this.Xa=b||0;return this};
+var oM7={by:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.tQc=function(a,b){this.L2=a;this.Xa=b||0;return this};
+g.k.F4m=function(){var a=this.vW.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.f2W=function(){var a=this.$O.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.jRt=function(a,b){this.Xj=a;this.Xa=b||0;return this};
+var BGm={JR:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.kig=function(a,b){this.HV=a;this.Xa=b||0;return this};
+g.k.DyA=function(){var a=this.R8.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var ede={qr:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var WPw={cX:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+XYq=function(a){return a?a.To||null:void 0};
+g.k.IqI=function(){var a=this.n$.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.j$M=function(){var a=this.pU.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.ini=function(a,b){this.V1=a;this.Xa=b||0;return this};
+g.ouA=function(a,b){this.uS=a;this.Xa=b||0;return this};
+Gwx=function(a){return a?a.oH||null:void 0};
+g.k.ynC=function(){var a=this.g9.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.plr=function(){var a=this.p5.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.Mzg=function(a,b){this.Ga=a;this.Xa=b||0;return this};
+g.k.whi=function(){var a=this.wh.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var zNk={R8:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.TQw=function(){var a=this.e0.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var aeK={UX:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var _su={b0:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+HV1=function(a){return a?a.ds||null:void 0};
+g.k.doM=function(){var a=this.Hf.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.W$k=function(a,b){this.vw=a;this.Xa=b||0;return this};
+g.k.vHi=function(){var a=this.h_.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.PA7=function(){var a=this.Dz.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var J3Z={WB:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var HyC={vl:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var Qeq={KJ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+Ytm=function(a){return a?a.IC||null:void 0};
+g.lel=function(a,b){this.nW=a;this.Xa=b||0;return this};
+$Gq=function(a){return a?a.KX||null:void 0};
+jum=function(a){return a?a.XB||null:void 0};
+g.k.iGx=function(){var a=this.fB.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var YcS={G5:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.WgI=function(a,b){this.xF=a;this.Xa=b||0;return this};
+g.BFJ=function(a,b){this.qr=a;this.Xa=b||0;return this};
+g.XE5=function(a,b){this.XP=a;this.Xa=b||0;return this};
+knu=function(a){return a?a.B_||null:void 0};
+g.k.fue=function(){var a=this.mG.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.gfs=function(){var a=this.V9.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var NJG={vz:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.Pjl=function(a,b){this.gw=a;this.Xa=b||0;return this};
+g.hgb=function(a,b){this.aS=a;this.Xa=b||0;return this};
+g.k.L2B=function(){var a=this.B_.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+hxD=function(a){return a?a.pl||null:void 0};
+var RCO={pN:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var VEh={gc:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var HwQ={vD:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.uWG=function(){var a=this.df.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var oBj={Ni:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var VXM={Kt:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+ZaU=function(a){return a?a.yq||null:void 0};
+g.mJs=function(a,b){this.Cc=a;this.Xa=b||0;return this};
+jx7=function(a){return a?a.K_||null:void 0};
+g.buj=function(a,b){this.hq=a;this.Xa=b||0;return this};
+g.k.Y4M=function(){var a=this.Wz.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+p7N=function(a){return a?a._A||null:void 0};
+var re3={CC:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+JBm=function(a){return a?a.$4||null:void 0};
+pkh=function(a){return a?a.ZJ||null:void 0};
+g.k.HD$=function(){var a=this.yh.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+sLE=function(a){return a?a.iN||null:void 0};
+n2g=function(a){return a?a.mc||null:void 0};
+g.NPa=function(a,b){this.zo=a;this.Xa=b||0;return this};
+g.lae=function(a,b){this.w3=a;this.Xa=b||0;return this};
+g.D7H=function(a,b){this.Yn=a;this.Xa=b||0;return this};
+r6b=function(a){return a?a.lX||null:void 0};
+g.EZp=function(a,b){this.Kk=a;this.Xa=b||0;return this};
+var aAG={qR:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.faO=function(){var a=this.IB.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.CJ4=function(){var a=this.kh.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var yoY={UU:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+Xfw=function(a){return a?a.jN||null:void 0};
+g.EF4=function(a,b){this.hp=a;this.Xa=b||0;return this};
+Bjg=function(a){return a?a.k_||null:void 0};
+var PG6={V_:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.ncr=function(a,b){this.Uz=a;this.Xa=b||0;return this};
+g.uo5=function(a,b){this.K8=a;this.Xa=b||0;return this};
+g.yZf=function(a,b){this.wA=a;this.Xa=b||0;return this};
+g.ZqH=function(a,b){this.Z0=a;this.Xa=b||0;return this};
+g.k.EO9=function(){var a=this.ip.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var FHn={x$:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.jX8=function(a,b){this.o7=a;this.Xa=b||0;return this};
+g.k.DtO=function(){var a=this.vF.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.iBA=function(a,b){this.NN=a;this.Xa=b||0;return this};
+g.k.Sz5=function(){var a=this.yR.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+jzb=function(a){return a?a.$n||null:void 0};
+g.tr9=function(a,b){this.aE=a;this.Xa=b||0;return this};
+g.PHN=function(a,b){this.ch=a;this.Xa=b||0;return this};
+jM_=function(a){return a?a.xZ||null:void 0};
+g.gKQ=function(a,b){this.re=a;this.Xa=b||0;return this};
+var kUR={_l:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+GHV=function(a){return a?a.d_||null:void 0};
+g.k.j5O=function(){var a=this.Tk.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+AKX=function(a){return a?a.hw||null:void 0};
+g.k.Wx9=function(){var a=this.mR.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.cv_=function(a,b){this.E9=a;this.Xa=b||0;return this};
+jwE=function(a){return a?a.i9||null:void 0};
+Bfb=function(a){return a?a.HY||null:void 0};
+g.k.E1H=function(){var a=this.Uf.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.Jxf=function(a,b){this.QC=a;this.Xa=b||0;return this};
+cVw=function(a){return a?a.OE||null:void 0};
+KvC=function(a){return a?a.Fw||null:void 0};
+g.k.ZDB=function(){var a=this.ao.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+LbV=function(a){return a?a.EO||null:void 0};
+var k_w={xg:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+boe=function(a){return a?a.b4||null:void 0};
+g.UET=function(a,b){this.Wf=a;this.Xa=b||0;return this};
+XT8=function(a){return a?a.f9||null:void 0};
+g.k.wVV=function(){var a=this.X7.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var Egf={Hz:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.okw=function(a,b){this.Me=a;this.Xa=b||0;return this};
+Chm=function(a){return a?a.v3||null:void 0};
+g.Mp6=function(a,b){this.gZ=a;this.Xa=b||0;return this};
+g.k.Lyd=function(){var a=this.TC.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g0d=function(a){return a?a.N7||null:void 0};
+X2D=function(a){return a?a.Pm||null:void 0};
+var LlK={st:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var SJ_={q_:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.n3m=function(a,b){this.E8=a;this.Xa=b||0;return this};
+var TDC={TR:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.lE9=function(){var a=this.yy.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+AsT=function(a){return a?a.Ol||null:void 0};
+Buz=function(a){return a?a.PU||null:void 0};
+g.k.QPY=function(){var a=this.AS.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+c$C=function(a){return a?a.Kr||null:void 0};
+var icE={Oo:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.q1u=function(a,b){this.OW=a;this.Xa=b||0;return this};
+var wty={q_:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var lBV={UI:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+Ll6=function(a){return a?a.QZ||null:void 0};
+g.k.W2n=function(){var a=this.lt.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var Cln={Mc:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+lH$=function(a){return a?a.eh||null:void 0};
+g.nIW=function(a,b){this.ee=a;this.Xa=b||0;return this};
+var _k4={vx:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.xre=function(a,b){this.kg=a;this.Xa=b||0;return this};
+var BEj={pR:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+Qdc=function(a){return a?a._i||null:void 0};
+g.k.Oc$=function(){var a=this.un.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.m_m=function(){var a=this.fm.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.YVq=function(){var a=this.sm.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.SzT=function(){var a=this.yO.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.Iti=function(){var a=this.cR.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.C$l=function(a,b){this.bU=a;this.Xa=b||0;return this};
+eTg=function(a){return a?a.aV||null:void 0};
+H2Y=function(a){return a?a.tG||null:void 0};
+g.k.QcF=function(){var a=this.wb.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var Ucw={cD:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var Keb={aU:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var c9Z={Kb:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var whX={NP:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var LIc={nN:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.t0J=function(a,b){this.WZ=a;this.Xa=b||0;return this};
+h5q=function(a){return a?a.E4||null:void 0};
+g.k.Icr=function(){var a=this.b_.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var FzQ={I7:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.oc3=function(a,b){this.gJ=a;this.Xa=b||0;return this};
+g.k.X0f=function(){var a=this.Z3.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.RPH=function(a,b){this.Ub=a;this.Xa=b||0;return this};
+HwX=function(a){return a?a.yT||null:void 0};
+var TBb={JI:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.Ec5=function(a,b){this.$e=a;this.Xa=b||0;return this};
+UD9=function(a){return a?a.hX||null:void 0};
+crV=function(a){return a?a.qQ||null:void 0};
+g.BRy=function(a,b){this.Jc=a;this.Xa=b||0;return this};
+XFk=function(a){return a?a.mu||null:void 0};
+g.Ml4=function(a,b){this.IS=a;this.Xa=b||0;return this};
+g.LKm=function(a,b){this.TI=a;this.Xa=b||0;return this};
+y72=function(a){return a?a.rd||null:void 0};
+g.k.q1r=function(){var a=this.HZ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k._Gi=function(){var a=this.ej.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.AID=function(){var a=this.wc.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var _dd={l9:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.uMn=function(a,b){this._n=a;this.Xa=b||0;return this};
+g.DFi=function(a,b){this.bx=a;this.Xa=b||0;return this};
+var Tbj={mO:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+qRN=function(a){return a?a.pw||null:void 0};
+g.JkC=function(a,b){this.i1=a;this.Xa=b||0;return this};
+g.dfZ=function(a,b){this.Gp=a;this.Xa=b||0;return this};
+var V9E={bO:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.NI1=function(a,b){this.hO=a;this.Xa=b||0;return this};
+g.zmr=function(a,b){this.z1=a;this.Xa=b||0;return this};
+var idx={LK:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.$5H=function(){var a=this.p0.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.Bqd=function(a,b){this.cS=a;this.Xa=b||0;return this};
+var vqm={sF:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+LJL=function(a){return a?a.UN||null:void 0};
+g.k.k6Y=function(){var a=this.Sl.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.J3q=function(){var a=this.Bp.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+$o0=function(a){return a?a.z2||null:void 0};
+g.OtP=function(a,b){this.p$=a;this.Xa=b||0;return this};
+g.k.Xrr=function(){var a=this.xp.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.sFV=function(a,b){this.OB=a;this.Xa=b||0;return this};
+YFS=function(a){return a?a._M||null:void 0};
+g.k.E_G=function(){var a=this.XQ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+Br9=function(a){return a?a.SW||null:void 0};
+g.k.fjI=function(){var a=this.gW.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.tcC=function(a,b){this.uC=a;this.Xa=b||0;return this};
+g.qna=function(a,b){this.KN=a;this.Xa=b||0;return this};
+g.k._b4=function(){var a=this.gI.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var zfX={mU:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var m0v={Dh:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+Cr4=function(a){return a?a.wU||null:void 0};
+g.pxE=function(a,b){this.U$=a;this.Xa=b||0;return this};
+var F_h={j5:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+$VZ=function(a){return a?a.QJ||null:void 0};
+var zhj={eP:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.b6T=function(a,b){this.ru=a;this.Xa=b||0;return this};
+lMB=function(a){return a?a.NJ||null:void 0};
+Ctb=function(a){return a?a.ei||null:void 0};
+T9B=function(a){return a?a.z4||null:void 0};
+g.IDi=function(a,b){this.wq=a;this.Xa=b||0;return this};
+hmg=function(a){return a?a.zI||null:void 0};
+wD3=function(a){return a?a.h$||null:void 0};
+Y2K=function(a){return a?a.vx||null:void 0};
+VbS=function(a){return a?a.ed||null:void 0};
+g.gG3=function(a,b){this.Z$=a;this.Xa=b||0;return this};
+g.XmH=function(a,b){this.HU=a;this.Xa=b||0;return this};
+var IsR={YE:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+izt=function(a){return a?a.hy||null:void 0};
+var V5u={Jx:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var nia={Vb:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var tg4={UZ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.xUA=function(){var a=this.M_.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+$aG=function(a){return a?a.pj||null:void 0};
+g.k.$x6=function(){var a=this.Xg.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.T6x=function(a,b){this.vb=a;this.Xa=b||0;return this};
+lai=function(a){return a?a.vG||null:void 0};
+B7o=function(a){return a?a.HV||null:void 0};
+g.k.icy=function(){var a=this.Jb.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g7F=function(a){return a?a.RP||null:void 0};
+var C9y={op:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var sGi={PH:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+yPp=function(a){return a?a.PN||null:void 0};
+RzJ=function(a){return a?a.uM||null:void 0};
+g.YcK=function(a,b){this.SE=a;this.Xa=b||0;return this};
+g.FS7=function(a,b){this.oh=a;this.Xa=b||0;return this};
+var GeY={x$:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.BI4=function(){var a=this.$u.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.llF=function(a,b){this.xD=a;this.Xa=b||0;return this};
+var omd={L5:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.iTg=function(a,b){this.j0=a;this.Xa=b||0;return this};
+UG$=function(a){return a?a.sw||null:void 0};
+DAA=function(a){return a?a.cL||null:void 0};
+g.k.T0f=function(){var a=this.QO.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+vEI=function(a){return a?a.mT||null:void 0};
+g.k.cxn=function(){var a=this.TN.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.czm=function(){var a=this.Ts.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.CyG=function(){var a=this.S4.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+Hf$=function(a){return a?a.qa||null:void 0};
+var Fim={vR:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.Pf5=function(){var a=this.FE.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.qjt=function(){var a=this.aF.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.j04=function(a,b){this.Qf=a;this.Xa=b||0;return this};
+g.UFi=function(a,b){this.WK=a;this.Xa=b||0;return this};
+g.SfW=function(a,b){this.lI=a;this.Xa=b||0;return this};
+var c1$={B3:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.Lbn=function(a,b){this.kv=a;this.Xa=b||0;return this};
+MNM=function(a){return a?a.RX||null:void 0};
+g.qFM=function(a,b){this.mX=a;this.Xa=b||0;return this};
+g.FtJ=function(a,b){this.tI=a;this.Xa=b||0;return this};
+j$s=function(a){return a?a.h0||null:void 0};
+var fJ_={Z9:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var _gM={K8:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.nmt=function(){var a=this.vs.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.IMG=function(a,b){this.Zw=a;this.Xa=b||0;return this};
+g.k.W1E=function(){var a=this.YL.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var L09={x8:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var F$Q={um:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.jQF=function(){var a=this.yi.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.Aor=function(){var a=this.xn.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.s0Y=function(a,b){this.Xu=a;this.Xa=b||0;return this};
+g.xOg=function(a,b){this.YK=a;this.Xa=b||0;return this};
+g.bjz=function(a,b){this.wT=a;this.Xa=b||0;return this};
+g.k.MSs=function(){var a=this.ia.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var cxw={yG:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var bKx={LV:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var Gae={Gx:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var Grl={Eu:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+m_q=function(a){return a?a.Xg||null:void 0};
+var OkB={FG:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.Gn5=function(a,b){this.fl=a;this.Xa=b||0;return this};
+var XMx={WS:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.jXt=function(a,b){this.VU=a;this.Xa=b||0;return this};
+var STm={k1:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+hkZ=function(a){return a?a.sn||null:void 0};
+g.xXo=function(a,b){this.lv=a;this.Xa=b||0;return this};
+var s5C={a7:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.MKZ=function(a,b){this.nN=a;this.Xa=b||0;return this};
+Ani=function(a){return a?a.ih||null:void 0};
+var nUl={h5:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var rIu={n7:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.g$Y=function(a,b){this.Mh=a;this.Xa=b||0;return this};
+g.rOY=function(a,b){this.hE=a;this.Xa=b||0;return this};
+g.k.wGv=function(){var a=this.ej.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var cXD={co:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var aRI={yO:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+WEo=function(a){return a?a.eJ||null:void 0};
+Sg2=function(a){return a?a.aJ||null:void 0};
+hST=function(a){return a?a.DL||null:void 0};
+g.k.wIe=function(){var a=this.Dv.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.b2q=function(a,b){this.VU=a;this.Xa=b||0;return this};
+g.k.Kq$=function(){var a=this.kc.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+P48=function(a){return a?a.mX||null:void 0};
+var Try={wc:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.FFM=function(a,b){this.$R=a;this.Xa=b||0;return this};
+var pz0={ZJ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+R3w=function(a){return a?a.Q7||null:void 0};
+var XXS={FF:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+X0q=function(a){return a?a.YC||null:void 0};
+var goW={n4:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.qtC=function(){var a=this.yH.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var XXX={G7:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.A2b=function(){var a=this.BY.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.WLt=function(a,b){this.nh=a;this.Xa=b||0;return this};
+g.kpH=function(a,b){this.WU=a;this.Xa=b||0;return this};
+R0s=function(a){return a?a.Ph||null:void 0};
+WWs=function(a){return a?a.l0||null:void 0};
+g.k.ZYL=function(){var a=this.R4.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.tVw=function(a,b){this.PT=a;this.Xa=b||0;return this};
+cV9=function(a){return a?a.IK||null:void 0};
+g.k.xrN=function(){var a=this.AL.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var r5t={w$:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.Mu5=function(a,b){this.$r=a;this.Xa=b||0;return this};
+PED=function(a){return a?a.lg||null:void 0};
+var q4W={pL:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var SGG={lg:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.xee=function(a,b){this.XU=a;this.Xa=b||0;return this};
+g.k.xME=function(){var a=this.tf.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var m1y={ra:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.pvO=function(){var a=this.lF.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+ej0=function(a){return a?a.dX||null:void 0};
+g.k.rzq=function(){var a=this.S6.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.wVj=function(){var a=this.Xp.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.M49=function(a,b){this.ed=a;this.Xa=b||0;return this};
+g.k.o$r=function(){var a=this.j5.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.jiX=function(a,b){this.l$=a;this.Xa=b||0;return this};
+var LTL={_O:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var rBW={Sc:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var uSI={cj:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var eF6={ZC:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.HNG=function(){var a=this.U$.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.mov=function(){var a=this.Jj.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+y1p=function(a){return a?a.T4||null:void 0};
+g.k.Ltk=function(){var a=this.fc.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.l2L=function(a,b){this.z1=a;this.Xa=b||0;return this};
+g.f4k=function(a,b){this.JT=a;this.Xa=b||0;return this};
+g.k.Cih=function(){var a=this.xB.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.j$$=function(){var a=this.I_.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.Kwn=function(a,b){this.mx=a;this.Xa=b||0;return this};
+cP7=function(a){return a?a.xm||null:void 0};
+g.k.egI=function(){var a=this.DZ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.IFq=function(a,b){this.Tr=a;this.Xa=b||0;return this};
+var $Z8={zt:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+Ehs=function(a){return a?a.mr||null:void 0};
+var Krc={pj:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+UUD=function(a){return a?a.rS||null:void 0};
+g.k.Z_7=function(){var a=this.pF.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var XS3={Rw:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var HGi={Ls:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+vkS=function(a){return a?a.FW||null:void 0};
+g.k.M2M=function(){var a=this.wD.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var mrm={RT:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.jC_=function(a,b){this.jJ=a;this.Xa=b||0;return this};
+K6X=function(a){return a?a._b||null:void 0};
+BEM=function(a){return a?a.hj||null:void 0};
+var yGG={DM:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.ItX=function(){var a=this.FR.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var h0E={CU:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var Gqr={Eg:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.QNt=function(a,b){this.VK=a;this.Xa=b||0;return this};
+g.k.M8p=function(){var a=this.hQ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.WA3=function(){var a=this.Nf.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var QBY={vY:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var Cyp={iG:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+YsV=function(a){return a?a.Nu||null:void 0};
+var FDe={bN:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+oOb=function(a){return a?a.$J||null:void 0};
+g.k.MWI=function(){var a=this.C4.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.LHp=function(a,b){this.ja=a;this.Xa=b||0;return this};
+var x2K={Ef:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var YEp={zP:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+fgU=function(a){return a?a._0||null:void 0};
+g.k.X$Q=function(){var a=this.l2.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.sWz=function(a,b){this.zS=a;this.Xa=b||0;return this};
+g.k.b80=function(){var a=this.dJ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+PkG=function(a){return a?a.Qi||null:void 0};
+g.k.cTb=function(){var a=this.ls.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+l48=function(a){return a?a.Yy||null:void 0};
+jvU=function(a){return a?a.$K||null:void 0};
+g.k.e6d=function(){var a=this.RM.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.Kk9=function(){var a=this.iD.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.Kp6=function(){var a=this.dZ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.vHp=function(){var a=this.J6.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.saq=function(){var a=this.B2.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.IEE=function(){var a=this.iI.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+HAW=function(a){return a?a.Bh||null:void 0};
+g.Qv6=function(a,b){this.aX=a;this.Xa=b||0;return this};
+AJQ=function(a){return a?a.gB||null:void 0};
+var Dr2={Ik:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var gkA={EY:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var STY={hV:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var dK1={LU:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var ZqG={x$:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+Rof=function(a){return a?a.RC||null:void 0};
+g.k.ddX=function(){var a=this.A2.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var Srl={Al:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var vNi={G1:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var _5A={pw:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var a90={I4:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.Qtu=function(a,b){this.wE=a;this.Xa=b||0;return this};
+JNg=function(a){return a?a.YY||null:void 0};
+g.tvB=function(a,b){this.kE=a;this.Xa=b||0;return this};
+g.k.Btw=function(){var a=this.xK.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+l99=function(a){return a?a._E||null:void 0};
+var LRF={Ff:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+riO=function(a){return a?a.kV||null:void 0};
+g.TZO=function(a,b){this.v5=a;this.Xa=b||0;return this};
+var PCp={av:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+q8g=function(a){return a?a.sR||null:void 0};
+g.k.sr1=function(){var a=this.tF.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.ykV=function(){var a=this.KS.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var dfA={N9:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var wTl={_m:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.r3J=function(a,b){this.hw=a;this.Xa=b||0;return this};
+g.k.wdl=function(){var a=this.TQ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.fZC=function(){var a=this.ey.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.pJm=function(a,b){this.TQ=a;this.Xa=b||0;return this};
+g.ze4=function(a,b){this.vD=a;this.Xa=b||0;return this};
+var Ser={Zi:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var iOQ={za:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+YiM=function(a){return a?a.K8||null:void 0};
+HAt=function(a){return a?a.QK||null:void 0};
+g.k.zj1=function(){var a=this.y$.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.kcD=function(){var a=this.BX.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var Hlk={Tw:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+Lu$=function(a){return a?a.vk||null:void 0};
+MXK=function(a){return a?a.n2||null:void 0};
+hGW=function(a){return a?a.$A||null:void 0};
+var $6Z={Q6:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var aOt={E6:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.uIC=function(a,b){this._N=a;this.Xa=b||0;return this};
+var hI9={$B:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+V4O=function(a){return a?a.h3||null:void 0};
+E1M=function(a){return a?a.Ow||null:void 0};
+g.eil=function(a,b){this.j5=a;this.Xa=b||0;return this};
+var gQf={R$:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.s8_=function(a,b){this.Lg=a;this.Xa=b||0;return this};
+yQv=function(a){return a?a.Vr||null:void 0};
+var kuL={hK:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var gMU={EA:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var cmF={VC:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.E9r=function(a,b){this.aa=a;this.Xa=b||0;return this};
+var Gyb={lQ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+_BJ=function(a){return a?a.Zr||null:void 0};
+var kdP={Sv:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.zQ6=function(){var a=this.a6.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var q1o={KN:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.ciX=function(){var a=this.Tk.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.ppo=function(){var a=this.sX.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.Ftb=function(a,b){this.JF=a;this.Xa=b||0;return this};
+g.trd=function(a,b){this.TM=a;this.Xa=b||0;return this};
+g.kBX=function(a,b){this.UT=a;this.Xa=b||0;return this};
+g.k.GEn=function(){var a=this.JL.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.TdM=function(){var a=this.HT.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+BvI=function(a){return a?a.qt||null:void 0};
+var P9u={DC:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.HPU=function(){var a=this.$Q.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+bb4=function(a){return a?a.Q_||null:void 0};
+g.MNh=function(a,b){this.rT=a;this.Xa=b||0;return this};
+g.bgn=function(a,b){this.IC=a;this.Xa=b||0;return this};
+g.k.u$6=function(){var a=this.wc.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.zge=function(){var a=this.ic.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+RwO=function(a){return a?a.pR||null:void 0};
+var ZD1={gd:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.QhD=function(a,b){this.v9=a;this.Xa=b||0;return this};
+zcO=function(a){return a?a.Xq||null:void 0};
+g.pl_=function(a,b){this.fQ=a;this.Xa=b||0;return this};
+Aa1=function(a){return a?a.q6||null:void 0};
+VY8=function(a){return a?a.gB||null:void 0};
+g.hKn=function(a,b){this.Nk=a;this.Xa=b||0;return this};
+g.C$8=function(a,b){this.fv=a;this.Xa=b||0;return this};
+g.k.L6H=function(){var a=this.I4.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.TXe=function(a,b){this.I3=a;this.Xa=b||0;return this};
+g.k.BDK=function(){var a=this.Mj.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.Gja=function(a,b){this._s=a;this.Xa=b||0;return this};
+g.gpp=function(a,b){this.OY=a;this.Xa=b||0;return this};
+$Fy=function(a){return a?a.Dr||null:void 0};
+g.k._zC=function(){var a=this.IV.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.by5=function(a,b){this.WK=a;this.Xa=b||0;return this};
+var dYJ={sI:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var b1P={M9:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.tee=function(a,b){this.mJ=a;this.Xa=b||0;return this};
+var n82={ct:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var Txi={TK:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.N6V=function(a,b){this.ZH=a;this.Xa=b||0;return this};
+g.Lvv=function(a,b){this.uL=a;this.Xa=b||0;return this};
+var XRf={i4:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.DzW=function(a,b){this.Ec=a;this.Xa=b||0;return this};
+g.QnY=function(a,b){this._w=a;this.Xa=b||0;return this};
+g.nQn=function(a,b){this.bo=a;this.Xa=b||0;return this};
+g.C9D=function(a,b){this.Zt=a;this.Xa=b||0;return this};
+g.k.ATV=function(){var a=this.Wx.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.Qsu=function(){var a=this.nL.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var hAI={I8:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+CKa=function(a){return a?a.i2||null:void 0};
+g.k.joR=function(){var a=this.sa.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.BP4=function(){var a=this.Wf.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.Neu=function(a,b){this.YT=a;this.Xa=b||0;return this};
+u1m=function(a){return a?a.T9||null:void 0};
+g.vUC=function(a,b){this.mD=a;this.Xa=b||0;return this};
+g.k.HXC=function(){var a=this.e9.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.oSf=function(){var a=this.fg.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var lWp={tZ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.K7n=function(){var a=this.uW.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.O5t=function(a,b){this.L$=a;this.Xa=b||0;return this};
+var G8C={n5:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g._3d=function(a,b){this.vQ=a;this.Xa=b||0;return this};
+rV9=function(a){return a?a.ia||null:void 0};
+x5R=function(a){return a?a.s3||null:void 0};
+var jzu={HS:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.t8l=function(a,b){this.bX=a;this.Xa=b||0;return this};
+MPs=function(a){return a?a.lN||null:void 0};
+g.k.Yqv=function(){var a=this.gm.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.Lie=function(a,b){this.GF=a;this.Xa=b||0;return this};
+var Mgx={Sb:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var qpG={jh:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.M0Z=function(){var a=this.di.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var Jm$={K5:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.lGh=function(a,b){this.iR=a;this.Xa=b||0;return this};
+etK=function(a){return a?a.I3||null:void 0};
+var DSP={Y6:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.pBz=function(a,b){this.Sr=a;this.Xa=b||0;return this};
+Q3m=function(a){return a?a.nn||null:void 0};
+var KcO={TA:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.nSK=function(a,b){this.jf=a;this.Xa=b||0;return this};
+g.k.wdC=function(){var a=this.FO.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var Og3={j8:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var ywj={r$:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.ogz=function(a,b){this.rY=a;this.Xa=b||0;return this};
+g.k.Rrw=function(){var a=this.mC.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.ztK=function(a,b){this._$=a;this.Xa=b||0;return this};
+T_O=function(a){return a?a.K_||null:void 0};
+g.K$L=function(a,b){this.Ud=a;this.Xa=b||0;return this};
+pUU=function(a){return a?a.Qn||null:void 0};
+var fhK={Zw:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+SKL=function(a){return a?a.uG||null:void 0};
+g.nkR=function(a,b){this.Hg=a;this.Xa=b||0;return this};
+g.k.wDw=function(){var a=this._3.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var NKM={To:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.pXm=function(a,b){this.bT=a;this.Xa=b||0;return this};
+sZY=function(a){return a?a.lc||null:void 0};
+var VtM={Ms:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.bDT=function(){var a=this.gc.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var OuO={Rr:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var eiS={L7:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var vQd={bH:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.MB_=function(){var a=this.t8.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var s$G={sI:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.CkI=function(){var a=this.Hi.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var OkK={FL:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.qJW=function(a,b){this.f$=a;this.Xa=b||0;return this};
+g.TyG=function(a,b){this.Z9=a;this.Xa=b||0;return this};
+g.nsX=function(a,b){this.SU=a;this.Xa=b||0;return this};
+g.tOt=function(a,b){this.jO=a;this.Xa=b||0;return this};
+g.w6S=function(a,b){this.QR=a;this.Xa=b||0;return this};
+g.Yw_=function(a,b){this.x6=a;this.Xa=b||0;return this};
+g.k.QO2=function(){var a=this.Sy.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var _PD={Eh:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var gY6={o1:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var Sxf={qb:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var er_={F_:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.rP7=function(){var a=this.Pj.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var VXa={Xw:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.MkF=function(a,b){this.NR=a;this.Xa=b||0;return this};
+ah2=function(a){return a?a.Do||null:void 0};
+Ikw=function(a){return a?a.vg||null:void 0};
+var QXF={Ys:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+t0L=function(a){return a?a.Tp||null:void 0};
+var gdo={l4:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.BJG=function(a,b){this.RH=a;this.Xa=b||0;return this};
+g.BZT=function(a,b){this.CS=a;this.Xa=b||0;return this};
+g.k.ha1=function(){var a=this.lN.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.s2z=function(){var a=this.Xy.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+FK3=function(a){return a?a.wE||null:void 0};
+g.YI6=function(a,b){this.SN=a;this.Xa=b||0;return this};
+g.Z2J=function(a,b){this.$W=a;this.Xa=b||0;return this};
+NbW=function(a){return a?a.U2||null:void 0};
+g.sRz=function(a,b){this.UP=a;this.Xa=b||0;return this};
+g.k.kcR=function(){var a=this.Jp.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.VAb=function(){var a=this.Lb.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+B6Y=function(a){return a?a.Cf||null:void 0};
+g.k.A0D=function(){var a=this.K$.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.Id9=function(){var a=this.RI.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.PKF=function(){var a=this.As.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.W9r=function(){var a=this.OK.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var nZr={ps:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.FvM=function(){var a=this._g.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.dng=function(a,b){this.ta=a;this.Xa=b||0;return this};
+var Lbu={zO:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var uFq={JN:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var rSA={Fc:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.Xf5=function(){var a=this.V4.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+vC8=function(a){return a?a.cu||null:void 0};
+g.k.zS1=function(){var a=this.pw.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var ss7={ni:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var MqN={Bl:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.Bf_=function(a,b){this.vr=a;this.Xa=b||0;return this};
+var EEe={yr:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+gZJ=function(a){return a?a.Iz||null:void 0};
+g.Ppa=function(a,b){this.$k=a;this.Xa=b||0;return this};
+var Y2L={ok:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.U2z=function(a,b){this.Ng=a;this.Xa=b||0;return this};
+g.k.flg=function(){var a=this.Xi.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.xT$=function(){var a=this.qK.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+Dum=function(a){return a?a.UL||null:void 0};
+gcO=function(a){return a?a.ZL||null:void 0};
+g.khj=function(a,b){this._F=a;this.Xa=b||0;return this};
+var Odq={rN:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var G1k={bq:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.sP0=function(){var a=this.Hg.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+LhX=function(a){return a?a.Xr||null:void 0};
+g.k.hZW=function(){var a=this.Mh.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.oXY=function(){var a=this.qs.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.HDZ=function(a,b){this.bS=a;this.Xa=b||0;return this};
+var Kgr={MC:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var Wts={e9:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.S0v=function(a,b){this.uE=a;this.Xa=b||0;return this};
+g.k.V5v=function(){var a=this.Ys.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+fKv=function(a){return a?a.qF||null:void 0};
+g.lmK=function(a,b){this.up=a;this.Xa=b||0;return this};
+xsb=function(a){return a?a.BM||null:void 0};
+g.Qhh=function(a,b){this.ke=a;this.Xa=b||0;return this};
+QmI=function(a){return a?a.TQ||null:void 0};
+var qfn={If:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.sfB=function(){var a=this.NN.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.WaD=function(a,b){this.Dz=a;this.Xa=b||0;return this};
+g.k.DGm=function(){var a=this.XY.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+LV8=function(a){return a?a.O5||null:void 0};
+a53=function(a){return a?a.Sy||null:void 0};
+var Ggf={UM:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var fwP={RG:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+COP=function(a){return a?a.tk||null:void 0};
+g.SDx=function(a,b){this.f8=a;this.Xa=b||0;return this};
+var Ht$={Rq:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.mrd=function(a,b){this.d8=a;this.Xa=b||0;return this};
+g.k.o34=function(){var a=this.Gq.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.LCF=function(a,b){this.LR=a;this.Xa=b||0;return this};
+g.SOn=function(a,b){this.kV=a;this.Xa=b||0;return this};
+j39=function(a){return a?a.lp||null:void 0};
+var n$q={az:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+Dfj=function(a){return a?a.F7||null:void 0};
+g.k.zo_=function(){var a=this.$X.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var dTy={hk:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.lL$=function(){var a=this.x5.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.Pfs=function(){var a=this.qu.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+M81=function(a){return a?a.Ql||null:void 0};
+g.k.DSr=function(){var a=this.Vu.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.J32=function(a,b){this.mD=a;this.Xa=b||0;return this};
+var gMD={pO:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var rPO={ue:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var uw2={ha:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.HgA=function(){var a=this.b9.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+l_B=function(a){return a?a.aI||null:void 0};
+var MTX={_L:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.Aa$=function(){var a=this.qf.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.y7f=function(){var a=this.BO.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.MBQ=function(){var a=this.QN.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var YqI={zt:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+CVZ=function(a){return a?a.af||null:void 0};
+g.SLC=function(a,b){this.GG=a;this.Xa=b||0;return this};
+g.ZFW=function(a,b){this.FQ=a;this.Xa=b||0;return this};
+var J5V={J8:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var Pqk={yY:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var _91={FQ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var YSb={lJ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+cr8=function(a){return a?a.ft||null:void 0};
+g.k.yij=function(){var a=this.ko.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+eDw=function(a){return a?a.Y2||null:void 0};
+var Y$w={Ht:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.SVJ=function(a,b){this.PX=a;this.Xa=b||0;return this};
+g.k.gNn=function(){var a=this.jy.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.rPG=function(){var a=this.sB.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.BDE=function(){var a=this.YR.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.VLr=function(a,b){this.Ua=a;this.Xa=b||0;return this};
+g.k.vE7=function(){var a=this.KX.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.QQI=function(){var a=this.jR.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.vqC=function(a,b){this.FF=a;this.Xa=b||0;return this};
+var PeI={YT:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var j1G={O7:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.Ix7=function(a,b){this.ov=a;this.Xa=b||0;return this};
+shS=function(a){return a?a.OV||null:void 0};
+var AST={a6:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.iRb=function(){var a=this.xV.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+MP4=function(a){return a?a.zN||null:void 0};
+u9C=function(a){return a?a.yG||null:void 0};
+var FFs={sE:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var TZg={w0:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+BqB=function(a){return a?a.uM||null:void 0};
+g.szq=function(a,b){this.gT=a;this.Xa=b||0;return this};
+g.sfh=function(a,b){this.DB=a;this.Xa=b||0;return this};
+oEl=function(a){return a?a.vM||null:void 0};
+e_3=function(a){return a?a.zw||null:void 0};
+var x9Y={NW:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.GVL=function(){var a=this.Me.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.x9J=function(){var a=this.pw.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var VNn={_h:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.D_Z=function(a,b){this.em=a;this.Xa=b||0;return this};
+g.k.lqC=function(){var a=this.x7.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var vDt={Ce:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+EUQ=function(a){return a?a.zX||null:void 0};
+g.k.ASj=function(){var a=this.FD.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.C7N=function(){var a=this.SM.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+ag3=function(a){return a?a.j3||null:void 0};
+var a_7={yz:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var J1n={DS:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.Ksl=function(a,b){this.py=a;this.Xa=b||0;return this};
+HD4=function(a){return a?a.hw||null:void 0};
+g.k.DO9=function(){var a=this.pd.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var S8a={Ma:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+IBU=function(a){return a?a.ao||null:void 0};
+g.hKx=function(a,b){this.$h=a;this.Xa=b||0;return this};
+g.LdH=function(a,b){this.nz=a;this.Xa=b||0;return this};
+var zI5={wm:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.F6j=function(a,b){this.xH=a;this.Xa=b||0;return this};
+g.EtT=function(a,b){this.up=a;this.Xa=b||0;return this};
+g._Yx=function(a,b){this.Ub=a;this.Xa=b||0;return this};
+g.k.hCq=function(){var a=this.cU.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+K6$=function(a){return a?a.r3||null:void 0};
+g.k.DLa=function(){var a=this._z.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.ztU=function(a,b){this.yc=a;this.Xa=b||0;return this};
+g.k.LIR=function(){var a=this.q7.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+L_r=function(a){return a?a._p||null:void 0};
+krs=function(a){return a?a.zG||null:void 0};
+var drx={qV:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.hIY=function(){var a=this.V9.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.y89=function(a,b){this.z9=a;this.Xa=b||0;return this};
+g.jn_=function(a,b){this.aM=a;this.Xa=b||0;return this};
+hSU=function(a){return a?a.T1||null:void 0};
+var rAh={X_:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+hlj=function(a){return a?a.ws||null:void 0};
+g.aCZ=function(a,b){this.JF=a;this.Xa=b||0;return this};
+FiC=function(a){return a?a.ZB||null:void 0};
+var oDs={Yn:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.yKc=function(a,b){this.Sr=a;this.Xa=b||0;return this};
+g.k.Enf=function(){var a=this.VO.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.ivN=function(){var a=this.sr.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.MbV=function(){var a=this.z0.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var fue={Zs:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.vg$=function(){var a=this.FF.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+tZf=function(a){return a?a.Rr||null:void 0};
+XEd=function(a){return a?a.WJ||null:void 0};
+fOM=function(a){return a?a.yQ||null:void 0};
+olS=function(a){return a?a.lQ||null:void 0};
+g.k.S26=function(){var a=this.WM.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.L0q=function(a,b){this.Z9=a;this.Xa=b||0;return this};
+GWT=function(a){return a?a.ZQ||null:void 0};
+FF5=function(a){return a?a.Lm||null:void 0};
+yeU=function(a){return a?a.hY||null:void 0};
+g.k.ao_=function(){var a=this.MY.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+jCG=function(a){return a?a.jB||null:void 0};
+k1S=function(a){return a?a.CX||null:void 0};
+g.k.sps=function(){var a=this.PF.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.Vh0=function(a,b){this.J3=a;this.Xa=b||0;return this};
+Sr9=function(a){return a?a.aY||null:void 0};
+var TUw={DY:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var dLB={gU:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+$oB=function(a){return a?a.cM||null:void 0};
+g.Er$=function(a,b){this.rr=a;this.Xa=b||0;return this};
+fwa=function(a){return a?a.BQ||null:void 0};
+y7g=function(a){return a?a.Xc||null:void 0};
+kDk=function(a){return a?a.$g||null:void 0};
+var YIO={SS:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.ehc=function(){var a=this.UG.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.vSP=function(a,b){this.xI=a;this.Xa=b||0;return this};
+g.Meo=function(a,b){this.kK=a;this.Xa=b||0;return this};
+var ZT0={KU:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+fMn=function(a){return a?a.Ss||null:void 0};
+var bRE={H3:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.TPZ=function(a,b){this.Na=a;this.Xa=b||0;return this};
+var IkB={sn:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.EWF=function(a,b){this.l7=a;this.Xa=b||0;return this};
+g.k.KWf=function(){var a=this.GC.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.pGJ=function(){var a=this.Us.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.qPb=function(){var a=this.EM.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+peN=function(a){return a?a.Et||null:void 0};
+g.k.muJ=function(){var a=this.Jl.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var YjZ={SW:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k._QG=function(){var a=this.c7.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+lsa=function(a){return a?a.oO||null:void 0};
+O_t=function(a){return a?a.Tm||null:void 0};
+g.k.zBU=function(){var a=this.GQ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var GRs={Fz:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.Wz5=function(){var a=this.n9.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.taa=function(a,b){this.Fk=a;this.Xa=b||0;return this};
+var cqE={C_:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+sML=function(a){return a?a.yh||null:void 0};
+var UEu={NA:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.cG$=function(){var a=this.yg.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.aqh=function(){var a=this.k1.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.gN1=function(){var a=this.rV.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.e0t=function(){var a=this.wp.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.HLd=function(){var a=this.DA.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.THI=function(a,b){this.Ml=a;this.Xa=b||0;return this};
+LH8=function(a){return a?a.So||null:void 0};
+g.k.L6t=function(){var a=this.Nc.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+Wka=function(a){return a?a.BJ||null:void 0};
+$1H=function(a){return a?a.fS||null:void 0};
+g.k.I$E=function(){var a=this.VJ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var ycR={ZL:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var oxE={hB:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.TuM=function(){var a=this.rR.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var Mjl={M4:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.onA=function(){var a=this.zD.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.uKl=function(a,b){this.Hx=a;this.Xa=b||0;return this};
+OaE=function(a){return a?a.LY||null:void 0};
+g.k.$51=function(){var a=this.fY.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.HJT=function(a,b){this.NE=a;this.Xa=b||0;return this};
+g.c7B=function(a,b){this.$c=a;this.Xa=b||0;return this};
+g.k.Qor=function(){var a=this._i.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+NKD=function(a){return a?a.VN||null:void 0};
+Fhq=function(a){return a?a.EQ||null:void 0};
+g.k.oqK=function(){var a=this._l.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+eTb=function(a){return a?a.FN||null:void 0};
+var GKr={vU:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.pzT=function(a,b){this.Md=a;this.Xa=b||0;return this};
+pjx=function(a){return a?a.ZL||null:void 0};
+g.k.SpK=function(){var a=this.HN.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.HhT=function(a,b){this.j4=a;this.Xa=b||0;return this};
+g.k.Rwc=function(){var a=this.A5.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+hwy=function(a){return a?a.Ra||null:void 0};
+g.mDy=function(a,b){this.GQ=a;this.Xa=b||0;return this};
+var Gsa={HH:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+s1N=function(a){return a?a.bf||null:void 0};
+var rig={Rb:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var Aa4={HR:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.yc6=function(a,b){this.EN=a;this.Xa=b||0;return this};
+GyW=function(a){return a?a.vt||null:void 0};
+var X32={KI:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.dl9=function(a,b){this.lD=a;this.Xa=b||0;return this};
+Bux=function(a){return a?a.wP||null:void 0};
+g.DvV=function(a,b){this.Tf=a;this.Xa=b||0;return this};
+EiJ=function(a){return a?a.dB||null:void 0};
+uIS=function(a){return a?a.YQ||null:void 0};
+var B6j={D1:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var aEf={YP:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.uRk=function(a,b){this.KP=a;this.Xa=b||0;return this};
+jMz=function(a){return a?a.Vd||null:void 0};
+g.Gd1=function(a,b){this.oY=a;this.Xa=b||0;return this};
+g.k.Fgu=function(){var a=this.dJ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.Jsg=function(a,b){this.F8=a;this.Xa=b||0;return this};
+g.fw9=function(a,b){this.a5=a;this.Xa=b||0;return this};
+g.Chx=function(a,b){this.vH=a;this.Xa=b||0;return this};
+g.k.qip=function(){var a=this.kS.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var tUy={n5:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var YQa={sz:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var Sre={FQ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.Mzw=function(a,b){this.Wv=a;this.Xa=b||0;return this};
+wnw=function(a){return a?a.NE||null:void 0};
+var ba2={aU:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.pdl=function(){var a=this.V5.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+hv9=function(a){return a?a._j||null:void 0};
+var aDv={W1:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.Ud$=function(a,b){this.y_=a;this.Xa=b||0;return this};
+g.xUP=function(a,b){this.ly=a;this.Xa=b||0;return this};
+gyJ=function(a){return a?a.js||null:void 0};
+g.Qla=function(a,b){this.jc=a;this.Xa=b||0;return this};
+var FAp={KF:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+EBc=function(a){return a?a.eu||null:void 0};
+J7b=function(a){return a?a.I5||null:void 0};
+g.gBK=function(a,b){this.TP=a;this.Xa=b||0;return this};
+g.gM7=function(a,b){this.UA=a;this.Xa=b||0;return this};
+xa6=function(a){return a?a.HP||null:void 0};
+var fqa={dO:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.tV_=function(a,b){this.vW=a;this.Xa=b||0;return this};
+g.k.UqS=function(){var a=this.X$.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+js9=function(a){return a?a.iA||null:void 0};
+g.k.w_m=function(){var a=this.I$.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.IgZ=function(){var a=this.GL.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+pXr=function(a){return a?a.lH||null:void 0};
+g.i9G=function(a,b){this.$w=a;this.Xa=b||0;return this};
+g.k._go=function(){var a=this.lw.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.f3A=function(a,b){this.eU=a;this.Xa=b||0;return this};
+g.k.dHn=function(){var a=this.Us.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.Mu6=function(){var a=this.Tw.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.Xte=function(a,b){this.W$=a;this.Xa=b||0;return this};
+g.yTo=function(a,b){this.Gy=a;this.Xa=b||0;return this};
+FVs=function(a){return a?a.p3||null:void 0};
+g.k.AZ7=function(){var a=this.wa.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.Ugj=function(){var a=this.MP.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.g1j=function(){var a=this.Js.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.d5U=function(){var a=this.nA.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.dBO=function(){var a=this.cJ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var RW7={r8:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var Zri={aW:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+Jlg=function(a){return a?a.U$||null:void 0};
+g.U3r=function(a,b){this.LG=a;this.Xa=b||0;return this};
+g.k.x4X=function(){var a=this.uH.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.wIK=function(a,b){this.lk=a;this.Xa=b||0;return this};
+g.k.eNr=function(){var a=this.xK.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+tYb=function(a){return a?a.cT||null:void 0};
+g.SWQ=function(a,b){this.O$=a;this.Xa=b||0;return this};
+var aR8={dT:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+AD8=function(a){return a?a.jX||null:void 0};
+g.k.KQv=function(){var a=this.JG.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var mdE={Uc:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.X63=function(){var a=this.eU.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.zg4=function(a,b){this.fB=a;this.Xa=b||0;return this};
+g.kd1=function(a,b){this.tT=a;this.Xa=b||0;return this};
+var tjy={wc:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.LME=function(a,b){this.YD=a;this.Xa=b||0;return this};
+var Iuc={O5:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+XRN=function(a){return a?a.UN||null:void 0};
+var oK7={vi:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+V85=function(a){return a?a.bg||null:void 0};
+g.$i5=function(a,b){this.TD=a;this.Xa=b||0;return this};
+OkU=function(a){return a?a.x1||null:void 0};
+g.k.ydX=function(){var a=this.Bx.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var Wfp={ds:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.uH$=function(){var a=this.$n.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.B2d=function(a,b){this._y=a;this.Xa=b||0;return this};
+g.e3w=function(a,b){this.w4=a;this.Xa=b||0;return this};
+g.e6w=function(a,b){this.Ur=a;this.Xa=b||0;return this};
+var sKb={ur:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.yNH=function(a,b){this.B7=a;this.Xa=b||0;return this};
+g.vNG=function(a,b){this.LS=a;this.Xa=b||0;return this};
+var Dz7={Hw:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var Ftq={Ki:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.qFZ=function(a,b){this.nG=a;this.Xa=b||0;return this};
+g.wmC=function(a,b){this.a$=a;this.Xa=b||0;return this};
+var HbN={GO:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var _Ns={cQ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.FsM=function(a,b){this.MF=a;this.Xa=b||0;return this};
+g.k.qyZ=function(){var a=this._q.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.X9j=function(){var a=this.Ag.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.XL1=function(){var a=this.Ke.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.d7P=function(){var a=this.nv.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var wZ2={WB:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.QYA=function(a,b){this.ar=a;this.Xa=b||0;return this};
+g.aEe=function(a,b){this.Ib=a;this.Xa=b||0;return this};
+g.k.yG8=function(){var a=this.Ab.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+N94=function(a){return a?a.zU||null:void 0};
+z7K=function(a){return a?a.E_||null:void 0};
+yKo=function(a){return a?a.zL||null:void 0};
+g.av7=function(a,b){this.nL=a;this.Xa=b||0;return this};
+g.k.LNZ=function(){var a=this.wP.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.WfN=function(a,b){this.Wa=a;this.Xa=b||0;return this};
+we4=function(a){return a?a.GZ||null:void 0};
+var i33={sG:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.Wmb=function(a,b){this.gS=a;this.Xa=b||0;return this};
+ygg=function(a){return a?a.pl||null:void 0};
+g.hlE=function(a,b){this.rI=a;this.Xa=b||0;return this};
+g.FP0=function(a,b){this.Jy=a;this.Xa=b||0;return this};
+var biD={ko:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.BDX=function(a,b){this.rV=a;this.Xa=b||0;return this};
+var fnR={N3:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.IEe=function(){var a=this.JD.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var R9j={F2:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.dDS=function(){var a=this.ZG.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.J0x=function(a,b){this.d1=a;this.Xa=b||0;return this};
+var YXa={ng:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.l8s=function(){var a=this.lA.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.F93=function(){var a=this.Mt.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var BEj={hQ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.mA8=function(a,b){this.vA=a;this.Xa=b||0;return this};
+g.k.PoY=function(){var a=this.dV.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.Ine=function(a,b){this.Yw=a;this.Xa=b||0;return this};
+g._j3=function(a,b){this.Is=a;this.Xa=b||0;return this};
+g.xOz=function(a,b){this.oH=a;this.Xa=b||0;return this};
+g.dCv=function(a,b){this.Gn=a;this.Xa=b||0;return this};
+g.LdG=function(a,b){this.PT=a;this.Xa=b||0;return this};
+var ruT={AG:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.Sjc=function(a,b){this.lh=a;this.Xa=b||0;return this};
+fo4=function(a){return a?a.mG||null:void 0};
+Q8O=function(a){return a?a.Rn||null:void 0};
+g.k.XGv=function(){var a=this.Fv.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var O9S={O5:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.itT=function(a,b){this.$h=a;this.Xa=b||0;return this};
+g.k.GkI=function(){var a=this.Vc.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.c4H=function(){var a=this.ej.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.G4M=function(){var a=this.hi.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var vro={$q:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.KoW=function(){var a=this.vi.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.sWX=function(){var a=this.Wi.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+HdZ=function(a){return a?a.Mv||null:void 0};
+mnF=function(a){return a?a.Oe||null:void 0};
+var QJX={bW:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.IIa=function(a,b){this.f5=a;this.Xa=b||0;return this};
+g.RQX=function(a,b){this.jS=a;this.Xa=b||0;return this};
+g.NKF=function(a,b){this.oT=a;this.Xa=b||0;return this};
+var jgn={ou:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+GlM=function(a){return a?a.on||null:void 0};
+g.k.hiO=function(){var a=this.eA.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+oGW=function(a){return a?a.H9||null:void 0};
+mcE=function(a){return a?a.zD||null:void 0};
+var wbw={fp:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var Rog={b4:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+yWf=function(a){return a?a.dk||null:void 0};
+var eWR={cF:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.Dko=function(a,b){this.We=a;this.Xa=b||0;return this};
+g.zwG=function(a,b){this.J_=a;this.Xa=b||0;return this};
+g.k.aEE=function(){var a=this.n8.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+FKs=function(a){return a?a.wM||null:void 0};
+Oau=function(a){return a?a.cf||null:void 0};
+g.kZz=function(a,b){this.ZT=a;this.Xa=b||0;return this};
+var AWo={pm:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.xFV=function(a,b){this.YV=a;this.Xa=b||0;return this};
+g.k.CCu=function(){var a=this.YS.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+ZWT=function(a){return a?a.Oj||null:void 0};
+var oWl={Ad:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var JH3={Be:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.QCU=function(){var a=this.Lv.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.EJC=function(){var a=this.D3.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.bxW=function(){var a=this.Fb.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var gQm={CL:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.W9S=function(){var a=this.RZ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var a4A={vB:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var CGf={a$:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.TVS=function(a,b){this.Dv=a;this.Xa=b||0;return this};
+g.P_6=function(a,b){this.s_=a;this.Xa=b||0;return this};
+HsX=function(a){return a?a.z8||null:void 0};
+var lZF={Ak:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.cIX=function(a,b){this.K2=a;this.Xa=b||0;return this};
+g._wW=function(a,b){this.xL=a;this.Xa=b||0;return this};
+var AlE={FP:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.WFo=function(a,b){this.VT=a;this.Xa=b||0;return this};
+g.k.mPH=function(){var a=this.hT.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+_5q=function(a){return a?a.F_||null:void 0};
+pwE=function(a){return a?a.un||null:void 0};
+g.k.AIj=function(){var a=this.vD.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.gxJ=function(){var a=this.Hq.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.aPG=function(a,b){this.Hd=a;this.Xa=b||0;return this};
+var fbk={fv:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.cjg=function(a,b){this.Vm=a;this.Xa=b||0;return this};
+var i_n={PH:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.yAQ=function(a,b){this.Z_=a;this.Xa=b||0;return this};
+blt=function(a){return a?a.ie||null:void 0};
+g.J5n=function(a,b){this.mD=a;this.Xa=b||0;return this};
+g.k.Dcm=function(){var a=this.Zn.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.Bof=function(){var a=this.S5.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.mrk=function(a,b){this.l4=a;this.Xa=b||0;return this};
+RSU=function(a){return a?a.pK||null:void 0};
+ECf=function(a){return a?a.Zh||null:void 0};
+var EX9={zp:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var ejq={BN:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var vGr={Z8:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+L_y=function(a){return a?a.qU||null:void 0};
+var Po$={pH:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.PR8=function(a,b){this.OZ=a;this.Xa=b||0;return this};
+g.boh=function(a,b){this.j7=a;this.Xa=b||0;return this};
+g.k.Nl6=function(){var a=this.N0.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+Csb=function(a){return a?a.Ef||null:void 0};
+var CZY={he:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.drN=function(){var a=this.X6.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var Df4={uv:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.fh2=function(){var a=this.lM.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+ZeO=function(a){return a?a.z7||null:void 0};
+g.k.YzI=function(){var a=this.FB.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.cAs=function(a,b){this.p7=a;this.Xa=b||0;return this};
+g.k.OTp=function(){var a=this.e6.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.Y3V=function(a,b){this.oR=a;this.Xa=b||0;return this};
+var lji={QM:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.CEQ=function(a,b){this.yf=a;this.Xa=b||0;return this};
+var bMD={kz:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.Mqj=function(a,b){this.mp=a;this.Xa=b||0;return this};
+var dqI={oh:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var EqX={Bv:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+aTk=function(a){return a?a.pY||null:void 0};
+g.k.x9g=function(){var a=this.or.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+Kh0=function(a){return a?a._h||null:void 0};
+AqB=function(a){return a?a.Pk||null:void 0};
+var vJU={mi:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var Xy={Kx:function(a,b){a.splice(0,b)},
+w7:function(a){a.reverse()},
+Pq:function(a,b){var c=a[0];a[0]=a[b%a.length];a[b%a.length]=c}};
+g.jAg=function(a,b){this.eO=a;this.Xa=b||0;return this};
+g.dzh=function(a,b){this.cB=a;this.Xa=b||0;return this};
+g.k.tbX=function(){var a=this.lq.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var zEM={Zt:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.ujo=function(){var a=this.Nc.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+Fq$=function(a){return a?a.SV||null:void 0};
+$HN=function(a){return a?a.ur||null:void 0};
+var wiV={vG:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.VZ3=function(a,b){this.rA=a;this.Xa=b||0;return this};
+g.tom=function(a,b){this.mK=a;this.Xa=b||0;return this};
+X$U=function(a){return a?a.rJ||null:void 0};
+var a90={$A:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+QVf=function(a){return a?a.Qi||null:void 0};
+g.Fm0=function(a,b){this.eG=a;this.Xa=b||0;return this};
+var jnJ={By:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.cTh=function(){var a=this.wt.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+GTC=function(a){return a?a.UB||null:void 0};
+g.WQW=function(a,b){this.lg=a;this.Xa=b||0;return this};
+g.k.dwo=function(){var a=this.LR.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var kQv={Wh:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.t_k=function(a,b){this.C4=a;this.Xa=b||0;return this};
+g.k.tCh=function(){var a=this.DC.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+mvS=function(a){return a?a.qz||null:void 0};
+var p5z={a9:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+P6b=function(a){return a?a.pR||null:void 0};
+var $Tb={vr:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+fVT=function(a){return a?a.LL||null:void 0};
+g.L2e=function(a,b){this.Xo=a;this.Xa=b||0;return this};
+g.k.mz4=function(){var a=this.RT.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+PtB=function(a){return a?a.TW||null:void 0};
+g.Kc3=function(a,b){this.ZB=a;this.Xa=b||0;return this};
+var cO0={UT:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.e9E=function(a,b){this.hi=a;this.Xa=b||0;return this};
+g.fxi=function(a,b){this.x5=a;this.Xa=b||0;return this};
+a9B=function(a){return a?a.wS||null:void 0};
+XSr=function(a){return a?a.lm||null:void 0};
+nzw=function(a){return a?a.jh||null:void 0};
+g.k.PZ7=function(){var a=this.MA.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.YfY=function(a,b){this.qp=a;this.Xa=b||0;return this};
+g.k.lCs=function(){var a=this.Zc.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+$fB=function(a){return a?a.lS||null:void 0};
+g.k.YvY=function(){var a=this.Og.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+MAS=function(a){return a?a.jo||null:void 0};
+var zVY={Yk:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+mwF=function(a){return a?a.xr||null:void 0};
+g.k.X$t=function(){var a=this.DY.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+J_r=function(a){return a?a.UA||null:void 0};
+g.CcD=function(a,b){this.Zt=a;this.Xa=b||0;return this};
+var t33={Ee:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.GRe=function(){var a=this.ts.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.x0S=function(){var a=this.t_.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.Wnh=function(){var a=this.pu.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+zt7=function(a){return a?a.Ak||null:void 0};
+g.k.Qun=function(){var a=this.A9.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var Ies={cA:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.A4V=function(){var a=this.ge.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+LFi=function(a){return a?a.DO||null:void 0};
+g.H3r=function(a,b){this.Uv=a;this.Xa=b||0;return this};
+g.k.yUz=function(){var a=this.xc.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var _x_={E4:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var Uko={ZE:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.S6m=function(){var a=this.XN.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.q0K=function(){var a=this.uE.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+PeV=function(a){return a?a.mQ||null:void 0};
+var m8Q={_B:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var mjY={NZ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.dHF=function(a,b){this._p=a;this.Xa=b||0;return this};
+g.wSs=function(a,b){this.jg=a;this.Xa=b||0;return this};
+S4H=function(a){return a?a.S0||null:void 0};
+g.k.V67=function(){var a=this.ih.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.Xtm=function(){var a=this.Lt.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+iCc=function(a){return a?a.Nm||null:void 0};
+var PG5={bE:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+n0B=function(a){return a?a.uU||null:void 0};
+g.k.TIW=function(){var a=this.ri.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.Nb0=function(){var a=this.rb.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var SCl={eM:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var zC7={Wa:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+tfc=function(a){return a?a.Yi||null:void 0};
+U_S=function(a){return a?a.Vk||null:void 0};
+QnX=function(a){return a?a.sK||null:void 0};
+n35=function(a){return a?a.vO||null:void 0};
+var IZ9={sQ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+Uny=function(a){return a?a.AL||null:void 0};
+g.k.pDY=function(){var a=this.HK.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var ie7={HE:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.BNx=function(){var a=this.Q1.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+Hhf=function(a){return a?a.HQ||null:void 0};
+g.oZ_=function(a,b){this.PK=a;this.Xa=b||0;return this};
+g.jRi=function(a,b){this.pU=a;this.Xa=b||0;return this};
+g.k.jZF=function(){var a=this.Ub.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.z$n=function(a,b){this.h$=a;this.Xa=b||0;return this};
+gLW=function(a){return a?a.j$||null:void 0};
+g.k.yYp=function(){var a=this.K3.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.WLA=function(a,b){this.Ur=a;this.Xa=b||0;return this};
+g.k.vep=function(){var a=this.cB.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.fru=function(a,b){this._c=a;this.Xa=b||0;return this};
+var S_M={Ej:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var Z_Y={a3:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.cg_=function(){var a=this.mC.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var Ink={lC:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var SBl={hd:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var R9C={lF:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.iPW=function(){var a=this.va.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var Kjs={k_:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.wdi=function(){var a=this.TR.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.x_6=function(a,b){this.Zd=a;this.Xa=b||0;return this};
+g.$Bl=function(a,b){this.$o=a;this.Xa=b||0;return this};
+O7k=function(a){return a?a._q||null:void 0};
+var Mzr={kQ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var Oki={zs:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.eOR=function(){var a=this.Et.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.J7q=function(){var a=this.l3.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.X6O=function(){var a=this.Bz.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var HZt={MR:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var nOl={gQ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.hIQ=function(){var a=this.UO.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.Ppy=function(){var a=this.FM.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.VKl=function(){var a=this.bS.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+mqa=function(a){return a?a.P2||null:void 0};
+g.mSS=function(a,b){this.un=a;this.Xa=b||0;return this};
+g.xCL=function(a,b){this.HX=a;this.Xa=b||0;return this};
+g.k.WIp=function(){var a=this.UE.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+Xu9=function(a){return a?a.eQ||null:void 0};
+pnj=function(a){return a?a.ZA||null:void 0};
+var RHi={Qx:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.he3=function(){var a=this.T9.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+npV=function(a){return a?a.tl||null:void 0};
+g.k.l6S=function(){var a=this.ll.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.DjN=function(a,b){this.t0=a;this.Xa=b||0;return this};
+var Or3={P7:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.Ufn=function(a,b){this.MV=a;this.Xa=b||0;return this};
+var yOi={WA:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+WMO=function(a){return a?a.QA||null:void 0};
+g.oZg=function(a,b){this.T7=a;this.Xa=b||0;return this};
+var BCo={Tf:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.oHt=function(){var a=this.Vs.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.QnJ=function(){var a=this.UI.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var $kU={vA:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var EbK={Sj:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+cfX=function(a){return a?a.dT||null:void 0};
+var SFc={gp:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var O_A={oD:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.DTP=function(){var a=this.o$.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var x67={Aj:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var AYC={lN:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.QdL=function(a,b){this.ZB=a;this.Xa=b||0;return this};
+var yoh={KQ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.rUf=function(a,b){this.M4=a;this.Xa=b||0;return this};
+g.k.lH4=function(){var a=this.Wl.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var Zvz={H8:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.iMG=function(){var a=this.AS.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.Ddm=function(){var a=this.FC.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.EEu=function(){var a=this.Wo.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+BkH=function(a){return a?a.da||null:void 0};
+g.k.jCj=function(){var a=this.aK.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.S85=function(a,b){this.aI=a;this.Xa=b||0;return this};
+g.k.ByB=function(){var a=this.mF.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.dgv=function(){var a=this.xK.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.aIa=function(a,b){this.bG=a;this.Xa=b||0;return this};
+g.k.qeY=function(){var a=this.uS.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.Z3o=function(){var a=this.PA.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+zuZ=function(a){return a?a.CJ||null:void 0};
+g.WPT=function(a,b){this.ny=a;this.Xa=b||0;return this};
+g.k.cUP=function(){var a=this.iK.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+tNY=function(a){return a?a.mQ||null:void 0};
+g.e3w=function(a,b){this.y9=a;this.Xa=b||0;return this};
+var nU1={Zj:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var PYi={JA:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g$3=function(a){return a?a.D9||null:void 0};
+var FsN={fS:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.B4M=function(a,b){this.zi=a;this.Xa=b||0;return this};
+var phM={PE:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+$AH=function(a){return a?a.ER||null:void 0};
+g.k.DIk=function(){var a=this.Yk.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.C$s=function(){var a=this.q8.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.gB8=function(){var a=this.e2.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var x5w={$3:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.oY4=function(a,b){this.TU=a;this.Xa=b||0;return this};
+g.$kl=function(a,b){this.w$=a;this.Xa=b||0;return this};
+jrq=function(a){return a?a.Qp||null:void 0};
+var N22={G2:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.Rwf=function(){var a=this.$0.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+tu7=function(a){return a?a.tW||null:void 0};
+LEw=function(a){return a?a.wZ||null:void 0};
+kO7=function(a){return a?a._n||null:void 0};
+g.k.thU=function(){var a=this.$T.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var DEm={oz:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.twd=function(a,b){this.BP=a;this.Xa=b||0;return this};
+g.k.Njq=function(){var a=this.a1.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var ibz={T9:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var NUr={RH:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.Tqi=function(){var a=this.gH.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+Niq=function(a){return a?a.n7||null:void 0};
+g.k.CoQ=function(){var a=this.y3.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.twt=function(){var a=this.Ht.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var Vh8={oU:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.VfC=function(a,b){this.dU=a;this.Xa=b||0;return this};
+var FNW={m$:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.LVF=function(){var a=this.Uy.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var gO7={c1:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var Gxq={GB:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.Gd3=function(a,b){this.Rj=a;this.Xa=b||0;return this};
+var jzn={u3:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.ITH=function(){var a=this.C0.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var xaT={mi:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.uoU=function(){var a=this._X.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var UAY={HJ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+OTF=function(a){return a?a.wk||null:void 0};
+g.Rwh=function(a,b){this.xs=a;this.Xa=b||0;return this};
+Ngr=function(a){return a?a.Za||null:void 0};
+g.uRW=function(a,b){this.rd=a;this.Xa=b||0;return this};
+g.k.O4z=function(){var a=this.cC.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.MAr=function(){var a=this.U4.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var qfQ={cK:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.ots=function(){var a=this.lN.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var BwT={gt:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+hz6=function(a){return a?a.ZG||null:void 0};
+Doz=function(a){return a?a.Hv||null:void 0};
+var bNw={B4:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+kZG=function(a){return a?a.c6||null:void 0};
+g.k.Kld=function(){var a=this.Hz.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.YZU=function(a,b){this.K$=a;this.Xa=b||0;return this};
+var kG$={eI:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.pNX=function(){var a=this.Bc.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.Nm8=function(a,b){this.Du=a;this.Xa=b||0;return this};
+g.XD2=function(a,b){this.QB=a;this.Xa=b||0;return this};
+g.fvn=function(a,b){this.bA=a;this.Xa=b||0;return this};
+var pni={cw:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.EVh=function(){var a=this.Te.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+Y_M=function(a){return a?a.Z1||null:void 0};
+g.f6M=function(a,b){this.bc=a;this.Xa=b||0;return this};
+g.k.$qW=function(){var a=this.uK.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.Z7H=function(a,b){this.kq=a;this.Xa=b||0;return this};
+Vmn=function(a){return a?a.fO||null:void 0};
+g.k.Zfs=function(){var a=this.lu.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.oBU=function(a,b){this.Sc=a;this.Xa=b||0;return this};
+g.k.RE9=function(){var a=this.N7.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.IaC=function(a,b){this.O8=a;this.Xa=b||0;return this};
+var DlQ={xh:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.CJ0=function(a,b){this.lv=a;this.Xa=b||0;return this};
+TFg=function(a){return a?a.xa||null:void 0};
+Zyn=function(a){return a?a.VQ||null:void 0};
+g.k.bTs=function(){var a=this.km.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.Js8=function(a,b){this.WN=a;this.Xa=b||0;return this};
+g.W_e=function(a,b){this.c1=a;this.Xa=b||0;return this};
+var uMR={MU:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.uFM=function(){var a=this.Hy.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var M6Q={m1:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.cvh=function(){var a=this.x6.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.hTm=function(a,b){this.GX=a;this.Xa=b||0;return this};
+g.k.rjq=function(){var a=this.uR.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var fdn={ur:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+IC3=function(a){return a?a.kk||null:void 0};
+var FmU={is:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var PD6={Ms:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.iQM=function(){var a=this.Ms.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var sdm={Kx:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+Mmp=function(a){return a?a.Km||null:void 0};
+zQ2=function(a){return a?a.en||null:void 0};
+g.$yb=function(a,b){this.Ao=a;this.Xa=b||0;return this};
+g.yd1=function(a,b){this.If=a;this.Xa=b||0;return this};
+g._uB=function(a,b){this.yP=a;this.Xa=b||0;return this};
+var QI2={wP:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var Obw={QN:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.Ab6=function(){var a=this.rS.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.w03=function(){var a=this.Mn.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.z0M=function(){var a=this.C5.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+no3=function(a){return a?a.CU||null:void 0};
+g.NQx=function(a,b){this.zE=a;this.Xa=b||0;return this};
+B_7=function(a){return a?a.Uv||null:void 0};
+g.Ra0=function(a,b){this.yU=a;this.Xa=b||0;return this};
+var Nwe={i5:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.Ckb=function(a,b){this.Nn=a;this.Xa=b||0;return this};
+g.qLI=function(a,b){this.V_=a;this.Xa=b||0;return this};
+yEO=function(a){return a?a.$3||null:void 0};
+g.l_y=function(a,b){this.H3=a;this.Xa=b||0;return this};
+g.CIB=function(a,b){this.UT=a;this.Xa=b||0;return this};
+var cw$={p2:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g._nj=function(a,b){this.ZY=a;this.Xa=b||0;return this};
+qfq=function(a){return a?a.Yl||null:void 0};
+g.H5X=function(a,b){this.nk=a;this.Xa=b||0;return this};
+zKw=function(a){return a?a.av||null:void 0};
+QBG=function(a){return a?a.Lo||null:void 0};
+g.C3o=function(a,b){this.mj=a;this.Xa=b||0;return this};
+g.E4b=function(a,b){this.eQ=a;this.Xa=b||0;return this};
+g.k.MlI=function(){var a=this.GI.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g4h=function(a){return a?a.Gy||null:void 0};
+_Rg=function(a){return a?a.bO||null:void 0};
+yE3=function(a){return a?a.$1||null:void 0};
+g.uFE=function(a,b){this.ZI=a;this.Xa=b||0;return this};
+g.k.nDH=function(){var a=this.$k.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.asi=function(a,b){this.vd=a;this.Xa=b||0;return this};
+g.k.qVe=function(){var a=this.II.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.JFZ=function(){var a=this.Qi.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.XXZ=function(){var a=this.aP.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+BWi=function(a){return a?a.vF||null:void 0};
+wXG=function(a){return a?a.KO||null:void 0};
+var tQu={l$:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var _a0={UR:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.hHg=function(){var a=this.Vz.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var LOu={sk:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.VmC=function(){var a=this.hO.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.U8d=function(){var a=this.Rg.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.pod=function(a,b){this.bR=a;this.Xa=b||0;return this};
+var T8g={MG:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.QSM=function(a,b){this.G7=a;this.Xa=b||0;return this};
+var NhD={BN:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k._nS=function(){var a=this.$W.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.EbZ=function(){var a=this.e7.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var gis={Q8:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var bBL={Dv:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.tV7=function(a,b){this.OK=a;this.Xa=b||0;return this};
+iEi=function(a){return a?a.dl||null:void 0};
+pbg=function(a){return a?a.hH||null:void 0};
+g.k.SIM=function(){var a=this.ZN.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+zIz=function(a){return a?a.K6||null:void 0};
+g.LWS=function(a,b){this.$a=a;this.Xa=b||0;return this};
+g.Tx5=function(a,b){this.tF=a;this.Xa=b||0;return this};
+g.Emq=function(a,b){this.et=a;this.Xa=b||0;return this};
+g.k.id6=function(){var a=this.a$.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.H1U=function(a,b){this.Zb=a;this.Xa=b||0;return this};
+g.WOk=function(a,b){this.V1=a;this.Xa=b||0;return this};
+g.k.RvJ=function(){var a=this.Vx.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.gxi=function(a,b){this.zU=a;this.Xa=b||0;return this};
+g.k.avi=function(){var a=this._7.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.Jmu=function(a,b){this.ba=a;this.Xa=b||0;return this};
+var c3b={i4:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k._1M=function(){var a=this.b4.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.nlA=function(a,b){this.c3=a;this.Xa=b||0;return this};
+var gou={NX:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.DHk=function(){var a=this.ya.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.mM$=function(){var a=this.ZF.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.jxa=function(a,b){this.dD=a;this.Xa=b||0;return this};
+var rzR={tV:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g._dM=function(a,b){this.E9=a;this.Xa=b||0;return this};
+g.uA6=function(a,b){this.RC=a;this.Xa=b||0;return this};
+g.k.II1=function(){var a=this.YB.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.S4U=function(){var a=this.yq.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.Svq=function(){var a=this.qP.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.Pc5=function(){var a=this.H_.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+$65=function(a){return a?a.QD||null:void 0};
+g.tTF=function(a,b){this.Nd=a;this.Xa=b||0;return this};
+g.k.eZZ=function(){var a=this.VK.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var _je={VV:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.ITG=function(){var a=this.Lv.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+Vh2=function(a){return a?a.Dg||null:void 0};
+gxC=function(a){return a?a.E1||null:void 0};
+g.yi_=function(a,b){this.kf=a;this.Xa=b||0;return this};
+var c2a={H$:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+ktl=function(a){return a?a.Si||null:void 0};
+rfw=function(a){return a?a.at||null:void 0};
+_vW=function(a){return a?a.Ix||null:void 0};
+g.MUr=function(a,b){this.MB=a;this.Xa=b||0;return this};
+var Zzm={NM:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+f7k=function(a){return a?a.vj||null:void 0};
+g.k.tK8=function(){var a=this.k8.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.SvR=function(){var a=this.Wn.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+eNi=function(a){return a?a.fL||null:void 0};
+G43=function(a){return a?a.Xh||null:void 0};
+g.k.Sqm=function(){var a=this.Bq.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+QKX=function(a){return a?a.d7||null:void 0};
+aXI=function(a){return a?a.Ji||null:void 0};
+g.k.ss0=function(){var a=this.Gq.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.ZHR=function(a,b){this.Xe=a;this.Xa=b||0;return this};
+g.GWC=function(a,b){this.UO=a;this.Xa=b||0;return this};
+g.HCY=function(a,b){this.qn=a;this.Xa=b||0;return this};
+ecr=function(a){return a?a.zl||null:void 0};
+var CJn={Ey:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+YEX=function(a){return a?a.FO||null:void 0};
+g.bw1=function(a,b){this.hK=a;this.Xa=b||0;return this};
+g.k.ePf=function(){var a=this.Gk.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.rrm=function(){var a=this.vS.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.Y1D=function(){var a=this.lr.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.lqV=function(){var a=this.Ur.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var qdh={eS:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+RYc=function(a){return a?a.Ib||null:void 0};
+QFS=function(a){return a?a.Xa||null:void 0};
+g.M3t=function(a,b){this.$F=a;this.Xa=b||0;return this};
+var ynI={IR:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k._ew=function(){var a=this.C3.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.x2$=function(){var a=this.XX.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+sOf=function(a){return a?a.Ry||null:void 0};
+r_A=function(a){return a?a.aV||null:void 0};
+g.k.YEF=function(){var a=this.Jg.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var Sa9={f_:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.yXm=function(){var a=this.Pe.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+hyD=function(a){return a?a.Mn||null:void 0};
+t0f=function(a){return a?a.jI||null:void 0};
+g.tyM=function(a,b){this.SG=a;this.Xa=b||0;return this};
+g.MXJ=function(a,b){this.sH=a;this.Xa=b||0;return this};
+var C7z={i_:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var tbn={Iy:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+P$T=function(a){return a?a.y6||null:void 0};
+var yUl={PH:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.ig2=function(a,b){this.Sl=a;this.Xa=b||0;return this};
+g._mA=function(a,b){this.un=a;this.Xa=b||0;return this};
+g.k.LsS=function(){var a=this.fZ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var Cem={TT:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var o4M={oF:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+CY9=function(a){return a?a.LR||null:void 0};
+g.k.JP3=function(){var a=this.ip.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+D$y=function(a){return a?a.$H||null:void 0};
+L8C=function(a){return a?a.Mk||null:void 0};
+yFw=function(a){return a?a.JF||null:void 0};
+var jjE={By:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+KVV=function(a){return a?a.le||null:void 0};
+g.k.fjJ=function(){var a=this.uo.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.ski=function(){var a=this.V1.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var caV={ep:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+fgd=function(a){return a?a.Lt||null:void 0};
+g.BN_=function(a,b){this.yV=a;this.Xa=b||0;return this};
+var nCq={oC:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.j8C=function(a,b){this.xK=a;this.Xa=b||0;return this};
+g.k.NM0=function(){var a=this.WC.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var oMR={z5:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var MoD={jr:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.vEE=function(){var a=this.no.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.AWZ=function(){var a=this.mZ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var YOm={bg:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k._IT=function(){var a=this.yx.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+WRH=function(a){return a?a.Va||null:void 0};
+var ebb={zQ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.zDT=function(a,b){this.LJ=a;this.Xa=b||0;return this};
+var JeE={L$:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var B6t={H8:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k._gW=function(){var a=this.OJ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.k6z=function(){var a=this._I.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.svE=function(){var a=this.QJ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.puz=function(a,b){this.CH=a;this.Xa=b||0;return this};
+var q0t={Z5:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var HRO={xU:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var m_$={Bj:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var bbI={Hu:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.zeH=function(a,b){this.ub=a;this.Xa=b||0;return this};
+var B89={r_:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+c_m=function(a){return a?a.j0||null:void 0};
+iA7=function(a){return a?a.j5||null:void 0};
+g.k.FFv=function(){var a=this.dP.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var P0X={wX:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.mBZ=function(){var a=this.Pw.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.m4W=function(){var a=this.VY.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+ha$=function(a){return a?a.gj||null:void 0};
+bTC=function(a){return a?a.HE||null:void 0};
+g.k.BXU=function(){var a=this.Ne.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var BhZ={Pz:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+BNN=function(a){return a?a.tw||null:void 0};
+g.k.XtD=function(){var a=this.On.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+C5r=function(a){return a?a.sq||null:void 0};
+g.k.IYN=function(){var a=this.LU.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var vjd={Zq:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+G9c=function(a){return a?a.LP||null:void 0};
+g.Z5y=function(a,b){this.dD=a;this.Xa=b||0;return this};
+var w_U={Av:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.kj1=function(){var a=this.pn.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var Dbh={f_:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+gCR=function(a){return a?a.qJ||null:void 0};
+g.v_j=function(a,b){this.J4=a;this.Xa=b||0;return this};
+QIb=function(a){return a?a.Zi||null:void 0};
+g.k.MhJ=function(){var a=this.Fa.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var hye={_9:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+gdG=function(a){return a?a.hG||null:void 0};
+g.k.IeZ=function(){var a=this.yo.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.JpG=function(a,b){this.Nd=a;this.Xa=b||0;return this};
+var Dmj={uD:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.KGY=function(a,b){this.A0=a;this.Xa=b||0;return this};
+var crz={bi:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var vOz={zo:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.Xe$=function(){var a=this.xs.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+d3I=function(a){return a?a.UX||null:void 0};
+g.k.zGt=function(){var a=this.PI.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var B1c={B9:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.Hzh=function(){var a=this.Jm.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.A7P=function(){var a=this.BU.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.Z3G=function(){var a=this.yR.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+QHZ=function(a){return a?a.pl||null:void 0};
+var upY={Mi:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.SA7=function(a,b){this.LX=a;this.Xa=b||0;return this};
+var M6n={Th:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var mhi={ED:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.xJh=function(a,b){this.FG=a;this.Xa=b||0;return this};
+LMK=function(a){return a?a.kO||null:void 0};
+g.FHc=function(a,b){this.Fv=a;this.Xa=b||0;return this};
+g.aCo=function(a,b){this.q5=a;this.Xa=b||0;return this};
+g.uqN=function(a,b){this.r1=a;this.Xa=b||0;return this};
+kRy=function(a){return a?a.hJ||null:void 0};
+g.k.djT=function(){var a=this.LZ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.plv=function(a,b){this.dW=a;this.Xa=b||0;return this};
+H6C=function(a){return a?a.yB||null:void 0};
+g.V9O=function(a,b){this.F_=a;this.Xa=b||0;return this};
+g.Gn8=function(a,b){this.mM=a;this.Xa=b||0;return this};
+g.FBX=function(a,b){this.uF=a;this.Xa=b||0;return this};
+g.ZoW=function(a,b){this.Gx=a;this.Xa=b||0;return this};
+aGU=function(a){return a?a.bQ||null:void 0};
+var Twq={X8:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g2J=function(a){return a?a.fx||null:void 0};
+var ka0={QB:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var hA7={QG:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.ie6=function(){var a=this.zJ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+$Yn=function(a){return a?a.jA||null:void 0};
+g.n6O=function(a,b){this.JS=a;this.Xa=b||0;return this};
+en9=function(a){return a?a.H9||null:void 0};
+g.$GX=function(a,b){this.hD=a;this.Xa=b||0;return this};
+g.k.Pvt=function(){var a=this.xU.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var XX0={WC:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var Qey={n4:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var vur={b1:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var oY4={RS:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.n_s=function(a,b){this.Pp=a;this.Xa=b||0;return this};
+g.nSk=function(a,b){this._Q=a;this.Xa=b||0;return this};
+g.k.uJv=function(){var a=this.hq.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+wya=function(a){return a?a.ai||null:void 0};
+g.rIc=function(a,b){this.Qk=a;this.Xa=b||0;return this};
+g.k.C9R=function(){var a=this.GE.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.CNj=function(a,b){this.Ii=a;this.Xa=b||0;return this};
+var lHO={_p:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+D5e=function(a){return a?a.uc||null:void 0};
+g.hkD=function(a,b){this.Sg=a;this.Xa=b||0;return this};
+g.jpH=function(a,b){this.oT=a;this.Xa=b||0;return this};
+g.k.J0y=function(){var a=this.Ax.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var tJm={VM:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+$JP=function(a){return a?a.Lo||null:void 0};
+var VAT={BU:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var Pwf={Al:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.Wmx=function(){var a=this.sm.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var oYj={Yn:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var VDE={Dl:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var LZV={WR:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+Eda=function(a){return a?a.PO||null:void 0};
+var Rq8={nw:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+DRL=function(a){return a?a.VM||null:void 0};
+b1F=function(a){return a?a.wk||null:void 0};
+g.k.sza=function(){var a=this.QM.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.HjT=function(a,b){this.h3=a;this.Xa=b||0;return this};
+qJn=function(a){return a?a.Zv||null:void 0};
+g.k.XmV=function(){var a=this.OA.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.Kxo=function(){var a=this.li.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+Sm_=function(a){return a?a.dU||null:void 0};
+g.k.yby=function(){var a=this.V8.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+yjH=function(a){return a?a.pp||null:void 0};
+RAK=function(a){return a?a.aE||null:void 0};
+g.k.R1C=function(){var a=this.mM.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+giQ=function(a){return a?a.AK||null:void 0};
+g.o_d=function(a,b){this.HB=a;this.Xa=b||0;return this};
+g.k.Gmh=function(){var a=this.pU.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.sor=function(a,b){this.Yq=a;this.Xa=b||0;return this};
+g.k.BX1=function(){var a=this.Lm.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var NeF={Ym:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.ERm=function(a,b){this.Bb=a;this.Xa=b||0;return this};
+g.k.VQ5=function(){var a=this.Zy.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.gAt=function(a,b){this.D3=a;this.Xa=b||0;return this};
+g.k.uQC=function(){var a=this.oa.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var dvX={V8:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.dxR=function(a,b){this.dc=a;this.Xa=b||0;return this};
+g.k.kGy=function(){var a=this.np.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var H0a={Gc:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var nvC={cc:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+iYL=function(a){return a?a.vr||null:void 0};
+g.EQ4=function(a,b){this.se=a;this.Xa=b||0;return this};
+g.YOI=function(a,b){this.ek=a;this.Xa=b||0;return this};
+var suI={yY:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.TPX=function(a,b){this.kb=a;this.Xa=b||0;return this};
+g.tzl=function(a,b){this.Pr=a;this.Xa=b||0;return this};
+g.TNB=function(a,b){this.Mz=a;this.Xa=b||0;return this};
+var htQ={DL:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.K99=function(){var a=this.DB.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var zXk={n_:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var $rl={tF:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+nqe=function(a){return a?a.xu||null:void 0};
+g.k.ajD=function(){var a=this.LD.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.RRT=function(a,b){this.Bc=a;this.Xa=b||0;return this};
+n6y=function(a){return a?a.$4||null:void 0};
+DJ1=function(a){return a?a.ii||null:void 0};
+g.MEC=function(a,b){this.W7=a;this.Xa=b||0;return this};
+g.XAG=function(a,b){this.Pd=a;this.Xa=b||0;return this};
+g.k.bHO=function(){var a=this.r3.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var SuB={Pf:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var J4j={tt:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.XIt=function(){var a=this.vP.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.cxM=function(){var a=this.fc.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var Rxw={gg:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.loB=function(a,b){this.aM=a;this.Xa=b||0;return this};
+var WTo={HR:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.N92=function(a,b){this.QW=a;this.Xa=b||0;return this};
+g.dFV=function(a,b){this.DK=a;this.Xa=b||0;return this};
+eJw=function(a){return a?a.Eo||null:void 0};
+g.c1d=function(a,b){this.Qh=a;this.Xa=b||0;return this};
+var sBV={BS:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var AE$={cA:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.mGk=function(a,b){this.oq=a;this.Xa=b||0;return this};
+LXk=function(a){return a?a.dO||null:void 0};
+g.RIw=function(a,b){this.uW=a;this.Xa=b||0;return this};
+var JTo={XI:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+ebl=function(a){return a?a.$Z||null:void 0};
+var r4N={dD:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.HNP=function(){var a=this.Hv.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+AyL=function(a){return a?a.cb||null:void 0};
+He0=function(a){return a?a.YI||null:void 0};
+var QU0={Rx:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+_9J=function(a){return a?a.Jk||null:void 0};
+wUF=function(a){return a?a.Yu||null:void 0};
+g.k.xWo=function(){var a=this.gR.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var jA8={p5:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.ew0=function(a,b){this.u7=a;this.Xa=b||0;return this};
+g.GIM=function(a,b){this.QA=a;this.Xa=b||0;return this};
+g.k.Xfa=function(){var a=this.dN.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.nJ2=function(a,b){this.cK=a;this.Xa=b||0;return this};
+var XV$={rf:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var kkQ={q4:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+bLU=function(a){return a?a.EI||null:void 0};
+var qSs={nP:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+C$g=function(a){return a?a.f2||null:void 0};
+var mRX={cW:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.jb$=function(a,b){this.PN=a;this.Xa=b||0;return this};
+aDo=function(a){return a?a.V3||null:void 0};
+ty_=function(a){return a?a.nC||null:void 0};
+g.G3L=function(a,b){this.d8=a;this.Xa=b||0;return this};
+g.tpk=function(a,b){this.Un=a;this.Xa=b||0;return this};
+g.k.qXJ=function(){var a=this.zo.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.l3t=function(){var a=this.Hw.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.qLS=function(){var a=this.Xg.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.kF8=function(a,b){this.Wc=a;this.Xa=b||0;return this};
+var FqS={CO:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+yXj=function(a){return a?a.Ix||null:void 0};
+g.LcY=function(a,b){this.cq=a;this.Xa=b||0;return this};
+g.LYv=function(a,b){this.Na=a;this.Xa=b||0;return this};
+var KLN={VJ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+y3L=function(a){return a?a.yS||null:void 0};
+var Aza={ou:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.vck=function(a,b){this.V3=a;this.Xa=b||0;return this};
+var wue={y1:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.w9O=function(){var a=this.ni.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var ixq={Ff:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var Q$Z={qh:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.R6Z=function(a,b){this.D7=a;this.Xa=b||0;return this};
+V0D=function(a){return a?a.hA||null:void 0};
+var $3b={qh:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+xeI=function(a){return a?a.UC||null:void 0};
+g.Sn9=function(a,b){this.td=a;this.Xa=b||0;return this};
+var WTX={N7:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.alo=function(a,b){this.Cs=a;this.Xa=b||0;return this};
+f$r=function(a){return a?a.Aa||null:void 0};
+var Pn4={To:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.q0k=function(){var a=this.Lm.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var tC_={uP:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+r4X=function(a){return a?a.c9||null:void 0};
+URt=function(a){return a?a.Jg||null:void 0};
+var wXp={Hf:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.JrE=function(a,b){this.Q0=a;this.Xa=b||0;return this};
+var zJz={UC:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.UCn=function(a,b){this.TK=a;this.Xa=b||0;return this};
+g.k.Vb5=function(){var a=this.UQ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var G7f={Fs:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.XF8=function(){var a=this.X$.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var jqt={_x:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.ybA=function(){var a=this.T5.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var ARU={Fz:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.Ijd=function(){var a=this.LN.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.mpG=function(){var a=this.bF.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.FIC=function(a,b){this.X1=a;this.Xa=b||0;return this};
+var w8q={wO:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+ytx=function(a){return a?a.Rv||null:void 0};
+g.k.Hu3=function(){var a=this.z9.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.iFi=function(){var a=this.UD.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var cBE={J$:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+avp=function(a){return a?a.PO||null:void 0};
+g.k.pmX=function(){var a=this.$T.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.pzv=function(){var a=this._W.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var VME={L7:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.f4B=function(){var a=this.TC.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.GJH=function(a,b){this.Ur=a;this.Xa=b||0;return this};
+Bg5=function(a){return a?a.NF||null:void 0};
+g.k.Tqz=function(){var a=this.M$.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.K1l=function(a,b){this.Is=a;this.Xa=b||0;return this};
+g.Q8Q=function(a,b){this.de=a;this.Xa=b||0;return this};
+var kCb={jP:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var kxm={b8:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+WgC=function(a){return a?a.hc||null:void 0};
+g.XH5=function(a,b){this.qf=a;this.Xa=b||0;return this};
+C1N=function(a){return a?a.nz||null:void 0};
+U1o=function(a){return a?a.GY||null:void 0};
+g.k.ai1=function(){var a=this.Zn.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+Lu8=function(a){return a?a.f_||null:void 0};
+g.k.ADq=function(){var a=this.JP.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var KFN={U8:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+UQa=function(a){return a?a.qC||null:void 0};
+g.qsp=function(a,b){this.fx=a;this.Xa=b||0;return this};
+var Py2={ih:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+Y7V=function(a){return a?a.yP||null:void 0};
+g.Y1n=function(a,b){this.iz=a;this.Xa=b||0;return this};
+g.k.XM7=function(){var a=this.kz.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var SZh={LI:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+jOZ=function(a){return a?a.Xx||null:void 0};
+t90=function(a){return a?a.PH||null:void 0};
+g.igu=function(a,b){this.YS=a;this.Xa=b||0;return this};
+g.k.W8d=function(){var a=this.p_.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var VLX={uT:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+ZOJ=function(a){return a?a.Pa||null:void 0};
+g.k.kNn=function(){var a=this.xq.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+qp4=function(a){return a?a.lY||null:void 0};
+l90=function(a){return a?a.wK||null:void 0};
+var DjQ={rJ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+xCa=function(a){return a?a.U3||null:void 0};
+g.dZD=function(a,b){this.Pv=a;this.Xa=b||0;return this};
+g.k.Fku=function(){var a=this.PD.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.O4K=function(){var a=this._E.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.acL=function(){var a=this.Ir.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+JuA=function(a){return a?a.gY||null:void 0};
+iKC=function(a){return a?a.P4||null:void 0};
+var Nai={lN:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+Ycv=function(a){return a?a.Qi||null:void 0};
+var sW$={GJ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.SV_=function(a,b){this.N7=a;this.Xa=b||0;return this};
+var USR={FH:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.cXB=function(a,b){this.JQ=a;this.Xa=b||0;return this};
+g.fM1=function(a,b){this.Sw=a;this.Xa=b||0;return this};
+O$I=function(a){return a?a.cb||null:void 0};
+g.jv8=function(a,b){this.lf=a;this.Xa=b||0;return this};
+var Gur={Nm:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.ydu=function(){var a=this.Rc.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+KdV=function(a){return a?a.Ps||null:void 0};
+var MSp={Ft:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var vEw={oe:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+UiQ=function(a){return a?a.V8||null:void 0};
+g.k.aJf=function(){var a=this.ZY.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+RP8=function(a){return a?a.FH||null:void 0};
+var RQr={k4:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+nAd=function(a){return a?a.X_||null:void 0};
+Glr=function(a){return a?a.dN||null:void 0};
+g.qqw=function(a,b){this.uN=a;this.Xa=b||0;return this};
+yJQ=function(a){return a?a.JY||null:void 0};
+g.VEO=function(a,b){this.WO=a;this.Xa=b||0;return this};
+g.MlT=function(a,b){this.B7=a;this.Xa=b||0;return this};
+rJu=function(a){return a?a.tk||null:void 0};
+R7U=function(a){return a?a.sf||null:void 0};
+g.k.gnl=function(){var a=this.yN.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+S6h=function(a){return a?a.yI||null:void 0};
+g.k.oMG=function(){var a=this.ku.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.frn=function(){var a=this.Tv.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.NSQ=function(){var a=this.dx.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+fr8=function(a){return a?a.La||null:void 0};
+g.k.N3E=function(){var a=this.Gz.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+VEB=function(a){return a?a.x3||null:void 0};
+g.v3_=function(a,b){this.ra=a;this.Xa=b||0;return this};
+g.AyU=function(a,b){this.PR=a;this.Xa=b||0;return this};
+var Qeq={GN:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var D_Y={n$:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.xFq=function(){var a=this.e1.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+fkw=function(a){return a?a.I6||null:void 0};
+g.dGF=function(a,b){this.D2=a;this.Xa=b||0;return this};
+g.k.yYe=function(){var a=this.K7.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.U46=function(){var a=this.fb.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g._5w=function(a,b){this.Cb=a;this.Xa=b||0;return this};
+g.gWL=function(a,b){this.U9=a;this.Xa=b||0;return this};
+var eFr={pv:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+ody=function(a){return a?a.K0||null:void 0};
+g.k.eZk=function(){var a=this.h0.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var WdS={OL:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+n_r=function(a){return a?a.Yv||null:void 0};
+var Mus={Dw:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+jcc=function(a){return a?a.SD||null:void 0};
+var FT$={Pq:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var HvF={Kv:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+C7g=function(a){return a?a.zB||null:void 0};
+g.MPN=function(a,b){this.bl=a;this.Xa=b||0;return this};
+$KP=function(a){return a?a.yI||null:void 0};
+var IXG={xU:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.jFe=function(a,b){this.GU=a;this.Xa=b||0;return this};
+var uEG={GI:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var ULz={dE:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+hnV=function(a){return a?a.L5||null:void 0};
+var R3x={cH:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.i5r=function(a,b){this.p2=a;this.Xa=b||0;return this};
+YqZ=function(a){return a?a.__||null:void 0};
+var AKt={ZI:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var fqz={r8:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+BME=function(a){return a?a.t2||null:void 0};
+var ohm={Cf:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var EJY={FB:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.eHK=function(){var a=this.HG.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+yuK=function(a){return a?a.nk||null:void 0};
+g.k.FXe=function(){var a=this.Qn.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+trL=function(a){return a?a.uA||null:void 0};
+TBY=function(a){return a?a.i1||null:void 0};
+g.ezQ=function(a,b){this.R9=a;this.Xa=b||0;return this};
+g.HHg=function(a,b){this.dY=a;this.Xa=b||0;return this};
+g.RCM=function(a,b){this.d2=a;this.Xa=b||0;return this};
+g.K6L=function(a,b){this.zj=a;this.Xa=b||0;return this};
+aKd=function(a){return a?a.P6||null:void 0};
+var JW_={zD:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+hm3=function(a){return a?a.mD||null:void 0};
+g.k.ByA=function(){var a=this.GS.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+lOl=function(a){return a?a.hQ||null:void 0};
+var YAU={ik:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var bvU={PE:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+akV=function(a){return a?a.ux||null:void 0};
+g.k.HtV=function(){var a=this.$r.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var x5t={m8:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.ALy=function(a,b){this.Un=a;this.Xa=b||0;return this};
+hJi=function(a){return a?a.Qw||null:void 0};
+g.oco=function(a,b){this.Fu=a;this.Xa=b||0;return this};
+var XRJ={T6:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var _cX={S9:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.$N3=function(){var a=this.rQ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+YLu=function(a){return a?a.nu||null:void 0};
+_Fp=function(a){return a?a.ki||null:void 0};
+KmO=function(a){return a?a.mJ||null:void 0};
+g.k.vL3=function(){var a=this.QO.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+Xdy=function(a){return a?a.ia||null:void 0};
+g.k.VdN=function(){var a=this.p1.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+e7K=function(a){return a?a.QY||null:void 0};
+g.k.I0N=function(){var a=this.zU.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.Zfa=function(){var a=this.zX.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+LMT=function(a){return a?a.g2||null:void 0};
+g.k.GvH=function(){var a=this.M1.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var HOZ={_$:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var k7X={p4:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var LUg={bU:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.M7_=function(a,b){this.FA=a;this.Xa=b||0;return this};
+SFS=function(a){return a?a.rr||null:void 0};
+var uD_={gg:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var CR3={xu:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.PpP=function(){var a=this.uM.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var YoO={tu:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.Xvx=function(){var a=this.lD.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+KG5=function(a){return a?a.o0||null:void 0};
+g.czP=function(a,b){this.OR=a;this.Xa=b||0;return this};
+g.k.f_R=function(){var a=this.pP.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var zbY={Ob:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+gYh=function(a){return a?a.xF||null:void 0};
+RBD=function(a){return a?a.By||null:void 0};
+g.k.R_u=function(){var a=this.NJ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+M02=function(a){return a?a.f$||null:void 0};
+g.zt4=function(a,b){this.n9=a;this.Xa=b||0;return this};
+g.k.ib2=function(){var a=this.uf.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var So1={Vb:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.kvZ=function(){var a=this.Ed.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var Sls={gL:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+N5H=function(a){return a?a.bt||null:void 0};
+var YwC={hJ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var ykl={Rl:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.D9Q=function(a,b){this.aY=a;this.Xa=b||0;return this};
+var NEv={xx:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.dJB=function(a,b){this.b6=a;this.Xa=b||0;return this};
+g.k.blD=function(){var a=this.ND.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.CXd=function(a,b){this.VS=a;this.Xa=b||0;return this};
+var Ga9={GE:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var q6H={Hn:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var bJe={c7:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var RIL={bO:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.Qot=function(a,b){this.HV=a;this.Xa=b||0;return this};
+g.k.qq_=function(){var a=this.Gt.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.VL0=function(){var a=this.mo.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.v4s=function(){var a=this.zB.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+sBj=function(a){return a?a.he||null:void 0};
+g.k.hw_=function(){var a=this.xZ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var YdP={WI:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var rg8={wC:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+h0Q=function(a){return a?a.Fw||null:void 0};
+ANi=function(a){return a?a.xk||null:void 0};
+var e0k={Ct:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.piM=function(){var a=this.G9.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+yhr=function(a){return a?a.GK||null:void 0};
+var QT9={br:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.p$C=function(a,b){this.Kt=a;this.Xa=b||0;return this};
+g.Sk3=function(a,b){this.HU=a;this.Xa=b||0;return this};
+var jGI={j3:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+hns=function(a){return a?a.lQ||null:void 0};
+var b1W={aM:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var qDd={wE:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.meF=function(){var a=this.Tx.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.xv4=function(){var a=this.CV.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.Jgx=function(a,b){this.xp=a;this.Xa=b||0;return this};
+iaf=function(a){return a?a.Gp||null:void 0};
+g.IAV=function(a,b){this.sX=a;this.Xa=b||0;return this};
+g.k.eZ5=function(){var a=this.UM.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.kLy=function(){var a=this.G7.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+lJ2=function(a){return a?a.aX||null:void 0};
+g.k.hNT=function(){var a=this.wA.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.toJ=function(a,b){this.iP=a;this.Xa=b||0;return this};
+var wWs={Go:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var CXw={FV:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+Y6z=function(a){return a?a.MN||null:void 0};
+_Op=function(a){return a?a.BO||null:void 0};
+T93=function(a){return a?a.mW||null:void 0};
+g.k.NV1=function(){var a=this.tq.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.Hq2=function(){var a=this.od.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.ONH=function(){var a=this.aA.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+WpR=function(a){return a?a.YP||null:void 0};
+pG$=function(a){return a?a.dA||null:void 0};
+_nM=function(a){return a?a.ir||null:void 0};
+var MaU={D_:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.zkL=function(){var a=this.hx.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.aeV=function(){var a=this.Xp.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+nc4=function(a){return a?a.hN||null:void 0};
+g.Q24=function(a,b){this.QI=a;this.Xa=b||0;return this};
+g.k.q$5=function(){var a=this.EU.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.eo4=function(){var a=this.YL.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.Ab2=function(a,b){this.NB=a;this.Xa=b||0;return this};
+osk=function(a){return a?a.PG||null:void 0};
+t_3=function(a){return a?a.Ax||null:void 0};
+KXz=function(a){return a?a.hL||null:void 0};
+z6A=function(a){return a?a.P7||null:void 0};
+Zca=function(a){return a?a.zD||null:void 0};
+g.k.k$z=function(){var a=this.gh.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.Efo=function(){var a=this.xZ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.NSc=function(a,b){this.gA=a;this.Xa=b||0;return this};
+var Dvm={jn:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.N8H=function(a,b){this.ql=a;this.Xa=b||0;return this};
+g.IDU=function(a,b){this.FQ=a;this.Xa=b||0;return this};
+var Zy9={C2:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.mXT=function(a,b){this.Fg=a;this.Xa=b||0;return this};
+var IWB={md:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+ksW=function(a){return a?a.kd||null:void 0};
+g.naK=function(a,b){this._l=a;this.Xa=b||0;return this};
+g.k.LwU=function(){var a=this.e8.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.Ouz=function(){var a=this.iv.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.XSM=function(){var a=this.x8.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.KV$=function(a,b){this.T5=a;this.Xa=b||0;return this};
+g.seL=function(a,b){this.Qp=a;this.Xa=b||0;return this};
+g.GtW=function(a,b){this.wX=a;this.Xa=b||0;return this};
+var AL3={KP:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var vj$={o0:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k._SU=function(){var a=this.B1.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+eWd=function(a){return a?a.z7||null:void 0};
+var V9h={j4:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+B50=function(a){return a?a.m6||null:void 0};
+EvE=function(a){return a?a.wb||null:void 0};
+g.vTx=function(a,b){this.L4=a;this.Xa=b||0;return this};
+g.k.BE9=function(){var a=this._l.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.tLO=function(a,b){this.X3=a;this.Xa=b||0;return this};
+g.k.yn6=function(){var a=this.t7.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.gyh=function(){var a=this.nG.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var ZsV={or:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var Rwu={GK:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.rOU=function(a,b){this.So=a;this.Xa=b||0;return this};
+FdN=function(a){return a?a.aI||null:void 0};
+g.H8f=function(a,b){this.IY=a;this.Xa=b||0;return this};
+var Zs1={gJ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+_Xj=function(a){return a?a.jv||null:void 0};
+g.k.OjI=function(){var a=this.Sp.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.Qie=function(){var a=this.L5.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.d6H=function(){var a=this.kL.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+qpV=function(a){return a?a.rY||null:void 0};
+var QJs={AZ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.J4B=function(){var a=this.jz.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var ZF$={Ls:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var Yds={Zu:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.k89=function(){var a=this.MI.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var f3P={XV:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+tJL=function(a){return a?a.Bn||null:void 0};
+Mvz=function(a){return a?a.OU||null:void 0};
+Ek0=function(a){return a?a.jb||null:void 0};
+g.k.XuL=function(){var a=this.qe.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.JdX=function(a,b){this.oW=a;this.Xa=b||0;return this};
+g.k.mx2=function(){var a=this.pb.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.M2m=function(a,b){this.xj=a;this.Xa=b||0;return this};
+g.oh_=function(a,b){this.Ld=a;this.Xa=b||0;return this};
+var Vms={Gj:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.ecr=function(){var a=this.JG.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.FKr=function(){var a=this.ft.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+K$p=function(a){return a?a.H6||null:void 0};
+var rOr={jD:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+VVS=function(a){return a?a.NH||null:void 0};
+os5=function(a){return a?a.h3||null:void 0};
+g.chp=function(a,b){this.Lb=a;this.Xa=b||0;return this};
+g.k.ird=function(){var a=this.T6.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.xE$=function(a,b){this.uZ=a;this.Xa=b||0;return this};
+g.WiR=function(a,b){this.No=a;this.Xa=b||0;return this};
+g.fS$=function(a,b){this.j$=a;this.Xa=b||0;return this};
+g.Tek=function(a,b){this.v0=a;this.Xa=b||0;return this};
+g.zYK=function(a,b){this.Ax=a;this.Xa=b||0;return this};
+var ONy={sJ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+viC=function(a){return a?a.G8||null:void 0};
+g.k.XK7=function(){var a=this.zi.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.R_u=function(a,b){this.Z9=a;this.Xa=b||0;return this};
+g.k.Kfe=function(){var a=this.$Q.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+Yum=function(a){return a?a.Iv||null:void 0};
+var QCJ={o$:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var dC8={kn:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var ZEl={YN:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.gja=function(a,b){this.wc=a;this.Xa=b||0;return this};
+g.xJr=function(a,b){this.Zi=a;this.Xa=b||0;return this};
+g.JVs=function(a,b){this.K2=a;this.Xa=b||0;return this};
+g.NQ4=function(a,b){this.AD=a;this.Xa=b||0;return this};
+g.k.CDk=function(){var a=this.YI.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var kGf={b0:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var cHf={e2:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.M9C=function(){var a=this.sb.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+hqU=function(a){return a?a.y8||null:void 0};
+var gtn={zp:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var mpj={YA:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.J$T=function(a,b){this.gh=a;this.Xa=b||0;return this};
+fIS=function(a){return a?a.gC||null:void 0};
+T$H=function(a){return a?a.sv||null:void 0};
+mTF=function(a){return a?a.rF||null:void 0};
+g.SEP=function(a,b){this.LE=a;this.Xa=b||0;return this};
+var gVw={S4:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.CpU=function(){var a=this.xK.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var tx4={UH:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+Ejq=function(a){return a?a.fB||null:void 0};
+var mwo={EO:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.NZU=function(a,b){this._Y=a;this.Xa=b||0;return this};
+g.kTI=function(a,b){this.Wa=a;this.Xa=b||0;return this};
+var wOg={xG:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.ljb=function(){var a=this.HB.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.RSs=function(){var a=this.$T.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.Hz2=function(a,b){this.Xg=a;this.Xa=b||0;return this};
+g.Igf=function(a,b){this.H4=a;this.Xa=b||0;return this};
+g.k.fQq=function(){var a=this.uk.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+U$C=function(a){return a?a.OA||null:void 0};
+var Q50={NU:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var T69={qJ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.yDu=function(){var a=this.KU.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.dBC=function(){var a=this.Ma.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+y3f=function(a){return a?a.R5||null:void 0};
+AWm=function(a){return a?a.fx||null:void 0};
+APw=function(a){return a?a.bd||null:void 0};
+g.k.abU=function(){var a=this.Js.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.HD_=function(a,b){this.ax=a;this.Xa=b||0;return this};
+g.xz7=function(a,b){this.PQ=a;this.Xa=b||0;return this};
+var ZpQ={H6:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.ui5=function(){var a=this.yR.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+ibi=function(a){return a?a.bp||null:void 0};
+var J9s={Qk:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k._kb=function(){var a=this.lr.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.aY$=function(a,b){this.gG=a;this.Xa=b||0;return this};
+x4N=function(a){return a?a.$1||null:void 0};
+var riJ={A7:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var O$3={fS:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.$rx=function(){var a=this.Ur.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.GWs=function(){var a=this.Zn.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var z14={S4:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+BVe=function(a){return a?a.As||null:void 0};
+nfY=function(a){return a?a.sS||null:void 0};
+g.k.LWe=function(){var a=this.T2.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.YWB=function(){var a=this.Yw.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+x8F=function(a){return a?a.Le||null:void 0};
+mYt=function(a){return a?a.v_||null:void 0};
+hL1=function(a){return a?a.k4||null:void 0};
+var T2u={Rd:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.bZ_=function(a,b){this.HQ=a;this.Xa=b||0;return this};
+g.k._V9=function(){var a=this.WX.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.Jgv=function(){var a=this.P9.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var NCi={u4:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.CMd=function(a,b){this.J5=a;this.Xa=b||0;return this};
+g.k.QSf=function(){var a=this.a4.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var dYF={sO:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.yIR=function(){var a=this.Zl.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var MYI={u4:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+D88=function(a){return a?a.HJ||null:void 0};
+wxB=function(a){return a?a.PC||null:void 0};
+kUc=function(a){return a?a.JC||null:void 0};
+g.PZT=function(a,b){this.E2=a;this.Xa=b||0;return this};
+var ehl={yi:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var M9c={NO:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var WTQ={Hc:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.YJz=function(a,b){this.ja=a;this.Xa=b||0;return this};
+g.k.iml=function(){var a=this.fw.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var UKM={_u:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var Dti={Q9:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.zq3=function(a,b){this.BL=a;this.Xa=b||0;return this};
+g.aAr=function(a,b){this.vf=a;this.Xa=b||0;return this};
+g.KjI=function(a,b){this.kU=a;this.Xa=b||0;return this};
+HXB=function(a){return a?a.GO||null:void 0};
+g.TNP=function(a,b){this.Qg=a;this.Xa=b||0;return this};
+g.k.e5G=function(){var a=this.Y8.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.iUL=function(a,b){this.vK=a;this.Xa=b||0;return this};
+dg$=function(a){return a?a.QG||null:void 0};
+g.k.hsR=function(){var a=this.ZP.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.Rag=function(){var a=this.Mq.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var heb={Fc:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.Emq=function(a,b){this.wf=a;this.Xa=b||0;return this};
+g.k.ysy=function(){var a=this.nQ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+uzv=function(a){return a?a.EZ||null:void 0};
+var kLk={mv:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.p_a=function(a,b){this.F9=a;this.Xa=b||0;return this};
+ehP=function(a){return a?a.H8||null:void 0};
+g.k.Ysu=function(){var a=this.V7.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+Rc2=function(a){return a?a.r7||null:void 0};
+JCM=function(a){return a?a.Xw||null:void 0};
+var ruq={r8:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+Ve5=function(a){return a?a.RZ||null:void 0};
+var ogu={Fd:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+YSc=function(a){return a?a.P9||null:void 0};
+SdF=function(a){return a?a.jG||null:void 0};
+var tNm={Ai:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+nDM=function(a){return a?a.FV||null:void 0};
+var u9I={Op:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.zkW=function(){var a=this.QL.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.xL_=function(){var a=this.D4.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.o5X=function(){var a=this.yr.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.IK1=function(a,b){this.OG=a;this.Xa=b||0;return this};
+veg=function(a){return a?a.Vn||null:void 0};
+g.k.R$C=function(){var a=this.NL.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.hb2=function(a,b){this.y7=a;this.Xa=b||0;return this};
+g.k.QyD=function(){var a=this.vA.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+fQw=function(a){return a?a.X4||null:void 0};
+g.nta=function(a,b){this.Zj=a;this.Xa=b||0;return this};
+var tjg={Qm:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.bjl=function(a,b){this.lt=a;this.Xa=b||0;return this};
+g.k.ARS=function(){var a=this.oC.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.GlT=function(){var a=this.du.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var K1i={Rs:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+PNA=function(a){return a?a.aO||null:void 0};
+g.P6l=function(a,b){this._O=a;this.Xa=b||0;return this};
+g.Y2m=function(a,b){this.BQ=a;this.Xa=b||0;return this};
+rLm=function(a){return a?a.X4||null:void 0};
+g.k.gM5=function(){var a=this.Gj.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.wk$=function(){var a=this.sl.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.qdQ=function(){var a=this.bU.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var TZm={Xk:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.Wx7=function(){var a=this.Hs.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.nxK=function(a,b){this.DM=a;this.Xa=b||0;return this};
+Azk=function(a){return a?a.$J||null:void 0};
+g.BLK=function(a,b){this.Xb=a;this.Xa=b||0;return this};
+g.k.zRt=function(){var a=this.lB.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+Wyn=function(a){return a?a.$x||null:void 0};
+$cw=function(a){return a?a.Ym||null:void 0};
+var Ixe={sO:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.HFx=function(a,b){this.Iw=a;this.Xa=b||0;return this};
+g.IIP=function(a,b){this.Cd=a;this.Xa=b||0;return this};
+g.k.osU=function(){var a=this.R6.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+PcQ=function(a){return a?a.GI||null:void 0};
+var bqN={QD:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.lCd=function(a,b){this.II=a;this.Xa=b||0;return this};
+XMs=function(a){return a?a.Rc||null:void 0};
+g.k.Ivz=function(){var a=this.ss.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.jSS=function(a,b){this.T_=a;this.Xa=b||0;return this};
+var Rxm={yV:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k._Sy=function(){var a=this.jF.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k._Rw=function(){var a=this.Pb.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+sy$=function(a){return a?a.If||null:void 0};
+GqZ=function(a){return a?a.q6||null:void 0};
+var SJR={D_:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.$Kw=function(a,b){this.M_=a;this.Xa=b||0;return this};
+g.EEl=function(a,b){this.OM=a;this.Xa=b||0;return this};
+g.k.Ku6=function(){var a=this.D$.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+oBX=function(a){return a?a.SV||null:void 0};
+g.k.Isk=function(){var a=this.SO.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.dDH=function(){var a=this.P1.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.c$7=function(a,b){this.qH=a;this.Xa=b||0;return this};
+qSP=function(a){return a?a.g4||null:void 0};
+g.K2b=function(a,b){this.VN=a;this.Xa=b||0;return this};
+var np2={Al:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var rJp={Ze:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+nQM=function(a){return a?a.jy||null:void 0};
+G8i=function(a){return a?a.E_||null:void 0};
+g.zgo=function(a,b){this.Dz=a;this.Xa=b||0;return this};
+g.k.WrV=function(){var a=this.kw.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k_C=function(a,b){this.oF=a;this.Xa=b||0;return this};
+var HvQ={mP:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.Yax=function(){var a=this.gp.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.xsg=function(){var a=this.IT.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+mzu=function(a){return a?a.HQ||null:void 0};
+XOn=function(a){return a?a.JW||null:void 0};
+g.SMz=function(a,b){this.IM=a;this.Xa=b||0;return this};
+DB$=function(a){return a?a.Ru||null:void 0};
+g.k.UV3=function(){var a=this.cL.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.$pc=function(){var a=this.LR.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.aXI=function(a,b){this.gf=a;this.Xa=b||0;return this};
+g.ln4=function(a,b){this.QK=a;this.Xa=b||0;return this};
+Ke3=function(a){return a?a.E9||null:void 0};
+var tbg={w3:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.qC8=function(a,b){this.JY=a;this.Xa=b||0;return this};
+g.k.I4a=function(){var a=this.GL.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.op8=function(a,b){this.pi=a;this.Xa=b||0;return this};
+g.k.CKA=function(){var a=this.Q3.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var h5R={Si:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+imW=function(a){return a?a.Q5||null:void 0};
+var Usj={_4:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+qlI=function(a){return a?a.zd||null:void 0};
+var Ah8={hd:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var Imu={W_:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var kDT={yB:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.cJH=function(){var a=this.Qx.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.d1K=function(a,b){this.Xc=a;this.Xa=b||0;return this};
+g.vu7=function(a,b){this.s_=a;this.Xa=b||0;return this};
+g.k.bTr=function(){var a=this.mH.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.i1K=function(a,b){this.SX=a;this.Xa=b||0;return this};
+g.k.zie=function(){var a=this.Fg.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var xzI={V2:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.qTp=function(a,b){this.cI=a;this.Xa=b||0;return this};
+ch6=function(a){return a?a.dU||null:void 0};
+var $n9={A9:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var ziK={N1:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.jXi=function(){var a=this.rV.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var bW0={IE:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.MHS=function(){var a=this.jv.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k._bz=function(){var a=this.XO.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.SdM=function(a,b){this.p8=a;this.Xa=b||0;return this};
+g.ARL=function(a,b){this.V0=a;this.Xa=b||0;return this};
+g.k.KJw=function(){var a=this._h.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.qIF=function(a,b){this.xh=a;this.Xa=b||0;return this};
+g.HLI=function(a,b){this.qF=a;this.Xa=b||0;return this};
+g.Chl=function(a,b){this.SU=a;this.Xa=b||0;return this};
+a1M=function(a){return a?a.BZ||null:void 0};
+g.k.IAs=function(){var a=this.pC.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+f3$=function(a){return a?a.ir||null:void 0};
+g.k.MmP=function(){var a=this.qi.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.FBM=function(){var a=this.Wc.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.s0e=function(a,b){this.PH=a;this.Xa=b||0;return this};
+var NNP={sR:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+u6H=function(a){return a?a.sO||null:void 0};
+g.Zaf=function(a,b){this.R9=a;this.Xa=b||0;return this};
+g.XR6=function(a,b){this.Rr=a;this.Xa=b||0;return this};
+g.k.dL5=function(){var a=this.Wo.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var ePs={dQ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.Txg=function(){var a=this.Kd.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+FmK=function(a){return a?a.kc||null:void 0};
+var aJc={E9:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.Adp=function(){var a=this.pT.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var QtL={hG:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.KqT=function(){var a=this.GP.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+akN=function(a){return a?a.bc||null:void 0};
+var wEx={T9:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+Hrm=function(a){return a?a.DH||null:void 0};
+g.k.lf1=function(){var a=this.Oq.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+NPB=function(a){return a?a.oh||null:void 0};
+var EFZ={qE:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.r0y=function(){var a=this.g7.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var tl1={m9:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.XOp=function(){var a=this.pX.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.b7j=function(){var a=this.oU.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.zjg=function(a,b){this.st=a;this.Xa=b||0;return this};
+g.NNo=function(a,b){this.rV=a;this.Xa=b||0;return this};
+K34=function(a){return a?a.uH||null:void 0};
+g.qxm=function(a,b){this.Ip=a;this.Xa=b||0;return this};
+g.pJ1=function(a,b){this._w=a;this.Xa=b||0;return this};
+g.k.UVJ=function(){var a=this.$f.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+BC0=function(a){return a?a.jl||null:void 0};
+g.k.e6c=function(){var a=this.E3.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var dVM={QP:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var B7f={J8:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.O6u=function(a,b){this.h6=a;this.Xa=b||0;return this};
+g.aEk=function(a,b){this.Vs=a;this.Xa=b||0;return this};
+g.yMh=function(a,b){this.Y4=a;this.Xa=b||0;return this};
+var bZP={P9:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.huK=function(){var a=this.iC.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.hRl=function(){var a=this.Mi.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.X_6=function(a,b){this.tg=a;this.Xa=b||0;return this};
+var _Tj={j2:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var wM2={NS:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.A$6=function(a,b){this.GN=a;this.Xa=b||0;return this};
+var sgR={Ec:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.XF5=function(){var a=this.CU.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.oAm=function(){var a=this.qa.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.C10=function(a,b){this.nN=a;this.Xa=b||0;return this};
+var ECL={XZ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var iY4={_N:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var l6z={Zy:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var tBw={ay:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.syK=function(a,b){this.Z4=a;this.Xa=b||0;return this};
+g.G_b=function(a,b){this.nm=a;this.Xa=b||0;return this};
+var cOj={N0:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.YO7=function(){var a=this.hQ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+_2n=function(a){return a?a.Ta||null:void 0};
+var t$$={Me:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.y6t=function(){var a=this.Lb.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+I4_=function(a){return a?a.yr||null:void 0};
+g.URt=function(a,b){this.MY=a;this.Xa=b||0;return this};
+var up4={NQ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var Jfz={jS:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.ULy=function(a,b){this.Ns=a;this.Xa=b||0;return this};
+g.n41=function(a,b){this.Bv=a;this.Xa=b||0;return this};
+g.LzC=function(a,b){this.s7=a;this.Xa=b||0;return this};
+var $kX={OL:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var DH$={tg:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.vI8=function(a,b){this.hL=a;this.Xa=b||0;return this};
+g.Fq2=function(a,b){this.ml=a;this.Xa=b||0;return this};
+g.xQf=function(a,b){this.mx=a;this.Xa=b||0;return this};
+g.xyd=function(a,b){this.N1=a;this.Xa=b||0;return this};
+var XSQ={NA:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+Ase=function(a){return a?a.nN||null:void 0};
+g.gsA=function(a,b){this.k1=a;this.Xa=b||0;return this};
+Bkz=function(a){return a?a.u$||null:void 0};
+g._xm=function(a,b){this.Ly=a;this.Xa=b||0;return this};
+g.doA=function(a,b){this.gk=a;this.Xa=b||0;return this};
+fdE=function(a){return a?a.aI||null:void 0};
+var KpB={fg:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+ijs=function(a){return a?a.ZL||null:void 0};
+g.K__=function(a,b){this.rP=a;this.Xa=b||0;return this};
+g.k.O27=function(){var a=this.HW.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+asy=function(a){return a?a.W4||null:void 0};
+g.k.vFj=function(){var a=this.An.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+Zry=function(a){return a?a.TV||null:void 0};
+g.RxO=function(a,b){this.a6=a;this.Xa=b||0;return this};
+g.I82=function(a,b){this.b7=a;this.Xa=b||0;return this};
+vzU=function(a){return a?a.Tv||null:void 0};
+var UBJ={Bq:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var kaf={i7:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.hLa=function(){var a=this.Zx.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var dIc={tW:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.LPz=function(){var a=this.$8.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+jbx=function(a){return a?a.g3||null:void 0};
+LjW=function(a){return a?a.vO||null:void 0};
+g.u7B=function(a,b){this.JV=a;this.Xa=b||0;return this};
+p38=function(a){return a?a.Fn||null:void 0};
+rJc=function(a){return a?a.El||null:void 0};
+g.k.bEj=function(){var a=this.d_.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var AIh={hv:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var tkl={b9:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.SVX=function(){var a=this.WM.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+O4Y=function(a){return a?a.yK||null:void 0};
+g.k.m8m=function(){var a=this.q7.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+GQd=function(a){return a?a.OD||null:void 0};
+g.k.tPQ=function(){var a=this.j5.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var Jmo={jV:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.IVt=function(){var a=this.$p.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.keV=function(a,b){this.Bz=a;this.Xa=b||0;return this};
+MRJ=function(a){return a?a.A0||null:void 0};
+g.MgO=function(a,b){this.WZ=a;this.Xa=b||0;return this};
+g.k.gaD=function(){var a=this.Wr.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var vHI={T$:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.v$1=function(){var a=this.IA.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.PJC=function(){var a=this.vw.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.jFU=function(){var a=this.nY.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.tDD=function(){var a=this.iK.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var BOR={MG:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var iiO={eQ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var afY={rJ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.vNA=function(a,b){this.SY=a;this.Xa=b||0;return this};
+HzY=function(a){return a?a.Wl||null:void 0};
+var Owv={cF:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var W7n={Yg:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.Y2o=function(a,b){this.gE=a;this.Xa=b||0;return this};
+g.k.NIs=function(){var a=this.w3.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.t49=function(a,b){this.AE=a;this.Xa=b||0;return this};
+g.u9I=function(a,b){this.UY=a;this.Xa=b||0;return this};
+g.LiV=function(a,b){this.gq=a;this.Xa=b||0;return this};
+g.V$7=function(a,b){this.aM=a;this.Xa=b||0;return this};
+k_W=function(a){return a?a.Zb||null:void 0};
+g.zY1=function(a,b){this.wu=a;this.Xa=b||0;return this};
+g.k.Gtp=function(){var a=this.pK.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var rkS={TA:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+jsx=function(a){return a?a.Vf||null:void 0};
+g.k.qlv=function(){var a=this.fQ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+iXu=function(a){return a?a.Pi||null:void 0};
+var wSF={Rl:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.wg9=function(a,b){this.yV=a;this.Xa=b||0;return this};
+var oNB={vj:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.sEs=function(a,b){this.E7=a;this.Xa=b||0;return this};
+var sSN={we:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var fyZ={Um:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.M2q=function(a,b){this.F7=a;this.Xa=b||0;return this};
+g.dCW=function(a,b){this.ip=a;this.Xa=b||0;return this};
+g.r6B=function(a,b){this.NC=a;this.Xa=b||0;return this};
+g.k.v71=function(){var a=this.Km.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var CgH={c_:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var l9n={Zr:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+$3U=function(a){return a?a.uD||null:void 0};
+var a5p={RP:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.ELC=function(){var a=this.ro.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+tRF=function(a){return a?a.SM||null:void 0};
+g.JOS=function(a,b){this.QS=a;this.Xa=b||0;return this};
+var jHJ={DI:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.IIf=function(){var a=this.tT.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var VJ4={y_:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.dX2=function(a,b){this.Pa=a;this.Xa=b||0;return this};
+g.r0R=function(a,b){this.Ud=a;this.Xa=b||0;return this};
+var V_3={Ei:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+fJB=function(a){return a?a.Ek||null:void 0};
+g.k.ZHM=function(){var a=this.ZD.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.R5k=function(){var a=this.V0.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.fUC=function(){var a=this.QT.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+yVz=function(a){return a?a.DJ||null:void 0};
+y7Y=function(a){return a?a.sE||null:void 0};
+g.k.ULD=function(){var a=this.DR.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.JTX=function(a,b){this.f9=a;this.Xa=b||0;return this};
+var AOB={OC:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.zp7=function(a,b){this.gE=a;this.Xa=b||0;return this};
+g.k.zL_=function(){var a=this.ip.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.iRC=function(a,b){this.XR=a;this.Xa=b||0;return this};
+k3z=function(a){return a?a.dN||null:void 0};
+g.k.k5D=function(){var a=this.f$.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var RSk={wK:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var dfC={MQ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.Y6f=function(){var a=this.Qh.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+fSO=function(a){return a?a.yO||null:void 0};
+OT4=function(a){return a?a.iZ||null:void 0};
+rvH=function(a){return a?a.SO||null:void 0};
+g.k.c5R=function(){var a=this.BH.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.Xtg=function(){var a=this.HF.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.rTU=function(a,b){this.CW=a;this.Xa=b||0;return this};
+g.sZU=function(a,b){this.y$=a;this.Xa=b||0;return this};
+lbj=function(a){return a?a.t9||null:void 0};
+g.k.Qhf=function(){var a=this.HR.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+e1e=function(a){return a?a.l4||null:void 0};
+var f4G={Mg:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k._Ap=function(){var a=this.Sb.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.un$=function(a,b){this.hN=a;this.Xa=b||0;return this};
+g.k.ptm=function(){var a=this.nH.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+k6K=function(a){return a?a.N5||null:void 0};
+g.Bii=function(a,b){this.kv=a;this.Xa=b||0;return this};
+ZlY=function(a){return a?a.WH||null:void 0};
+g.k.zF8=function(){var a=this.NM.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.N0N=function(){var a=this.Ks.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var SGv={rV:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.tj1=function(){var a=this.gU.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+jUI=function(a){return a?a.OM||null:void 0};
+g.k.eOM=function(){var a=this.O9.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var Lpe={gR:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.DbB=function(){var a=this.eG.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.W2s=function(a,b){this.xs=a;this.Xa=b||0;return this};
+var Wcc={nT:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.u0X=function(){var a=this.eL.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+pUq=function(a){return a?a.X6||null:void 0};
+g.k.AA1=function(){var a=this.en.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.wkl=function(a,b){this.JR=a;this.Xa=b||0;return this};
+g.k.otS=function(){var a=this.qX.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var xFv={qx:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.cf1=function(){var a=this.zl.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var CLZ={fd:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+rZ9=function(a){return a?a.Bs||null:void 0};
+WJ6=function(a){return a?a.F0||null:void 0};
+var d_5={Ss:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var WTV={ZT:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var iGl={yY:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.$Si=function(a,b){this.G9=a;this.Xa=b||0;return this};
+c_h=function(a){return a?a.tC||null:void 0};
+var ayp={$c:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.tAA=function(a,b){this.Ez=a;this.Xa=b||0;return this};
+var _Yy={nl:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var cnm={S4:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var tR$={B4:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+aPQ=function(a){return a?a.YC||null:void 0};
+var WEX={F$:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.rhG=function(a,b){this.Cv=a;this.Xa=b||0;return this};
+g.TMO=function(a,b){this.Nj=a;this.Xa=b||0;return this};
+g._Q4=function(a,b){this.Wf=a;this.Xa=b||0;return this};
+UwN=function(a){return a?a.N_||null:void 0};
+g.k.jEr=function(){var a=this.jA.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var Oxk={K0:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+xgm=function(a){return a?a.Yi||null:void 0};
+g.k.H6n=function(){var a=this.lH.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var wCQ={sr:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.wVX=function(){var a=this.gx.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+QJL=function(a){return a?a.Gh||null:void 0};
+wsE=function(a){return a?a.sM||null:void 0};
+rDu=function(a){return a?a.gf||null:void 0};
+g.POM=function(a,b){this.X1=a;this.Xa=b||0;return this};
+g.ZhX=function(a,b){this.st=a;this.Xa=b||0;return this};
+g.k._pQ=function(){var a=this.s$.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var Ooo={Ym:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g._8B=function(a,b){this.f6=a;this.Xa=b||0;return this};
+g.gr_=function(a,b){this.oB=a;this.Xa=b||0;return this};
+g.k.q75=function(){var a=this.gi.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.egg=function(){var a=this.ci.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.lRf=function(a,b){this.Np=a;this.Xa=b||0;return this};
+g.k.U39=function(){var a=this.gB.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+Kuj=function(a){return a?a.Mn||null:void 0};
+g.k.iqk=function(){var a=this.Sg.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var Grc={hg:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.Y2G=function(){var a=this.fa.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.iXk=function(){var a=this.rN.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.Nqv=function(a,b){this.PW=a;this.Xa=b||0;return this};
+g.wDB=function(a,b){this.wR=a;this.Xa=b||0;return this};
+var gaa={R8:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var HYA={Ci:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.ZB5=function(){var a=this.uV.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.Akf=function(a,b){this.G$=a;this.Xa=b||0;return this};
+g.k.jFc=function(){var a=this.PZ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.Aea=function(){var a=this.e6.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+T0k=function(a){return a?a.KL||null:void 0};
+g.k._BL=function(){var a=this.qy.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var Nll={xf:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+Tvr=function(a){return a?a.jM||null:void 0};
+aqW=function(a){return a?a.XP||null:void 0};
+j0Q=function(a){return a?a.RI||null:void 0};
+var mdm={_z:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var A9n={PU:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var gsM={MD:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var dP5={ri:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var tlb={NH:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.M2p=function(){var a=this.Va.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.VBx=function(){var a=this.G0.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var qhL={oF:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.el1=function(a,b){this.Ea=a;this.Xa=b||0;return this};
+g.k.Fnf=function(){var a=this.uB.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var DXy={aE:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var sXd={pY:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.s7j=function(){var a=this.Tu.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.PUT=function(){var a=this.cY.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.mpR=function(a,b){this.Op=a;this.Xa=b||0;return this};
+g.k.cYK=function(){var a=this.CF.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.tq6=function(a,b){this.oP=a;this.Xa=b||0;return this};
+var B5r={dh:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.Gwn=function(a,b){this.vY=a;this.Xa=b||0;return this};
+g.k.BZ8=function(){var a=this.qt.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var q2t={lU:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+PUT=function(a){return a?a.QY||null:void 0};
+H5l=function(a){return a?a.R4||null:void 0};
+var gF6={_I:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var dmE={Hh:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+ATv=function(a){return a?a.Sw||null:void 0};
+so4=function(a){return a?a.pC||null:void 0};
+g.k.mfH=function(){var a=this.eN.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+N9U=function(a){return a?a.e8||null:void 0};
+g.BjG=function(a,b){this.qI=a;this.Xa=b||0;return this};
+g.Tbe=function(a,b){this.ub=a;this.Xa=b||0;return this};
+Oka=function(a){a=a.split("");Xy.Pq(a,47);Xy.w7(a,38);Xy.Kx(a,2);Xy.Pq(a,21);Xy.w7(a,62);Xy.Kx(a,3);return a.join("")};
+var Yk="split;join;reverse;push;length;enhanced_except_".split(";");
+Hma=function(a){var b=a[Yk[0]](""),c=[function(d,e){e=(e%d.length+d.length)%d.length;d.splice(-e).reverse().forEach(function(f){d.unshift(f)})},
+-1137205394,"/,,[/,913,/](,)}",function(d){d[Yk[2]]()},function(d,e){d[Yk[3]](e)},function(d,e){e=(e%d.length+d.length)%d.length;var f=d[0];d[0]=d[e];d[e]=f},
+function(d,e){for(var f=64,h=[];++f-h.length-32;){switch(f){case 58:f-=14;case 91:case 92:case 93:continue;case 123:f=47;case 94:case 95:case 96:continue;case 46:f=95;default:h.push(String.fromCharCode(f))}}d.forEach(function(l,m,n){n[m]=h[(h.indexOf(l)-h.indexOf(e[m])+m-32+f--)%h.length]})},
+null,b,/[\]\\}],/,"Xq9_zK-pL2mW0vYtR7sJ",function(d,e){e=(e%d.length+d.length)%d.length;d.splice(0,1,d.splice(e,1,d[0])[0])},
+function(d,e){for(e=(e%d.length+d.length)%d.length;e--;)d.unshift(d.pop())},
+function(d,e){d.length=0;var f=e.split("");for(var h=0;h<f.length;h++)d[Yk[3]](f[h])},
+function(){for(var d=64,e=[];++d-e.length-32;)switch(d){case 46:d=95;default:e.push(String.fromCharCode(d));case 94:case 95:case 96:break;case 123:d-=76;case 92:case 93:continue;case 58:d=44;case 91:}return e}];
+c[7]=c;c[15]=c[14]();
+try{c[6](c[8],c[10]),c[0](c[8],c[1]),c[5](c[8],c[1]*-3),c[3](c[8]),c[11](c[8],7),c[12](c[8],-1351),c[6](c[8],c[2]+c[10]),c[4](c[7],c[2]),c[0](c[8],c[7].length),c[5](c[8],c[15].length^9),c[3](c[8])}catch(d){return Yk[5]+a}
+return b[Yk[1]]("")};
+var Gma=[Hma];
+g.k.se9=function(){var a=this.CE.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.irt=function(a,b){this.GF=a;this.Xa=b||0;return this};
+g.k.FLD=function(){var a=this.oO.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var EYm={oA:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.OF6=function(){var a=this.FQ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var B9c={lM:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.cVP=function(){var a=this.Bg.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+CuA=function(a){return a?a.P$||null:void 0};
+g.iA3=function(a,b){this.y5=a;this.Xa=b||0;return this};
+aCi=function(a){return a?a.Ev||null:void 0};
+g.qTa=function(a,b){this.dS=a;this.Xa=b||0;return this};
+$Yo=function(a){return a?a.Zm||null:void 0};
+g.KLg=function(a,b){this.VA=a;this.Xa=b||0;return this};
+E_V=function(a){return a?a.Kq||null:void 0};
+var R_T={EE:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.Art=function(a,b){this.b5=a;this.Xa=b||0;return this};
+PYt=function(a){return a?a.UB||null:void 0};
+g.k.V8P=function(){var a=this.lE.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.Io$=function(){var a=this.om.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.HJV=function(){var a=this.C9.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.TkF=function(a,b){this.iu=a;this.Xa=b||0;return this};
+var Zr6={me:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+WWo=function(a){return a?a.Jz||null:void 0};
+var nJa={Jw:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+Nrw=function(a){return a?a.bN||null:void 0};
+g.UHI=function(a,b){this.Qh=a;this.Xa=b||0;return this};
+g.fgt=function(a,b){this.uF=a;this.Xa=b||0;return this};
+var y_h={vj:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+LeV=function(a){return a?a.TT||null:void 0};
+var zBI={yV:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.G8j=function(){var a=this.f6.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.Zer=function(a,b){this.Kv=a;this.Xa=b||0;return this};
+QTV=function(a){return a?a.OZ||null:void 0};
+var gW2={Sg:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.lwg=function(a,b){this.bk=a;this.Xa=b||0;return this};
+kL7=function(a){return a?a.IR||null:void 0};
+g.k.ECQ=function(){var a=this.yJ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+zxS=function(a){return a?a.Mu||null:void 0};
+var Hz6={R1:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+La9=function(a){return a?a.$S||null:void 0};
+g.k.YQs=function(){var a=this.t4.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.Yns=function(a,b){this.W$=a;this.Xa=b||0;return this};
+g.Y0V=function(a,b){this.ns=a;this.Xa=b||0;return this};
+g.etm=function(a,b){this.O_=a;this.Xa=b||0;return this};
+var fbv={rE:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var GGg={TE:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var fxx={WW:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var xDn={GG:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.LyZ=function(a,b){this.u0=a;this.Xa=b||0;return this};
+g.k.jWE=function(){var a=this.Lk.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.bJY=function(a,b){this.xk=a;this.Xa=b||0;return this};
+$Cd=function(a){return a?a.GL||null:void 0};
+g.YuZ=function(a,b){this.yP=a;this.Xa=b||0;return this};
+g.k.s9u=function(){var a=this.Ho.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+cWg=function(a){return a?a.HN||null:void 0};
+g.sXS=function(a,b){this.gq=a;this.Xa=b||0;return this};
+var Ncu={W6:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.tBE=function(){var a=this.iG.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.rlu=function(a,b){this.jf=a;this.Xa=b||0;return this};
+g.lco=function(a,b){this.e9=a;this.Xa=b||0;return this};
+g.k.a6h=function(){var a=this.tJ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.r6A=function(a,b){this.Ni=a;this.Xa=b||0;return this};
+g.k.zva=function(){var a=this.kq.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var axD={fo:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var FD4={ni:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.x7I=function(a,b){this.$d=a;this.Xa=b||0;return this};
+g.k.D_4=function(){var a=this.lN.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+gCn=function(a){return a?a.Mk||null:void 0};
+_MK=function(a){return a?a.jD||null:void 0};
+g.k.LOr=function(){var a=this.K3.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var Xea={rU:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var FtQ={d1:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.B1s=function(){var a=this.bs.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.kgT=function(a,b){this.NC=a;this.Xa=b||0;return this};
+g.k.aPN=function(){var a=this.X5.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.Byt=function(){var a=this.x9.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+yc3=function(a){return a?a.Ri||null:void 0};
+tjZ=function(a){return a?a.T1||null:void 0};
+g.k.utV=function(){var a=this.sH.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.WeC=function(a,b){this.lZ=a;this.Xa=b||0;return this};
+fy1=function(a){return a?a.rN||null:void 0};
+L21=function(a){return a?a.Mo||null:void 0};
+g.k.Lcs=function(){var a=this.QW.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var w9E={cf:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var tiB={tp:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.G8n=function(){var a=this.aj.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var _2c={gu:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.LU5=function(a,b){this.iE=a;this.Xa=b||0;return this};
+m89=function(a){return a?a.dK||null:void 0};
+g.k.iLT=function(){var a=this.Sz.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.bpr=function(a,b){this.Mg=a;this.Xa=b||0;return this};
+g.XZk=function(a,b){this.fp=a;this.Xa=b||0;return this};
+g.mn1=function(a,b){this.hn=a;this.Xa=b||0;return this};
+var VZk={pE:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.GH4=function(a,b){this.c1=a;this.Xa=b||0;return this};
+var XQ$={tu:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.tkz=function(a,b){this.xV=a;this.Xa=b||0;return this};
+g.k.cZY=function(){var a=this.i5.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+Qth=function(a){return a?a.jl||null:void 0};
+g.MEm=function(a,b){this.hF=a;this.Xa=b||0;return this};
+var gWD={py:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.EX0=function(){var a=this.Pv.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.N2L=function(){var a=this.ac.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var KbB={RV:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var mv6={Ne:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var NeR={_y:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.XWH=function(){var a=this.cp.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+lBB=function(a){return a?a.o9||null:void 0};
+var pop={uD:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.tao=function(){var a=this.yq.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var $jX={ai:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.SU$=function(a,b){this.oA=a;this.Xa=b||0;return this};
+g.k.XDu=function(){var a=this.Nm.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var btS={P2:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+BZ7=function(a){return a?a.yV||null:void 0};
+var u7u={ky:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+KqS=function(a){return a?a.X4||null:void 0};
+var Jfm={fC:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var aZX={cP:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.AUi=function(){var a=this.rE.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.pAR=function(){var a=this.hR.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var jY8={zY:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+fRS=function(a){return a?a.JK||null:void 0};
+var Zte={k8:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.exa=function(a,b){this.af=a;this.Xa=b||0;return this};
+vrz=function(a){return a?a.Y$||null:void 0};
+g.k.gPZ=function(){var a=this.Nm.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.GRV=function(){var a=this.qQ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.FCb=function(a,b){this.ds=a;this.Xa=b||0;return this};
+var D8K={zj:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var bQJ={bL:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+mhr=function(a){return a?a.fg||null:void 0};
+var eLr={kW:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.HH$=function(a,b){this.FN=a;this.Xa=b||0;return this};
+g.c71=function(a,b){this.Mc=a;this.Xa=b||0;return this};
+g.qky=function(a,b){this.dU=a;this.Xa=b||0;return this};
+g.k.sES=function(){var a=this.yQ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+_nJ=function(a){return a?a.md||null:void 0};
+var LC8={MK:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var Flx={dQ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.n89=function(a,b){this.dy=a;this.Xa=b||0;return this};
+g.k.ygU=function(){var a=this.Xz.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.I4y=function(){var a=this.ph.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var DK5={VO:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.I0X=function(a,b){this.N_=a;this.Xa=b||0;return this};
+var d67={TD:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var wdG={ZF:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.EGj=function(){var a=this._X.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+xrK=function(a){return a?a.Jx||null:void 0};
+As6=function(a){return a?a.xS||null:void 0};
+g.k._DA=function(){var a=this.ax.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+WxT=function(a){return a?a.Eh||null:void 0};
+g.qjl=function(a,b){this.uo=a;this.Xa=b||0;return this};
+var h3q={O2:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g._OF=function(a,b){this.xx=a;this.Xa=b||0;return this};
+g.tHj=function(a,b){this.v8=a;this.Xa=b||0;return this};
+g._mD=function(a,b){this.D3=a;this.Xa=b||0;return this};
+sbM=function(a){return a?a.hv||null:void 0};
+Bol=function(a){return a?a.Zs||null:void 0};
+g.JL3=function(a,b){this.gb=a;this.Xa=b||0;return this};
+g.k.g1X=function(){var a=this.id.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.$o$=function(a,b){this._s=a;this.Xa=b||0;return this};
+hus=function(a){return a?a.wc||null:void 0};
+g.ycj=function(a,b){this.if=a;this.Xa=b||0;return this};
+Z8_=function(a){return a?a.aS||null:void 0};
+var fjK={ZQ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var KeS={K0:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.uoe=function(a,b){this.jK=a;this.Xa=b||0;return this};
+var da9={r6:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+npd=function(a){return a?a.Yt||null:void 0};
+g.RQR=function(a,b){this.pM=a;this.Xa=b||0;return this};
+g.k.pFr=function(){var a=this.OF.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var EmV={hk:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.QE1=function(){var a=this.B0.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.RdW=function(a,b){this.VZ=a;this.Xa=b||0;return this};
+Y_$=function(a){return a?a.d4||null:void 0};
+g.k.axl=function(){var a=this.C2.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.VRa=function(){var a=this.Vi.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var m2f={XO:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+fL2=function(a){return a?a.Cj||null:void 0};
+Bfv=function(a){return a?a.zN||null:void 0};
+g.k.aoG=function(){var a=this.ap.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.aaq=function(a,b){this.h2=a;this.Xa=b||0;return this};
+vZL=function(a){return a?a.za||null:void 0};
+var yW8={nz:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+AS_=function(a){return a?a.pj||null:void 0};
+g.k.zCH=function(){var a=this.qk.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var HbI={Jr:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+k4L=function(a){return a?a.OO||null:void 0};
+var SmH={v0:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.yrl=function(){var a=this.rY.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.CFd=function(a,b){this.oi=a;this.Xa=b||0;return this};
+ee2=function(a){return a?a.XP||null:void 0};
+JZq=function(a){return a?a.eM||null:void 0};
+g.k.PwP=function(){var a=this.FS.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+T18=function(a){return a?a.Ae||null:void 0};
+XZq=function(a){return a?a.Td||null:void 0};
+var Y3f={nC:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var xHa={XC:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var AGC={ft:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.XIb=function(){var a=this.ya.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.q21=function(){var a=this.DQ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+IEf=function(a){return a?a.hJ||null:void 0};
+K9R=function(a){return a?a.w6||null:void 0};
+g.sce=function(a,b){this.ih=a;this.Xa=b||0;return this};
+var koJ={XC:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.akF=function(){var a=this.MR.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+lLj=function(a){return a?a.wj||null:void 0};
+Bny=function(a){return a?a.Zf||null:void 0};
+g.YhC=function(a,b){this.$t=a;this.Xa=b||0;return this};
+g.OdE=function(a,b){this.V3=a;this.Xa=b||0;return this};
+g.HHd=function(a,b){this.u6=a;this.Xa=b||0;return this};
+var U_R={AB:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+pLD=function(a){return a?a.az||null:void 0};
+g.pEs=function(a,b){this.c$=a;this.Xa=b||0;return this};
+g.k.BY7=function(){var a=this.mn.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.Bpr=function(a,b){this.R1=a;this.Xa=b||0;return this};
+g.l1A=function(a,b){this.Ky=a;this.Xa=b||0;return this};
+$dN=function(a){return a?a.rg||null:void 0};
+kQd=function(a){return a?a.pX||null:void 0};
+e5a=function(a){return a?a.ca||null:void 0};
+g.BDY=function(a,b){this.Gi=a;this.Xa=b||0;return this};
+var TjY={OC:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var X_G={b0:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.dpD=function(){var a=this.Jl.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+rGD=function(a){return a?a.H4||null:void 0};
+var Of9={ol:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.moP=function(a,b){this.IR=a;this.Xa=b||0;return this};
+Agd=function(a){return a?a.JK||null:void 0};
+var b6V={I$:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var mr0={x3:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var Hxw={qF:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.YdN=function(a,b){this.t4=a;this.Xa=b||0;return this};
+afU=function(a){return a?a.vQ||null:void 0};
+g.k.GO0=function(){var a=this.sk.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.qfV=function(){var a=this.Fk.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.Edi=function(){var a=this.XE.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var LAH={Lk:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.C46=function(){var a=this.AR.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+kkr=function(a){return a?a.RO||null:void 0};
+g.k.HCU=function(){var a=this.VI.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var GOz={Xp:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var fNB={TM:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.WbZ=function(a,b){this.gk=a;this.Xa=b||0;return this};
+rSk=function(a){return a?a.p0||null:void 0};
+g.k.UTM=function(){var a=this.J7.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.Dd7=function(a,b){this.eD=a;this.Xa=b||0;return this};
+var G1C={Wh:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+BIq=function(a){return a?a.WM||null:void 0};
+k02=function(a){return a?a.PK||null:void 0};
+g.uhD=function(a,b){this.CE=a;this.Xa=b||0;return this};
+g.xgk=function(a,b){this.Po=a;this.Xa=b||0;return this};
+V4t=function(a){return a?a.f9||null:void 0};
+$Ik=function(a){return a?a.ev||null:void 0};
+g.s59=function(a,b){this.tB=a;this.Xa=b||0;return this};
+g.k.p0O=function(){var a=this.r$.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.IRE=function(){var a=this.bf.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var mxF={Wl:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.NvS=function(a,b){this.A6=a;this.Xa=b||0;return this};
+g._8Q=function(a,b){this.wf=a;this.Xa=b||0;return this};
+g.Nrm=function(a,b){this.GJ=a;this.Xa=b||0;return this};
+g.SjS=function(a,b){this.uf=a;this.Xa=b||0;return this};
+pme=function(a){return a?a.P0||null:void 0};
+PwM=function(a){return a?a.fG||null:void 0};
+g.WyS=function(a,b){this.g2=a;this.Xa=b||0;return this};
+JUq=function(a){return a?a.XI||null:void 0};
+g.nyp=function(a,b){this.RO=a;this.Xa=b||0;return this};
+g.qp7=function(a,b){this.iB=a;this.Xa=b||0;return this};
+bcM=function(a){return a?a.iG||null:void 0};
+g.k.jz2=function(){var a=this.qz.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.W6c=function(a,b){this.S_=a;this.Xa=b||0;return this};
+var YC7={H_:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+UA3=function(a){return a?a.ZI||null:void 0};
+g.k.hmx=function(){var a=this.oG.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.nYg=function(){var a=this.YX.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+Vp4=function(a){return a?a.Rd||null:void 0};
+var pgO={Ng:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.ZZb=function(a,b){this.Ji=a;this.Xa=b||0;return this};
+g.bxC=function(a,b){this.Vx=a;this.Xa=b||0;return this};
+YEP=function(a){return a?a.y7||null:void 0};
+g.k.ZpY=function(){var a=this.aJ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.cD9=function(a,b){this.jK=a;this.Xa=b||0;return this};
+lpg=function(a){return a?a.U9||null:void 0};
+Cg5=function(a){return a?a.Y2||null:void 0};
+g.aLS=function(a,b){this.SL=a;this.Xa=b||0;return this};
+ZPu=function(a){return a?a.c0||null:void 0};
+g.LX$=function(a,b){this._6=a;this.Xa=b||0;return this};
+g.hFM=function(a,b){this.qM=a;this.Xa=b||0;return this};
+g.Vqu=function(a,b){this.jt=a;this.Xa=b||0;return this};
+var Bay={Pp:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.SUd=function(){var a=this.ka.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+Hvi=function(a){return a?a.lw||null:void 0};
+$SP=function(a){return a?a.Ih||null:void 0};
+ZL0=function(a){return a?a.Dc||null:void 0};
+g.k.DN5=function(){var a=this.Cr.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+_Kp=function(a){return a?a.Se||null:void 0};
+g.k.UsU=function(){var a=this.ow.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.y5V=function(a,b){this.Cu=a;this.Xa=b||0;return this};
+g.k.yvV=function(){var a=this.G7.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.$Fo=function(a,b){this.bI=a;this.Xa=b||0;return this};
+g.XXF=function(a,b){this.sK=a;this.Xa=b||0;return this};
+g.k.rHO=function(){var a=this.sa.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.tEn=function(){var a=this.F$.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.fcn=function(a,b){this.Np=a;this.Xa=b||0;return this};
+g.smv=function(a,b){this.t7=a;this.Xa=b||0;return this};
+g.k.dHP=function(){var a=this.NC.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+W5$=function(a){return a?a.wo||null:void 0};
+g.ehT=function(a,b){this.iL=a;this.Xa=b||0;return this};
+g.fl2=function(a,b){this.DT=a;this.Xa=b||0;return this};
+IIT=function(a){return a?a.nd||null:void 0};
+var pu3={bv:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.SkD=function(){var a=this.SO.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+xhN=function(a){return a?a.w7||null:void 0};
+g.$uX=function(a,b){this.AY=a;this.Xa=b||0;return this};
+g.k.kpo=function(){var a=this.TN.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.HHc=function(){var a=this.hP.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+PCq=function(a){return a?a.Pz||null:void 0};
+PcZ=function(a){return a?a.TU||null:void 0};
+Snk=function(a){return a?a.b9||null:void 0};
+g.z5s=function(a,b){this.Dj=a;this.Xa=b||0;return this};
+g.iOJ=function(a,b){this.o6=a;this.Xa=b||0;return this};
+V81=function(a){return a?a.Ti||null:void 0};
+var Dwi={MH:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.Hhq=function(a,b){this.tH=a;this.Xa=b||0;return this};
+g.dFS=function(a,b){this.aK=a;this.Xa=b||0;return this};
+g.k.kQr=function(){var a=this.fk.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+rTT=function(a){return a?a.Nr||null:void 0};
+PA7=function(a){return a?a.$G||null:void 0};
+var EDL={YO:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var c2s={K4:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+rT1=function(a){return a?a.hN||null:void 0};
+var c3V={eF:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.djK=function(a,b){this.LL=a;this.Xa=b||0;return this};
+var anP={ot:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.v7s=function(a,b){this.nH=a;this.Xa=b||0;return this};
+g.jn2=function(a,b){this.ha=a;this.Xa=b||0;return this};
+g.hPU=function(a,b){this.LR=a;this.Xa=b||0;return this};
+g.k.W_3=function(){var a=this.hZ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.j2M=function(a,b){this.Mk=a;this.Xa=b||0;return this};
+YqQ=function(a){return a?a.Fm||null:void 0};
+g.k.JEi=function(){var a=this.BE.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var Hkq={hK:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.vKM=function(a,b){this.oZ=a;this.Xa=b||0;return this};
+var Wrz={fq:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.G1U=function(a,b){this.dX=a;this.Xa=b||0;return this};
+bre=function(a){return a?a.Hl||null:void 0};
+g.k.qGi=function(){var a=this.NR.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.$qE=function(a,b){this.jx=a;this.Xa=b||0;return this};
+g.k.tqt=function(){var a=this.aB.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.qqm=function(a,b){this.Ov=a;this.Xa=b||0;return this};
+g.k.BlD=function(){var a=this.JM.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.iT5=function(a,b){this.T_=a;this.Xa=b||0;return this};
+g.zpH=function(a,b){this.WC=a;this.Xa=b||0;return this};
+g.bif=function(a,b){this.fQ=a;this.Xa=b||0;return this};
+var VD0={V8:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.g3n=function(){var a=this.pz.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.iol=function(a,b){this.ts=a;this.Xa=b||0;return this};
+SwB=function(a){return a?a.bf||null:void 0};
+var VPy={AW:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var AIz={wu:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.t8G=function(){var a=this.qL.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var Qdv={a5:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.ILX=function(){var a=this.Ty.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.Sar=function(a,b){this.HK=a;this.Xa=b||0;return this};
+MAJ=function(a){return a?a.CJ||null:void 0};
+IiB=function(a){return a?a.K5||null:void 0};
+g.k.c18=function(){var a=this.wr.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var GCA={TR:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.C1z=function(){var a=this.vy.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var UT1={CE:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.hCf=function(a,b){this._U=a;this.Xa=b||0;return this};
+g.k.Dsd=function(){var a=this.rC.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var OPf={du:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.pwh=function(a,b){this.jO=a;this.Xa=b||0;return this};
+vvd=function(a){return a?a.vG||null:void 0};
+var GRJ={kx:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.BJH=function(a,b){this.tQ=a;this.Xa=b||0;return this};
+etN=function(a){return a?a.NY||null:void 0};
+qAH=function(a){return a?a.p8||null:void 0};
+g.k.Qx9=function(){var a=this.EO.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var SFz={sL:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.nSs=function(){var a=this.gb.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.n0I=function(){var a=this.v1.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.THU=function(a,b){this.p6=a;this.Xa=b||0;return this};
+var p_s={yl:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.ijX=function(){var a=this.un.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.A09=function(){var a=this.oY.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.TvY=function(a,b){this.k1=a;this.Xa=b||0;return this};
+g.qvI=function(a,b){this.k3=a;this.Xa=b||0;return this};
+VhG=function(a){return a?a.Ws||null:void 0};
+$Gx=function(a){return a?a.J9||null:void 0};
+var ZTM={gr:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.eQO=function(a,b){this.Ev=a;this.Xa=b||0;return this};
+eHu=function(a){return a?a.Mn||null:void 0};
+nS1=function(a){return a?a.uG||null:void 0};
+g.AM2=function(a,b){this.Jk=a;this.Xa=b||0;return this};
+QTk=function(a){return a?a._S||null:void 0};
+var o8d={uC:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+a4z=function(a){return a?a.K4||null:void 0};
+var r6F={uQ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+_K9=function(a){return a?a.hq||null:void 0};
+g.dt2=function(a,b){this.bV=a;this.Xa=b||0;return this};
+g.eMU=function(a,b){this.Ur=a;this.Xa=b||0;return this};
+g.k.Un4=function(){var a=this.X7.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+zzX=function(a){return a?a.Rv||null:void 0};
+g.dLk=function(a,b){this.Ox=a;this.Xa=b||0;return this};
+var qSX={qy:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.liM=function(a,b){this.Da=a;this.Xa=b||0;return this};
+var AML={jM:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var rsG={lY:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+PGa=function(a){return a?a.Va||null:void 0};
+g.KVn=function(a,b){this.Ad=a;this.Xa=b||0;return this};
+g.dK2=function(a,b){this.iE=a;this.Xa=b||0;return this};
+g.coF=function(a,b){this.Xk=a;this.Xa=b||0;return this};
+Rx1=function(a){return a?a.pd||null:void 0};
+g.k.hVM=function(){var a=this.JH.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.zt9=function(){var a=this.ik.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.KyE=function(a,b){this.V4=a;this.Xa=b||0;return this};
+C0j=function(a){return a?a.xM||null:void 0};
+xPD=function(a){return a?a.qd||null:void 0};
+XzI=function(a){return a?a.iA||null:void 0};
+var ze5={Ss:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.VVV=function(){var a=this.F_.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var Y51={oG:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.lQM=function(a,b){this.cn=a;this.Xa=b||0;return this};
+Ivr=function(a){return a?a.pb||null:void 0};
+hln=function(a){return a?a.D6||null:void 0};
+g.XQS=function(a,b){this.sw=a;this.Xa=b||0;return this};
+var yGN={OR:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.nbM=function(a,b){this.fC=a;this.Xa=b||0;return this};
+var Dm5={Wc:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.qtd=function(a,b){this.GW=a;this.Xa=b||0;return this};
+g.k.p_6=function(){var a=this.aY.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.HDP=function(){var a=this.oU.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.UdR=function(){var a=this.ZY.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.c1b=function(a,b){this.S2=a;this.Xa=b||0;return this};
+g.k.g2R=function(){var a=this.kQ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var vBZ={v8:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var IqW={f_:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.VHP=function(a,b){this.MI=a;this.Xa=b||0;return this};
+g.k.$on=function(){var a=this.xm.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.kRS=function(a,b){this.FL=a;this.Xa=b||0;return this};
+g.K5U=function(a,b){this.mM=a;this.Xa=b||0;return this};
+g.ObM=function(a,b){this.Ks=a;this.Xa=b||0;return this};
+g.c5l=function(a,b){this.ST=a;this.Xa=b||0;return this};
+var wZy={_9:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.AC8=function(){var a=this.pw.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var N6x={iK:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var jtn={T8:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.sRL=function(a,b){this.wF=a;this.Xa=b||0;return this};
+g.ekC=function(a,b){this.Hs=a;this.Xa=b||0;return this};
+ifs=function(a){return a?a.Sk||null:void 0};
+var JP1={fe:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+Rcp=function(a){return a?a.uo||null:void 0};
+XMa=function(a){return a?a.bY||null:void 0};
+g.k.z9E=function(){var a=this.pH.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.tC3=function(a,b){this.FG=a;this.Xa=b||0;return this};
+DD0=function(a){return a?a.cK||null:void 0};
+g.k.gH2=function(){var a=this.JB.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var nqM={nn:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.mMC=function(a,b){this.bz=a;this.Xa=b||0;return this};
+asn=function(a){return a?a.LS||null:void 0};
+g.k.lky=function(){var a=this.Z9.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.YKs=function(a,b){this.sL=a;this.Xa=b||0;return this};
+g.k.c96=function(){var a=this.Ci.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.F3y=function(){var a=this.zy.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+j8O=function(a){return a?a._K||null:void 0};
+g.jqL=function(a,b){this.vw=a;this.Xa=b||0;return this};
+var nmE={Bd:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.MS9=function(a,b){this.UW=a;this.Xa=b||0;return this};
+g.SUN=function(a,b){this.X$=a;this.Xa=b||0;return this};
+g.k.KJQ=function(){var a=this.VJ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var vt5={wF:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.vcb=function(){var a=this.V_.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.cdw=function(a,b){this.iN=a;this.Xa=b||0;return this};
+g.bm6=function(a,b){this.Tf=a;this.Xa=b||0;return this};
+g.k.u2e=function(){var a=this.hr.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+nx3=function(a){return a?a.aT||null:void 0};
+var NxB={M5:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.oQm=function(){var a=this.F$.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+Qp$=function(a){return a?a.R6||null:void 0};
+g.HTA=function(a,b){this.g7=a;this.Xa=b||0;return this};
+g.WP0=function(a,b){this.Bi=a;this.Xa=b||0;return this};
+var qlm={b2:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.knv=function(){var a=this.CA.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.NDb=function(a,b){this.oz=a;this.Xa=b||0;return this};
+g.k.o4G=function(){var a=this.Ce.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+HjT=function(a){return a?a.TD||null:void 0};
+var sTG={$m:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var M8y={yU:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.ZEO=function(a,b){this.OY=a;this.Xa=b||0;return this};
+Y8T=function(a){return a?a.pM||null:void 0};
+var hX7={tF:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.MWN=function(){var a=this.f9.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.Twk=function(){var a=this._i.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var hdB={Z$:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.pJ7=function(){var a=this.bH.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+yEZ=function(a){return a?a.bh||null:void 0};
+var n6d={lm:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+wlA=function(a){return a?a.K9||null:void 0};
+g.RBV=function(a,b){this.$J=a;this.Xa=b||0;return this};
+g.k.AeO=function(){var a=this.GL.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.f6a=function(a,b){this.TB=a;this.Xa=b||0;return this};
+g.k.K7w=function(){var a=this.ry.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.ADv=function(){var a=this.HB.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+Z1b=function(a){return a?a.nL||null:void 0};
+var z4A={Ib:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.id2=function(){var a=this.O4.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var jLx={Es:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.cK0=function(){var a=this.xk.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g6U=function(a){return a?a.eJ||null:void 0};
+XzF=function(a){return a?a.zT||null:void 0};
+var PoJ={Zn:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+RsV=function(a){return a?a.P_||null:void 0};
+g.k.PDh=function(){var a=this.wg.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.iW8=function(a,b){this.jY=a;this.Xa=b||0;return this};
+var tnu={NM:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.LIP=function(){var a=this._e.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+Ipe=function(a){return a?a.xZ||null:void 0};
+var MoE={TR:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var S7y={ed:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var Dv8={jC:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.gUo=function(){var a=this.vU.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var zOy={Zf:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.RtB=function(){var a=this.Zr.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+Cxs=function(a){return a?a.f6||null:void 0};
+var Oyq={gu:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.msM=function(){var a=this.aQ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+qPd=function(a){return a?a.TH||null:void 0};
+g.AR9=function(a,b){this.Rg=a;this.Xa=b||0;return this};
+g.rs2=function(a,b){this.fw=a;this.Xa=b||0;return this};
+$PS=function(a){return a?a.go||null:void 0};
+var _Jk={H2:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+C5l=function(a){return a?a.cD||null:void 0};
+Cyw=function(a){return a?a.Aw||null:void 0};
+var Vdm={Qz:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.Tni=function(a,b){this.dp=a;this.Xa=b||0;return this};
+dcr=function(a){return a?a.$7||null:void 0};
+var Puy={CN:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var vBe={gH:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+ilY=function(a){return a?a.Bh||null:void 0};
+g.EQ6=function(a,b){this.pi=a;this.Xa=b||0;return this};
+g.k.VpP=function(){var a=this.n1.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.t00=function(a,b){this.RI=a;this.Xa=b||0;return this};
+Wbk=function(a){return a?a.HD||null:void 0};
+sYf=function(a){return a?a.DA||null:void 0};
+var BBp={im:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+UKz=function(a){return a?a.pB||null:void 0};
+g.k.ezF=function(){var a=this.CS.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+cqY=function(a){return a?a.Wz||null:void 0};
+QUJ=function(a){return a?a.If||null:void 0};
+g.WxY=function(a,b){this.Pl=a;this.Xa=b||0;return this};
+var $ZF={ol:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var VvA={un:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.B77=function(){var a=this.FH.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var Iug={vS:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+v41=function(a){return a?a.MK||null:void 0};
+g.bBX=function(a,b){this.Fj=a;this.Xa=b||0;return this};
+g.k.S4P=function(){var a=this.sP.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.GWI=function(a,b){this.Qm=a;this.Xa=b||0;return this};
+Q4N=function(a){return a?a.Wi||null:void 0};
+var JvM={ya:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.yc4=function(){var a=this.fD.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+OF1=function(a){return a?a.l3||null:void 0};
+var Nfd={JC:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var lhZ={yS:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var KIb={gp:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+grk=function(a){return a?a.L$||null:void 0};
+g.xtn=function(a,b){this.tk=a;this.Xa=b||0;return this};
+tX_=function(a){return a?a.oY||null:void 0};
+JER=function(a){return a?a.EL||null:void 0};
+var xrj={kJ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.eEh=function(){var a=this.JY.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var lJ0={Nq:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var oXu={Ty:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var jkB={qp:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.Jn2=function(){var a=this.$g.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var q0g={jK:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.tCA=function(a,b){this.kq=a;this.Xa=b||0;return this};
+g.z1X=function(a,b){this.Su=a;this.Xa=b||0;return this};
+var OQF={yV:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.KW$=function(){var a=this.d7.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var GpZ={XM:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.t53=function(a,b){this.Le=a;this.Xa=b||0;return this};
+g.k.Swx=function(){var a=this.sd.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k8o=function(a,b){this.yy=a;this.Xa=b||0;return this};
+g.vxh=function(a,b){this.Ip=a;this.Xa=b||0;return this};
+iVe=function(a){return a?a.Ib||null:void 0};
+QfG=function(a){return a?a.L9||null:void 0};
+g.wLX=function(a,b){this.zv=a;this.Xa=b||0;return this};
+var rW3={VG:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.ZoK=function(a,b){this.gS=a;this.Xa=b||0;return this};
+var blg={vj:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.m96=function(){var a=this.fs.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.UlV=function(a,b){this.Mt=a;this.Xa=b||0;return this};
+g.llG=function(a,b){this.Kf=a;this.Xa=b||0;return this};
+var PHi={_3:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k0U=function(a,b){this.cI=a;this.Xa=b||0;return this};
+var Tx4={_9:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.Ted=function(a,b){this.uG=a;this.Xa=b||0;return this};
+g.SxM=function(a,b){this.RI=a;this.Xa=b||0;return this};
+var _3S={xC:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+$vX=function(a){return a?a.TY||null:void 0};
+g.k.JXU=function(){var a=this.Ib.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.Erg=function(){var a=this.yK.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.UlZ=function(a,b){this.dn=a;this.Xa=b||0;return this};
+RTE=function(a){return a?a.F5||null:void 0};
+g.k.vXU=function(){var a=this.rH.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.TXo=function(){var a=this.bX.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.FSj=function(){var a=this.et.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+D7$=function(a){return a?a.Gc||null:void 0};
+var Rv1={XL:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+$ju=function(a){return a?a.Ce||null:void 0};
+g.k.o9Q=function(){var a=this.cs.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var F5J={j4:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.nKE=function(a,b){this.WS=a;this.Xa=b||0;return this};
+var YRF={sk:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var lC0={zm:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var itx={nD:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+vIg=function(a){return a?a.GP||null:void 0};
+var l_z={_A:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var zHN={_I:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.cvk=function(){var a=this.kt.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+bD2=function(a){return a?a.FQ||null:void 0};
+ERs=function(a){return a?a.TI||null:void 0};
+QvV=function(a){return a?a.w4||null:void 0};
+g.Coc=function(a,b){this.gy=a;this.Xa=b||0;return this};
+g.k.JQ5=function(){var a=this.Pu.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.hsX=function(){var a=this.kf.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+n1z=function(a){return a?a.DT||null:void 0};
+g.k.ogW=function(){var a=this.le.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+Onx=function(a){return a?a.$J||null:void 0};
+g.zZJ=function(a,b){this.ln=a;this.Xa=b||0;return this};
+var bZk={Ri:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.hEN=function(a,b){this.f$=a;this.Xa=b||0;return this};
+_9C=function(a){return a?a.qx||null:void 0};
+var uL1={fx:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+$mf=function(a){return a?a.DH||null:void 0};
+Nc4=function(a){return a?a.pC||null:void 0};
+g.ScQ=function(a,b){this.Fq=a;this.Xa=b||0;return this};
+g.k.LGt=function(){var a=this.YC.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.b4i=function(){var a=this.mJ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+m3Q=function(a){return a?a.yu||null:void 0};
+var klv={UC:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.Gpw=function(a,b){this.wn=a;this.Xa=b||0;return this};
+R6k=function(a){return a?a._4||null:void 0};
+g.UGm=function(a,b){this.FN=a;this.Xa=b||0;return this};
+var uTD={GZ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.aYD=function(){var a=this.T2.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.ST6=function(a,b){this.z_=a;this.Xa=b||0;return this};
+zIH=function(a){return a?a.zt||null:void 0};
+g.swV=function(a,b){this._p=a;this.Xa=b||0;return this};
+SX$=function(a){return a?a.b3||null:void 0};
+var uLd={AG:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+PYl=function(a){return a?a.Zi||null:void 0};
+g.PAu=function(a,b){this.oM=a;this.Xa=b||0;return this};
+var L3i={hH:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g._fN=function(a,b){this.zD=a;this.Xa=b||0;return this};
+BJ8=function(a){return a?a.S0||null:void 0};
+var KAY={q8:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var wdr={WN:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+hif=function(a){return a?a.Js||null:void 0};
+g.k.TGp=function(){var a=this.T0.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var oSY={Cv:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+IZF=function(a){return a?a._B||null:void 0};
+g.FRo=function(a,b){this.c6=a;this.Xa=b||0;return this};
+WZy=function(a){return a?a.q4||null:void 0};
+d8a=function(a){return a?a.Gi||null:void 0};
+g.rAV=function(a,b){this.pO=a;this.Xa=b||0;return this};
+var gFP={I2:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.$HV=function(){var a=this.nQ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.r1G=function(){var a=this.od.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var xdK={CD:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.v7e=function(a,b){this.SL=a;this.Xa=b||0;return this};
+g.RFY=function(a,b){this.Vl=a;this.Xa=b||0;return this};
+g.RCB=function(a,b){this.RI=a;this.Xa=b||0;return this};
+d6q=function(a){return a?a.zY||null:void 0};
+g.YG8=function(a,b){this.KZ=a;this.Xa=b||0;return this};
+g.k.QZk=function(){var a=this.vL.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+Gnc=function(a){return a?a.AO||null:void 0};
+g.QHD=function(a,b){this.ns=a;this.Xa=b||0;return this};
+g.u2f=function(a,b){this.q6=a;this.Xa=b||0;return this};
+PbU=function(a){return a?a.iP||null:void 0};
+Z3Y=function(a){return a?a.M4||null:void 0};
+g.k.YdC=function(){var a=this.ld.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.srK=function(){var a=this.m2.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.xA4=function(a,b){this.Ku=a;this.Xa=b||0;return this};
+g.k.E07=function(){var a=this.Uy.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+Qya=function(a){return a?a.C0||null:void 0};
+g.REr=function(a,b){this.k0=a;this.Xa=b||0;return this};
+var kMr={Yt:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.z35=function(){var a=this.$n.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.OWg=function(){var a=this.ev.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.OAF=function(){var a=this.rK.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.otT=function(a,b){this.L3=a;this.Xa=b||0;return this};
+g.k.cU_=function(){var a=this.Hq.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.w3y=function(a,b){this.Xo=a;this.Xa=b||0;return this};
+g.XcH=function(a,b){this.zh=a;this.Xa=b||0;return this};
+var YlA={Rf:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.W8z=function(a,b){this.ki=a;this.Xa=b||0;return this};
+g.k.BEf=function(){var a=this.J3.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.O3K=function(){var a=this.Y9.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+qAz=function(a){return a?a.uv||null:void 0};
+O$J=function(a){return a?a.OD||null:void 0};
+g.BcT=function(a,b){this.jg=a;this.Xa=b||0;return this};
+g.k.yX7=function(){var a=this.yA.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.VwO=function(){var a=this.vN.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var iiN={lP:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.fdK=function(a,b){this.G4=a;this.Xa=b||0;return this};
+g.O1l=function(a,b){this.cF=a;this.Xa=b||0;return this};
+g.k.wy8=function(){var a=this.cQ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+sZf=function(a){return a?a.$p||null:void 0};
+iuZ=function(a){return a?a.Fp||null:void 0};
+kWQ=function(a){return a?a.c_||null:void 0};
+Q1q=function(a){return a?a.oJ||null:void 0};
+var C$k={Os:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+d91=function(a){return a?a.BM||null:void 0};
+g.k.lfW=function(){var a=this.QT.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.ele=function(){var a=this.i7.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.uzb=function(){var a=this.q$.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+TI2=function(a){return a?a.vK||null:void 0};
+MJI=function(a){return a?a.aD||null:void 0};
+_vV=function(a){return a?a.$N||null:void 0};
+g.k.fJd=function(){var a=this.rO.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+_RY=function(a){return a?a.KR||null:void 0};
+cbz=function(a){return a?a.SK||null:void 0};
+bzh=function(a){return a?a.qC||null:void 0};
+var Iqe={Hm:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+UUL=function(a){return a?a.EC||null:void 0};
+g.Qt8=function(a,b){this.gs=a;this.Xa=b||0;return this};
+g.k.EW2=function(){var a=this.ci.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.JYP=function(){var a=this.eH.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var hys={kB:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var T5M={Ce:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var FMQ={KD:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.sSb=function(){var a=this.pm.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.xG7=function(){var a=this.jB.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var CSt={xu:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.Ru7=function(a,b){this.QU=a;this.Xa=b||0;return this};
+g.k.LCs=function(){var a=this.F9.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.$02=function(){var a=this.d1.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.Fn2=function(a,b){this._r=a;this.Xa=b||0;return this};
+g.k.Kis=function(){var a=this.pY.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.JWV=function(){var a=this.TL.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+C8m=function(a){return a?a.Tk||null:void 0};
+g.k.INq=function(){var a=this.L2.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.ZGh=function(a,b){this.HP=a;this.Xa=b||0;return this};
+var dlu={ul:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.rzy=function(){var a=this.yn.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.cLX=function(a,b){this.aF=a;this.Xa=b||0;return this};
+LX1=function(a){return a?a.nI||null:void 0};
+g.BYc=function(a,b){this.Uj=a;this.Xa=b||0;return this};
+tuq=function(a){return a?a.WM||null:void 0};
+g.k.Pue=function(){var a=this.Os.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.IuO=function(){var a=this._D.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var AMF={qC:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.ERa=function(){var a=this.N2.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+eiY=function(a){return a?a.wB||null:void 0};
+ccB=function(a){return a?a.PZ||null:void 0};
+g.k.TrJ=function(){var a=this.Tb.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var E_D={ca:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var B3C={o3:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+_el=function(a){return a?a.Fg||null:void 0};
+g.k.v_7=function(){var a=this.Vu.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var rot={$i:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.G6A=function(){var a=this.T7.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k._d2=function(){var a=this.l$.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+EoZ=function(a){return a?a.c8||null:void 0};
+gM0=function(a){return a?a._Q||null:void 0};
+etQ=function(a){return a?a.Lu||null:void 0};
+g.grC=function(a,b){this.RM=a;this.Xa=b||0;return this};
+g.k.wpZ=function(){var a=this.dN.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.FwP=function(a,b){this.$e=a;this.Xa=b||0;return this};
+g.k.A2t=function(){var a=this.yT.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+yRf=function(a){return a?a.Km||null:void 0};
+var _Z7={pr:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+o5U=function(a){return a?a.EP||null:void 0};
+var iGj={ze:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.Mhj=function(){var a=this.XN.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.LHF=function(){var a=this.zM.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.CpG=function(a,b){this.AM=a;this.Xa=b||0;return this};
+g.mIt=function(a,b){this.BS=a;this.Xa=b||0;return this};
+var reQ={So:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var P8F={P1:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.GY0=function(a,b){this.Zm=a;this.Xa=b||0;return this};
+var PJz={XW:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.gHr=function(){var a=this.As.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+t$G=function(a){return a?a.IL||null:void 0};
+g.iND=function(a,b){this.Ie=a;this.Xa=b||0;return this};
+g.JAN=function(a,b){this.qj=a;this.Xa=b||0;return this};
+g.k.P$c=function(){var a=this.BZ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.CYm=function(a,b){this.Bq=a;this.Xa=b||0;return this};
+se_=function(a){return a?a.OF||null:void 0};
+g.Ynx=function(a,b){this.tZ=a;this.Xa=b||0;return this};
+g.k.Hwh=function(){var a=this._q.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var j6l={yU:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var YIT={Kh:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.EkJ=function(a,b){this.Xu=a;this.Xa=b||0;return this};
+g.syx=function(a,b){this.vO=a;this.Xa=b||0;return this};
+g.k.OYf=function(){var a=this.rs.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.kBt=function(){var a=this.VP.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+N5v=function(a){return a?a.WQ||null:void 0};
+g.vwl=function(a,b){this.cC=a;this.Xa=b||0;return this};
+g.k.OYF=function(){var a=this.qt.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+rke=function(a){return a?a.YU||null:void 0};
+Me1=function(a){return a?a.P$||null:void 0};
+g.JdS=function(a,b){this.mM=a;this.Xa=b||0;return this};
+var x74={an:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.xBP=function(){var a=this.e_.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+TVe=function(a){return a?a.X5||null:void 0};
+g.i7d=function(a,b){this.kY=a;this.Xa=b||0;return this};
+var $4t={dV:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.kEx=function(a,b){this.ZS=a;this.Xa=b||0;return this};
+$ky=function(a){return a?a.LJ||null:void 0};
+oY7=function(a){return a?a.vm||null:void 0};
+var zwf={To:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.c0A=function(a,b){this.TB=a;this.Xa=b||0;return this};
+var ngg={$h:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.Qvc=function(){var a=this.bR.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.L$N=function(a,b){this.Dn=a;this.Xa=b||0;return this};
+g.k.xpO=function(){var a=this.ZZ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.VoQ=function(a,b){this.Yz=a;this.Xa=b||0;return this};
+SG4=function(a){return a?a.ts||null:void 0};
+g.k.KIH=function(){var a=this.Lr.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+rDR=function(a){return a?a.O7||null:void 0};
+g.KIw=function(a,b){this.RQ=a;this.Xa=b||0;return this};
+g.k.cKz=function(){var a=this.Bg.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var M1h={oL:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var qKb={Th:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var ufu={lZ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+uw0=function(a){return a?a.Bu||null:void 0};
+g.uJw=function(a,b){this.wY=a;this.Xa=b||0;return this};
+var HLV={AJ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.eiG=function(){var a=this.wK.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.Z9W=function(a,b){this.Qc=a;this.Xa=b||0;return this};
+g.KaS=function(a,b){this.E9=a;this.Xa=b||0;return this};
+var $8z={kI:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.hf1=function(a,b){this.v8=a;this.Xa=b||0;return this};
+odU=function(a){return a?a.Hc||null:void 0};
+var qnI={GO:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var xjX={fS:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.Zht=function(){var a=this.wc.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+bgf=function(a){return a?a.IT||null:void 0};
+var RJr={ce:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+Vmc=function(a){return a?a._B||null:void 0};
+g.k.reO=function(){var a=this.O$.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+NRz=function(a){return a?a.l5||null:void 0};
+CGT=function(a){return a?a.Bu||null:void 0};
+g.WWa=function(a,b){this.s3=a;this.Xa=b||0;return this};
+g.K_o=function(a,b){this.ga=a;this.Xa=b||0;return this};
+NeW=function(a){return a?a.OY||null:void 0};
+g.wqk=function(a,b){this.yr=a;this.Xa=b||0;return this};
+g.cWI=function(a,b){this.O0=a;this.Xa=b||0;return this};
+g.k.OOn=function(){var a=this._1.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+U8r=function(a){return a?a.jU||null:void 0};
+g.wBK=function(a,b){this.pq=a;this.Xa=b||0;return this};
+g.EB9=function(a,b){this.jf=a;this.Xa=b||0;return this};
+g.wJH=function(a,b){this.hj=a;this.Xa=b||0;return this};
+GE$=function(a){return a?a.oa||null:void 0};
+var P$s={sL:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.f1b=function(a,b){this.tY=a;this.Xa=b||0;return this};
+var FyN={xn:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var Bdy={G2:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+r44=function(a){return a?a.rq||null:void 0};
+cgC=function(a){return a?a.Zl||null:void 0};
+pl7=function(a){return a?a.$d||null:void 0};
+g.k.rGX=function(){var a=this.Ki.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.EKw=function(){var a=this.p6.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.$gC=function(a,b){this.fs=a;this.Xa=b||0;return this};
+g.k.kfi=function(){var a=this.g1.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.w_J=function(a,b){this.r3=a;this.Xa=b||0;return this};
+g.QNS=function(a,b){this.Ck=a;this.Xa=b||0;return this};
+g.fUx=function(a,b){this.cg=a;this.Xa=b||0;return this};
+gto=function(a){return a?a.QR||null:void 0};
+g.k.Z3p=function(){var a=this.pn.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var PJc={oX:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.FxK=function(){var a=this.P5.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var zPb={FP:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+a1D=function(a){return a?a.aK||null:void 0};
+var rI1={B4:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.q2y=function(){var a=this.u1.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.ZHV=function(){var a=this.hL.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+Vkx=function(a){return a?a.wf||null:void 0};
+var rVG={k3:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+mxR=function(a){return a?a.nX||null:void 0};
+a48=function(a){return a?a.qU||null:void 0};
+g.LX0=function(a,b){this.YS=a;this.Xa=b||0;return this};
+g.SvY=function(a,b){this.ee=a;this.Xa=b||0;return this};
+var VNs={gG:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var $Kn={KC:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.qPw=function(){var a=this.Br.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+OIW=function(a){return a?a.Vi||null:void 0};
+g.k.arK=function(){var a=this.EH.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.CXr=function(a,b){this.UT=a;this.Xa=b||0;return this};
+var en7={Ix:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+ldz=function(a){return a?a.RA||null:void 0};
+SoR=function(a){return a?a.Lx||null:void 0};
+g.ERA=function(a,b){this.m0=a;this.Xa=b||0;return this};
+g._E1=function(a,b){this._R=a;this.Xa=b||0;return this};
+g.XR3=function(a,b){this.uO=a;this.Xa=b||0;return this};
+ydJ=function(a){return a?a.Xo||null:void 0};
+var Xt4={jX:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+MxK=function(a){return a?a.uG||null:void 0};
+var Tvd={uY:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.Slv=function(a,b){this.hM=a;this.Xa=b||0;return this};
+g.k.bQ_=function(){var a=this.U_.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.ztM=function(){var a=this.Yw.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+ITn=function(a){return a?a.Kj||null:void 0};
+vW7=function(a){return a?a.Sb||null:void 0};
+g.k._AG=function(){var a=this.MM.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.YQ$=function(){var a=this.BP.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.Jez=function(){var a=this.Ag.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var sQF={lZ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.HI_=function(){var a=this.Dh.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+sic=function(a){return a?a.Xm||null:void 0};
+var qIg={kE:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+ZzD=function(a){return a?a.GN||null:void 0};
+var XX$={Qa:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var PvC={iT:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var AtR={Bk:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.Kdz=function(){var a=this.o9.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+$zp=function(a){return a?a.oG||null:void 0};
+var xlS={SP:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+vp8=function(a){return a?a.Qf||null:void 0};
+jQJ=function(a){return a?a.Dg||null:void 0};
+var jtA={lt:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var k0X={iO:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var jfW={IF:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.VXF=function(){var a=this.u7.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.U_f=function(a,b){this.pI=a;this.Xa=b||0;return this};
+var cIz={c8:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.BeM=function(a,b){this.FE=a;this.Xa=b||0;return this};
+XyL=function(a){return a?a.Wc||null:void 0};
+g.k.ET1=function(){var a=this.ER.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.cRZ=function(){var a=this.JJ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+UKa=function(a){return a?a.QW||null:void 0};
+g.YWp=function(a,b){this.$l=a;this.Xa=b||0;return this};
+g.pCK=function(a,b){this.$N=a;this.Xa=b||0;return this};
+var kWm={Eo:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.mfu=function(a,b){this.Ll=a;this.Xa=b||0;return this};
+e5F=function(a){return a?a.Wb||null:void 0};
+g.k.sYu=function(){var a=this.Uf.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+v0c=function(a){return a?a.gt||null:void 0};
+aWi=function(a){return a?a.MO||null:void 0};
+g.k.nt$=function(){var a=this.DA.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.uTk=function(a,b){this.d6=a;this.Xa=b||0;return this};
+Wdy=function(a){return a?a.Tz||null:void 0};
+var DJ_={gm:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var _66={OL:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.g7p=function(a,b){this.EY=a;this.Xa=b||0;return this};
+var CTe={QI:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.gHX=function(){var a=this.Aa.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+f$$=function(a){return a?a.n_||null:void 0};
+g.Ec9=function(a,b){this.Pl=a;this.Xa=b||0;return this};
+var ZOe={hV:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.Nqn=function(a,b){this.U5=a;this.Xa=b||0;return this};
+BV1=function(a){return a?a.Z9||null:void 0};
+g.VsX=function(a,b){this.D$=a;this.Xa=b||0;return this};
+var b2C={Hu:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.GOK=function(a,b){this.Cy=a;this.Xa=b||0;return this};
+g.uNB=function(a,b){this.mL=a;this.Xa=b||0;return this};
+T0l=function(a){return a?a.kF||null:void 0};
+g.k.toj=function(){var a=this.ZT.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.bLZ=function(a,b){this.MA=a;this.Xa=b||0;return this};
+var kG7={zM:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+$ZU=function(a){return a?a.R1||null:void 0};
+g.wFL=function(a,b){this.Um=a;this.Xa=b||0;return this};
+g.IR5=function(a,b){this.RZ=a;this.Xa=b||0;return this};
+g.k$k=function(a,b){this.jM=a;this.Xa=b||0;return this};
+g.k.VaQ=function(){var a=this.VV.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.gO5=function(a,b){this.py=a;this.Xa=b||0;return this};
+g.k.LSy=function(){var a=this.Ft.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var FMw={Kl:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.a9q=function(a,b){this.$F=a;this.Xa=b||0;return this};
+g.k.nuD=function(){var a=this.CJ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.p4h=function(){var a=this.rE.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.eRz=function(){var a=this.uS.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var dAu={Jh:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+SCm=function(a){return a?a.wC||null:void 0};
+var QVl={vv:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+_VX=function(a){return a?a.Zf||null:void 0};
+g.wZc=function(a,b){this.JL=a;this.Xa=b||0;return this};
+g.AZS=function(a,b){this.uw=a;this.Xa=b||0;return this};
+g.k.cdL=function(){var a=this.jj.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var hc0={rv:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.$YS=function(){var a=this.Y6.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.eP_=function(a,b){this.P4=a;this.Xa=b||0;return this};
+g.k.P10=function(){var a=this.VN.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.$9x=function(a,b){this.hw=a;this.Xa=b||0;return this};
+R1O=function(a){return a?a.Tr||null:void 0};
+var wY3={wg:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.uch=function(a,b){this.qW=a;this.Xa=b||0;return this};
+var bYr={TQ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.IYQ=function(a,b){this.nP=a;this.Xa=b||0;return this};
+g.k.VCK=function(){var a=this.yB.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.pd8=function(a,b){this.Ew=a;this.Xa=b||0;return this};
+var S99={x9:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.TEG=function(){var a=this.fj.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var HGN={Ng:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.uNH=function(a,b){this.wm=a;this.Xa=b||0;return this};
+g.k.ksb=function(){var a=this.sE.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.lwb=function(a,b){this.TI=a;this.Xa=b||0;return this};
+n84=function(a){return a?a.yX||null:void 0};
+phI=function(a){return a?a.vL||null:void 0};
+YED=function(a){return a?a.CH||null:void 0};
+Zou=function(a){return a?a.HA||null:void 0};
+g.k.G8R=function(){var a=this.$y.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var an7={Z3:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.o7H=function(){var a=this.MM.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var zzT={V2:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.HDE=function(){var a=this.ca.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.Y0P=function(){var a=this.$P.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.PDf=function(){var a=this.H5.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.c8v=function(a,b){this.tK=a;this.Xa=b||0;return this};
+KSN=function(a){return a?a.iG||null:void 0};
+var fc$={wu:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.Xwr=function(){var a=this.qH.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+hD4=function(a){return a?a.RM||null:void 0};
+Qra=function(a){return a?a.oN||null:void 0};
+g.k.Kng=function(){var a=this.oV.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.zB2=function(a,b){this.rV=a;this.Xa=b||0;return this};
+var $dX={bn:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.np1=function(){var a=this.g5.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.mul=function(a,b){this.S3=a;this.Xa=b||0;return this};
+var xSO={Wy:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.Ayt=function(a,b){this.SZ=a;this.Xa=b||0;return this};
+g.zB6=function(a,b){this.fp=a;this.Xa=b||0;return this};
+var TSC={wf:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.dLO=function(){var a=this.Qc.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+iwG=function(a){return a?a.Wy||null:void 0};
+joy=function(a){return a?a.go||null:void 0};
+gz_=function(a){return a?a.LL||null:void 0};
+gx7=function(a){return a?a.af||null:void 0};
+g.gWc=function(a,b){this.jw=a;this.Xa=b||0;return this};
+rfR=function(a){return a?a.wa||null:void 0};
+g.k.of1=function(){var a=this.sH.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.cOP=function(a,b){this.xq=a;this.Xa=b||0;return this};
+BjT=function(a){return a?a.CW||null:void 0};
+fub=function(a){return a?a.m5||null:void 0};
+var vqX={UO:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.k_B=function(){var a=this.f8.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+mVr=function(a){return a?a.dW||null:void 0};
+var pNq={uJ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+uKA=function(a){return a?a.Pe||null:void 0};
+g.k.rm9=function(){var a=this.zL.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+N9f=function(a){return a?a.sb||null:void 0};
+var $AY={zs:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+F$X=function(a){return a?a.r0||null:void 0};
+var l0B={ZV:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+P$k=function(a){return a?a.nH||null:void 0};
+XsY=function(a){return a?a.sp||null:void 0};
+g._9e=function(a,b){this.xw=a;this.Xa=b||0;return this};
+WZx=function(a){return a?a.ud||null:void 0};
+var DrR={fT:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var V_e={FB:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var DzW={gr:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.tiF=function(a,b){this.pz=a;this.Xa=b||0;return this};
+zFu=function(a){return a?a.c8||null:void 0};
+g.k.Xxx=function(){var a=this.VR.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.YfW=function(a,b){this.W4=a;this.Xa=b||0;return this};
+g.oyS=function(a,b){this.Qz=a;this.Xa=b||0;return this};
+g.k.L3G=function(){var a=this.mQ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.KlZ=function(a,b){this._P=a;this.Xa=b||0;return this};
+var PYs={AD:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.CO9=function(a,b){this.tw=a;this.Xa=b||0;return this};
+g.k.lPd=function(){var a=this.q1.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.lbG=function(a,b){this.qD=a;this.Xa=b||0;return this};
+g.k.lvC=function(){var a=this.M_.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var w$I={Xa:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var OQq={X3:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+Qfn=function(a){return a?a.Vz||null:void 0};
+var C2L={Np:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var DNO={jl:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var cva={iS:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+vcu=function(a){return a?a.Se||null:void 0};
+g.k.s3a=function(){var a=this.rS.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+vaU=function(a){return a?a.U4||null:void 0};
+g.k.MAk=function(){var a=this.Cy.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.hsn=function(){var a=this.yf.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.MF5=function(){var a=this.qa.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.TNP=function(){var a=this.xa.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+TxW=function(a){return a?a.Jz||null:void 0};
+L5K=function(a){return a?a.eQ||null:void 0};
+var DkW={oq:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.hUV=function(){var a=this.mQ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.og0=function(){var a=this.Bs.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var Gun={P2:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var ewG={Q7:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.ymc=function(){var a=this.Gs.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.z7I=function(a,b){this.eU=a;this.Xa=b||0;return this};
+g.k.CDs=function(){var a=this.Rm.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.jtc=function(){var a=this.kA.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+tcf=function(a){return a?a.qf||null:void 0};
+g.k.vGC=function(){var a=this.dQ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.JUN=function(a,b){this.tF=a;this.Xa=b||0;return this};
+var Ca2={RH:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+ajK=function(a){return a?a.Pu||null:void 0};
+g.piS=function(a,b){this.oZ=a;this.Xa=b||0;return this};
+g.ADO=function(a,b){this.Vc=a;this.Xa=b||0;return this};
+jOx=function(a){return a?a.$_||null:void 0};
+g.EZw=function(a,b){this.nk=a;this.Xa=b||0;return this};
+g.k.l9W=function(){var a=this.e2.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k._mr=function(){var a=this.QH.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.I7G=function(a,b){this.eM=a;this.Xa=b||0;return this};
+var owg={lf:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+YyZ=function(a){return a?a.l_||null:void 0};
+g.k.imp=function(){var a=this.sW.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.K2W=function(){var a=this.$y.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.d2Q=function(a,b){this.al=a;this.Xa=b||0;return this};
+g.bZb=function(a,b){this.FV=a;this.Xa=b||0;return this};
+g.k.ZHb=function(){var a=this.DW.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.U6n=function(){var a=this.KG.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var kod={fu:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.kQG=function(){var a=this.hx.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.nnY=function(a,b){this.rW=a;this.Xa=b||0;return this};
+dD8=function(a){return a?a.Qn||null:void 0};
+g.k.FzD=function(){var a=this.Fx.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.v4r=function(a,b){this.tB=a;this.Xa=b||0;return this};
+var V13={x_:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var srY={pd:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+VWK=function(a){return a?a.YN||null:void 0};
+g.bJm=function(a,b){this.Am=a;this.Xa=b||0;return this};
+$A9=function(a){return a?a.Oi||null:void 0};
+g.vrb=function(a,b){this.Q0=a;this.Xa=b||0;return this};
+var KuD={Im:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+wnk=function(a){return a?a.qM||null:void 0};
+var Avg={G8:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.Dhc=function(a,b){this.Y$=a;this.Xa=b||0;return this};
+g.k.wI4=function(){var a=this.N2.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var B6G={BL:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.hAA=function(){var a=this.Ax.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.u_x=function(a,b){this.EP=a;this.Xa=b||0;return this};
+g.LJF=function(a,b){this.T3=a;this.Xa=b||0;return this};
+var _WC={Kq:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.VqX=function(){var a=this.$o.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+EQJ=function(a){return a?a.tf||null:void 0};
+Hju=function(a){return a?a.Is||null:void 0};
+g.f$B=function(a,b){this.h7=a;this.Xa=b||0;return this};
+Sqh=function(a){return a?a.fO||null:void 0};
+Jnv=function(a){return a?a.zB||null:void 0};
+var YyN={WT:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+PMh=function(a){return a?a.UI||null:void 0};
+var CcS={zL:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+ZDy=function(a){return a?a.dY||null:void 0};
+g.k.L5P=function(){var a=this.aX.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var lu$={ud:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.Qcx=function(a,b){this.ot=a;this.Xa=b||0;return this};
+g.k.rBN=function(){var a=this.bc.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.YsA=function(a,b){this.T0=a;this.Xa=b||0;return this};
+UOW=function(a){return a?a.rT||null:void 0};
+g.k.PCs=function(){var a=this.sS.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.UDB=function(){var a=this.Px.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+t8a=function(a){return a?a.Ic||null:void 0};
+g.DfY=function(a,b){this.zg=a;this.Xa=b||0;return this};
+var NrA={nA:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var ZYw={IB:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.qDl=function(){var a=this.wM.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.XW6=function(){var a=this.Rv.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.oeS=function(){var a=this.ZA.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var _MM={ou:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.ugD=function(){var a=this.VD.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+Pjp=function(a){return a?a.cw||null:void 0};
+g.ss8=function(a,b){this.GC=a;this.Xa=b||0;return this};
+var D7t={Gx:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+KQo=function(a){return a?a.Zs||null:void 0};
+var hh7={wI:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+aSo=function(a){return a?a.Oz||null:void 0};
+g.pJ9=function(a,b){this.AO=a;this.Xa=b||0;return this};
+oRX=function(a){return a?a.b7||null:void 0};
+var kNo={$R:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.mF4=function(){var a=this.Q7.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.zYw=function(a,b){this.J0=a;this.Xa=b||0;return this};
+ZGD=function(a){return a?a.H3||null:void 0};
+g.k.qao=function(){var a=this.M2.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+V5a=function(a){return a?a.WQ||null:void 0};
+g.k.KH2=function(){var a=this.IU.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.ITI=function(a,b){this.mc=a;this.Xa=b||0;return this};
+g.k.Gif=function(){var a=this.cA.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var Akb={l3:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.Hoo=function(){var a=this.ul.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+J4M=function(a){return a?a.Rt||null:void 0};
+var Mr5={OC:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.FKC=function(){var a=this.Um.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var zf6={D0:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+tjB=function(a){return a?a.gS||null:void 0};
+maL=function(a){return a?a.f_||null:void 0};
+g.tsH=function(a,b){this.JL=a;this.Xa=b||0;return this};
+Hr5=function(a){return a?a.m6||null:void 0};
+sIp=function(a){return a?a.pt||null:void 0};
+F1B=function(a){return a?a.y2||null:void 0};
+Tw6=function(a){return a?a.ad||null:void 0};
+K4c=function(a){return a?a.rx||null:void 0};
+var mvc={It:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.uPl=function(){var a=this.VV.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+f1A=function(a){return a?a.WS||null:void 0};
+w5W=function(a){return a?a.ni||null:void 0};
+g.k.f$G=function(){var a=this.yW.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var bpj={kv:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+VXt=function(a){return a?a.pv||null:void 0};
+RX$=function(a){return a?a.Vm||null:void 0};
+var xa5={EA:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+yKc=function(a){return a?a.M1||null:void 0};
+g.u0C=function(a,b){this.wj=a;this.Xa=b||0;return this};
+g.k.Q0H=function(){var a=this.xY.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+Cip=function(a){return a?a.gG||null:void 0};
+var hSU={dv:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+WcV=function(a){return a?a.Lx||null:void 0};
+NdC=function(a){return a?a.zb||null:void 0};
+F1u=function(a){return a?a.zy||null:void 0};
+WDA=function(a){return a?a.Ml||null:void 0};
+var uJd={EU:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+Gbd=function(a){return a?a.dP||null:void 0};
+g.XyK=function(a,b){this.L5=a;this.Xa=b||0;return this};
+g.oip=function(a,b){this.sb=a;this.Xa=b||0;return this};
+g.UJ4=function(a,b){this.ge=a;this.Xa=b||0;return this};
+g.wFV=function(a,b){this.Od=a;this.Xa=b||0;return this};
+D3t=function(a){return a?a.TN||null:void 0};
+g.UMj=function(a,b){this.Ip=a;this.Xa=b||0;return this};
+g.k.DOE=function(){var a=this.$i.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var KT3={iZ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k._QX=function(){var a=this.io.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.Maw=function(a,b){this.rj=a;this.Xa=b||0;return this};
+g.Myk=function(a,b){this.Po=a;this.Xa=b||0;return this};
+KvH=function(a){return a?a.al||null:void 0};
+HGn=function(a){return a?a.eG||null:void 0};
+g.EsF=function(a,b){this.Dc=a;this.Xa=b||0;return this};
+g.Jrg=function(a,b){this.wM=a;this.Xa=b||0;return this};
+var w95={kF:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.edN=function(){var a=this.RK.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+A8_=function(a){return a?a.Dl||null:void 0};
+g.oqJ=function(a,b){this.Uv=a;this.Xa=b||0;return this};
+g.koT=function(a,b){this.$Z=a;this.Xa=b||0;return this};
+g.RSl=function(a,b){this.EZ=a;this.Xa=b||0;return this};
+g.k.noM=function(){var a=this.Yl.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.tee=function(){var a=this.a6.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.Z$Z=function(a,b){this.L$=a;this.Xa=b||0;return this};
+var WWs={qC:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.nw3=function(a,b){this.D0=a;this.Xa=b||0;return this};
+var h6W={WJ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+QWM=function(a){return a?a.tR||null:void 0};
+g.k.BJ7=function(){var a=this.Iy.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+K9_=function(a){return a?a.G4||null:void 0};
+g.k.BLz=function(){var a=this.OY.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+ZVy=function(a){return a?a.sp||null:void 0};
+g.k.JCO=function(){var a=this.Jz.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+cWR=function(a){return a?a.aO||null:void 0};
+g.k.mkM=function(){var a=this.$z.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var d7$={Xx:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.lWW=function(){var a=this.DQ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var aOJ={Jj:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var s5i={K6:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+D$m=function(a){return a?a.ji||null:void 0};
+g.FUK=function(a,b){this.Hm=a;this.Xa=b||0;return this};
+var _uc={pR:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.Yq8=function(a,b){this.Ic=a;this.Xa=b||0;return this};
+ORk=function(a){return a?a.xj||null:void 0};
+var HA2={j$:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+EAt=function(a){return a?a.Tf||null:void 0};
+var tGK={ji:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.EpM=function(){var a=this.EJ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.siz=function(){var a=this.Uq.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.Kwr=function(a,b){this.eB=a;this.Xa=b||0;return this};
+g.k.VSO=function(){var a=this._z.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.ibf=function(){var a=this.SY.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var DYP={N1:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.oG1=function(){var a=this.c8.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.TS$=function(){var a=this.LG.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+y__=function(a){return a?a.pr||null:void 0};
+Tso=function(a){return a?a.XR||null:void 0};
+cQx=function(a){return a?a.w5||null:void 0};
+var _Nf={MP:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.j1U=function(a,b){this.ey=a;this.Xa=b||0;return this};
+g.YqS=function(a,b){this.Di=a;this.Xa=b||0;return this};
+Rx$=function(a){return a?a.fL||null:void 0};
+g.$JP=function(a,b){this.Mb=a;this.Xa=b||0;return this};
+g.k.xBj=function(){var a=this.pN.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.Upj=function(){var a=this.Py.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.AB3=function(a,b){this.MV=a;this.Xa=b||0;return this};
+g.k.MPP=function(){var a=this.FZ.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.CjP=function(){var a=this.mg.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var o21={c9:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var o8n={Mc:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var kxA={yb:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var gfU={RV:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.jJk=function(){var a=this._L.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.uDD=function(a,b){this.VE=a;this.Xa=b||0;return this};
+g.k.Olp=function(){var a=this.DY.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+FhR=function(a){return a?a.kT||null:void 0};
+var Iiu={wQ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.NNI=function(a,b){this.kc=a;this.Xa=b||0;return this};
+g.k.kQm=function(){var a=this.LY.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.Aq4=function(a,b){this.b$=a;this.Xa=b||0;return this};
+var VhI={p8:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.KHL=function(a,b){this.mB=a;this.Xa=b||0;return this};
+g.k.ve5=function(){var a=this.KV.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var bwW={V9:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.qIu=function(){var a=this.qx.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.aYc=function(a,b){this.WG=a;this.Xa=b||0;return this};
+VRO=function(a){return a?a.WT||null:void 0};
+var gHh={zD:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+SuK=function(a){return a?a.DN||null:void 0};
+g.k.$Dc=function(){var a=this.Dz.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+bru=function(a){return a?a.Ch||null:void 0};
+g.A3v=function(a,b){this.YN=a;this.Xa=b||0;return this};
+var XJJ={dy:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+KGS=function(a){return a?a.KE||null:void 0};
+g.k.uQk=function(){var a=this.J9.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.baO=function(){var a=this.hM.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var KyF={sf:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var zDo={WB:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.Ou$=function(a,b){this.JK=a;this.Xa=b||0;return this};
+b5B=function(a){return a?a.D7||null:void 0};
+g.k.Weu=function(){var a=this.Xn.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.h96=function(a,b){this.Uh=a;this.Xa=b||0;return this};
+g.JHX=function(a,b){this.dS=a;this.Xa=b||0;return this};
+var Yza={CP:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+VCy=function(a){return a?a.gC||null:void 0};
+var Ki4={UY:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.QwT=function(a,b){this.AR=a;this.Xa=b||0;return this};
+e61=function(a){return a?a.Uk||null:void 0};
+An4=function(a){return a?a.mf||null:void 0};
+g.M3p=function(a,b){this.aE=a;this.Xa=b||0;return this};
+var GE2={J1:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.Ipe=function(){var a=this.U0.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var ROw={UF:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.i8_=function(){var a=this.PR.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.Us1=function(){var a=this.Cb.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var kBz={Ax:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.cH8=function(a,b){this.bM=a;this.Xa=b||0;return this};
+Q7C=function(a){return a?a.n2||null:void 0};
+N5x=function(a){return a?a.Tm||null:void 0};
+g.k.Kox=function(){var a=this.MA.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.$6G=function(a,b){this.uK=a;this.Xa=b||0;return this};
+g.k.Wu6=function(){var a=this.cd.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var HOq={pU:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var XII={Jj:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var p6j={Kj:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+qaQ=function(a){return a?a.M2||null:void 0};
+g.k.gWi=function(){var a=this.Ak.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+iHP=function(a){return a?a.Py||null:void 0};
+g.k.SCw=function(){var a=this.JI.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.$xP=function(a,b){this.n5=a;this.Xa=b||0;return this};
+g.k.Efu=function(){var a=this.xB.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.YXC=function(a,b){this.un=a;this.Xa=b||0;return this};
+g.k.KG$=function(){var a=this.kv.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var Obw={VU:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.ACX=function(){var a=this.Nm.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.dng=function(a,b){this.oj=a;this.Xa=b||0;return this};
+g.k.MRu=function(){var a=this.Kd.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.oLZ=function(a,b){this.Ro=a;this.Xa=b||0;return this};
+g.mOc=function(a,b){this.Zy=a;this.Xa=b||0;return this};
+g.k.y9a=function(){var a=this.vR.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.A1G=function(a,b){this.ni=a;this.Xa=b||0;return this};
+CPo=function(a){return a?a.c5||null:void 0};
+var $Et={GX:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var st3={wO:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.RhI=function(a,b){this.lI=a;this.Xa=b||0;return this};
+ga_=function(a){return a?a.Mr||null:void 0};
+KTs=function(a){return a?a.pm||null:void 0};
+var ULd={OJ:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+bNL=function(a){return a?a.gP||null:void 0};
+var Gbh={RP:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.Jll=function(){var a=this.cS.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.y3j=function(a,b){this.ic=a;this.Xa=b||0;return this};
+g.wtS=function(a,b){this.h5=a;this.Xa=b||0;return this};
+rti=function(a){return a?a.N4||null:void 0};
+g.zd1=function(a,b){this.JR=a;this.Xa=b||0;return this};
+Rga=function(a){return a?a.Q8||null:void 0};
+g.k.GjM=function(){var a=this._8.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.qCw=function(a,b){this.qN=a;this.Xa=b||0;return this};
+g.k.zWC=function(){var a=this.bB.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.y44=function(a,b){this.bF=a;this.Xa=b||0;return this};
+var bXD={LV:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.NMy=function(){var a=this.Sw.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.AyW=function(a,b){this.D_=a;this.Xa=b||0;return this};
+g.k.j7o=function(){var a=this.WW.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+Eh5=function(a){return a?a.$D||null:void 0};
+g.uu9=function(a,b){this.it=a;this.Xa=b||0;return this};
+var Nzh={VN:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+QAc=function(a){return a?a.qU||null:void 0};
+var BAa={qS:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var Dcn={wf:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var sS5={YU:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.hSq=function(a,b){this.Lp=a;this.Xa=b||0;return this};
+var zOe={MC:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.K2i=function(){var a=this.pS.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.sQZ=function(a,b){this.lR=a;this.Xa=b||0;return this};
+g.$n5=function(a,b){this.$m=a;this.Xa=b||0;return this};
+var CQa={_n:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+PoM=function(a){return a?a.i7||null:void 0};
+var k7O={O8:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.xMy=function(){var a=this.yh.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+zbK=function(a){return a?a.F3||null:void 0};
+var CTM={cT:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var Mb5={$q:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.KYM=function(a,b){this.Em=a;this.Xa=b||0;return this};
+var t1S={VU:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.$Xb=function(a,b){this.Jw=a;this.Xa=b||0;return this};
+g.Igx=function(a,b){this.Su=a;this.Xa=b||0;return this};
+tDb=function(a){return a?a.kr||null:void 0};
+g.k.GAe=function(){var a=this.Hp.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.nyR=function(){var a=this.jY.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.K9a=function(a,b){this.I$=a;this.Xa=b||0;return this};
+var $qD={If:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.Lpx=function(){var a=this.MC.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.IFt=function(a,b){this.ES=a;this.Xa=b||0;return this};
+var aI0={BV:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.DLV=function(a,b){this.fR=a;this.Xa=b||0;return this};
+g.k.hAC=function(){var a=this.BW.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var c35={oc:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.RL4=function(){var a=this.cF.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var pls={Ix:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.O$C=function(){var a=this.V7.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.w_A=function(){var a=this.SF.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var VTc={w9:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.wvV=function(a,b){this.EF=a;this.Xa=b||0;return this};
+var Elo={Fw:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+wPb=function(a){return a?a.OS||null:void 0};
+g.xu2=function(a,b){this.eu=a;this.Xa=b||0;return this};
+g.k.qMb=function(){var a=this.k9.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var jGK={za:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.Jsn=function(a,b){this.Nr=a;this.Xa=b||0;return this};
+VS5=function(a){return a?a.PP||null:void 0};
+var lgy={Az:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.ckD=function(a,b){this.xl=a;this.Xa=b||0;return this};
+g.F1f=function(a,b){this.iB=a;this.Xa=b||0;return this};
+g.k.o05=function(){var a=this._4.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+b3D=function(a){return a?a.q5||null:void 0};
+g.DrV=function(a,b){this.kZ=a;this.Xa=b||0;return this};
+i$g=function(a){return a?a.yJ||null:void 0};
+g.IJE=function(a,b){this.et=a;this.Xa=b||0;return this};
+var tQQ={dk:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var kP9={UB:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+Cop=function(a){return a?a.dC||null:void 0};
+g.k.J_z=function(){var a=this.Rl.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.WIL=function(a,b){this.j$=a;this.Xa=b||0;return this};
+g.SHK=function(a,b){this.HU=a;this.Xa=b||0;return this};
+var Wgk={Yg:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var VsN={Mr:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.CPa=function(a,b){this.Oi=a;this.Xa=b||0;return this};
+var nw0={C1:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.eB0=function(a,b){this.qh=a;this.Xa=b||0;return this};
+NAW=function(a){return a?a.gT||null:void 0};
+var GbK={DU:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+sMR=function(a){return a?a.yC||null:void 0};
+var qYw={Xq:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+pJ0=function(a){return a?a._v||null:void 0};
+var rmQ={J7:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var WzA={gz:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.E8a=function(){var a=this.Uq.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var x5L={D6:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.LMZ=function(){var a=this.mu.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.Wxo=function(){var a=this.cS.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var LKW={l6:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+jCt=function(a){return a?a.mk||null:void 0};
+$kc=function(a){return a?a.ol||null:void 0};
+g.k.FE4=function(){var a=this.s2.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var Zib={ot:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var ODS={X3:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.rlZ=function(a,b){this.uk=a;this.Xa=b||0;return this};
+var QZL={$j:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+kcH=function(a){return a?a.Oc||null:void 0};
+g.sr6=function(a,b){this.HH=a;this.Xa=b||0;return this};
+var TK6={AA:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.PXq=function(a,b){this.LU=a;this.Xa=b||0;return this};
+g.k.JSP=function(){var a=this.sl.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+y5D=function(a){return a?a.GH||null:void 0};
+FkX=function(a){return a?a.Y1||null:void 0};
+g.eaT=function(a,b){this.b$=a;this.Xa=b||0;return this};
+g.yfy=function(a,b){this.cd=a;this.Xa=b||0;return this};
+var Y_N={eY:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+var MZ1={aW:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.KuH=function(){var a=this.ad.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.zZH=function(a,b){this.$c=a;this.Xa=b||0;return this};
+g.k.l1x=function(){var a=this._O.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+lOM=function(a){return a?a.q0||null:void 0};
+EBj=function(a){return a?a.J0||null:void 0};
+g.$2G=function(a,b){this.X6=a;this.Xa=b||0;return this};
+g.k.omK=function(){var a=this.Wi.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var DIu={Gl:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.hJA=function(a,b){this.As=a;this.Xa=b||0;return this};
+g.k.lSR=function(){var a=this.__.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.A7r=function(){var a=this.hO.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+OAF=function(a){return a?a.Mm||null:void 0};
+g.Zuh=function(a,b){this.P1=a;this.Xa=b||0;return this};
+var miW={lg:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.hzJ=function(a,b){this.rD=a;this.Xa=b||0;return this};
+g.DQE=function(a,b){this.sv=a;this.Xa=b||0;return this};
+var o7W={$0:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+I_2=function(a){return a?a.t4||null:void 0};
+RLE=function(a){return a?a.oC||null:void 0};
+izV=function(a){return a?a.Am||null:void 0};
+var VXB={Dm:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.k.ftZ=function(){var a=this.FX.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.g6B=function(a,b){this.Bt=a;this.Xa=b||0;return this};
+g.MB2=function(a,b){this.n8=a;this.Xa=b||0;return this};
+g.k.tSa=function(){var a=this.Xv.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.JEL=function(){var a=this.OH.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+g.k.cqX=function(){var a=this.oW.length;for(var b=0;b<a;b++)this.Qz(b);return a};
+var blf={_W:function(a){return a.split(",")},L0:function(a,b){return a.concat(b)}};
+g.Rka=function(a,b,c){c&&(c=Oka(decodeURIComponent(c)),a.set(b,encodeURIComponent(c)))};
+g.Sla=function(a){var b;a.D&&(b=a.get("n"))&&(b=Gma[0](b),a.set("n",b),Gma.length||Oka(""))};
+g.Tla={signatureTimestamp:20010,Hz:!0};
+})(_yt_player);
\ No newline at end of file
@@ -0,0 +1,359 @@
+"""اختبار تحميل شامل: مستخدمون وهميون يرسلون روابط ويضغطون الأزرار
+
+يشغل معالجات YouTubeTelegramBot الحقيقية عبر Application (بنفس سياسة معالجة التحديثات
+المستخدمة في الإنتاج) مقابل:
+- Bot API وهمي محلي يستقبل sendMessage و editMessageText و sendVideo ...
+- خادم وسائط محلي يقدم صفحات المشاهدة و byte ranges مع تقييد السرعة وحقن الأعطال
+
+الخوادم تعمل في عملية منفصلة حتى تعكس قياسات الذاكرة استهلاك البوت فقط.
+
+الاستخدام:
+    python benchmarks/loadtest.py --users 20 --rounds 3
+    python benchmarks/loadtest.py --users 50 --bandwidth 1000000 --fail-rate 0.05
+    python benchmarks/loadtest.py --users 50 --concurrent-updates 1   # مقارنة مع المعالجة التسلسلية
+    python benchmarks/loadtest.py --think-time 5 --bandwidth 2000000 --prefetch   # التحميل المسبق التخميني
+    python benchmarks/loadtest.py --users 40 --bandwidth 500000 --max-active-jobs 8   # رفض المهام الزائدة
+    python benchmarks/loadtest.py --users 20 --ingress-bandwidth 4000000 --small-weight 1   # بدون أولوية الملفات الصغيرة
+
+المخرجات: الإنتاجية (مهمة/ثانية) وزمن p50/p95/p99 لكل مرحلة وأعلى RSS.
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from typing import Dict, List
+
+from common import current_rss_mb, load_bot, peak_rss_mb, route_requests_to, summarize
+from fake_servers import fetch_stats, start_in_subprocess
+
+bot_module = load_bot()
+
+from telegram import Update  # noqa: E402
+from telegram.ext import Application  # noqa: E402
+
+FAKE_TOKEN = '123456:FAKE-TOKEN-FOR-LOADTEST'
+
+
+def parse_mix(spec: str) -> List:
+    """تحويل "video_360:0.7,audio_mp3:0.3" إلى قائمة (خيار، وزن)"""
+    mix = []
+    for item in spec.split(','):
+        choice, _, weight = item.partition(':')
+        mix.append((choice.strip(), float(weight or 1)))
+    return mix
+
+
+class LoadTest:
+    def __init__(self, args, urls: Dict[str, str]):
+        self.args = args
+        self.urls = urls
+        self.random = random.Random(args.seed)
+        self.mix = parse_mix(args.mix)
+        self.bot = bot_module.YouTubeTelegramBot()
+        self.pending: Dict[int, asyncio.Future] = {}
+        self.delivered: Dict[int, bool] = {}
+        self.uploads: Dict[int, int] = {}
+        self.busy: Dict[int, int] = {}  # آخر "أعد المحاولة بعد N ث" لكل مستخدم
+        self.latencies: Dict[str, List[float]] = {'link_to_keyboard': [], 'tap_to_delivery': [], 'end_to_end': []}
+        self.outcomes: Dict[str, int] = {}
+        self.update_ids = iter(range(1, 10**9))
+        self.peak_sampled_rss = 0.0
+        self._instrument()
+
+        builder = (
+            Application.builder()
+            .token(FAKE_TOKEN)
+            .base_url(urls['api'])
+            .base_file_url(urls['api_files'])
+            .connection_pool_size(args.pool_size)
+        )
+        if args.concurrent_updates:
+            bot_module.CONCURRENT_UPDATES = args.concurrent_updates
+        if args.prefetch:
+            bot_module.SPECULATIVE_PREFETCH = True
+            bot_module.PREFETCH_MIN_SAMPLES = args.prefetch_min_samples
+            self.bot.prefetch_limiter = bot_module.TokenBucket(args.prefetch_bandwidth)
+        if args.max_active_jobs is not None:
+            bot_module.MAX_ACTIVE_JOBS = args.max_active_jobs
+        bot_module.SMALL_JOB_WEIGHT = args.small_weight
+        if args.memory_file_max_mb is not None:
+            bot_module.MEMORY_FILE_MAX_MB = args.memory_file_max_mb
+        if args.ingress_bandwidth:
+            bot_module.DOWNLOAD_BANDWIDTH = args.ingress_bandwidth
+            self.bot.ingress = bot_module.BandwidthShaper(args.ingress_bandwidth)
+        if args.egress_bandwidth:
+            self.bot.egress = bot_module.BandwidthShaper(args.egress_bandwidth)
+        self.application = bot_module.build_application(self.bot, builder)
+
+    def _instrument(self):
+        """تغليف المعالجات لمعرفة متى ينتهي كل مستخدم من كل خطوة"""
+        bot = self.bot
+        original_url = bot.handle_url
+        original_callback = bot.handle_callback
+        original_send = bot.send_file
+        original_upload = bot.upload_file
+        original_busy = bot.notify_busy
+        test = self
+
+        async def handle_url(update, context):
+            try:
+                await original_url(update, context)
+            finally:
+                test._resolve(update.effective_user.id)
+
+        async def handle_callback(update, context):
+            try:
+                await original_callback(update, context)
+            finally:
+                test._resolve(update.effective_user.id)
+
+        async def send_file(query, *args, **kwargs):
+            result = await original_send(query, *args, **kwargs)
+            test.delivered[query.from_user.id] = True
+            return result
+
+        async def upload_file(message, *args, **kwargs):
+            result = await original_upload(message, *args, **kwargs)
+            test.uploads[message.chat_id] = test.uploads.get(message.chat_id, 0) + 1
+            return result
+
+        async def notify_busy(query, reason, retry_after):
+            test.busy[query.from_user.id] = retry_after
+            await original_busy(query, reason, retry_after)
+
+        bot.handle_url = handle_url
+        bot.handle_callback = handle_callback
+        bot.send_file = send_file
+        bot.upload_file = upload_file
+        bot.notify_busy = notify_busy
+
+    def _resolve(self, user_id: int):
+        future = self.pending.pop(user_id, None)
+        if future and not future.done():
+            future.set_result(True)
+
+    def _user(self, user_id: int) -> Dict:
+        return {'id': user_id, 'is_bot': False, 'first_name': f'User{user_id}', 'language_code': 'ar'}
+
+    def _message_update(self, user_id: int, text: str) -> Update:
+        data = {
+            'update_id': next(self.update_ids),
+            'message': {
+                'message_id': next(self.update_ids),
+                'date': int(time.time()),
+                'chat': {'id': user_id, 'type': 'private'},
+                'from': self._user(user_id),
+                'text': text,
+            },
+        }
+        return Update.de_json(data, self.application.bot)
+
+    def _callback_update(self, user_id: int, choice: str) -> Update:
+        data = {
+            'update_id': next(self.update_ids),
+            'callback_query': {
+                'id': str(next(self.update_ids)),
+                'from': self._user(user_id),
+                'chat_instance': str(user_id),
+                'data': choice,
+                'message': {
+                    'message_id': next(self.update_ids),
+                    'date': int(time.time()),
+                    'chat': {'id': user_id, 'type': 'private'},
+                    'from': {'id': 42, 'is_bot': True, 'first_name': 'FakeBot'},
+                    'text': '📊 اختر جودة التحميل:',
+                },
+            },
+        }
+        return Update.de_json(data, self.application.bot)
+
+    async def _send(self, user_id: int, update: Update) -> float:
+        future = asyncio.get_running_loop().create_future()
+        self.pending[user_id] = future
+        start = time.perf_counter()
+        await self.application.update_queue.put(update)
+        await asyncio.wait_for(future, timeout=self.args.timeout)
+        return time.perf_counter() - start
+
+    def _choose(self) -> str:
+        total = sum(weight for _, weight in self.mix)
+        pick = self.random.uniform(0, total)
+        for choice, weight in self.mix:
+            pick -= weight
+            if pick <= 0:
+                return choice
+        return self.mix[-1][0]
+
+    def _count(self, outcome: str):
+        self.outcomes[outcome] = self.outcomes.get(outcome, 0) + 1
+
+    async def run_user(self, index: int):
+        user_id = 10_000 + index
+        await asyncio.sleep(self.random.uniform(0, self.args.ramp))
+        for round_no in range(self.args.rounds):
+            video_id = f"u{index:04d}r{round_no:05d}"[:11]
+            link = f"https://www.youtube.com/watch?v={video_id}"
+            choice = self._choose()
+            if self.args.playlist:
+                # كل مستخدم يرسل قائمة مختلفة حتى لا يخدم الكاش الطلبات التالية
+                link = f"https://www.youtube.com/playlist?list=PL{self.args.playlist}x{index}r{round_no}"
+                choice = f"pl_{choice}"
+            self.delivered.pop(user_id, None)
+            try:
+                link_latency = await self._send(user_id, self._message_update(user_id, link))
+                self.latencies['link_to_keyboard'].append(link_latency)
+                if user_id not in self.bot.user_sessions:
+                    self._count('analysis_failed')
+                    continue
+
+                await asyncio.sleep(self.random.uniform(0, self.args.think_time))
+                tap_latency = await self._send(user_id, self._callback_update(user_id, choice))
+                # رفض بسبب الانشغال: إعادة الضغط بعد المدة التي اقترحها البوت
+                for _ in range(self.args.busy_retries):
+                    retry_after = self.busy.pop(user_id, None)
+                    if retry_after is None:
+                        break
+                    self._count('busy')
+                    await asyncio.sleep(retry_after * self.args.busy_wait_scale)
+                    tap_latency = await self._send(user_id, self._callback_update(user_id, choice))
+                if self.busy.pop(user_id, None) is not None:
+                    self._count('shed')
+                    continue
+                self.latencies['tap_to_delivery'].append(tap_latency)
+                self.latencies['end_to_end'].append(link_latency + tap_latency)
+                # لكل خيار على حدة: يظهر أثر توزيع السرعة على الملفات الصغيرة مقابل الكبيرة
+                self.latencies.setdefault(f"tap:{choice}", []).append(tap_latency)
+                delivered = self.delivered.get(user_id) or (self.args.playlist and self.uploads.get(user_id))
+                self._count('delivered' if delivered else 'download_failed')
+            except asyncio.TimeoutError:
+                self.pending.pop(user_id, None)
+                self._count('timeout')
+
+    async def sample_rss(self, stop: asyncio.Event):
+        while not stop.is_set():
+            self.peak_sampled_rss = max(self.peak_sampled_rss, current_rss_mb())
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=0.1)
+            except asyncio.TimeoutError:
+                pass
+
+    async def run(self) -> float:
+        await self.application.initialize()
+        await self.application.start()
+        await self.bot.workers.start()  # كما في on_startup (post_init لا يعمل بدون run_polling)
+        stop = asyncio.Event()
+        sampler = asyncio.create_task(self.sample_rss(stop))
+        start = time.perf_counter()
+        try:
+            await asyncio.gather(*(self.run_user(i) for i in range(self.args.users)))
+        finally:
+            elapsed = time.perf_counter() - start
+            stop.set()
+            await sampler
+            self.bot.workers.shutdown()
+            await self.application.stop()
+            await self.application.shutdown()
+        return elapsed
+
+
+def report(test: LoadTest, elapsed: float, api_stats: Dict, media_stats: Dict):
+    args = test.args
+    jobs = args.users * args.rounds
+    delivered = test.outcomes.get('delivered', 0)
+    print(f"\n📊 نتائج اختبار التحميل: {args.users} مستخدم × {args.rounds} جولة = {jobs} مهمة")
+    print(f"   concurrent_updates={bot_module.CONCURRENT_UPDATES}  "
+          f"bandwidth={args.bandwidth or '∞'} B/s  fail={args.fail_rate}  reset={args.reset_rate}")
+    if args.ingress_bandwidth or args.egress_bandwidth:
+        print(f"   shaper: ingress={args.ingress_bandwidth or '∞'} B/s  egress={args.egress_bandwidth or '∞'} B/s  "
+              f"small_weight={args.small_weight}")
+    if args.prefetch:
+        print(f"   prefetch: bandwidth={args.prefetch_bandwidth or '∞'} B/s  "
+              f"min_samples={args.prefetch_min_samples}  stats={json.dumps(test.bot.selection_stats)}")
+    print(f"⏱️ الزمن الكلي: {elapsed:.2f} ث")
+    print(f"🚀 الإنتاجية: {delivered / elapsed if elapsed else 0:.2f} ملف/ث  ({delivered}/{jobs} تم تسليمها)")
+    print(f"📋 النتائج: {json.dumps(test.outcomes, ensure_ascii=False)}")
+    if test.bot.admission.rejected:
+        print(f"🚦 المهام المرفوضة حسب السبب: {json.dumps(test.bot.admission.rejected)}  "
+              f"(MAX_ACTIVE_JOBS={bot_module.MAX_ACTIVE_JOBS})")
+    print(f"\n{'stage':<20}{'count':>7}{'p50 s':>10}{'p95 s':>10}{'p99 s':>10}{'max s':>10}")
+    # زمن أول رد مفيد (المعاينة أو الأزرار) مقابل زمن الأزرار، مقاس داخل البوت من بداية معالجة الرابط
+    analysis = {f"bot:{stage}": list(values) for stage, values in test.bot.analysis_times.items()}
+    for stage, values in {**test.latencies, **analysis}.items():
+        stats = summarize(values)
+        print(f"{stage:<20}{stats['count']:>7}{stats['p50']:>10.3f}{stats['p95']:>10.3f}"
+              f"{stats['p99']:>10.3f}{stats['max']:>10.3f}")
+    print(f"\n🧠 أعلى RSS: {max(peak_rss_mb(), test.peak_sampled_rss):.1f} MB")
+    buffers = test.bot.buffers
+    print(f"🧮 مخازن الذاكرة (حد {bot_module.MEMORY_FILE_MAX_MB:g} MB): "
+          f"جديدة={buffers.allocated} معاد استخدامها={buffers.reused} "
+          f"محتفظ بها={sum(len(b) for b in buffers.free) / (1024 * 1024):.0f} MB")
+    api_calls = {k.split(':', 1)[1]: v for k, v in api_stats.items() if k.startswith('method:')}
+    print(f"🤖 طلبات Bot API: {json.dumps(api_calls)}")
+    print(f"🎬 خادم الوسائط: {json.dumps(media_stats)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='اختبار تحميل البوت مقابل خوادم محلية وهمية')
+    parser.add_argument('--users', type=int, default=10, help='عدد المستخدمين المتزامنين')
+    parser.add_argument('--rounds', type=int, default=2, help='عدد الروابط لكل مستخدم')
+    parser.add_argument('--mix', default='video_360:0.6,audio_mp3:0.4', help='توزيع الأزرار المضغوطة')
+    parser.add_argument('--playlist', type=int, default=0,
+                        help='إرسال روابط قوائم تشغيل بهذا العدد من العناصر بدلاً من فيديوهات مفردة')
+    parser.add_argument('--think-time', type=float, default=0.5, help='أقصى زمن تفكير قبل الضغط (ث)')
+    parser.add_argument('--ramp', type=float, default=1.0, help='توزيع بدء المستخدمين على هذه المدة (ث)')
+    parser.add_argument('--timeout', type=float, default=300.0, help='مهلة كل خطوة (ث)')
+    parser.add_argument('--concurrent-updates', type=int, default=0,
+                        help='0 = نفس إعداد الإنتاج (CONCURRENT_UPDATES)، 1 = تسلسلي، أو عدد التحديثات المتزامنة')
+    parser.add_argument('--pool-size', type=int, default=256, help='حجم مجمع اتصالات Bot API')
+    parser.add_argument('--api-latency', type=float, default=0.02, help='زمن استجابة Bot API (ث)')
+    parser.add_argument('--bandwidth', type=int, default=0, help='سرعة كل اتصال وسائط بايت/ث (0 = بدون حد)')
+    parser.add_argument('--size-scale', type=float, default=0.05, help='نسبة حجم الملفات المقدمة من clen')
+    parser.add_argument('--fail-rate', type=float, default=0.0, help='احتمال 503 لطلبات الوسائط')
+    parser.add_argument('--reset-rate', type=float, default=0.0, help='احتمال قطع الاتصال أثناء التدفق')
+    parser.add_argument('--slow-start', type=float, default=0.0, help='تأخير أول بايت (ث)')
+    parser.add_argument('--prefetch', action='store_true', help='تفعيل التحميل المسبق التخميني')
+    parser.add_argument('--prefetch-bandwidth', type=int, default=1024 * 1024,
+                        help='حد السرعة المشترك للتحميلات المسبقة بايت/ث (0 = بدون حد)')
+    parser.add_argument('--prefetch-min-samples', type=int, default=5,
+                        help='عدد الاختيارات المطلوبة قبل بدء التخمين')
+    parser.add_argument('--max-active-jobs', type=int, default=None,
+                        help='حد المهام الجارية للتحكم بالقبول (الافتراضي: MAX_ACTIVE_JOBS)')
+    parser.add_argument('--busy-retries', type=int, default=3, help='عدد مرات إعادة الضغط بعد رسالة الانشغال')
+    parser.add_argument('--busy-wait-scale', type=float, default=1.0,
+                        help='نسبة الانتظار من المدة المقترحة في رسالة الانشغال')
+    parser.add_argument('--ingress-bandwidth', type=int, default=0,
+                        help='السرعة الكلية المشتركة لتحميلات البوت بايت/ث (DOWNLOAD_BANDWIDTH، 0 = بدون حد)')
+    parser.add_argument('--egress-bandwidth', type=int, default=0,
+                        help='السرعة الكلية المشتركة للرفع إلى تلجرام بايت/ث (UPLOAD_BANDWIDTH، 0 = بدون حد)')
+    parser.add_argument('--small-weight', type=float, default=bot_module.SMALL_JOB_WEIGHT,
+                        help='وزن الملفات الصغيرة في توزيع السرعة (1 = توزيع متساوٍ)')
+    parser.add_argument('--memory-file-max-mb', type=float, default=None,
+                        help='حد الملفات المحملة في الذاكرة بدل القرص (0 = تعطيل، الافتراضي: MEMORY_FILE_MAX_MB)')
+    parser.add_argument('--analysis-latency', type=float, default=0.0,
+                        help='تأخير صفحة المشاهدة و youtubei/v1/player (ث)؛ oEmbed يبقى سريعاً')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('-v', '--verbose', action='store_true', help='إظهار سجلات البوت')
+    args = parser.parse_args()
+
+    if not args.verbose:
+        bot_module.logging.getLogger().setLevel(bot_module.logging.WARNING)
+        bot_module.logger.disabled = True
+
+    if args.analysis_latency:
+        args.path_delay = {path: (1.0, args.analysis_latency) for path in ('/watch', '/youtubei/v1/player')}
+    urls, server = start_in_subprocess(**vars(args))
+    restore = route_requests_to(urls['media'])
+    try:
+        test = LoadTest(args, urls)
+        elapsed = asyncio.run(test.run())
+        report(test, elapsed, fetch_stats(urls['api_stats']), fetch_stats(urls['media_stats']))
+    finally:
+        restore()
+        server.terminate()
+    return 0 if test.outcomes.get('delivered', 0) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
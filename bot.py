@@ -7,13 +7,43 @@ import requests
 import urllib.parse
 import re
 import json
-from typing import Dict, List, Optional
-from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
-from telegram.ext import Application, CommandHandler, MessageHandler, CallbackQueryHandler, ContextTypes, filters
+import signal
+import socket
+import sqlite3
+import sys
+import threading
+import tracemalloc
+import shutil
+import heapq
+import contextlib
+import functools
+import math
+import multiprocessing
+import xml.etree.ElementTree as ElementTree
+from collections import deque
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+from telegram import (
+    Update, Chat, Message, InlineKeyboardButton, InlineKeyboardMarkup, MessageEntity,
+    InlineQueryResultArticle, InlineQueryResultCachedAudio, InlineQueryResultCachedVideo, InputTextMessageContent,
+    InputMediaAudio, InputMediaVideo
+)
+from telegram.ext import (
+    Application, CommandHandler, MessageHandler, CallbackQueryHandler, InlineQueryHandler, ContextTypes, filters
+)
 from telegram.constants import ParseMode
 import aiofiles
 from dotenv import load_dotenv
 
+try:
+    import resource
+except ImportError:  # غير متوفر على Windows
+    resource = None
+
+from jsinterp import JSError, JSInterpreter, free_identifiers, parse_expression_at
+
 # تحميل المتغيرات البيئية
 load_dotenv()
 
@@ -30,6 +60,144 @@ DOWNLOAD_PATH = os.getenv('DOWNLOAD_PATH', './downloads/')
 USE_PROXY = os.getenv('USE_PROXY', 'false').lower() == 'true'
 PROXY_URL = os.getenv('PROXY_URL', '')
 
+# إعدادات الكاش
+VIDEO_INFO_CACHE_TTL = int(os.getenv('VIDEO_INFO_CACHE_TTL', '1800'))  # روابط التحميل تنتهي صلاحيتها بعد ساعات
+VIDEO_INFO_CACHE_SIZE = int(os.getenv('VIDEO_INFO_CACHE_SIZE', '500'))
+
+# إعدادات قوائم التشغيل
+PLAYLIST_MAX_ITEMS = int(os.getenv('PLAYLIST_MAX_ITEMS', '50'))
+PLAYLIST_EXTRACT_CONCURRENCY = int(os.getenv('PLAYLIST_EXTRACT_CONCURRENCY', '4'))
+PLAYLIST_DOWNLOAD_CONCURRENCY = int(os.getenv('PLAYLIST_DOWNLOAD_CONCURRENCY', '2'))
+
+# الحد الأقصى لعدد الروابط المعالجة من رسالة واحدة
+BATCH_MAX_LINKS = int(os.getenv('BATCH_MAX_LINKS', '10'))
+
+# عدد التحديثات التي تعالج بالتوازي (1 = معالجة تسلسلية)
+CONCURRENT_UPDATES = int(os.getenv('CONCURRENT_UPDATES', '64'))
+
+# الوضع المضمن (inline): محادثة اختيارية لرفع الملفات مسبقاً والحصول على file_id
+INLINE_CACHE_CHAT_ID = os.getenv('INLINE_CACHE_CHAT_ID', '')
+
+# حد تلجرام لرفع الملفات عبر Bot API
+TELEGRAM_FILE_LIMIT = 50 * 1024 * 1024
+
+# حجم الدفعة عند قراءة التحميلات من الشبكة
+DOWNLOAD_CHUNK_SIZE = int(os.getenv('DOWNLOAD_CHUNK_SIZE', str(64 * 1024)))
+
+# البث المباشر وإعادة البث عبر قوائم HLS/DASH: عدد المقاطع المحملة بالتوازي لكل تحميل
+MANIFEST_CONCURRENCY = int(os.getenv('MANIFEST_CONCURRENCY', '4'))
+LIVE_WINDOW_MINUTES = float(os.getenv('LIVE_WINDOW_MINUTES', '10'))  # من البث الجاري تحمل آخر N دقيقة
+MANIFEST_SEGMENT_RETRIES = 3
+
+# التحميل المسبق التخميني للخيار الأكثر اختياراً أثناء انتظار ضغط المستخدم
+SPECULATIVE_PREFETCH = os.getenv('SPECULATIVE_PREFETCH', 'false').lower() == 'true'
+PREFETCH_BANDWIDTH = int(os.getenv('PREFETCH_BANDWIDTH', str(1024 * 1024)))  # بايت/ثانية لكل التحميلات المسبقة
+PREFETCH_MIN_SAMPLES = int(os.getenv('PREFETCH_MIN_SAMPLES', '10'))
+
+# المعالجة اللاحقة بـ ffmpeg: تنسيق الصوت المرسل (mp3 / m4a / opus) وعدد عمليات ffmpeg المتزامنة
+FFMPEG_PATH = os.getenv('FFMPEG_PATH', 'ffmpeg')
+FFMPEG_WORKERS = int(os.getenv('FFMPEG_WORKERS', str(os.cpu_count() or 1)))
+AUDIO_FORMAT = os.getenv('AUDIO_FORMAT', 'mp3').lower()
+AUDIO_BITRATE = os.getenv('AUDIO_BITRATE', '192k')
+
+# إعادة الترميز لحجم محدد عندما تتجاوز كل التنسيقات المتاحة حد تلجرام (بدل رسالة "حجم الملف كبير جداً")
+TRANSCODE_TO_FIT = os.getenv('TRANSCODE_TO_FIT', 'false').lower() == 'true'
+TRANSCODE_WORKERS = int(os.getenv('TRANSCODE_WORKERS', '1'))  # عمليات إعادة الترميز المتزامنة (كل واحدة تستخدم عدة أنوية)
+TRANSCODE_PRESET = os.getenv('TRANSCODE_PRESET', 'veryfast')  # preset لـ libx264 (يعمل على أي معالج)
+TRANSCODE_TWO_PASS_MAX_SECONDS = int(os.getenv('TRANSCODE_TWO_PASS_MAX_SECONDS', '900'))  # 0 = مرور واحد دائماً
+TRANSCODE_SIZE_MARGIN = 0.96  # هامش تحت الحد لأن معدل البت الناتج يختلف قليلاً عن المطلوب
+TRANSCODE_MIN_VIDEO_KBPS = 150  # أقل من هذا لا يستحق الإرسال
+TRANSCODE_MIN_AUDIO_KBPS = 32
+# أقصى ارتفاع للصورة حسب معدل بت الفيديو المتاح (kbps، الارتفاع أو None = كما هو)
+TRANSCODE_HEIGHTS = [(2500, None), (1200, 720), (600, 480), (300, 360), (0, 240)]
+
+# تقسيم الملفات الأكبر من الحد إلى أجزاء عند الإطارات المفتاحية بدون إعادة ترميز (-c copy -f segment)
+# وإرسالها كمجموعة وسائط مرتبة
+SPLIT_TO_FIT = os.getenv('SPLIT_TO_FIT', 'true').lower() == 'true'
+SPLIT_MAX_PARTS = 10  # أقصى عدد عناصر في مجموعة وسائط تلجرام
+SPLIT_SIZE_MARGIN = 0.9  # الأجزاء تنتهي عند إطار مفتاحي بعد المدة المحسوبة فتكون أكبر قليلاً منها
+
+# الملفات الصغيرة تحمل إلى الذاكرة في مخازن معاد استخدامها وترسل بدون كتابتها على القرص
+MEMORY_FILE_MAX_MB = float(os.getenv('MEMORY_FILE_MAX_MB', '8'))  # 0 = تعطيل
+MEMORY_POOL_MB = float(os.getenv('MEMORY_POOL_MB', '64'))  # أقصى حجم للمخازن المحتفظ بها بين المهام
+
+# امتدادات الملفات التي ترسل كصوت
+AUDIO_EXTENSIONS = ('.mp3', '.m4a', '.opus', '.ogg')
+
+# كاش عمليات فك التوقيع ودالة n المستخرجة من ملف المشغل (base.js) لكل إصدار
+PLAYER_CACHE_PATH = os.getenv('PLAYER_CACHE_PATH', './cache/player/')
+PLAYER_CACHE_SCHEMA = 3  # يرفع عند تغيير شكل البيانات المحفوظة حتى يعاد تحليل ملفات المشغل
+# ثوانٍ قبل إعادة تحميل وتحليل مشغل لم يتعرف المحلل على دواله (يحفظ في الذاكرة وعلى القرص)
+PLAYER_FAILURE_TTL = int(os.getenv('PLAYER_FAILURE_TTL', '600'))
+PLAYER_DOWNLOAD_FAILURE_TTL = 60  # فشل تحميل base.js غالباً مؤقت: في الذاكرة فقط ولمدة أقصر
+
+# واجهة youtubei/v1/player: JSON مختصر بدل صفحة المشاهدة الكاملة (الصفحة تبقى طريقة احتياطية)
+INNERTUBE_PLAYER = os.getenv('INNERTUBE_PLAYER', 'true').lower() == 'true'
+INNERTUBE_CLIENT_NAME = os.getenv('INNERTUBE_CLIENT_NAME', 'WEB')
+INNERTUBE_CLIENT_VERSION = os.getenv('INNERTUBE_CLIENT_VERSION', '2.20241010.00.00')
+INNERTUBE_API_KEY = os.getenv('INNERTUBE_API_KEY', '')
+
+# قراءة صفحة المشاهدة دفعة بدفعة والتوقف بعد ytInitialPlayerResponse بدل تحميلها كاملة في الذاكرة
+WATCH_PAGE_STREAMING = os.getenv('WATCH_PAGE_STREAMING', 'true').lower() == 'true'
+WATCH_PAGE_CHUNK_SIZE = 64 * 1024
+
+# تحويل المعامل n في روابط googlevideo بدالة المشغل (بدونه يخنق يوتيوب سرعة التحميل)
+N_TRANSFORM = os.getenv('N_TRANSFORM', 'true').lower() == 'true'
+N_CACHE_SIZE = 1024  # عدد نتائج تحويل n المحفوظة في الذاكرة
+
+# التحكم بالقبول: رفض مهام التحميل الجديدة برسالة "مشغول" عند تجاوز حدود الموارد
+MAX_ACTIVE_JOBS = int(os.getenv('MAX_ACTIVE_JOBS', '32'))  # 0 = بدون حد
+MIN_FREE_DISK_MB = int(os.getenv('MIN_FREE_DISK_MB', '500'))  # بعد خصم ما ستكتبه التحميلات الجارية
+DOWNLOAD_BANDWIDTH = int(os.getenv('DOWNLOAD_BANDWIDTH', '0'))  # سعة الخط بايت/ثانية، 0 = غير معروفة
+MIN_JOB_BANDWIDTH = int(os.getenv('MIN_JOB_BANDWIDTH', str(256 * 1024)))  # أقل حصة مقبولة لمهمة جديدة عند امتلاء الخط
+WORKER_THREADS = int(os.getenv('WORKER_THREADS', '64'))  # خيوط asyncio.to_thread (أغلبها ينتظر الشبكة)
+ADMISSION_HIGH_WATERMARK = float(os.getenv('ADMISSION_HIGH_WATERMARK', '0.8'))  # نسبة الاستخدام التي يبدأ عندها الرفض
+# توزيع سرعة الخط بين التحميلات (من googlevideo) والرفع (إلى تلجرام) بجدولة عادلة موزونة:
+# كل مستخدم يأخذ حصة متساوية، والملفات الصغيرة وزنها أكبر حتى تنتهي بسرعة
+UPLOAD_BANDWIDTH = int(os.getenv('UPLOAD_BANDWIDTH', '0'))  # بايت/ثانية لكل عمليات الرفع، 0 = بدون حد
+SMALL_JOB_BYTES = 10 * 1024 * 1024
+SMALL_JOB_WEIGHT = 4.0
+PREFETCH_WEIGHT = 0.25  # التحميل المسبق التخميني يأخذ ما يتبقى فقط
+UPLOAD_SHAPING_CHUNK = 1024 * 1024
+
+# تشغيل طرق استخراج المعلومات بالتحوط (الطريقة التالية تبدأ إذا تأخرت الحالية عن p90 زمنها المعتاد)
+METADATA_HEDGE = os.getenv('METADATA_HEDGE', 'true').lower() == 'true'  # false = بالترتيب واحدة بعد الأخرى
+METADATA_HEDGE_DELAY = float(os.getenv('METADATA_HEDGE_DELAY', '2'))  # ثوانٍ قبل توفر عينات كافية لحساب p90
+BACKEND_STATS_WINDOW = 50  # عدد آخر المحاولات المحفوظة لكل طريقة
+BACKEND_MIN_SAMPLES = 5  # أقل عدد أزمنة ناجحة لاستخدام p90 بدل METADATA_HEDGE_DELAY
+BACKEND_MIN_HEDGE_DELAY = 0.05  # حتى لا تبدأ كل الطرق معاً عندما تكون الأولى سريعة جداً
+
+# سجل المهام الدائم للاستعادة بعد إعادة التشغيل
+JOB_JOURNAL_PATH = os.getenv('JOB_JOURNAL_PATH', './cache/jobs.sqlite3')  # فارغ = تعطيل
+JOB_DRAIN_TIMEOUT = float(os.getenv('JOB_DRAIN_TIMEOUT', '20'))  # ثوانٍ لإكمال المهام الجارية بعد SIGTERM
+JOB_MAX_ATTEMPTS = 2  # المحاولة الأصلية + استئناف واحد بعد إعادة التشغيل
+JOB_RESUME_MAX_AGE = 6 * 3600  # المهام الأقدم تفشل برسالة بدل الاستئناف
+JOB_JOURNAL_RETENTION = 7 * 24 * 3600  # حذف المهام المنتهية الأقدم من أسبوع عند التشغيل
+
+# زمن أول رد مفيد على الرابط (المعاينة أو الأزرار) وزمن ظهور الأزرار، لآخر N رابط
+ANALYSIS_TIMES_WINDOW = 1000
+
+# عمليات منفصلة للمعالجة الثقيلة على المعالج (تحليل صفحة المشاهدة وملف المشغل وتشغيل دالة n)
+# حتى لا تتأخر معالجة تحديثات تلجرام وتستخدم كل الأنوية. 0 = خيوط داخل نفس العملية
+WORKER_PROCESSES = int(os.getenv('WORKER_PROCESSES', str(os.cpu_count() or 1)))
+
+# تشخيص الأداء أثناء التشغيل: الأمر /profile للمشرفين فقط، و SIGUSR1 (المعالج) و SIGUSR2 (الذاكرة) على الخادم
+ADMIN_IDS = {int(value) for value in re.findall(r'-?\d+', os.getenv('ADMIN_IDS', ''))}
+PROFILE_PATH = os.getenv('PROFILE_PATH', './cache/profiles/')  # مجلد التقارير
+PROFILE_INTERVAL = float(os.getenv('PROFILE_INTERVAL', '0.01'))  # ثوانٍ بين عينات المعالج
+PROFILE_DEFAULT_SECONDS = 30
+PROFILE_MAX_SECONDS = 600
+PROFILE_TRACEMALLOC_FRAMES = 10  # عمق المكدس المحفوظ لكل تخصيص ذاكرة
+PROFILE_TOP = 15  # عدد السطور في ملخص التقرير
+
+BUSY_REASONS = {
+    'jobs': 'عدد التحميلات الجارية',
+    'disk': 'مساحة التخزين',
+    'sockets': 'عدد الاتصالات المفتوحة',
+    'threads': 'خيوط المعالجة',
+    'bandwidth': 'سرعة الشبكة',
+}
+
 # إنشاء مجلد التحميل إذا لم يكن موجوداً
 os.makedirs(DOWNLOAD_PATH, exist_ok=True)
 
@@ -42,52 +210,1586 @@ USER_AGENTS = [
     'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
 ]
 
+class TokenBucket:
+    """محدد سرعة (token bucket) غير متزامن يمكن مشاركته بين عدة تحميلات"""
+    
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate  # بايت/ثانية، 0 = بدون حد
+        self.capacity = burst or rate
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+    
+    async def consume(self, amount: int):
+        """الانتظار حتى يتوفر رصيد كافٍ لـ amount بايت"""
+        if self.rate <= 0:
+            return
+        async with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            # يسمح بالرصيد السالب للدفعات الأكبر من السعة، ثم ننتظر حتى يعود للصفر
+            self.tokens -= amount
+            if self.tokens < 0:
+                await asyncio.sleep(-self.tokens / self.rate)
+
+class BufferPool:
+    """مجمع مخازن bytearray يعاد استخدامها بين التحميلات حتى لا تتكرر حجوزات الذاكرة الكبيرة"""
+    
+    GRANULARITY = 1024 * 1024  # تقريب أحجام المخازن حتى يصلح المخزن لملفات متقاربة الحجم
+    
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.free: List[bytearray] = []
+        self.allocated = 0  # عدد المخازن الجديدة (لقياس إعادة الاستخدام)
+        self.reused = 0
+    
+    def acquire(self, size: int) -> bytearray:
+        fitting = [buffer for buffer in self.free if len(buffer) >= size]
+        if fitting:
+            buffer = min(fitting, key=len)
+            self.free.remove(buffer)
+            self.reused += 1
+            return buffer
+        self.allocated += 1
+        return bytearray(-(-size // self.GRANULARITY) * self.GRANULARITY)
+    
+    def release(self, buffer: bytearray):
+        self.free.append(buffer)
+        # التخلص من الأصغر أولاً عند تجاوز الحد، فالمخازن الكبيرة تصلح لكل الأحجام
+        self.free.sort(key=len, reverse=True)
+        while self.free and sum(len(b) for b in self.free) > self.max_bytes:
+            self.free.pop()
+
+class MemoryFile:
+    """ملف محمل في مخزن من BufferPool بدل القرص، name يحدد اسم الملف المرسل وامتداده"""
+    
+    def __init__(self, name: str, buffer, size: int = 0, pool: Optional[BufferPool] = None):
+        self.name = name
+        self.buffer = buffer
+        self.size = size
+        self.pool = pool
+    
+    @property
+    def view(self) -> memoryview:
+        return memoryview(self.buffer)[:self.size]
+    
+    def getvalue(self) -> bytes:
+        """المحتوى كـ bytes، وهي النسخة الوحيدة التي تحتاجها مكتبة تلجرام لبناء طلب الرفع"""
+        if isinstance(self.buffer, bytes) and self.size == len(self.buffer):
+            return self.buffer
+        return self.view.tobytes()
+    
+    def release(self):
+        """إرجاع المخزن للمجمع (بعد الإرسال أو عند الفشل أو الإلغاء)"""
+        if self.pool is not None and self.buffer is not None:
+            self.pool.release(self.buffer)
+        self.buffer = None
+
+def file_ready(file) -> bool:
+    """هل ناتج التحميل (مسار أو MemoryFile) موجود وجاهز للإرسال"""
+    if isinstance(file, MemoryFile):
+        return file.buffer is not None and file.size > 0
+    return bool(file) and os.path.exists(file)
+
+def discard_file(file):
+    """حذف ناتج التحميل: الملف من القرص أو إرجاع المخزن للمجمع"""
+    if isinstance(file, MemoryFile):
+        file.release()
+    elif file and os.path.exists(file):
+        os.remove(file)
+
+def plan_transcode(kind: str, duration: float, target_bytes: int) -> Optional[Dict]:
+    """معدلات البت (kbps) وأقصى ارتفاع لملف مدته duration ثانية حتى لا يتجاوز target_bytes
+
+    يرجع None إذا كانت المدة غير معروفة أو كان معدل البت الناتج أقل من المقبول.
+    """
+    if not duration or duration <= 0:
+        return None
+    total_kbps = target_bytes * 8 / duration / 1000 * TRANSCODE_SIZE_MARGIN
+    if kind == 'audio':
+        audio_kbps = min(int(total_kbps), 320)
+        return {'audio_kbps': audio_kbps} if audio_kbps >= TRANSCODE_MIN_AUDIO_KBPS else None
+
+    audio_kbps = 128 if total_kbps >= 1000 else 96 if total_kbps >= 500 else 64
+    video_kbps = int(total_kbps - audio_kbps)
+    if video_kbps < TRANSCODE_MIN_VIDEO_KBPS:
+        return None
+    max_height = next(height for kbps, height in TRANSCODE_HEIGHTS if video_kbps >= kbps)
+    return {'video_kbps': video_kbps, 'audio_kbps': audio_kbps, 'max_height': max_height}
+
+def part_captions(kind: str, total: int, caption: Optional[str] = None) -> List[str]:
+    """تعليقات أجزاء الملف المقسم بالترتيب ("الجزء 1/3")"""
+    prefix = caption or ('🎵' if kind == 'audio' else '📹')
+    separator = ' • ' if caption else ' '
+    return [f"{prefix}{separator}الجزء {index}/{total}" for index in range(1, total + 1)]
+
+class BandwidthShaper:
+    """token bucket مشترك بين عدة تدفقات مع جدولة عادلة موزونة (WFQ)
+    
+    كل طلب consume يأخذ وقت انتهاء افتراضي = max(الساعة الافتراضية، انتهاء طلبه السابق) + الحجم / الوزن،
+    ويمنح الرصيد بترتيب وقت الانتهاء. وزن التدفق = وزن المهمة (أكبر للملفات الصغيرة) مقسوماً على
+    عدد تدفقات نفس المستخدم، فيحصل كل مستخدم على حصة متساوية مهما فتح من تحميلات.
+    """
+    
+    def __init__(self, rate: float):
+        self.rate = rate  # بايت/ثانية، 0 = بدون حد
+        self.capacity = max(rate / 4, DOWNLOAD_CHUNK_SIZE)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.vtime = 0.0
+        self.queue: List[Tuple[float, int, int, asyncio.Future]] = []
+        self.sequence = 0
+        self.user_flows: Dict = {}  # عدد التدفقات المفتوحة لكل مستخدم
+        self.scheduler: Optional[asyncio.Task] = None
+    
+    def open_flow(self, user, size: int, job: Optional[Dict] = None) -> Dict:
+        """تسجيل تدفق جديد (تحميل أو رفع) لمستخدم، size الحجم المتوقع إن كان معروفاً"""
+        self.user_flows[user] = self.user_flows.get(user, 0) + 1
+        weight = SMALL_JOB_WEIGHT if 0 < size <= SMALL_JOB_BYTES else 1.0
+        return {'user': user, 'weight': weight, 'finish': 0.0, 'job': job if job is not None else {}}
+    
+    def close_flow(self, flow: Dict):
+        count = self.user_flows.get(flow['user'], 1) - 1
+        if count > 0:
+            self.user_flows[flow['user']] = count
+        else:
+            self.user_flows.pop(flow['user'], None)
+    
+    async def consume(self, flow: Dict, amount: int):
+        """انتظار دور التدفق للحصول على رصيد amount بايت"""
+        if self.rate <= 0:
+            return
+        # الوزن يقرأ عند كل طلب لأن عدد تدفقات المستخدم ووزن المهمة قد يتغيران أثناء التحميل
+        weight = flow['weight'] * flow['job'].get('weight', 1.0) / self.user_flows.get(flow['user'], 1)
+        flow['finish'] = max(self.vtime, flow['finish']) + amount / weight
+        future = asyncio.get_running_loop().create_future()
+        self.sequence += 1
+        heapq.heappush(self.queue, (flow['finish'], self.sequence, amount, future))
+        if self.scheduler is None or self.scheduler.done():
+            self.scheduler = asyncio.create_task(self._schedule())
+        await future
+    
+    async def _schedule(self):
+        while self.queue:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens < 0:
+                # الانتظار قبل اختيار الطلب التالي حتى تدخل الطلبات الأعلى أولوية التي تصل أثناءه
+                await asyncio.sleep(-self.tokens / self.rate)
+                continue
+            finish, _, amount, future = heapq.heappop(self.queue)
+            if future.done():  # أُلغي الطلب (إلغاء المهمة) قبل أن يأتي دوره
+                continue
+            self.vtime = finish
+            # مثل TokenBucket: يسمح بالرصيد السالب للدفعات الأكبر من السعة
+            self.tokens -= amount
+            future.set_result(None)
+
+class CountingThreadPoolExecutor(ThreadPoolExecutor):
+    """مجمع الخيوط الافتراضي لـ asyncio.to_thread مع عداد للمهام الجارية والمنتظرة"""
+    
+    def __init__(self, max_workers: int):
+        super().__init__(max_workers=max_workers, thread_name_prefix='bot-worker')
+        self.max_workers = max_workers
+        self.pending = 0
+        self._pending_lock = threading.Lock()
+    
+    def submit(self, fn, /, *args, **kwargs):
+        with self._pending_lock:
+            self.pending += 1
+        future = super().submit(fn, *args, **kwargs)
+        future.add_done_callback(self._done)
+        return future
+    
+    def _done(self, _future):
+        with self._pending_lock:
+            self.pending -= 1
+
+def _init_worker_process(log_level: int, log_disabled: bool, parent_pid: int):
+    # Ctrl+C يصل لكل العمليات: العملية الرئيسية تنهي المهام (drain) ثم توقف العمليات.
+    # SIGTERM يبقى افتراضياً حتى يمكن إيقاف عملية معالجة بـ kill عادي (المجمع يستبدل إذا توقفت إحداها)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    # نفس إعدادات السجلات في العملية الرئيسية وقت إنشاء المجمع
+    logging.getLogger().setLevel(log_level)
+    logger.disabled = log_disabled
+    threading.Thread(target=_exit_with_parent, args=(parent_pid,), name='parent-watch', daemon=True).start()
+
+def _exit_with_parent(parent_pid: int):
+    """إنهاء عملية المعالجة عندما تتوقف العملية الرئيسية بدون تنظيف (kill -9، نفاد الذاكرة)
+    
+    بدونها تبقى العمليات تحت pid 1 مع كل إعادة تشغيل. تغير الأب يعني أن البوت توقف.
+    """
+    while os.getppid() == parent_pid:
+        time.sleep(1)
+    os._exit(1)
+
+class CPUWorkers:
+    """مجمع عمليات منفصلة للمعالجة الثقيلة على المعالج (تحليل HTML و base.js ومفسر JavaScript)
+    
+    الواجهة (تحديثات تلجرام والجلسات والتحميل) تبقى في العملية الرئيسية، وما يرسل هنا دوال على مستوى
+    الوحدة تأخذ وترجع بيانات قابلة للتسلسل. العمليات تبدأ بـ spawn حتى لا ترث خيوط البوت ومقابسه،
+    ويستبدل المجمع إذا توقفت إحداها (نفاد الذاكرة مثلاً). processes=0 ينفذ نفس الدوال في خيوط to_thread.
+    """
+    
+    def __init__(self, processes: int = WORKER_PROCESSES):
+        self.processes = max(0, processes)
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self.running = 0
+        self.completed = 0
+        self.restarts = 0
+    
+    def _pool(self) -> ProcessPoolExecutor:
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(self.processes, mp_context=multiprocessing.get_context('spawn'),
+                                                initializer=_init_worker_process,
+                                                initargs=(logging.getLogger().level, logger.disabled, os.getpid()))
+        return self.executor
+    
+    async def start(self):
+        """تشغيل العمليات مسبقاً حتى لا يدفع أول رابط زمن بدء بايثون واستيراد البوت"""
+        if not self.processes:
+            return
+        loop = asyncio.get_running_loop()
+        try:
+            pids = await asyncio.gather(*(loop.run_in_executor(self._pool(), os.getpid) for _ in range(self.processes)))
+        except (BrokenProcessPool, OSError) as e:
+            # البوت يعمل بدونها (في خيوط) بدل أن يتوقف عن التشغيل
+            logger.error(f"فشل في تشغيل عمليات المعالجة، سيتم التحليل في خيوط: {e}")
+            self.shutdown()
+            self.processes = 0
+            return
+        logger.info(f"عمليات المعالجة جاهزة: {len(set(pids))}")
+    
+    async def run(self, func: Callable, *args):
+        """تنفيذ func(*args) في عملية منفصلة وانتظار الناتج (الاستثناءات تنتقل كما هي)"""
+        self.running += 1
+        try:
+            if not self.processes:
+                return await asyncio.to_thread(func, *args)
+            loop = asyncio.get_running_loop()
+            for attempt in range(2):
+                pool = self._pool()
+                try:
+                    return await loop.run_in_executor(pool, func, *args)
+                except BrokenProcessPool:
+                    if self.executor is pool:
+                        logger.error("توقفت إحدى عمليات المعالجة، جاري استبدال المجمع")
+                        self.executor = None
+                        self.restarts += 1
+                        pool.shutdown(wait=False, cancel_futures=True)
+                    if attempt:
+                        raise
+        finally:
+            self.running -= 1
+            self.completed += 1
+    
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+    
+    def snapshot(self) -> Dict:
+        return {'processes': self.processes, 'running': self.running, 'completed': self.completed,
+                'restarts': self.restarts}
+
+class AdmissionController:
+    """قياس حي لموارد البوت وقرار قبول مهام التحميل الجديدة
+    
+    الموارد المراقبة: عدد المهام الجارية، المساحة الحرة بعد خصم ما ستكتبه التحميلات الجارية،
+    الملفات والمقابس المفتوحة مقابل RLIMIT_NOFILE، خيوط to_thread، وحصة المهمة الجديدة من
+    DOWNLOAD_BANDWIDTH عندما يكون الخط ممتلئاً. عند تجاوز أي حد ترجع check() السبب وتقدير الوقت حتى يتوفر مكان.
+    """
+    
+    RATE_WINDOW = 5  # ثوانٍ لحساب سرعة التحميل الكلية
+    
+    def __init__(self):
+        self.executor = CountingThreadPoolExecutor(max(1, WORKER_THREADS))
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.rate_buckets: Dict[int, int] = {}  # بايتات محملة لكل ثانية {ثانية: بايت}
+        self.rejected: Dict[str, int] = {}  # عدد المهام المرفوضة لكل سبب
+    
+    def attach(self):
+        """تثبيت مجمع الخيوط المعدود كمنفذ افتراضي لحلقة الأحداث الحالية (مرة لكل حلقة)"""
+        loop = asyncio.get_running_loop()
+        if self.loop is not loop:
+            loop.set_default_executor(self.executor)
+            self.loop = loop
+    
+    def record(self, amount: int):
+        """تسجيل بايتات محملة لحساب السرعة الكلية"""
+        second = int(time.monotonic())
+        self.rate_buckets[second] = self.rate_buckets.get(second, 0) + amount
+        if len(self.rate_buckets) > self.RATE_WINDOW + 1:
+            for key in [key for key in self.rate_buckets if key < second - self.RATE_WINDOW]:
+                del self.rate_buckets[key]
+    
+    def bandwidth(self) -> float:
+        """سرعة التحميل الكلية بايت/ثانية خلال آخر RATE_WINDOW ثوانٍ مكتملة"""
+        second = int(time.monotonic())
+        total = sum(v for k, v in self.rate_buckets.items() if second - self.RATE_WINDOW <= k < second)
+        return total / self.RATE_WINDOW
+    
+    def open_files(self) -> Optional[Tuple[int, int]]:
+        """(الملفات والمقابس المفتوحة، الحد الأقصى) أو None إذا لم يمكن قياسها على هذا النظام"""
+        if resource is None:
+            return None
+        try:
+            limit = resource.getrlimit(resource.RLIMIT_NOFILE)[0]
+            count = len(os.listdir('/proc/self/fd'))
+        except OSError:
+            return None
+        if limit == resource.RLIM_INFINITY or limit <= 0:
+            return None
+        return count, limit
+    
+    def usage(self, jobs: List[Dict]) -> Dict:
+        """لقطة من الموارد الحالية (تستخدم في القرار وفي السجلات)"""
+        reserved = sum(max(0, job.get('bytes_total', 0) - job.get('bytes_done', 0)) for job in jobs)
+        try:
+            free = shutil.disk_usage(DOWNLOAD_PATH).free - reserved
+        except OSError:
+            free = None
+        return {
+            'jobs': len(jobs),
+            'free_disk_mb': free / (1024 * 1024) if free is not None else None,
+            'open_files': self.open_files(),
+            'threads': (self.executor.pending, self.executor.max_workers),
+            'bandwidth': self.bandwidth(),
+        }
+    
+    def check(self, jobs: List[Dict]) -> Optional[Tuple[str, int]]:
+        """None إذا أمكن قبول مهمة جديدة، وإلا (سبب الرفض، ثوانٍ مقترحة لإعادة المحاولة)"""
+        usage = self.usage(jobs)
+        reason = None
+        if MAX_ACTIVE_JOBS > 0 and usage['jobs'] >= MAX_ACTIVE_JOBS:
+            reason = 'jobs'
+        elif usage['free_disk_mb'] is not None and usage['free_disk_mb'] < MIN_FREE_DISK_MB:
+            reason = 'disk'
+        elif usage['open_files'] and usage['open_files'][0] >= usage['open_files'][1] * ADMISSION_HIGH_WATERMARK:
+            reason = 'sockets'
+        elif usage['threads'][0] >= usage['threads'][1] * ADMISSION_HIGH_WATERMARK:
+            reason = 'threads'
+        elif (DOWNLOAD_BANDWIDTH > 0 and usage['bandwidth'] >= DOWNLOAD_BANDWIDTH * ADMISSION_HIGH_WATERMARK
+              and DOWNLOAD_BANDWIDTH / (usage['jobs'] + 1) < MIN_JOB_BANDWIDTH):
+            # الخط المشغول وحده لا يكفي للرفض (موزع السرعة يملؤه دائماً)، بل حصة المهمة الجديدة منه
+            reason = 'bandwidth'
+        
+        if not reason:
+            return None
+        return reason, self.retry_after(jobs)
+    
+    def retry_after(self, jobs: List[Dict]) -> int:
+        """أقرب وقت متوقع لانتهاء مهمة جارية بناءً على سرعتها الحالية (بين 5 و 120 ثانية)"""
+        now = time.monotonic()
+        etas = []
+        for job in jobs:
+            done, total, started = job.get('bytes_done', 0), job.get('bytes_total', 0), job.get('stream_started')
+            if total > 0 and done > 0 and started and now > started:
+                etas.append((total - done) / (done / (now - started)))
+        if not etas:
+            return 30
+        return int(min(120, max(5, min(etas) + 1)))
+
+class JobJournal:
+    """سجل دائم لمهام التحميل المقبولة (SQLite بوضع WAL) للاستعادة بعد توقف البوت
+    
+    كل مهمة صف واحد يحدث عند كل انتقال: accepted ثم download و convert و upload، وأخيراً
+    done أو failed أو cancelled أو resumed (استبدلتها مهمة جديدة بعد إعادة التشغيل). الصفوف بدون
+    حالة نهائية عند التشغيل التالي مهام قطعها تعطل البوت أو إيقافه (interrupted بعد SIGTERM)،
+    ومعها مسار الملف الجزئي و itag حتى يكمل التحميل بـ Range من حيث توقف.
+    الكتابات صغيرة ومتزامنة على حلقة الأحداث: مع WAL و synchronous=NORMAL لا يوجد fsync لكل تحديث.
+    """
+    
+    TERMINAL = ('done', 'failed', 'cancelled', 'resumed')
+    
+    def __init__(self, path: str = JOB_JOURNAL_PATH):
+        self.db: Optional[sqlite3.Connection] = None
+        if not path:
+            return
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.db = sqlite3.connect(path, isolation_level=None)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('PRAGMA synchronous=NORMAL')
+        self.db.execute(
+            'CREATE TABLE IF NOT EXISTS jobs ('
+            ' id INTEGER PRIMARY KEY AUTOINCREMENT,'
+            ' chat_id INTEGER, message_id INTEGER, user_id INTEGER,'
+            ' video_id TEXT, url TEXT, choice TEXT,'
+            ' state TEXT NOT NULL, attempts INTEGER NOT NULL DEFAULT 1,'
+            ' partial_path TEXT, itag INTEGER,'
+            ' created REAL NOT NULL, updated REAL NOT NULL)'
+        )
+    
+    def add(self, chat_id: int, message_id: int, user_id: int, video_id: Optional[str], url: Optional[str],
+            choice: str, attempts: int = 1) -> Optional[int]:
+        """تسجيل مهمة مقبولة وإرجاع معرفها (None إذا كان السجل معطلاً)"""
+        if self.db is None:
+            return None
+        now = time.time()
+        cursor = self.db.execute(
+            'INSERT INTO jobs (chat_id, message_id, user_id, video_id, url, choice, state, attempts, created, updated)'
+            ' VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (chat_id, message_id, user_id, video_id, url, choice, 'accepted', attempts, now, now)
+        )
+        return cursor.lastrowid
+    
+    def update(self, job_id: Optional[int], **fields):
+        """تحديث حالة المهمة أو الملف الجزئي (state, partial_path, itag)"""
+        if self.db is None or job_id is None or not fields:
+            return
+        columns = ', '.join(f"{name} = ?" for name in fields)
+        self.db.execute(f'UPDATE jobs SET {columns}, updated = ? WHERE id = ?',
+                        (*fields.values(), time.time(), job_id))
+    
+    def unfinished(self) -> List[Dict]:
+        """المهام التي لم تصل لحالة نهائية (قطعها توقف البوت)"""
+        if self.db is None:
+            return []
+        placeholders = ', '.join('?' * len(self.TERMINAL))
+        rows = self.db.execute(f'SELECT * FROM jobs WHERE state NOT IN ({placeholders}) ORDER BY id', self.TERMINAL)
+        return [dict(row) for row in rows]
+    
+    def prune(self, max_age: float = JOB_JOURNAL_RETENTION):
+        """حذف المهام المنتهية القديمة حتى لا يكبر الملف"""
+        if self.db is None:
+            return
+        placeholders = ', '.join('?' * len(self.TERMINAL))
+        self.db.execute(f'DELETE FROM jobs WHERE state IN ({placeholders}) AND updated < ?',
+                        (*self.TERMINAL, time.time() - max_age))
+
+class RecoveredQuery:
+    """بديل CallbackQuery لمهمة مستأنفة بعد إعادة التشغيل: رسالة التقدم معروفة من السجل فقط"""
+    
+    def __init__(self, bot, chat_id: int, message_id: int, user_id: int):
+        self.message = Message(message_id=message_id, date=datetime.now(), chat=Chat(id=chat_id, type=Chat.PRIVATE))
+        self.message.set_bot(bot)
+        self.user_id = user_id
+    
+    async def answer(self, *args, **kwargs):
+        return True
+    
+    async def edit_message_text(self, text: str, **kwargs):
+        return await self.message.edit_text(text, **kwargs)
+
+class HedgedBackends:
+    """سجل طرق بديلة تعطي نفس النتيجة (مثل youtubei/v1/player وصفحة المشاهدة) مع تشغيل متحوط
+    
+    تبدأ الطريقة الأفضل وحدها، وإذا لم ترد خلال p90 زمنها المعتاد تبدأ التالية بجانبها بدل انتظار
+    مهلتها كاملة (10-15 ث)، وإذا فشلت تبدأ التالية فوراً. أول نتيجة مقبولة (accept) تفوز وتلغى البقية
+    (طلب requests الجاري في خيط لا يمكن قطعه، لكن نتيجته تهمل). الترتيب يتكيف مع آخر
+    BACKEND_STATS_WINDOW محاولة لكل طريقة: الزمن المتوسط للنجاح مقسوماً على نسبة النجاح.
+    """
+    
+    def __init__(self, name: str, accept: Callable[[Optional[Dict]], bool], hedge: bool = METADATA_HEDGE):
+        self.name = name
+        self.accept = accept
+        self.hedge = hedge
+        self.backends: Dict[str, Callable] = {}
+        self.latencies: Dict[str, deque] = {}  # أزمنة المحاولات المقبولة
+        self.outcomes: Dict[str, deque] = {}  # True/False لكل محاولة انتهت (الملغاة لا تحسب)
+        self.wins: Dict[str, int] = {}
+    
+    def register(self, name: str, func: Callable):
+        """إضافة طريقة؛ ترتيب التسجيل هو الترتيب الأولي قبل توفر إحصائيات"""
+        self.backends[name] = func
+        self.latencies[name] = deque(maxlen=BACKEND_STATS_WINDOW)
+        self.outcomes[name] = deque(maxlen=BACKEND_STATS_WINDOW)
+        self.wins[name] = 0
+    
+    def p90(self, name: str) -> float:
+        """زمن الانتظار قبل بدء الطريقة التالية بجانب هذه"""
+        samples = sorted(self.latencies[name])
+        if len(samples) < BACKEND_MIN_SAMPLES:
+            return METADATA_HEDGE_DELAY
+        return max(BACKEND_MIN_HEDGE_DELAY, samples[int(0.9 * (len(samples) - 1))])
+    
+    def expected_time(self, name: str) -> float:
+        """الزمن المتوقع للحصول على نتيجة مقبولة من هذه الطريقة"""
+        outcomes = self.outcomes[name]
+        success_rate = (sum(outcomes) + 1) / (len(outcomes) + 2)
+        samples = sorted(self.latencies[name])
+        latency = samples[len(samples) // 2] if samples else METADATA_HEDGE_DELAY
+        return latency / success_rate
+    
+    def order(self) -> List[str]:
+        names = list(self.backends)
+        if not self.hedge:
+            return names
+        return sorted(names, key=lambda name: (self.expected_time(name), names.index(name)))
+    
+    def record(self, name: str, accepted: bool, elapsed: float):
+        self.outcomes[name].append(accepted)
+        if accepted:
+            self.latencies[name].append(elapsed)
+    
+    async def run(self, *args) -> Optional[Dict]:
+        """أول نتيجة مقبولة، وإلا أول نتيجة غير فارغة (رسالة خطأ مثلاً)، وإلا None"""
+        order = self.order()
+        pending: Dict[asyncio.Task, Tuple[str, float]] = {}
+        fallback = None
+        next_index = 0
+        hedge_at = 0.0
+        try:
+            while True:
+                now = time.monotonic()
+                if next_index < len(order) and (not pending or (self.hedge and now >= hedge_at)):
+                    name = order[next_index]
+                    next_index += 1
+                    pending[asyncio.create_task(self.backends[name](*args))] = (name, now)
+                    hedge_at = now + self.p90(name)
+                    if len(pending) > 1:
+                        logger.info(f"{self.name}: {name} بدأت بجانب طريقة متأخرة")
+                if not pending:
+                    return fallback
+                
+                timeout = max(0.0, hedge_at - now) if self.hedge and next_index < len(order) else None
+                done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    name, started = pending.pop(task)
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        logger.warning(f"{self.name}: فشل في {name}: {e}")
+                        result = None
+                    accepted = bool(self.accept(result))
+                    self.record(name, accepted, time.monotonic() - started)
+                    if accepted:
+                        self.wins[name] += 1
+                        logger.info(f"{self.name}: نجحت {name} خلال {time.monotonic() - started:.2f} ث")
+                        return result
+                    if result is not None and fallback is None:
+                        fallback = result
+        finally:
+            for task in pending:
+                task.cancel()
+    
+    def snapshot(self) -> Dict[str, Dict]:
+        """إحصائيات كل طريقة بالترتيب الحالي (للسجلات والقياس)"""
+        stats = {}
+        for name in self.order():
+            samples = sorted(self.latencies[name])
+            outcomes = self.outcomes[name]
+            stats[name] = {
+                'attempts': len(outcomes),
+                'success_rate': round(sum(outcomes) / len(outcomes), 3) if outcomes else None,
+                'p50': round(samples[len(samples) // 2], 3) if samples else None,
+                'p90': round(self.p90(name), 3),
+                'wins': self.wins[name],
+            }
+        return stats
+
+class Profiler:
+    """تشخيص المعالج والذاكرة أثناء التشغيل بدون أي تكلفة وهو متوقف
+    
+    المعالج: عينات من مكدسات الخيوط كل PROFILE_INTERVAL ثانية تكتب بصيغة collapsed stacks (سطر
+    "خيط;دالة;...;دالة عدد") التي تقرأها flamegraph.pl و speedscope. حلقة الأحداث (الخيط الرئيسي) تؤخذ
+    عيناتها بـ SIGPROF كل PROFILE_INTERVAL من زمن المعالج، لأن خيط العينات لا يحصل على GIL إلا عندما
+    تتركه الحلقة في select فتظهر دائماً خاملة؛ باقي الخيوط يقرأها خيط (sys._current_frames).
+    الخيط المنتظر (select، خيوط to_thread بلا عمل) يعد "(idle)" بدون قراءة مكدسه.
+    الذاكرة: tracemalloc يبدأ مع أول لقطة، وكل لقطة تكتب أكبر مواقع التخصيص والفرق عن اللقطة السابقة.
+    عمليات CPUWorkers و ffmpeg منفصلة فلا تظهر هنا.
+    """
+    
+    # (الملف، الدالة) في أعلى المكدس تعني أن الخيط ينتظر ولا يستخدم المعالج
+    IDLE_FRAMES = {('selectors.py', 'select'), ('threading.py', 'wait'), ('thread.py', '_worker'),
+                   ('queue.py', 'get'), ('connection.py', 'wait'), ('socket.py', 'readinto'),
+                   ('ssl.py', 'read'), ('socketserver.py', 'serve_forever')}
+    
+    def __init__(self, path: str = PROFILE_PATH, interval: float = PROFILE_INTERVAL):
+        self.path = path
+        self.interval = interval
+        self.thread: Optional[threading.Thread] = None
+        self.stop_event = threading.Event()
+        self.labels: Dict = {}  # تسمية كل code object مرة واحدة
+        self.stacks: Dict[str, int] = {}  # عينات الخيوط الأخرى
+        self.main_stacks: Dict[str, int] = {}  # عينات SIGPROF للخيط الرئيسي
+        self.samples = 0
+        self.main_samples = 0
+        self.previous_handler = None  # معالج SIGPROF السابق أثناء العينات بالإشارة
+        self.started = 0.0
+        self.snapshot: Optional[tracemalloc.Snapshot] = None  # آخر لقطة ذاكرة للمقارنة
+    
+    @property
+    def cpu_running(self) -> bool:
+        return self.thread is not None
+    
+    @staticmethod
+    def source_name(filename: str) -> str:
+        """اسم الملف المختصر في التقارير، مع الحزمة لملفات __init__.py (re/__init__.py)"""
+        base = os.path.basename(filename)
+        if base == '__init__.py':
+            return f"{os.path.basename(os.path.dirname(filename))}/{base}"
+        return base
+    
+    def start_cpu(self) -> bool:
+        """بدء أخذ العينات (من الخيط الرئيسي لتفعيل SIGPROF)؛ False إذا كان يعمل بالفعل"""
+        if self.thread is not None:
+            return False
+        self.stacks = {}
+        self.main_stacks = {}
+        self.samples = 0
+        self.main_samples = 0
+        self.started = time.time()
+        self.previous_handler = None
+        if hasattr(signal, 'setitimer') and threading.current_thread() is threading.main_thread():
+            self.previous_handler = signal.signal(signal.SIGPROF, self._on_sigprof) or signal.SIG_DFL
+            signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._sample_loop, name='profiler', daemon=True)
+        self.thread.start()
+        return True
+    
+    def _stack(self, frame, name: str) -> str:
+        code = frame.f_code
+        if (os.path.basename(code.co_filename), code.co_name) in self.IDLE_FRAMES:
+            return f"{name};(idle)"
+        frames = []
+        while frame is not None:
+            code = frame.f_code
+            label = self.labels.get(code)
+            if label is None:
+                label = self.labels[code] = \
+                    f"{code.co_name} ({self.source_name(code.co_filename)}:{code.co_firstlineno})"
+            frames.append(label)
+            frame = frame.f_back
+        frames.append(name)
+        return ';'.join(reversed(frames))
+    
+    def _on_sigprof(self, signum, frame):
+        stack = self._stack(frame, threading.main_thread().name)
+        self.main_stacks[stack] = self.main_stacks.get(stack, 0) + 1
+        self.main_samples += 1
+    
+    def _sample_loop(self):
+        own = threading.get_ident()
+        main = threading.main_thread().ident if self.previous_handler is not None else None
+        names: Dict[int, str] = {}
+        names_updated = 0.0
+        while not self.stop_event.wait(self.interval):
+            now = time.monotonic()
+            if now - names_updated > 1:
+                # خيوط المجمعات (bot-worker_12) تدمج تحت اسم واحد
+                names = {thread.ident: re.sub(r'[_-]?\d+$', '', thread.name) for thread in threading.enumerate()}
+                names_updated = now
+            self.samples += 1
+            for ident, frame in sys._current_frames().items():
+                if ident == own or ident == main:
+                    continue
+                stack = self._stack(frame, names.get(ident, 'thread'))
+                self.stacks[stack] = self.stacks.get(stack, 0) + 1
+    
+    def stop_cpu(self) -> Optional[Dict]:
+        """إيقاف العينات وكتابة التقرير (من الخيط الرئيسي)؛ يرجع الملخص ومسار الملف أو None إذا لم يكن يعمل"""
+        if self.thread is None:
+            return None
+        signal_sampling = self.previous_handler is not None
+        if signal_sampling:
+            signal.setitimer(signal.ITIMER_PROF, 0, 0)
+            signal.signal(signal.SIGPROF, self.previous_handler)
+            self.previous_handler = None
+        self.stop_event.set()
+        self.thread.join()
+        self.thread = None
+        elapsed = time.time() - self.started
+        stacks = dict(self.stacks)
+        for stack, count in self.main_stacks.items():
+            stacks[stack] = stacks.get(stack, 0) + count
+        os.makedirs(self.path, exist_ok=True)
+        path = os.path.join(self.path, f"cpu-{datetime.now():%Y%m%d-%H%M%S}.collapsed")
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in sorted(stacks.items(), key=lambda item: -item[1]):
+                f.write(f"{stack} {count}\n")
+        
+        busy = 0
+        own: Dict[str, int] = {}  # الزمن الذاتي: الدالة في أعلى المكدس
+        bot: Dict[str, int] = {}  # الزمن الشامل لدوال البوت: الدالة في أي مكان من المكدس
+        loop_busy = 0
+        main_name = threading.main_thread().name
+        for stack, count in stacks.items():
+            frames = stack.split(';')
+            if frames[-1] == '(idle)':
+                continue
+            busy += count
+            if frames[0] == main_name:
+                loop_busy += count
+            own[frames[-1]] = own.get(frames[-1], 0) + count
+            for label in set(frames[1:]):
+                if '(bot.py:' in label or '(jsinterp.py:' in label:
+                    bot[label] = bot.get(label, 0) + count
+        
+        def top(counts: Dict[str, int]) -> List[Tuple[str, int]]:
+            return sorted(counts.items(), key=lambda item: -item[1])[:PROFILE_TOP]
+        
+        if signal_sampling:
+            # كل عينة SIGPROF تمثل PROFILE_INTERVAL من زمن المعالج
+            loop_share = loop_busy * self.interval / elapsed if elapsed else 0.0
+        else:
+            loop_share = loop_busy / self.samples if self.samples else 0.0
+        return {
+            'path': path,
+            'seconds': elapsed,
+            'samples': self.samples + self.main_samples,
+            'busy_samples': busy,
+            'loop_busy': min(1.0, loop_share),
+            'self': top(own),
+            'bot': top(bot),
+        }
+    
+    def memory_snapshot(self) -> Dict:
+        """لقطة ذاكرة وكتابة تقريرها؛ أول استدعاء يبدأ tracemalloc فتكون لقطته أساساً للمقارنة"""
+        first = not tracemalloc.is_tracing()
+        if first:
+            tracemalloc.start(PROFILE_TRACEMALLOC_FRAMES)
+            self.snapshot = None
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+        ))
+        current, peak = tracemalloc.get_traced_memory()
+        top = snapshot.statistics('lineno')[:PROFILE_TOP]
+        diff = snapshot.compare_to(self.snapshot, 'lineno')[:PROFILE_TOP] if self.snapshot else []
+        
+        os.makedirs(self.path, exist_ok=True)
+        path = os.path.join(self.path, f"mem-{datetime.now():%Y%m%d-%H%M%S}.txt")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(f"traced {current / 1e6:.1f} MB, peak {peak / 1e6:.1f} MB, "
+                    f"overhead {tracemalloc.get_tracemalloc_memory() / 1e6:.1f} MB\n\n")
+            f.write("# top allocations (lineno)\n")
+            f.writelines(f"{stat}\n" for stat in top)
+            if diff:
+                f.write("\n# diff vs previous snapshot\n")
+                f.writelines(f"{stat}\n" for stat in diff)
+            f.write("\n# tracebacks\n")
+            for stat in snapshot.statistics('traceback')[:5]:
+                f.write(f"\n{stat.size / 1024:.1f} KiB in {stat.count} blocks\n")
+                f.writelines(f"{line}\n" for line in stat.traceback.format())
+        self.snapshot = snapshot
+        
+        def where(stat) -> str:
+            return f"{self.source_name(stat.traceback[0].filename)}:{stat.traceback[0].lineno}"
+        
+        return {
+            'path': path,
+            'first': first,
+            'traced_mb': current / 1e6,
+            'peak_mb': peak / 1e6,
+            'top': [(where(stat), stat.size / 1024, stat.count) for stat in top],
+            'diff': [(where(stat), stat.size_diff / 1024) for stat in diff if stat.size_diff],
+        }
+    
+    def stop_memory(self) -> bool:
+        """إيقاف tracemalloc (يضاعف تقريباً تكلفة كل تخصيص وهو يعمل)"""
+        tracing = tracemalloc.is_tracing()
+        tracemalloc.stop()
+        self.snapshot = None
+        return tracing
+
+def parse_signature_ops(player_js: str) -> Optional[List[Tuple[str, int]]]:
+    """استخراج عمليات فك توقيع signatureCipher من ملف المشغل
+    
+    دالة فك التوقيع في base.js بالشكل:
+        Xy=function(a){a=a.split("");Ab.cd(a,3);Ab.ef(a,45);return a.join("")}
+    والكائن المساعد Ab يحتوي ثلاث عمليات فقط: عكس المصفوفة، حذف أول b عنصر، وتبديل الأول مع b.
+    يرجع قائمة (العملية، المعامل) أو None إذا لم يتم التعرف على البنية.
+    """
+    body_match = re.search(
+        r'function\(\s*([\w$]+)\s*\)\s*\{\s*\1\s*=\s*\1\.split\(\s*""\s*\)\s*;(.*?)return\s+\1\.join\(\s*""\s*\)',
+        player_js, re.DOTALL
+    )
+    if not body_match:
+        return None
+    
+    calls = re.findall(r'([\w$]+)(?:\.([\w$]+)|\["([\w$]+)"\])\(\s*[\w$]+\s*,\s*(\d+)\s*\)', body_match.group(2))
+    if not calls:
+        return None
+    
+    helper_name = calls[0][0]
+    helper_match = re.search(
+        r'(?:var\s+|[;,]\s*)' + re.escape(helper_name) + r'\s*=\s*\{(.*?)\};',
+        player_js, re.DOTALL
+    )
+    if not helper_match:
+        return None
+    
+    # تصنيف دوال الكائن المساعد حسب محتواها
+    kinds = {}
+    for name, body in re.findall(r'([\w$]+)\s*:\s*function\([^)]*\)\s*\{([^}]*)\}', helper_match.group(1)):
+        if 'reverse' in body:
+            kinds[name] = 'reverse'
+        elif 'splice' in body:
+            kinds[name] = 'splice'
+        else:
+            kinds[name] = 'swap'
+    
+    ops = []
+    for obj, dot_name, bracket_name, arg in calls:
+        kind = kinds.get(dot_name or bracket_name)
+        if obj != helper_name or not kind:
+            return None
+        ops.append((kind, int(arg)))
+    return ops
+
+def parse_signature_timestamp(player_js: str) -> Optional[int]:
+    """رقم إصدار التوقيع (signatureTimestamp) الذي يرسل مع طلب youtubei/v1/player"""
+    match = re.search(r'(?:signatureTimestamp|sts)\s*:\s*(\d{5})', player_js)
+    return int(match.group(1)) if match else None
+
+def apply_signature_ops(signature: str, ops) -> str:
+    """تطبيق عمليات فك التوقيع على قيمة s من signatureCipher"""
+    chars = list(signature)
+    for kind, arg in ops:
+        if kind == 'reverse':
+            chars.reverse()
+        elif kind == 'splice':
+            del chars[:arg]
+        elif kind == 'swap' and chars:
+            index = arg % len(chars)
+            chars[0], chars[index] = chars[index], chars[0]
+    return ''.join(chars)
+
+# مواضع استدعاء دالة تحويل n في base.js، مثل:
+#   a.D&&(b=a.get("n"))&&(b=Gma[0](b),a.set("n",b),...)
+N_FUNCTION_CALL_PATTERNS = [
+    r'\.get\("n"\)\)&&\(b=([\w$]+)(?:\[(\d+)\])?\([\w$]+\)',
+    r'b=String\.fromCharCode\(110\),c=a\.get\(b\)\)&&\(c=([\w$]+)(?:\[(\d+)\])?\([\w$]+\)',
+    r'([\w$]+)(?:\[(\d+)\])?\([\w$]+\),[\w$]+\.set\("n",',
+]
+
+def _find_js_assignment(player_js: str, name: str, function_only: bool = False) -> Optional[str]:
+    """نص القيمة المسندة إلى اسم عام في ملف المشغل (var name=... أو name=... أو function name(...))"""
+    match = re.search(
+        r'\bfunction\s+' + re.escape(name) + r'\s*\(|(?:\b(?:var|let|const)\s+|[;,{}\n]\s*)'
+        + re.escape(name) + r'\s*=(?!=)\s*' + (r'(?=function\s*\()' if function_only else ''),
+        player_js
+    )
+    if not match:
+        return None
+    start = match.start() if match.group().startswith('function') else match.end()
+    try:
+        _, end = parse_expression_at(player_js, start)
+    except JSError:
+        return None
+    return player_js[start:end]
+
+def extract_n_function(player_js: str) -> Optional[Dict]:
+    """استخراج دالة تحويل المعامل n من ملف المشغل مع المتغيرات العامة التي تحتاجها
+    
+    يرجع {'name': ..., 'code': 'function(a){...}', 'globals': {الاسم: نص القيمة}}
+    حتى يمكن حفظها في كاش المشغل وتشغيلها لاحقاً بدون الملف الكامل، أو None.
+    """
+    name = None
+    for pattern in N_FUNCTION_CALL_PATTERNS:
+        match = re.search(pattern, player_js)
+        if not match:
+            continue
+        name, index = match.group(1), match.group(2)
+        if index is not None:
+            # الاستدعاء عبر مصفوفة: var Gma=[Hma] ثم Gma[0](b)
+            array_match = re.search(r'\b(?:var\s+)?' + re.escape(name) + r'\s*=\s*\[([^\]]+)\]', player_js)
+            if not array_match:
+                name = None
+                continue
+            items = [item.strip() for item in array_match.group(1).split(',')]
+            name = items[int(index)] if int(index) < len(items) else None
+        if name:
+            break
+    
+    code = _find_js_assignment(player_js, name, function_only=True) if name else None
+    if not code:
+        # احتياطي: الدالة التي ترجع "enhanced_except_" عند الفشل
+        marker = player_js.find('enhanced_except_')
+        if marker < 0:
+            return None
+        candidates = [m for m in re.finditer(r'([\w$]+)=function\(\s*[\w$]+\s*\)\s*\{', player_js[:marker])]
+        if not candidates:
+            return None
+        name = candidates[-1].group(1)
+        code = _find_js_assignment(player_js, name, function_only=True)
+        if not code:
+            return None
+    
+    # المتغيرات العامة المستخدمة داخل الدالة (جداول النصوص مثلاً)، بمستويين من التبعية
+    global_sources: Dict[str, str] = {}
+    try:
+        pending = free_identifiers(code)
+        for _ in range(2):
+            found = []
+            for global_name in pending:
+                if global_name in global_sources or global_name == name:
+                    continue
+                source = _find_js_assignment(player_js, global_name)
+                if source:
+                    global_sources[global_name] = source
+                    found.append(source)
+            pending = [n for source in found for n in free_identifiers(source)]
+    except JSError as e:
+        logger.warning(f"فشل في تحليل متغيرات دالة n العامة: {e}")
+    
+    return {'name': name, 'code': code, 'globals': global_sources}
+
+def compile_n_function(n_code: Dict) -> Callable[[str], str]:
+    """تحويل بيانات دالة n المحفوظة إلى دالة بايثون آمنة للاستخدام من عدة خيوط"""
+    sources = n_code.get('globals') or {}
+    interpreter = JSInterpreter(global_resolver=lambda name: interpreter.evaluate_expression(sources[name]))
+    function = interpreter.compile_function(n_code['code'])
+    lock = threading.Lock()
+    
+    def transform(n: str) -> str:
+        with lock:
+            result = interpreter.call(function, n)
+        if not isinstance(result, str) or result.startswith('enhanced_except_'):
+            raise JSError(f"نتيجة غير صالحة لتحويل n: {result!r}")
+        return result
+    
+    return transform
+
+_n_transforms: Dict[str, Optional[Callable[[str], str]]] = {}  # دوال n المجمعة في هذه العملية لكل إصدار مشغل
+
+def transform_n(player: str, n_code: Dict, n: str) -> str:
+    """تحويل قيمة n بدالة المشغل (يعمل في CPUWorkers)؛ الدالة تجمع مرة واحدة لكل إصدار في كل عملية"""
+    if player not in _n_transforms:
+        try:
+            _n_transforms[player] = compile_n_function(n_code)
+        except (JSError, RecursionError) as e:
+            logger.warning(f"فشل في تجميع دالة n للمشغل {player}: {e}")
+            _n_transforms[player] = None
+    transform = _n_transforms[player]
+    if transform is None:
+        raise JSError(f"دالة n غير قابلة للتجميع للمشغل {player}")
+    return transform(n)
+
+def parse_player_js(player_js: str, version: str) -> Dict:
+    """تحليل ملف المشغل (يعمل في CPUWorkers): بيانات فك التوقيع ودالة n كما تحفظ في كاش المشغل"""
+    return {
+        'schema': PLAYER_CACHE_SCHEMA,
+        'player': version,
+        'signature': parse_signature_ops(player_js),
+        'n': extract_n_function(player_js),
+        'sts': parse_signature_timestamp(player_js),
+    }
+
+def replace_query_param(url: str, name: str, value: str) -> str:
+    """استبدال قيمة معامل في رابط مع الحفاظ على بقية المعاملات"""
+    parts = urllib.parse.urlsplit(url)
+    query = [
+        (key, value if key == name else current)
+        for key, current in urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+    ]
+    return urllib.parse.urlunsplit(parts._replace(query=urllib.parse.urlencode(query)))
+
+class YouTubeLink(NamedTuple):
+    """الشكل الموحد لرابط يوتيوب: نفس الفيديو بأي صيغة رابط يعطي نفس المفتاح للكاش وإزالة التكرار"""
+    video_id: Optional[str]
+    playlist_id: Optional[str]
+    start_time: Optional[int]
+
+YOUTUBE_HOSTS = ('youtube.com', 'youtube-nocookie.com')  # مع أي نطاق فرعي: www و m و music ...
+VIDEO_ID_RE = re.compile(r'[A-Za-z0-9_-]{11}')
+PLAYLIST_ID_RE = re.compile(r'[A-Za-z0-9_-]{2,64}')
+VIDEO_PATH_RE = re.compile(r'/(?:shorts|live|embed|v|e|watch)/([A-Za-z0-9_-]{11})(?:[/?#]|$)')
+# بداية رابط يوتيوب داخل نص حر، والتحقق الفعلي من النطاق والمعرف في normalize_youtube_url
+YOUTUBE_LINK_RE = re.compile(
+    r'(?<![\w.@-])(?:https?://)?(?:[\w-]+\.)*(?:youtube\.com|youtu\.be|youtube-nocookie\.com)/[^\s<>"]+'
+)
+START_TIME_RE = re.compile(r'(?:(\d+)h)?(?:(\d+)m)?(?:(\d+)s?)?')
+
+def _parse_start_time(value: str) -> Optional[int]:
+    """تحويل t=90 أو t=90s أو t=1h2m3s إلى ثوانٍ"""
+    match = START_TIME_RE.fullmatch(value.strip().lower())
+    if not match or not any(match.groups()):
+        return None
+    hours, minutes, seconds = (int(group or 0) for group in match.groups())
+    return hours * 3600 + minutes * 60 + seconds
+
+@functools.lru_cache(maxsize=4096)  # نفس الرابط يحلل عدة مرات أثناء معالجة الرسالة
+def normalize_youtube_url(url: str) -> Optional[YouTubeLink]:
+    """تحليل رابط يوتيوب بكل صيغه إلى (video_id, playlist_id, start_time)
+    
+    يدعم watch و youtu.be و shorts و live و embed (ومنها youtube-nocookie) و music.youtube.com
+    و m.youtube.com و attribution_link. يرجع None لأي نطاق غير يوتيوب أو رابط بدون فيديو أو قائمة،
+    بدون أي طلب شبكة.
+    """
+    url = url.strip()
+    if '://' not in url[:12]:
+        url = 'https://' + url.lstrip('/')
+    try:
+        parts = urllib.parse.urlsplit(url)
+        host = (parts.hostname or '').rstrip('.')
+    except ValueError:
+        return None
+    if parts.scheme.lower() not in ('http', 'https'):
+        return None
+    
+    if host == 'youtu.be':
+        match = VIDEO_ID_RE.match(parts.path, 1)
+        video_id = match.group(0) if match and parts.path[12:13] in ('', '/') else None
+    elif host in YOUTUBE_HOSTS or host.endswith(('.youtube.com', '.youtube-nocookie.com')):
+        match = VIDEO_PATH_RE.match(parts.path)
+        # embed/videoseries?list= قائمة تشغيل وليست فيديو بطول 11 حرفاً
+        video_id = match.group(1) if match and match.group(1) != 'videoseries' else None
+    else:
+        return None
+    
+    query = urllib.parse.parse_qs(parts.query) if parts.query else {}
+    if parts.path.rstrip('/') == '/attribution_link' and query.get('u'):
+        # رابط مشاركة قديم يحمل رابط المشاهدة الحقيقي في u=
+        inner = normalize_youtube_url('https://www.youtube.com' + query['u'][0])
+        return inner if inner and (inner.video_id or inner.playlist_id) else None
+    
+    if video_id is None and host != 'youtu.be' and parts.path.rstrip('/') in ('/watch', ''):
+        candidate = query.get('v', [''])[0]
+        video_id = candidate if VIDEO_ID_RE.fullmatch(candidate) else None
+    
+    playlist = query.get('list', [''])[0]
+    playlist_id = playlist if PLAYLIST_ID_RE.fullmatch(playlist) else None
+    
+    start_time = None
+    fragment = urllib.parse.parse_qs(parts.fragment) if parts.fragment else {}
+    for value in query.get('t', []) + query.get('start', []) + fragment.get('t', []):
+        start_time = _parse_start_time(value)
+        if start_time is not None:
+            break
+    
+    if not video_id and not playlist_id:
+        return None
+    return YouTubeLink(video_id, playlist_id, start_time if video_id else None)
+
+class WatchPageScanner:
+    """قراءة صفحة المشاهدة دفعة بدفعة والتوقف بعد ytInitialPlayerResponse
+    
+    يحفظ بداية الصفحة فقط حتى نهاية ytInitialPlayerResponse (أول "};" بعده، نفس حدود التحليل الكامل):
+    العنوان ورابط المشغل في <head> وبقية المعلومات داخل رد المشغل، أما ytInitialData وما بعده (أغلب حجم
+    الصفحة) فلا يقرأ من الشبكة أصلاً. البحث في كل دفعة رخيص لأنه في العملية الرئيسية، والتحليل في
+    parse_watch_page داخل CPUWorkers. الصفحة بدون ytInitialPlayerResponse (مثل صفحة الموافقة على
+    الكوكيز) تقرأ كاملة.
+    """
+    PLAYER_RESPONSE = re.compile(rb'ytInitialPlayerResponse"?\]?\s*=\s*{')
+    OVERLAP = 64  # من نهاية الدفعة السابقة، لما يقع على الحد بين دفعتين
+    
+    def __init__(self):
+        self.chunks: List[bytes] = []
+        self.size = 0
+        self.tail = b''
+        self.search_from: Optional[int] = None  # موضع البحث عن نهاية رد المشغل في الصفحة
+        self.end: Optional[int] = None
+    
+    def feed(self, chunk: bytes) -> bool:
+        """إضافة دفعة، ترجع True عندما لا تلزم قراءة المزيد"""
+        if self.end is not None:
+            return True
+        data = self.tail + chunk if self.tail else chunk
+        offset = self.size - len(self.tail)  # موضع data[0] في الصفحة
+        self.chunks.append(chunk)
+        self.size += len(chunk)
+        self.tail = data[-self.OVERLAP:]
+        
+        if self.search_from is None:
+            match = self.PLAYER_RESPONSE.search(data)
+            if not match:
+                return False
+            self.search_from = offset + match.end() - 1
+        
+        end = data.find(b'};', max(0, self.search_from - offset))
+        if end < 0:
+            # "}" في آخر الدفعة قد يكمله ";" في أولى التالية
+            self.search_from = max(self.search_from, self.size - 1)
+            return False
+        self.end = offset + end + 2
+        return True
+    
+    def page(self) -> bytes:
+        """بداية الصفحة حتى نهاية ytInitialPlayerResponse (أو كل ما قرئ)"""
+        page = b''.join(self.chunks)
+        self.chunks = []
+        return page[:self.end] if self.end is not None else page
+
+def scan_watch_page(response) -> bytes:
+    """قراءة رد صفحة المشاهدة (stream=True) حتى نهاية ytInitialPlayerResponse ثم إغلاق الاتصال"""
+    scanner = WatchPageScanner()
+    try:
+        for chunk in response.iter_content(WATCH_PAGE_CHUNK_SIZE):
+            if scanner.feed(chunk):
+                break
+    finally:
+        response.close()
+    return scanner.page()
+
+def find_player_response(html: Union[str, bytes]) -> Optional[Dict]:
+    """استخراج ytInitialPlayerResponse من صفحة المشاهدة (يعمل في CPUWorkers)"""
+    if isinstance(html, str):
+        html = html.encode('utf-8')
+    config_patterns = [
+        rb'var ytInitialPlayerResponse = ({.+?});',
+        rb'ytInitialPlayerResponse\s*=\s*({.+?});',
+        rb'window\["ytInitialPlayerResponse"\]\s*=\s*({.+?});'
+    ]
+    
+    for pattern in config_patterns:
+        for match in re.finditer(pattern, html, re.DOTALL):
+            try:
+                config_text = match.group(1)
+                # تنظيف JSON
+                config_text = re.sub(rb'\\n', b'', config_text)
+                config_text = re.sub(rb'\\t', b'', config_text)
+                
+                player_config = json.loads(config_text)
+                logger.info("تم العثور على تكوين المشغل بنجاح")
+                return player_config
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                logger.warning(f"فشل في تحليل JSON: {e}")
+    return None
+
+def find_alternative_formats(html: str) -> List[Dict]:
+    """طريقة بديلة لاستخراج التنسيقات من HTML بدون playerResponse (يعمل في CPUWorkers)"""
+    formats = []
+    
+    # البحث عن patterns مختلفة في HTML
+    alternative_patterns = [
+        r'"url":"([^"]+)".*?"itag":(\d+)',
+        r'"signatureCipher":"([^"]+)".*?"itag":(\d+)',
+        r'itag=(\d+).*?url=([^&]+)',
+    ]
+    
+    for pattern in alternative_patterns:
+        matches = re.finditer(pattern, html)
+        for match in matches:
+            try:
+                if len(match.groups()) >= 2:
+                    url = match.group(1) if 'url' in pattern else match.group(2)
+                    itag = match.group(2) if 'url' in pattern else match.group(1)
+                    
+                    # تنظيف URL
+                    if url.startswith('\\'):
+                        url = url.replace('\\', '')
+                    
+                    # إنشاء تنسيق أساسي
+                    format_info = {
+                        'itag': int(itag) if itag.isdigit() else 0,
+                        'url': url,
+                        'ext': 'mp4',  # افتراضي
+                        'type': 'video'  # افتراضي
+                    }
+                    
+                    # تخمين الجودة بناءً على itag
+                    quality_map = {
+                        22: {'height': 720, 'quality': '720p'},
+                        18: {'height': 360, 'quality': '360p'},
+                        140: {'type': 'audio', 'quality': '128kbps', 'ext': 'm4a'},
+                        251: {'type': 'audio', 'quality': '160kbps', 'ext': 'webm'},
+                    }
+                    
+                    if int(itag) in quality_map:
+                        format_info.update(quality_map[int(itag)])
+                    
+                    formats.append(format_info)
+            except Exception as e:
+                logger.warning(f"تجاهل تنسيق غير صحيح: {e}")
+                continue
+    
+    # إزالة التكرارات
+    unique_formats = []
+    seen_itags = set()
+    for fmt in formats:
+        if fmt['itag'] not in seen_itags:
+            unique_formats.append(fmt)
+            seen_itags.add(fmt['itag'])
+    
+    logger.info(f"تم استخراج {len(unique_formats)} تنسيق بالطريقة البديلة")
+    return unique_formats
+
+def parse_watch_page(html: bytes, video_id: str) -> Dict:
+    """تحليل صفحة المشاهدة كبايتات (يعمل في CPUWorkers)
+    
+    html الصفحة كاملة أو بدايتها من scan_watch_page. يرجع {'error': ..., 'message': ...} للفيديو غير
+    المتاح أو الخاص، وإلا {'info': {title, uploader, duration, thumbnail}, 'player_config':
+    ytInitialPlayerResponse أو None, 'player_path': رابط base.js أو None, 'html': الصفحة كنص للطريقة
+    البديلة عندما لا يوجد فيها ytInitialPlayerResponse وإلا None}.
+    """
+    # فحص إذا كان الفيديو متاحاً
+    if b'Video unavailable' in html or b'This video is not available' in html:
+        return {'error': 'unavailable', 'message': 'الفيديو غير متاح'}
+    
+    if b'Private video' in html or b'This video is private' in html:
+        return {'error': 'private', 'message': 'الفيديو خاص'}
+    
+    info = {}
+    
+    # استخراج العنوان
+    title_patterns = [
+        rb'<title>(.+?) - YouTube</title>',
+        rb'"title":"([^"]+)"',
+        rb'<meta name="title" content="([^"]+)"',
+        rb'<meta property="og:title" content="([^"]+)"'
+    ]
+    
+    for pattern in title_patterns:
+        match = re.search(pattern, html)
+        if match:
+            info['title'] = match.group(1).decode('utf-8', errors='replace').replace('\\u0026', '&').replace('\\', '')
+            break
+    
+    if 'title' not in info:
+        info['title'] = 'عنوان غير معروف'
+    
+    # استخراج اسم القناة
+    channel_patterns = [
+        rb'"ownerChannelName":"([^"]+)"',
+        rb'"author":"([^"]+)"',
+        rb'<link itemprop="name" content="([^"]+)"',
+        rb'"channelName":"([^"]+)"'
+    ]
+    
+    for pattern in channel_patterns:
+        match = re.search(pattern, html)
+        if match:
+            info['uploader'] = match.group(1).decode('utf-8', errors='replace').replace('\\u0026', '&').replace('\\', '')
+            break
+    
+    if 'uploader' not in info:
+        info['uploader'] = 'قناة غير معروفة'
+    
+    # استخراج المدة
+    duration_patterns = [
+        rb'"lengthSeconds":"(\d+)"',
+        rb'"duration":"PT(\d+)M(\d+)S"',
+        rb'<meta itemprop="duration" content="PT(\d+)M(\d+)S"'
+    ]
+    
+    duration = 0
+    for pattern in duration_patterns:
+        match = re.search(pattern, html)
+        if match:
+            if b'lengthSeconds' in pattern:
+                duration = int(match.group(1))
+            else:
+                minutes = int(match.group(1))
+                seconds = int(match.group(2))
+                duration = minutes * 60 + seconds
+            break
+    
+    info['duration'] = duration
+    
+    # استخراج الصورة المصغرة
+    thumbnail_patterns = [
+        rb'"url":"(https://i\.ytimg\.com/vi/[^/]+/maxresdefault\.jpg)"',
+        rb'"url":"(https://i\.ytimg\.com/vi/[^/]+/hqdefault\.jpg)"',
+        rb'<meta property="og:image" content="([^"]+)"'
+    ]
+    
+    for pattern in thumbnail_patterns:
+        match = re.search(pattern, html)
+        if match:
+            info['thumbnail'] = match.group(1).decode('utf-8', errors='replace').replace('\\', '')
+            break
+    
+    if 'thumbnail' not in info:
+        info['thumbnail'] = f"https://i.ytimg.com/vi/{video_id}/hqdefault.jpg"
+    
+    player_config = find_player_response(html)
+    match = re.search(rb'"(?:jsUrl|PLAYER_JS_URL)"\s*:\s*"([^"]+base\.js)"', html)
+    return {
+        'info': info,
+        'player_config': player_config,
+        'player_path': match.group(1).decode('utf-8', errors='replace') if match else None,
+        'html': html.decode('utf-8', errors='replace') if player_config is None else None,
+    }
+
+def _hls_attributes(value: str) -> Dict[str, str]:
+    """خصائص سطر HLS مثل BANDWIDTH=1280000,RESOLUTION=1280x720,CODECS="avc1,mp4a" """
+    return {key: item.strip('"') for key, item in re.findall(r'([A-Z0-9-]+)=("[^"]*"|[^,]*)', value)}
+
+def parse_hls_playlist(text: str, base_url: str) -> Dict:
+    """تحليل قائمة HLS (m3u8) رئيسية أو قائمة مقاطع (يعمل في CPUWorkers)
+    
+    القائمة الرئيسية ترجع {'variants': [{'url', 'bandwidth', 'width', 'height', 'fps', 'codecs'}]}،
+    وقائمة المقاطع ترجع {'segments': [{'url', 'duration', 'sequence'}], 'init', 'live', 'encrypted'}
+    حيث live تعني عدم وجود EXT-X-ENDLIST (بث جارٍ يضاف إليه المزيد).
+    """
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    if not lines or lines[0] != '#EXTM3U':
+        raise ValueError("ليست قائمة m3u8")
+    
+    variants, segments = [], []
+    variant = None
+    duration = None
+    sequence = 0
+    init = None
+    live = True
+    encrypted = False
+    for line in lines[1:]:
+        if line.startswith('#EXT-X-STREAM-INF:'):
+            variant = _hls_attributes(line.split(':', 1)[1])
+        elif line.startswith('#EXTINF:'):
+            duration = float(line[len('#EXTINF:'):].split(',', 1)[0])
+        elif line.startswith('#EXT-X-MEDIA-SEQUENCE:'):
+            sequence = int(line.split(':', 1)[1])
+        elif line.startswith('#EXT-X-MAP:'):
+            init = urllib.parse.urljoin(base_url, _hls_attributes(line.split(':', 1)[1]).get('URI', ''))
+        elif line.startswith('#EXT-X-KEY:'):
+            encrypted = _hls_attributes(line.split(':', 1)[1]).get('METHOD', 'NONE') != 'NONE'
+        elif line == '#EXT-X-ENDLIST' or line == '#EXT-X-PLAYLIST-TYPE:VOD':
+            live = False
+        elif not line.startswith('#'):
+            url = urllib.parse.urljoin(base_url, line)
+            if variant is not None:
+                width, _, height = variant.get('RESOLUTION', '').partition('x')
+                variants.append({
+                    'url': url,
+                    'bandwidth': int(variant.get('BANDWIDTH') or 0),
+                    'width': int(width) if width.isdigit() else None,
+                    'height': int(height) if height.isdigit() else None,
+                    'fps': float(variant['FRAME-RATE']) if variant.get('FRAME-RATE') else None,
+                    'codecs': variant.get('CODECS', ''),
+                })
+                variant = None
+            elif duration is not None:
+                segments.append({'url': url, 'duration': duration, 'sequence': sequence + len(segments)})
+                duration = None
+    
+    if variants:
+        return {'variants': variants}
+    return {'segments': segments, 'init': init, 'live': live, 'encrypted': encrypted}
+
+def _xml_children(element, name: str) -> List:
+    """العناصر الفرعية بالاسم بدون namespace (ملفات MPD تستخدم urn:mpeg:dash:schema:mpd:2011)"""
+    return [child for child in element if child.tag.rsplit('}', 1)[-1] == name] if element is not None else []
+
+def _xml_child(element, name: str):
+    children = _xml_children(element, name)
+    return children[0] if children else None
+
+def _dash_inherited(name: str, *elements):
+    """أول عنصر بالاسم من الأقرب للأبعد (Representation ثم AdaptationSet)؛ العنصر بدون أبناء قيمته False"""
+    for element in elements:
+        child = _xml_child(element, name)
+        if child is not None:
+            return child
+    return None
+
+def _dash_base_url(element, base: str) -> str:
+    """BaseURL العنصر منسوباً إلى BaseURL الأب"""
+    child = _xml_child(element, 'BaseURL')
+    return urllib.parse.urljoin(base, (child.text or '').strip()) if child is not None else base
+
+def parse_iso_duration(value: Optional[str]) -> float:
+    """مدة ISO 8601 مثل PT1H2M3.5S بالثواني (0 إذا كانت فارغة)"""
+    match = re.match(r'P(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:([\d.]+)S)?)?$', value or '')
+    if not match:
+        return 0.0
+    days, hours, minutes, seconds = match.groups()
+    return int(days or 0) * 86400 + int(hours or 0) * 3600 + int(minutes or 0) * 60 + float(seconds or 0)
+
+def _dash_template(template: str, representation_id: str, bandwidth: int, number: int = 0, start: int = 0) -> str:
+    """تعويض $RepresentationID$ و $Number$ و $Time$ و $Bandwidth$ (مع صيغة مثل $Number%05d$)"""
+    values = {'RepresentationID': representation_id, 'Number': number, 'Time': start, 'Bandwidth': bandwidth}
+    
+    def substitute(match):
+        if not match.group(1):
+            return '$'
+        value = values[match.group(1)]
+        return match.group(2) % value if match.group(2) else str(value)
+    
+    return re.sub(r'\$(?:(RepresentationID|Number|Time|Bandwidth)(%0\d+d)?)?\$', substitute, template)
+
+def _dash_timeline(timeline, period_seconds: float, timescale: int) -> List[Tuple[int, int]]:
+    """أزمنة ومدد المقاطع (بوحدات timescale) من SegmentTimeline؛ r=-1 يتكرر حتى نهاية الفترة"""
+    entries = []
+    current = 0
+    items = _xml_children(timeline, 'S')
+    for index, item in enumerate(items):
+        current = int(item.get('t', current))
+        duration = int(item.get('d'))
+        repeat = int(item.get('r', 0))
+        if repeat < 0:
+            end = int(items[index + 1].get('t')) if index + 1 < len(items) and items[index + 1].get('t') else \
+                int(period_seconds * timescale)
+            repeat = max(0, math.ceil((end - current) / duration) - 1)
+        for _ in range(repeat + 1):
+            entries.append((current, duration))
+            current += duration
+    return entries
+
+def parse_dash_manifest(text: str, base_url: str, now: Optional[float] = None) -> Dict:
+    """تحليل ملف DASH (MPD) إلى تمثيلات مع روابط مقاطعها بالترتيب (يعمل في CPUWorkers)
+    
+    يدعم SegmentList و SegmentTemplate (بـ SegmentTimeline أو مدة ثابتة) و BaseURL لملف واحد.
+    يرجع {'live': type == dynamic، 'duration', 'representations': [{'id', 'type', 'mime', 'codecs',
+    'bandwidth', 'width', 'height', 'fps', 'init', 'segments': [{'url', 'duration'}]}]}.
+    """
+    root = ElementTree.fromstring(text)
+    live = root.get('type') == 'dynamic'
+    total_duration = parse_iso_duration(root.get('mediaPresentationDuration'))
+    base = _dash_base_url(root, base_url)
+    # بث جارٍ: المقاطع المتاحة الآن من availabilityStartTime و timeShiftBufferDepth
+    now = time.time() if now is None else now
+    available_start = root.get('availabilityStartTime')
+    if available_start:
+        available_start = datetime.fromisoformat(available_start.replace('Z', '+00:00')).timestamp()
+    buffer_depth = parse_iso_duration(root.get('timeShiftBufferDepth'))
+    
+    periods = _xml_children(root, 'Period')
+    if not periods:
+        raise ValueError("لا توجد Period في ملف MPD")
+    # ملفات يوتيوب فيها فترة واحدة، وفي البث تكون الأخيرة هي الجارية
+    period = periods[-1]
+    period_base = _dash_base_url(period, base)
+    period_seconds = parse_iso_duration(period.get('duration')) or total_duration
+    if live and not period_seconds and available_start:
+        period_seconds = now - available_start - parse_iso_duration(period.get('start'))
+    
+    representations = []
+    for adaptation in _xml_children(period, 'AdaptationSet'):
+        adaptation_base = _dash_base_url(adaptation, period_base)
+        for representation in _xml_children(adaptation, 'Representation'):
+            rep_id = representation.get('id', '')
+            bandwidth = int(representation.get('bandwidth') or 0)
+            mime = representation.get('mimeType') or adaptation.get('mimeType') or ''
+            content_type = adaptation.get('contentType') or mime.split('/')[0]
+            rep_base = _dash_base_url(representation, adaptation_base)
+            segment_list = _dash_inherited('SegmentList', representation, adaptation)
+            template = _dash_inherited('SegmentTemplate', representation, adaptation)
+            init = None
+            segments = []
+            
+            if segment_list is not None:
+                timescale = int(segment_list.get('timescale', 1))
+                initialization = _xml_child(segment_list, 'Initialization')
+                if initialization is not None and initialization.get('sourceURL'):
+                    init = urllib.parse.urljoin(rep_base, initialization.get('sourceURL'))
+                timeline = _dash_timeline(_xml_child(segment_list, 'SegmentTimeline'), period_seconds, timescale)
+                fixed = int(segment_list.get('duration', 0)) / timescale
+                for index, item in enumerate(_xml_children(segment_list, 'SegmentURL')):
+                    duration = timeline[index][1] / timescale if index < len(timeline) else fixed
+                    segments.append({'url': urllib.parse.urljoin(rep_base, item.get('media', '')),
+                                     'duration': duration})
+            elif template is not None:
+                timescale = int(template.get('timescale', 1))
+                start_number = int(template.get('startNumber', 1))
+                media = template.get('media', '')
+                if template.get('initialization'):
+                    init = urllib.parse.urljoin(rep_base, _dash_template(template.get('initialization'), rep_id, bandwidth))
+                timeline = _xml_child(template, 'SegmentTimeline')
+                if timeline is not None:
+                    for index, (start, duration) in enumerate(_dash_timeline(timeline, period_seconds, timescale)):
+                        url = _dash_template(media, rep_id, bandwidth, start_number + index, start)
+                        segments.append({'url': urllib.parse.urljoin(rep_base, url), 'duration': duration / timescale})
+                elif template.get('duration'):
+                    duration = int(template.get('duration')) / timescale
+                    if live and available_start:
+                        # آخر مقطع مكتمل الآن، وأقدمها ضمن نافذة timeShiftBufferDepth
+                        last = start_number + int((now - available_start) / duration) - 1
+                        first = max(start_number, last - int(buffer_depth / duration) + 1) if buffer_depth else start_number
+                    else:
+                        first, last = start_number, start_number + math.ceil(period_seconds / duration) - 1
+                    for number in range(first, last + 1):
+                        url = _dash_template(media, rep_id, bandwidth, number, (number - start_number) * duration)
+                        segments.append({'url': urllib.parse.urljoin(rep_base, url), 'duration': duration})
+            else:
+                # SegmentBase أو بدون معلومات مقاطع: الملف كاملاً من BaseURL
+                segments.append({'url': rep_base, 'duration': period_seconds})
+            
+            representations.append({
+                'id': rep_id,
+                'type': 'video' if content_type == 'video' else 'audio' if content_type == 'audio' else content_type,
+                'mime': mime,
+                'codecs': representation.get('codecs') or adaptation.get('codecs') or '',
+                'bandwidth': bandwidth,
+                'width': int(representation.get('width')) if representation.get('width') else None,
+                'height': int(representation.get('height')) if representation.get('height') else None,
+                'fps': representation.get('frameRate') or adaptation.get('frameRate'),
+                'init': init,
+                'segments': segments,
+            })
+    return {'live': live, 'duration': total_duration, 'representations': representations}
+
+def live_window(segments: List[Dict], seconds: float) -> List[Dict]:
+    """آخر المقاطع التي يغطي مجموع مددها seconds ثانية (نافذة "آخر N دقيقة" من البث)"""
+    covered = 0.0
+    for index in range(len(segments) - 1, -1, -1):
+        covered += segments[index]['duration']
+        if covered >= seconds:
+            return segments[index:]
+    return segments
+
 class YouTubeTelegramBot:
     def __init__(self):
         self.user_sessions: Dict[int, Dict] = {}
         self.proxy_status: Dict[str, bool] = {}  # كاش لحالة البروكسي
+        self.video_info_cache: Dict[str, Dict] = {}  # كاش معلومات الفيديو {video_id: {'info': ..., 'time': ...}}
+        self.file_id_cache: Dict[str, Dict] = {}  # كاش file_id للملفات المرسلة {video_id:choice: {'file_id': ..., 'kind': ...}}
+        self.background_tasks: Dict[str, asyncio.Task] = {}  # مهام التجهيز في الخلفية للوضع المضمن
+        self.selection_stats: Dict[str, int] = {}  # عدد مرات اختيار كل زر تحميل {callback_data: count}
+        self.prefetch_limiter = TokenBucket(PREFETCH_BANDWIDTH)  # حد سرعة مشترك لكل التحميلات المسبقة
+        self.active_jobs: Dict[Tuple[int, int], Dict] = {}  # مهام التحميل الجارية {(chat_id, message_id): job}
+        self.ffmpeg_slots = asyncio.Semaphore(max(1, FFMPEG_WORKERS))  # مجمع عمليات ffmpeg بعدد الأنوية
+        self.ffmpeg_missing = False
+        # إعادة الترميز لحجم محدد: مجمع أصغر داخل ffmpeg_slots لأن كل ترميز فيديو يستخدم عدة أنوية
+        self.transcode_slots = asyncio.Semaphore(max(1, TRANSCODE_WORKERS))
+        self.transcode_waiting = 0
+        self.transcode_stats: deque = deque(maxlen=ANALYSIS_TIMES_WINDOW)  # زمن ومعالج كل مهمة لضبط TRANSCODE_WORKERS
+        self.player_cache: Dict[str, Dict] = {}  # بيانات ملف المشغل المحللة لكل إصدار {version: {...}}
+        self.player_failures: Dict[str, float] = {}  # إصدارات فشل تحميلها أو تحليلها {version: وقت إعادة المحاولة}
+        self.player_tasks: Dict[str, asyncio.Task] = {}  # تحليل ملفات المشغل الجاري (لتجنب التحميل المكرر)
+        self.n_results: Dict[Tuple[str, str], str] = {}  # نتائج تحويل n {(version, n): الناتج}
+        self.player_url: Optional[str] = None  # آخر رابط ملف مشغل معروف
+        self.admission = AdmissionController()  # حدود الموارد لقبول مهام التحميل الجديدة
+        self.workers = CPUWorkers()  # عمليات التحليل الثقيل على المعالج بجانب الواجهة
+        self.ingress = BandwidthShaper(DOWNLOAD_BANDWIDTH)  # سرعة التحميل المشتركة بين كل المهام
+        self.egress = BandwidthShaper(UPLOAD_BANDWIDTH)  # سرعة الرفع إلى تلجرام المشتركة
+        self.buffers = BufferPool(int(MEMORY_POOL_MB * 1024 * 1024))  # مخازن الملفات الصغيرة في الذاكرة
+        # جلسة بمجمع اتصالات لمقاطع HLS/DASH: مئات الطلبات الصغيرة لنفس الخادم بدل اتصال جديد لكل مقطع
+        self.segment_session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=max(16, MANIFEST_CONCURRENCY * 4))
+        self.segment_session.mount('https://', adapter)
+        self.segment_session.mount('http://', adapter)
+        # مصادر معلومات الفيديو مع الروابط: الخطأ الحاسم (خاص، غير متاح) يقبل مثل النتيجة
+        self.info_backends = HedgedBackends('video_info', lambda info: bool(info) and (
+            'error' not in info or info['error'] in ('private', 'unavailable')))
+        if INNERTUBE_PLAYER:
+            self.info_backends.register('innertube', self.get_video_info_innertube)
+        self.info_backends.register('watch_page', self.get_video_info_watch_page)
+        # مصادر المعلومات الأساسية فقط (بدون روابط)
+        self.basic_info_backends = HedgedBackends('basic_info', lambda info: bool(info) and 'title' in info)
+        self.basic_info_backends.register('oembed', self._get_video_info_method1)
+        self.basic_info_backends.register('scraping', self._get_video_info_method2)
+        self.basic_info_backends.register('data_api', self._get_video_info_method3)
+        self.journal = JobJournal()  # سجل المهام الدائم (انظر recover_jobs و drain)
+        self.draining = False  # بعد SIGTERM: لا مهام جديدة
+        self.recovery_tasks: set = set()  # مهام مستأنفة من السجل قبل أن تصبح في active_jobs
+        # أزمنة تحليل الروابط بالثواني: first_feedback (العنوان والصورة) و keyboard (أزرار الجودة)
+        self.analysis_times: Dict[str, deque] = {
+            'first_feedback': deque(maxlen=ANALYSIS_TIMES_WINDOW),
+            'keyboard': deque(maxlen=ANALYSIS_TIMES_WINDOW),
+        }
+        self.profiler = Profiler()  # تشخيص المعالج والذاكرة للمشرفين (/profile و SIGUSR1/SIGUSR2)
+        self.profile_stop: Optional[asyncio.Event] = None  # إيقاف قياس المعالج الجاري قبل انتهاء مدته
         
     def extract_video_id(self, url: str) -> Optional[str]:
-        """استخراج معرف الفيديو من رابط يوتيوب باستخدام regex"""
-        patterns = [
-            r'(?:youtube\.com\/watch\?v=|youtu\.be\/|youtube\.com\/embed\/|youtube\.com\/v\/)([a-zA-Z0-9_-]{11})',
-            r'youtube\.com\/watch\?.*v=([a-zA-Z0-9_-]{11})',
-            r'youtu\.be\/([a-zA-Z0-9_-]{11})',
-            r'youtube\.com\/embed\/([a-zA-Z0-9_-]{11})',
-            r'youtube\.com\/v\/([a-zA-Z0-9_-]{11})',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                video_id = match.group(1)
-                logger.info(f"تم استخراج معرف الفيديو: {video_id}")
-                return video_id
+        """استخراج معرف الفيديو من رابط يوتيوب بأي صيغة (انظر normalize_youtube_url)"""
+        link = normalize_youtube_url(url)
+        if link and link.video_id:
+            logger.info(f"تم استخراج معرف الفيديو: {link.video_id}")
+            return link.video_id
         
         logger.warning(f"فشل في استخراج معرف الفيديو من: {url}")
         return None
     
+    def extract_playlist_id(self, url: str) -> Optional[str]:
+        """استخراج معرف قائمة التشغيل (list=) من رابط يوتيوب"""
+        link = normalize_youtube_url(url)
+        if link and link.playlist_id:
+            logger.info(f"تم استخراج معرف قائمة التشغيل: {link.playlist_id}")
+            return link.playlist_id
+        return None
+    
     async def get_video_info_direct(self, video_id: str) -> Optional[Dict]:
         """الحصول على معلومات الفيديو مباشرة من يوتيوب بدون yt-dlp"""
         try:
-            # استخدام طرق مختلفة للحصول على معلومات الفيديو
-            methods = [
-                self._get_video_info_method1,
-                self._get_video_info_method2,
-                self._get_video_info_method3
-            ]
-            
-            for method in methods:
-                try:
-                    result = await method(video_id)
-                    if result and 'title' in result:
-                        logger.info(f"نجح في الحصول على معلومات الفيديو باستخدام الطريقة: {method.__name__}")
-                        return result
-                except Exception as e:
-                    logger.warning(f"فشل في {method.__name__}: {e}")
-                    continue
-            
-            return None
+            # الطرق المختلفة تعمل بالتحوط وبالترتيب الأسرع حالياً (انظر HedgedBackends)
+            return await self.basic_info_backends.run(video_id)
             
         except Exception as e:
             logger.error(f"خطأ في get_video_info_direct: {e}")
@@ -349,8 +2051,130 @@ class YouTubeTelegramBot:
         
         return 'unknown'
     
+    async def discover_player_url(self) -> Optional[str]:
+        """رابط ملف المشغل الحالي: آخر مشغل معروف، أو من iframe_api (ملف صغير) عند بدء التشغيل"""
+        if self.player_url:
+            return self.player_url
+        try:
+            proxies = {'http': PROXY_URL, 'https': PROXY_URL} if USE_PROXY and PROXY_URL else None
+            response = await asyncio.to_thread(
+                requests.get, "https://www.youtube.com/iframe_api",
+                proxies=proxies,
+                headers={'User-Agent': random.choice(USER_AGENTS)},
+                timeout=10
+            )
+            match = re.search(r'player\\?/([\w-]+)\\?/', response.text) if response.status_code == 200 else None
+        except Exception as e:
+            logger.warning(f"فشل في تحديد إصدار المشغل من iframe_api: {e}")
+            return None
+        if not match:
+            return None
+        self.player_url = f"https://www.youtube.com/s/player/{match.group(1)}/player_ias.vflset/en_US/base.js"
+        return self.player_url
+    
+    async def get_video_info_innertube(self, video_id: str) -> Optional[Dict]:
+        """معلومات الفيديو وروابطه من youtubei/v1/player (JSON مختصر بدل صفحة المشاهدة الكاملة)
+        
+        يرجع نفس شكل get_complete_video_info، أو None عند أي فشل غير حاسم (خطأ شبكة، تحقق
+        من العمر، تنسيقات لا يمكن فكها...) حتى يتراجع المستدعي إلى صفحة المشاهدة.
+        """
+        try:
+            # ملف المشغل مطلوب لفك التوقيع وتحويل n، و signatureTimestamp يرسل مع الطلب
+            player_url = await self.discover_player_url()
+            player_data = await self.get_player_data(player_url) if player_url else None
+            
+            payload = {
+                'context': {'client': {
+                    'clientName': INNERTUBE_CLIENT_NAME,
+                    'clientVersion': INNERTUBE_CLIENT_VERSION,
+                    'hl': 'en',
+                }},
+                'videoId': video_id,
+                'contentCheckOk': True,
+                'racyCheckOk': True,
+            }
+            if player_data and player_data.get('sts'):
+                payload['playbackContext'] = {'contentPlaybackContext': {'signatureTimestamp': player_data['sts']}}
+            
+            api_url = "https://www.youtube.com/youtubei/v1/player?prettyPrint=false"
+            if INNERTUBE_API_KEY:
+                api_url += f"&key={INNERTUBE_API_KEY}"
+            
+            proxies = {'http': PROXY_URL, 'https': PROXY_URL} if USE_PROXY and PROXY_URL else None
+            response = await asyncio.to_thread(
+                requests.post, api_url,
+                json=payload,
+                proxies=proxies,
+                headers={'User-Agent': random.choice(USER_AGENTS), 'Origin': 'https://www.youtube.com'},
+                timeout=15
+            )
+            if response.status_code != 200:
+                logger.warning(f"فشل طلب youtubei/v1/player: {response.status_code}")
+                return None
+            data = response.json()
+            
+            # حالة التشغيل مباشرة بدل البحث عن نصوص في HTML
+            status = data.get('playabilityStatus', {})
+            state = status.get('status')
+            reason = f"{status.get('reason', '')} {status.get('messages', '')}".lower()
+            if state == 'LOGIN_REQUIRED' and 'private' in reason:
+                return {'error': 'private', 'message': 'الفيديو خاص'}
+            if state == 'ERROR':
+                return {'error': 'unavailable', 'message': 'الفيديو غير متاح'}
+            # UNPLAYABLE رفض خاص بسياق العميل (التضمين معطل، بعض قيود العمر والمنطقة) وصفحة المشاهدة
+            # تعرض كثيراً من هذه الفيديوهات، لذلك لا يعتبر نتيجة نهائية بل يكمل إلى الشرط التالي
+            if state != 'OK':
+                logger.info(f"youtubei/v1/player: حالة {state}، جاري استخدام صفحة المشاهدة")
+                return None
+            
+            details = data.get('videoDetails', {})
+            microformat = data.get('microformat', {}).get('playerMicroformatRenderer', {})
+            thumbnails = (
+                microformat.get('thumbnail', {}).get('thumbnails')
+                or details.get('thumbnail', {}).get('thumbnails')
+                or []
+            )
+            video_info = {
+                'id': video_id,
+                'webpage_url': f"https://www.youtube.com/watch?v={video_id}",
+                'method': 'innertube',
+                'title': details.get('title') or 'عنوان غير معروف',
+                'uploader': details.get('author') or microformat.get('ownerChannelName') or 'قناة غير معروفة',
+                'duration': int(details.get('lengthSeconds') or 0),
+                'thumbnail': (
+                    max(thumbnails, key=lambda t: t.get('width', 0))['url'] if thumbnails
+                    else f"https://i.ytimg.com/vi/{video_id}/hqdefault.jpg"
+                ),
+            }
+            
+            formats = await self.extract_formats_from_player_response(data, player_url)
+            streaming_data = data.get('streamingData', {})
+            if formats:
+                video_info['formats'] = formats
+            elif streaming_data.get('formats') or streaming_data.get('adaptiveFormats'):
+                # تنسيقات موجودة لكن لا يمكن استخدامها (توقيع غير معروف مثلاً): صفحة المشاهدة قد تنجح
+                return None
+            else:
+                # بث مباشر أو فيديو بدون تنسيقات مباشرة
+                video_info['formats'] = []
+                video_info['no_direct_download'] = True
+            
+            logger.info(f"تم استخراج {len(video_info['formats'])} تنسيق عبر youtubei/v1/player")
+            return video_info
+            
+        except Exception as e:
+            logger.warning(f"خطأ في youtubei/v1/player: {e}")
+            return None
+    
     async def get_complete_video_info(self, video_id: str) -> Optional[Dict]:
-        """الحصول على معلومات الفيديو الكاملة مع الروابط باستخدام regex وHTML فقط"""
+        """الحصول على معلومات الفيديو الكاملة مع الروابط من youtubei/v1/player أو صفحة المشاهدة
+        
+        الطريقتان تعملان بالتحوط: الأسرع حالياً تبدأ أولاً، والأخرى تبدأ بجانبها إذا تأخرت أو فشلت.
+        """
+        return await self.info_backends.run(video_id)
+    
+    async def get_video_info_watch_page(self, video_id: str) -> Optional[Dict]:
+        """معلومات الفيديو وروابطه من صفحة المشاهدة (حتى ytInitialPlayerResponse فقط مع WATCH_PAGE_STREAMING)"""
         try:
             url = f"https://www.youtube.com/watch?v={video_id}"
             
@@ -369,113 +2193,45 @@ class YouTubeTelegramBot:
                 requests.get, url, 
                 proxies=proxies, 
                 headers=headers, 
-                timeout=15
+                timeout=15,
+                stream=WATCH_PAGE_STREAMING
             )
             
             if response.status_code != 200:
+                response.close()
                 logger.error(f"فشل في الحصول على صفحة الفيديو: {response.status_code}")
                 return {'error': 'http_error', 'message': f'HTTP {response.status_code}'}
             
-            html = response.text
-            
-            # فحص إذا كان الفيديو متاحاً
-            if 'Video unavailable' in html or 'This video is not available' in html:
-                return {'error': 'unavailable', 'message': 'الفيديو غير متاح'}
-            
-            if 'Private video' in html or 'This video is private' in html:
-                return {'error': 'private', 'message': 'الفيديو خاص'}
+            if WATCH_PAGE_STREAMING:
+                # القراءة تتوقف بعد ytInitialPlayerResponse، ولا يحفظ إلا ما قبله كبايتات (بدون تحويل إلى نص)
+                raw_page = await asyncio.to_thread(scan_watch_page, response)
+            else:
+                raw_page = response.content
+            # التحليل (regex و json.loads لرد المشغل) في عملية منفصلة
+            page = await self.workers.run(parse_watch_page, raw_page, video_id)
+            del raw_page
+            if 'error' in page:
+                return page
             
-            # استخراج المعلومات الأساسية
             video_info = {
                 'id': video_id,
                 'webpage_url': url,
-                'method': 'regex_html'
+                'method': 'regex_html',
+                **page['info']
             }
             
-            # استخراج العنوان
-            title_patterns = [
-                r'<title>(.+?) - YouTube</title>',
-                r'"title":"([^"]+)"',
-                r'<meta name="title" content="([^"]+)"',
-                r'<meta property="og:title" content="([^"]+)"'
-            ]
-            
-            for pattern in title_patterns:
-                match = re.search(pattern, html)
-                if match:
-                    title = match.group(1).replace('\\u0026', '&').replace('\\', '')
-                    video_info['title'] = title
-                    break
-            
-            if 'title' not in video_info:
-                video_info['title'] = 'عنوان غير معروف'
-            
-            # استخراج اسم القناة
-            channel_patterns = [
-                r'"ownerChannelName":"([^"]+)"',
-                r'"author":"([^"]+)"',
-                r'<link itemprop="name" content="([^"]+)"',
-                r'"channelName":"([^"]+)"'
-            ]
-            
-            for pattern in channel_patterns:
-                match = re.search(pattern, html)
-                if match:
-                    uploader = match.group(1).replace('\\u0026', '&').replace('\\', '')
-                    video_info['uploader'] = uploader
-                    break
-            
-            if 'uploader' not in video_info:
-                video_info['uploader'] = 'قناة غير معروفة'
-            
-            # استخراج المدة
-            duration_patterns = [
-                r'"lengthSeconds":"(\d+)"',
-                r'"duration":"PT(\d+)M(\d+)S"',
-                r'<meta itemprop="duration" content="PT(\d+)M(\d+)S"'
-            ]
-            
-            duration = 0
-            for pattern in duration_patterns:
-                match = re.search(pattern, html)
-                if match:
-                    if 'lengthSeconds' in pattern:
-                        duration = int(match.group(1))
-                    else:
-                        minutes = int(match.group(1))
-                        seconds = int(match.group(2))
-                        duration = minutes * 60 + seconds
-                    break
-            
-            video_info['duration'] = duration
-            
-            # استخراج الصورة المصغرة
-            thumbnail_patterns = [
-                r'"url":"(https://i\.ytimg\.com/vi/[^/]+/maxresdefault\.jpg)"',
-                r'"url":"(https://i\.ytimg\.com/vi/[^/]+/hqdefault\.jpg)"',
-                r'<meta property="og:image" content="([^"]+)"'
-            ]
-            
-            for pattern in thumbnail_patterns:
-                match = re.search(pattern, html)
-                if match:
-                    thumbnail = match.group(1).replace('\\', '')
-                    video_info['thumbnail'] = thumbnail
-                    break
-            
-            if 'thumbnail' not in video_info:
-                video_info['thumbnail'] = f"https://i.ytimg.com/vi/{video_id}/hqdefault.jpg"
-            
             # استخراج روابط التحميل
-            formats = await self.extract_formats_from_html(html, video_id)
+            formats = await self.extract_formats_from_html(
+                page['html'], video_id, page['player_config'], page['player_path']
+            )
             if formats:
                 video_info['formats'] = formats
                 logger.info(f"تم استخراج {len(formats)} تنسيق للتحميل")
             else:
                 logger.warning("لم يتم العثور على روابط تحميل، جاري المحاولة بطرق بديلة...")
                 
-                # محاولة استخراج روابط بطريقة مختلفة
-                alternative_formats = await self.extract_alternative_formats(html, video_id)
+                # محاولة استخراج روابط بطريقة مختلفة (الصفحة محفوظة فقط إذا لم يظهر فيها ytInitialPlayerResponse)
+                alternative_formats = await self.extract_alternative_formats(page['html'], video_id) if page['html'] else []
                 if alternative_formats:
                     video_info['formats'] = alternative_formats
                     logger.info(f"تم استخراج {len(alternative_formats)} تنسيق بالطريقة البديلة")
@@ -488,45 +2244,34 @@ class YouTubeTelegramBot:
             return video_info
             
         except Exception as e:
-            logger.error(f"خطأ في get_complete_video_info: {e}")
+            logger.error(f"خطأ في get_video_info_watch_page: {e}")
             return {'error': 'extraction_error', 'message': str(e)}
     
-    async def extract_formats_from_html(self, html: str, video_id: str) -> List[Dict]:
-        """استخراج تنسيقات التحميل من HTML"""
+    async def extract_formats_from_html(self, html: Optional[str], video_id: str,
+                                        player_config: Optional[Dict] = None,
+                                        player_path: Optional[str] = None) -> List[Dict]:
+        """استخراج تنسيقات التحميل من HTML (player_config و player_path إذا حللهما parse_watch_page مسبقاً)"""
         try:
-            formats = []
-            
-            # البحث عن بيانات التكوين الخاصة بالمشغل
-            config_patterns = [
-                r'var ytInitialPlayerResponse = ({.+?});',
-                r'ytInitialPlayerResponse\s*=\s*({.+?});',
-                r'window\["ytInitialPlayerResponse"\]\s*=\s*({.+?});'
-            ]
-            
-            player_config = None
-            for pattern in config_patterns:
-                matches = re.finditer(pattern, html, re.DOTALL)
-                for match in matches:
-                    try:
-                        config_text = match.group(1)
-                        # تنظيف JSON
-                        config_text = re.sub(r'\\n', '', config_text)
-                        config_text = re.sub(r'\\t', '', config_text)
-                        
-                        player_config = json.loads(config_text)
-                        logger.info("تم العثور على تكوين المشغل بنجاح")
-                        break
-                    except json.JSONDecodeError as e:
-                        logger.warning(f"فشل في تحليل JSON: {e}")
-                        continue
-                
-                if player_config:
-                    break
+            if player_config is None and html:
+                player_config = await self.workers.run(find_player_response, html)
             
             if not player_config:
                 logger.error("فشل في العثور على تكوين المشغل")
                 return []
             
+            return await self.extract_formats_from_player_response(
+                player_config, self.extract_player_url(html or '', player_config, player_path)
+            )
+            
+        except Exception as e:
+            logger.error(f"خطأ في استخراج التنسيقات: {e}")
+            return []
+    
+    async def extract_formats_from_player_response(self, player_config: Dict, player_url: Optional[str]) -> List[Dict]:
+        """استخراج تنسيقات التحميل من playerResponse (من صفحة المشاهدة أو من youtubei/v1/player)"""
+        try:
+            formats = []
+            
             # استخراج معلومات التدفق
             streaming_data = player_config.get('streamingData', {})
             if not streaming_data:
@@ -535,7 +2280,7 @@ class YouTubeTelegramBot:
                 # محاولة البحث عن بيانات أخرى
                 video_details = player_config.get('videoDetails', {})
                 if video_details.get('isLiveContent'):
-                    logger.error("هذا بث مباشر، غير مدعوم حالياً")
+                    logger.error("بث مباشر بدون بيانات تدفق (لم يبدأ بعد أو انتهى بدون إعادة)")
                     return []
                 
                 # البحث عن بيانات في مواقع أخرى
@@ -547,11 +2292,23 @@ class YouTubeTelegramBot:
                 logger.error("لا توجد بيانات تدفق متاحة - قد يكون الفيديو محمياً أو خاص")
                 return []
             
+            # تجهيز فك التوقيع وتحويل n مرة واحدة للصفحة إذا احتاجتها التنسيقات
+            player_data = None
+            signature_ops = None
+            all_formats = streaming_data.get('formats', []) + streaming_data.get('adaptiveFormats', [])
+            needs_signature = any('signatureCipher' in fmt and 'url' not in fmt for fmt in all_formats)
+            needs_n = N_TRANSFORM and any(
+                re.search(r'[?&]n=', fmt.get('url') or fmt.get('signatureCipher', '')) for fmt in all_formats
+            )
+            if (needs_signature or needs_n) and player_url:
+                player_data = await self.get_player_data(player_url)
+                signature_ops = player_data.get('signature') if player_data else None
+            
             # معالجة التنسيقات العادية
             if 'formats' in streaming_data:
                 for fmt in streaming_data['formats']:
                     if 'url' in fmt or 'signatureCipher' in fmt:
-                        format_info = self.process_format(fmt, 'video')
+                        format_info = self.process_format(fmt, 'video', signature_ops)
                         if format_info:
                             formats.append(format_info)
             
@@ -561,10 +2318,19 @@ class YouTubeTelegramBot:
                     if 'url' in fmt or 'signatureCipher' in fmt:
                         mime_type = fmt.get('mimeType', '')
                         format_type = 'video' if 'video/' in mime_type else 'audio'
-                        format_info = self.process_format(fmt, format_type)
+                        format_info = self.process_format(fmt, format_type, signature_ops)
                         if format_info:
                             formats.append(format_info)
             
+            if needs_n and player_data:
+                await self.apply_n_transform(formats, player_data)
+            
+            if not formats and (streaming_data.get('hlsManifestUrl') or streaming_data.get('dashManifestUrl')):
+                # بث مباشر أو إعادة بث بدون روابط مباشرة: الجودات من قوائم HLS/DASH
+                formats = await self.extract_manifest_formats(
+                    streaming_data, bool(player_config.get('videoDetails', {}).get('isLive'))
+                )
+            
             # ترتيب التنسيقات حسب الجودة
             video_formats = [f for f in formats if f.get('type') == 'video']
             audio_formats = [f for f in formats if f.get('type') == 'audio']
@@ -580,15 +2346,110 @@ class YouTubeTelegramBot:
             logger.error(f"خطأ في استخراج التنسيقات: {e}")
             return []
     
-    def process_format(self, fmt: Dict, format_type: str) -> Optional[Dict]:
+    async def extract_manifest_formats(self, streaming_data: Dict, is_live: bool) -> List[Dict]:
+        """تنسيقات من hlsManifestUrl و dashManifestUrl (تحمل مقطعاً مقطعاً بـ download_manifest)
+        
+        جودات HLS (فيديو وصوت في نفس المقاطع) أولاً، ثم جودات DASH غير الموجودة فيها (فيديو يدمج مع
+        أفضل صوت)، وصوت DASH منفصل لخيار الصوت فقط.
+        """
+        formats = []
+        heights = set()
+        
+        hls_url = streaming_data.get('hlsManifestUrl')
+        if hls_url:
+            try:
+                master = await self.workers.run(parse_hls_playlist, await self._fetch_manifest(hls_url), hls_url)
+            except (requests.RequestException, ValueError) as e:
+                logger.warning(f"فشل في تحليل قائمة HLS: {e}")
+                master = {}
+            for variant in sorted(master.get('variants', []), key=lambda v: v['bandwidth'], reverse=True):
+                if not variant['height'] or variant['height'] in heights:
+                    continue
+                heights.add(variant['height'])
+                formats.append({
+                    'itag': f"hls-{variant['height']}",
+                    'url': variant['url'],
+                    'protocol': 'hls',
+                    'live': is_live,
+                    'quality': f"{variant['height']}p",
+                    'type': 'video',
+                    'ext': 'mp4',
+                    'filesize': None,
+                    'width': variant['width'],
+                    'height': variant['height'],
+                    'fps': variant['fps'],
+                    'tbr': variant['bandwidth'] / 1000,
+                    'vcodec': variant['codecs'].split(',')[0] if variant['codecs'] else None,
+                    'acodec': variant['codecs'].split(',')[-1] if ',' in variant['codecs'] else None,
+                })
+        
+        dash_url = streaming_data.get('dashManifestUrl')
+        if dash_url:
+            try:
+                manifest = await self.workers.run(parse_dash_manifest, await self._fetch_manifest(dash_url), dash_url)
+            except (requests.RequestException, ValueError, ElementTree.ParseError) as e:
+                logger.warning(f"فشل في تحليل ملف DASH: {e}")
+                manifest = {}
+            # mp4 أولاً حتى تختار الجودة المكررة بترميز يقبله تلجرام
+            representations = sorted(manifest.get('representations', []),
+                                     key=lambda r: ('mp4' not in r['mime'], -r['bandwidth']))
+            for rep in representations:
+                if rep['type'] == 'video' and (not rep['height'] or rep['height'] in heights):
+                    continue
+                if rep['type'] not in ('video', 'audio'):
+                    continue
+                if rep['type'] == 'video':
+                    heights.add(rep['height'])
+                ext = self._get_extension_from_mime(rep['mime'])
+                formats.append({
+                    'itag': rep['id'],
+                    'url': dash_url,
+                    'protocol': 'dash',
+                    'live': is_live,
+                    'quality': f"{rep['height']}p" if rep['type'] == 'video' else 'audio',
+                    'type': rep['type'],
+                    'ext': 'mp4' if rep['type'] == 'video' else ext,
+                    'filesize': None,
+                    'width': rep['width'],
+                    'height': rep['height'],
+                    'fps': rep['fps'],
+                    'tbr': rep['bandwidth'] / 1000,
+                    'abr': rep['bandwidth'] / 1000 if rep['type'] == 'audio' else None,
+                    'vcodec': rep['codecs'] if rep['type'] == 'video' else 'none',
+                    'acodec': rep['codecs'] if rep['type'] == 'audio' else 'none',
+                })
+        
+        logger.info(f"تم استخراج {len(formats)} تنسيق من قوائم HLS/DASH{' (بث مباشر)' if is_live else ''}")
+        return formats
+    
+    async def _fetch_manifest(self, url: str) -> str:
+        """تحميل قائمة HLS أو ملف MPD كنص"""
+        proxies = {'http': PROXY_URL, 'https': PROXY_URL} if USE_PROXY and PROXY_URL else None
+        response = await asyncio.to_thread(
+            self.segment_session.get, url,
+            proxies=proxies,
+            headers={'User-Agent': random.choice(USER_AGENTS)},
+            timeout=15
+        )
+        with response:
+            response.raise_for_status()
+            return response.text
+    
+    def process_format(self, fmt: Dict, format_type: str, signature_ops=None) -> Optional[Dict]:
         """معالجة تنسيق واحد"""
         try:
             # الحصول على الرابط
             url = fmt.get('url')
             if not url and 'signatureCipher' in fmt:
-                # معالجة التواقيع المشفرة (معقدة، قد نحتاج لتجاهلها)
-                logger.warning("تم تجاهل تنسيق مشفر")
-                return None
+                if not signature_ops:
+                    logger.warning("تم تجاهل تنسيق مشفر")
+                    return None
+                # فك التوقيع بالعمليات المستخرجة من ملف المشغل
+                cipher = urllib.parse.parse_qs(fmt['signatureCipher'])
+                if 's' not in cipher or 'url' not in cipher:
+                    return None
+                signature = apply_signature_ops(cipher['s'][0], signature_ops)
+                url = f"{cipher['url'][0]}&{cipher.get('sp', ['signature'])[0]}={urllib.parse.quote(signature)}"
             
             if not url:
                 return None
@@ -628,65 +2489,142 @@ class YouTubeTelegramBot:
             logger.error(f"خطأ في معالجة التنسيق: {e}")
             return None
     
+    def extract_player_url(self, html: str, player_config: Optional[Dict] = None,
+                           player_path: Optional[str] = None) -> Optional[str]:
+        """استخراج رابط ملف المشغل (base.js) من صفحة المشاهدة"""
+        player_path = (player_config or {}).get('assets', {}).get('js') or player_path
+        if not player_path and html:
+            match = re.search(r'"(?:jsUrl|PLAYER_JS_URL)"\s*:\s*"([^"]+base\.js)"', html)
+            player_path = match.group(1) if match else None
+        if not player_path:
+            return None
+        # آخر مشغل معروف يستخدمه مسار youtubei/v1/player (الذي لا يحتوي رابط المشغل)
+        self.player_url = urllib.parse.urljoin('https://www.youtube.com', player_path.replace('\\/', '/'))
+        return self.player_url
+    
+    async def get_player_data(self, player_url: str) -> Optional[Dict]:
+        """بيانات فك التوقيع وتحويل n لإصدار المشغل: من الذاكرة ثم القرص ثم تحميل base.js وتحليله"""
+        version_match = re.search(r'/s/player/([\w-]+)/', player_url)
+        version = version_match.group(1) if version_match else player_url
+        
+        if version in self.player_cache:
+            return self.player_cache[version]
+        # بدون هذا يعاد تحميل base.js (عدة ميجابايت) وتحليله مع كل فيديو عندما يغير يوتيوب المشغل
+        retry_at = self.player_failures.get(version)
+        if retry_at is not None:
+            if time.time() < retry_at:
+                return None
+            del self.player_failures[version]
+        
+        # تحليل واحد فقط لكل إصدار حتى لو طلبته عدة صفحات في نفس الوقت
+        task = self.player_tasks.get(version)
+        if task is None:
+            task = asyncio.create_task(self._load_player_data(version, player_url))
+            self.player_tasks[version] = task
+            task.add_done_callback(lambda _: self.player_tasks.pop(version, None))
+        
+        player_data = await asyncio.shield(task)
+        if player_data:
+            self.player_cache[version] = player_data
+        return player_data
+    
+    async def apply_n_transform(self, formats: List[Dict], player_data: Dict):
+        """استبدال المعامل n في روابط التنسيقات بناتج دالة المشغل حتى لا تُخنق سرعة التحميل
+        
+        كل تنسيقات الصفحة تشترك عادة في نفس قيمة n، لذلك تحسب كل قيمة مرة واحدة فقط.
+        عند فشل التحويل تبقى الروابط كما هي (تعمل لكن بسرعة مخنوقة).
+        """
+        n_code = player_data.get('n')
+        if not n_code:
+            return
+        version = player_data.get('player')
+        
+        for fmt in formats:
+            query = urllib.parse.parse_qs(urllib.parse.urlsplit(fmt['url']).query)
+            n = query.get('n', [None])[0]
+            if not n:
+                continue
+            key = (version, n)
+            result = self.n_results.get(key)
+            if result is None:
+                try:
+                    # المفسر في عملية منفصلة حتى لا يتوقف البوت أثناء تشغيله
+                    result = await self.workers.run(transform_n, version, n_code, n)
+                except (JSError, RecursionError) as e:
+                    logger.warning(f"فشل تحويل المعامل n ({version}): {e}")
+                    return
+                if len(self.n_results) >= N_CACHE_SIZE:
+                    self.n_results.pop(next(iter(self.n_results)))
+                self.n_results[key] = result
+            fmt['url'] = replace_query_param(fmt['url'], 'n', result)
+    
+    async def _load_player_data(self, version: str, player_url: str) -> Optional[Dict]:
+        safe_version = re.sub(r'[^\w-]', '_', version)
+        cache_file = os.path.join(PLAYER_CACHE_PATH, f"{safe_version}.json")
+        try:
+            with open(cache_file, encoding='utf-8') as f:
+                player_data = json.load(f)
+            if player_data.get('schema') == PLAYER_CACHE_SCHEMA:
+                failed = player_data.get('failed')
+                if failed is None:
+                    return player_data
+                if time.time() - failed < PLAYER_FAILURE_TTL:
+                    self.player_failures[version] = failed + PLAYER_FAILURE_TTL
+                    return None
+        except (OSError, ValueError):
+            pass
+        
+        try:
+            proxies = {'http': PROXY_URL, 'https': PROXY_URL} if USE_PROXY and PROXY_URL else None
+            response = await asyncio.to_thread(
+                requests.get, player_url,
+                proxies=proxies,
+                headers={'User-Agent': random.choice(USER_AGENTS)},
+                timeout=15
+            )
+            if response.status_code != 200:
+                logger.error(f"فشل في تحميل ملف المشغل {version}: {response.status_code}")
+                self.player_failures[version] = time.time() + PLAYER_DOWNLOAD_FAILURE_TTL
+                return None
+            player_js = response.text
+        except Exception as e:
+            logger.error(f"خطأ في تحميل ملف المشغل {version}: {e}")
+            self.player_failures[version] = time.time() + PLAYER_DOWNLOAD_FAILURE_TTL
+            return None
+        
+        player_data = await self.workers.run(parse_player_js, player_js, version)
+        if not player_data['signature']:
+            logger.warning(f"لم يتم التعرف على دالة فك التوقيع في المشغل {version}")
+        if not player_data['n']:
+            logger.warning(f"لم يتم التعرف على دالة تحويل n في المشغل {version}")
+        if not player_data['signature'] and not player_data['n']:
+            # سجل سلبي حتى لا يعاد التحليل مع كل فيديو، ورفع PLAYER_CACHE_SCHEMA بعد إصلاح المحلل يلغيه
+            failed = time.time()
+            self.player_failures[version] = failed + PLAYER_FAILURE_TTL
+            logger.warning(f"سيعاد تحليل المشغل {version} بعد {PLAYER_FAILURE_TTL} ثانية")
+            self._save_player_data(cache_file, {'schema': PLAYER_CACHE_SCHEMA, 'player': version, 'failed': failed})
+            return None
+        logger.info(
+            f"تم تحليل ملف المشغل {version}: {len(player_data['signature'] or [])} عملية فك توقيع، "
+            f"دالة n: {player_data['n']['name'] if player_data['n'] else 'غير موجودة'}"
+        )
+        
+        self._save_player_data(cache_file, player_data)
+        return player_data
+    
+    def _save_player_data(self, cache_file: str, player_data: Dict):
+        try:
+            os.makedirs(PLAYER_CACHE_PATH, exist_ok=True)
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                json.dump(player_data, f)
+        except OSError as e:
+            logger.warning(f"فشل في حفظ كاش المشغل: {e}")
+    
     async def extract_alternative_formats(self, html: str, video_id: str) -> List[Dict]:
         """طريقة بديلة لاستخراج التنسيقات عند فشل الطريقة الأساسية"""
         try:
-            formats = []
-            
-            # البحث عن patterns مختلفة في HTML
-            alternative_patterns = [
-                r'"url":"([^"]+)".*?"itag":(\d+)',
-                r'"signatureCipher":"([^"]+)".*?"itag":(\d+)',
-                r'itag=(\d+).*?url=([^&]+)',
-            ]
-            
-            for pattern in alternative_patterns:
-                matches = re.finditer(pattern, html)
-                for match in matches:
-                    try:
-                        if len(match.groups()) >= 2:
-                            url = match.group(1) if 'url' in pattern else match.group(2)
-                            itag = match.group(2) if 'url' in pattern else match.group(1)
-                            
-                            # تنظيف URL
-                            if url.startswith('\\'):
-                                url = url.replace('\\', '')
-                            
-                            # إنشاء تنسيق أساسي
-                            format_info = {
-                                'itag': int(itag) if itag.isdigit() else 0,
-                                'url': url,
-                                'ext': 'mp4',  # افتراضي
-                                'type': 'video'  # افتراضي
-                            }
-                            
-                            # تخمين الجودة بناءً على itag
-                            quality_map = {
-                                22: {'height': 720, 'quality': '720p'},
-                                18: {'height': 360, 'quality': '360p'},
-                                140: {'type': 'audio', 'quality': '128kbps', 'ext': 'm4a'},
-                                251: {'type': 'audio', 'quality': '160kbps', 'ext': 'webm'},
-                            }
-                            
-                            if int(itag) in quality_map:
-                                format_info.update(quality_map[int(itag)])
-                            
-                            formats.append(format_info)
-                    except Exception as e:
-                        logger.warning(f"تجاهل تنسيق غير صحيح: {e}")
-                        continue
-            
-            # إزالة التكرارات
-            unique_formats = []
-            seen_itags = set()
-            for fmt in formats:
-                if fmt['itag'] not in seen_itags:
-                    unique_formats.append(fmt)
-                    seen_itags.add(fmt['itag'])
-            
-            logger.info(f"تم استخراج {len(unique_formats)} تنسيق بالطريقة البديلة")
-            return unique_formats
-            
+            # regex تمتد حتى نهاية السطر، وسكربتات الصفحة سطر واحد بعدة ميجابايت: في عملية منفصلة
+            return await self.workers.run(find_alternative_formats, html)
         except Exception as e:
             logger.error(f"خطأ في الطريقة البديلة: {e}")
             return []
@@ -790,6 +2728,15 @@ class YouTubeTelegramBot:
         
     async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """معالج أمر /start"""
+        # رابط عميق من الوضع المضمن: /start <video_id>
+        if context.args and re.fullmatch(r'[a-zA-Z0-9_-]{11}', context.args[0]):
+            await self.process_links(
+                update.message,
+                update.message.from_user.id,
+                [f"https://www.youtube.com/watch?v={context.args[0]}"]
+            )
+            return
+        
         welcome_message = """
 🎬 مرحباً بك في بوت تحميل الفيديوهات!
 
@@ -925,21 +2872,171 @@ class YouTubeTelegramBot:
                 parse_mode=ParseMode.MARKDOWN
             )
 
+    async def profile_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """تشخيص الأداء للمشرفين (ADMIN_IDS) فقط
+        
+        /profile [ثوانٍ] قياس المعالج، /profile stop إيقافه مبكراً، /profile mem لقطة ذاكرة (الأولى تبدأ
+        التتبع) و /profile mem stop لإيقاف التتبع. التقارير تكتب في PROFILE_PATH.
+        """
+        user = update.effective_user
+        if not user or user.id not in ADMIN_IDS:
+            # بدون رد حتى لا يظهر وجود الأمر لغير المشرفين
+            logger.warning(f"رفض /profile من مستخدم غير مشرف: {user.id if user else None}")
+            return
+        
+        args = [arg.lower() for arg in context.args or []]
+        message = update.message
+        if args[:1] == ['mem']:
+            if args[1:2] == ['stop']:
+                stopped = self.profiler.stop_memory()
+                await message.reply_text("⏹️ تم إيقاف تتبع الذاكرة" if stopped else "ℹ️ تتبع الذاكرة غير مفعل")
+                return
+            report = await asyncio.to_thread(self.profiler.memory_snapshot)
+            await message.reply_text(self.format_memory_report(report))
+            return
+        
+        if args[:1] == ['stop']:
+            if self.profile_stop is None:
+                await message.reply_text("ℹ️ لا يوجد قياس معالج جارٍ")
+            else:
+                self.profile_stop.set()
+            return
+        
+        try:
+            seconds = float(args[0]) if args else PROFILE_DEFAULT_SECONDS
+        except ValueError:
+            await message.reply_text(
+                "❌ الاستخدام: `/profile [ثوانٍ]` أو `/profile stop` أو `/profile mem` أو `/profile mem stop`",
+                parse_mode=ParseMode.MARKDOWN
+            )
+            return
+        seconds = min(max(seconds, 1), PROFILE_MAX_SECONDS)
+        
+        async def notify(report: Dict):
+            await message.reply_text(self.format_cpu_report(report))
+        
+        if not self.start_profile(seconds, notify):
+            await message.reply_text("⏳ يوجد قياس معالج جارٍ بالفعل، أوقفه بـ /profile stop")
+            return
+        await message.reply_text(f"🔬 بدء قياس المعالج لمدة {seconds:g} ث... (/profile stop للإيقاف مبكراً)")
+    
+    def start_profile(self, seconds: float, notify: Optional[Callable] = None) -> bool:
+        """بدء قياس المعالج لمدة seconds ثم كتابة التقرير وتمريره إلى notify؛ False إذا كان يعمل"""
+        if self.profile_stop is not None or not self.profiler.start_cpu():
+            return False
+        self.profile_stop = asyncio.Event()
+        logger.warning(f"بدء قياس المعالج لمدة {seconds:g} ث")
+        asyncio.ensure_future(self._finish_profile(seconds, notify))
+        return True
+    
+    async def _finish_profile(self, seconds: float, notify: Optional[Callable]):
+        try:
+            await asyncio.wait_for(self.profile_stop.wait(), seconds)
+        except asyncio.TimeoutError:
+            pass
+        try:
+            # على حلقة الأحداث نفسها: إعادة معالج SIGPROF ممكنة من الخيط الرئيسي فقط
+            report = self.profiler.stop_cpu()
+        finally:
+            self.profile_stop = None
+        if not report:
+            return
+        hottest = ', '.join(label for label, _ in report['bot'][:3])
+        logger.warning(
+            f"انتهى قياس المعالج: {report['samples']} عينة، حلقة الأحداث مشغولة {report['loop_busy']:.0%}، "
+            f"الأعلى: {hottest or '-'} ← {report['path']}"
+        )
+        if notify:
+            try:
+                await notify(report)
+            except Exception as e:
+                logger.error(f"فشل في إرسال تقرير قياس المعالج: {e}")
+    
+    def toggle_profile(self):
+        """SIGUSR1: بدء قياس المعالج لمدة PROFILE_DEFAULT_SECONDS، أو إيقاف الجاري وكتابة تقريره"""
+        if self.profile_stop is not None:
+            self.profile_stop.set()
+        else:
+            self.start_profile(PROFILE_DEFAULT_SECONDS)
+    
+    async def memory_signal(self):
+        """SIGUSR2: لقطة ذاكرة في PROFILE_PATH (الأولى تبدأ التتبع)"""
+        report = await asyncio.to_thread(self.profiler.memory_snapshot)
+        logger.warning(f"لقطة ذاكرة: {report['traced_mb']:.1f} MB متتبعة ← {report['path']}")
+    
+    def format_cpu_report(self, report: Dict) -> str:
+        busy = max(report['busy_samples'], 1)
+        lines = [
+            f"🔬 قياس المعالج: {report['seconds']:.0f} ث، {report['samples']} عينة",
+            f"🔄 حلقة الأحداث مشغولة {report['loop_busy']:.0%} من الوقت",
+            "",
+            "🔥 الأعلى زمناً ذاتياً:",
+        ]
+        lines += [f"{count / busy:6.1%}  {label}" for label, count in report['self'][:10]]
+        if report['bot']:
+            lines += ["", "🤖 دوال البوت (شامل):"]
+            lines += [f"{count / busy:6.1%}  {label}" for label, count in report['bot'][:10]]
+        lines += ["", f"📁 {report['path']}"]
+        return '\n'.join(lines)[:4000]
+    
+    def format_memory_report(self, report: Dict) -> str:
+        lines = [f"🧠 الذاكرة المتتبعة: {report['traced_mb']:.1f} MB (الذروة {report['peak_mb']:.1f} MB)"]
+        if report['first']:
+            lines.append("ℹ️ بدأ التتبع الآن؛ اللقطة التالية تظهر ما تغير بعدها")
+        if report['diff']:
+            lines += ["", "📈 الفرق عن اللقطة السابقة:"]
+            lines += [f"{size:+9.1f} KiB  {where}" for where, size in report['diff'][:10]]
+        if report['top']:
+            lines += ["", "📦 أكبر المواقع:"]
+            lines += [f"{size:9.1f} KiB  {where} ({count})" for where, size, count in report['top'][:10]]
+        lines += ["", f"📁 {report['path']}"]
+        return '\n'.join(lines)[:4000]
+
     async def handle_url(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """معالج الروابط المرسلة"""
-        url = update.message.text.strip()
+        # خيوط to_thread تمر عبر المجمع المعدود حتى يمكن قياس انشغالها
+        self.admission.attach()
         user_id = update.message.from_user.id
         
+        if self.draining:
+            await update.message.reply_text("🔄 البوت يعيد التشغيل الآن، أعد إرسال الرابط بعد دقيقة.")
+            return
+        
+        # البحث عن كل روابط يوتيوب في النص أو التعليق والكيانات
+        urls = self.extract_youtube_links(update.message)
+        
         # التحقق من صحة الرابط
-        if not self.is_valid_youtube_url(url):
+        if not urls:
             await update.message.reply_text(
                 "❌ الرابط غير صحيح!\n"
                 "يرجى إرسال رابط صحيح من يوتيوب."
             )
             return
         
+        await self.process_links(update.message, user_id, urls)
+
+    async def process_links(self, message, user_id: int, urls: List[str]):
+        """تحليل الروابط المستخرجة من رسالة وعرض خيارات التحميل"""
+        # إزالة التكرارات حسب معرف الفيديو
+        video_urls = {}
+        for link in urls:
+            video_id = self.extract_video_id(link)
+            if video_id and video_id not in video_urls:
+                video_urls[video_id] = link
+        url = next(iter(video_urls.values())) if video_urls else urls[0]
+        started = time.perf_counter()
+        
+        # إلغاء التحميل المسبق للجلسة السابقة
+        if user_id in self.user_sessions:
+            self._cancel_prefetch(self.user_sessions[user_id])
+        
+        # فيديو واحد: التحليل والمعاينة يبدآن مع رسالة الانتظار بدل انتظار ردها (مع البروكسي بعد فحصه)
+        info_task = preview_task = None
+        if len(video_urls) == 1 and not (USE_PROXY and PROXY_URL):
+            info_task, preview_task = self._start_analysis(url)
+        
         # إرسال رسالة انتظار
-        loading_message = await update.message.reply_text(
+        loading_message = await message.reply_text(
             "🔍 جاري تحليل الفيديو...\nيرجى الانتظار..."
         )
         
@@ -968,14 +3065,28 @@ class YouTubeTelegramBot:
                     f"🌐 البروكسي متصل بنجاح! IP: {proxy_ip}"
                 )
                 await asyncio.sleep(1)  # عرض رسالة النجاح لثانية واحدة
+                await loading_message.edit_text(
+                    "🔍 جاري تحليل الفيديو...\nيرجى الانتظار..."
+                )
         
-        await loading_message.edit_text(
-            "🔍 جاري تحليل الفيديو...\nيرجى الانتظار..."
-        )
+        # عدة فيديوهات في رسالة واحدة
+        if len(video_urls) > 1:
+            await self.open_batch(loading_message.edit_text, user_id, list(video_urls)[:BATCH_MAX_LINKS],
+                                  ignored=max(0, len(video_urls) - BATCH_MAX_LINKS))
+            return
+        
+        # روابط قوائم التشغيل بدون فيديو محدد
+        playlist_id = self.extract_playlist_id(url)
+        if playlist_id and not video_urls:
+            await self.open_playlist(loading_message.edit_text, user_id, url, playlist_id)
+            return
+        
+        if info_task is None:
+            info_task, preview_task = self._start_analysis(url)
         
         try:
-            # الحصول على معلومات الفيديو
-            video_info = await self.get_video_info(url)
+            # الحصول على معلومات الفيديو مع عرض المعاينة إذا وصلت أولاً
+            video_info, previewed = await self._await_analysis(loading_message, info_task, preview_task, started)
             
             if not video_info:
                 await loading_message.edit_text(
@@ -1021,31 +3132,27 @@ class YouTubeTelegramBot:
             self.user_sessions[user_id] = {
                 'url': url,
                 'video_info': video_info,
+                'playlist_id': playlist_id,
                 'message_id': loading_message.message_id
             }
             
             # إنشاء أزرار الخيارات
-            keyboard = self.create_quality_keyboard(video_info)
-            
-            video_title = video_info.get('title', 'غير معروف')[:50]
-            duration = self.format_duration(video_info.get('duration', 0))
-            uploader = video_info.get('uploader', 'غير معروف')
-            
-            info_text = f"""
-📹 **معلومات الفيديو:**
-
-🎬 **العنوان:** {video_title}
-👤 **القناة:** {uploader}
-⏱️ **المدة:** {duration}
-
-📊 اختر جودة التحميل:
-            """
+            keyboard = self.create_quality_keyboard(video_info, playlist_id)
             
             await loading_message.edit_text(
-                info_text,
+                self.format_video_text(video_info, "📊 اختر جودة التحميل:"),
                 reply_markup=keyboard,
                 parse_mode=ParseMode.MARKDOWN
             )
+            elapsed = time.perf_counter() - started
+            self._record_analysis('keyboard', elapsed)
+            if not previewed:
+                # بدون معاينة (من الكاش أو التحليل كان أسرع) الأزرار نفسها أول رد
+                self._record_analysis('first_feedback', elapsed)
+            
+            # بدء تحميل الخيار الأرجح أثناء انتظار اختيار المستخدم (التخمين أول ما يتوقف تحت الضغط)
+            if SPECULATIVE_PREFETCH and not self.admission.check(list(self.active_jobs.values())):
+                self._start_prefetch(self.user_sessions[user_id], keyboard)
             
         except Exception as e:
             logger.error(f"خطأ في معالجة الرابط: {e}")
@@ -1054,10 +3161,96 @@ class YouTubeTelegramBot:
                 "يرجى المحاولة مرة أخرى."
             )
 
+    def _start_analysis(self, url: str) -> Tuple[asyncio.Task, Optional[asyncio.Task]]:
+        """بدء التحليل الكامل، ومعه معاينة oEmbed إذا لم تكن المعلومات في الكاش"""
+        info_task = asyncio.create_task(self.get_video_info(url))
+        video_id = self.extract_video_id(url)
+        if not video_id or self._get_cached_video_info(video_id):
+            return info_task, None
+        return info_task, asyncio.create_task(self.get_video_preview(video_id))
+    
+    async def _await_analysis(self, message, info_task: asyncio.Task, preview_task: Optional[asyncio.Task],
+                              started: float) -> Tuple[Optional[Dict], bool]:
+        """انتظار التحليل الكامل مع عرض العنوان والصورة أولاً إذا وصلت المعاينة قبله
+        
+        يرجع (معلومات الفيديو، هل عرضت المعاينة).
+        """
+        previewed = False
+        try:
+            if preview_task:
+                done, _ = await asyncio.wait({info_task, preview_task}, return_when=asyncio.FIRST_COMPLETED)
+                preview = preview_task.result() if info_task not in done else None
+                if preview:
+                    try:
+                        await message.edit_text(
+                            self.format_video_text(preview, "⏳ جاري تجهيز خيارات الجودة..."),
+                            parse_mode=ParseMode.MARKDOWN
+                        )
+                        previewed = True
+                        self._record_analysis('first_feedback', time.perf_counter() - started)
+                    except Exception as e:
+                        logger.warning(f"فشل في عرض المعاينة: {e}")
+            return await info_task, previewed
+        finally:
+            if preview_task:
+                preview_task.cancel()
+    
+    async def get_video_preview(self, video_id: str) -> Optional[Dict]:
+        """العنوان والقناة والصورة من oEmbed (رد JSON صغير) لعرضها قبل انتهاء التحليل الكامل"""
+        try:
+            return await self._get_video_info_method1(video_id)
+        except Exception:
+            return None
+    
+    def format_video_text(self, video_info: Dict, footer: str) -> str:
+        """نص رسالة معلومات الفيديو؛ الرابط المخفي في أوله يعرض الصورة المصغرة كمعاينة"""
+        video_title = video_info.get('title', 'غير معروف')[:50]
+        uploader = video_info.get('uploader', 'غير معروف')
+        thumbnail = video_info.get('thumbnail')
+        lines = [
+            f"[\u200b]({thumbnail})📹 **معلومات الفيديو:**" if thumbnail else "📹 **معلومات الفيديو:**",
+            "",
+            f"🎬 **العنوان:** {video_title}",
+            f"👤 **القناة:** {uploader}",
+        ]
+        # oEmbed لا يوفر المدة
+        if video_info.get('duration'):
+            lines.append(f"⏱️ **المدة:** {self.format_duration(video_info['duration'])}")
+        lines.extend(["", footer])
+        return "\n".join(lines)
+    
+    def _record_analysis(self, stage: str, seconds: float):
+        self.analysis_times[stage].append(seconds)
+        logger.info(f"زمن {stage} للرابط: {seconds:.2f} ث")
+    
+    def extract_youtube_links(self, message) -> List[str]:
+        """استخراج كل روابط يوتيوب من نص الرسالة أو تعليق الوسائط بما فيها الروابط المخفية (text_link)"""
+        text = message.text or message.caption or ''
+        links = []
+        
+        # الكيانات تشمل الروابط المخفية خلف نص
+        entities = message.parse_entities() if message.text else message.parse_caption_entities()
+        for entity, entity_text in entities.items():
+            if entity.type == MessageEntity.TEXT_LINK and entity.url:
+                links.append(entity.url)
+            elif entity.type == MessageEntity.URL:
+                links.append(entity_text)
+        
+        # الروابط المكتوبة بدون كيانات (مثلاً رسائل معاد توجيهها)
+        links.extend(YOUTUBE_LINK_RE.findall(text))
+        
+        # إزالة التكرار حسب الشكل الموحد: youtu.be و shorts و watch لنفس الفيديو رابط واحد
+        unique_links = {}
+        for link in links:
+            link = link.strip().rstrip('.,;)')
+            normalized = normalize_youtube_url(link) if link else None
+            if normalized and normalized[:2] not in unique_links:
+                unique_links[normalized[:2]] = link
+        return list(unique_links.values())
+
     def is_valid_youtube_url(self, url: str) -> bool:
-        """التحقق من صحة رابط يوتيوب"""
-        youtube_domains = ['youtube.com', 'youtu.be', 'www.youtube.com', 'm.youtube.com']
-        return any(domain in url for domain in youtube_domains)
+        """التحقق من أن الرابط من نطاق يوتيوب ويحمل فيديو أو قائمة تشغيل"""
+        return normalize_youtube_url(url) is not None
 
 
 
@@ -1070,6 +3263,15 @@ class YouTubeTelegramBot:
             logger.error("فشل في استخراج معرف الفيديو من الرابط")
             return {'error': 'invalid_url', 'message': 'رابط غير صحيح'}
         
+        return await self.get_video_info_by_id(video_id)
+
+    async def get_video_info_by_id(self, video_id: str) -> Optional[Dict]:
+        """الحصول على معلومات الفيديو من الكاش أو من يوتيوب"""
+        cached = self._get_cached_video_info(video_id)
+        if cached:
+            logger.info(f"تم استخدام معلومات الفيديو من الكاش: {video_id}")
+            return cached
+        
         logger.info(f"جاري تحليل الفيديو: {video_id}")
         
         # الحصول على معلومات الفيديو والروابط في عملية واحدة
@@ -1081,10 +3283,109 @@ class YouTubeTelegramBot:
         if 'error' in video_info:
             return video_info
         
+        self._cache_video_info(video_id, video_info)
         logger.info(f"تم استخراج معلومات الفيديو بنجاح: {video_info.get('title', 'غير معروف')[:30]}...")
         return video_info
 
-    def create_quality_keyboard(self, video_info: Dict) -> InlineKeyboardMarkup:
+    def _get_cached_video_info(self, video_id: str) -> Optional[Dict]:
+        """قراءة معلومات الفيديو من الكاش إذا لم تنته صلاحيتها"""
+        entry = self.video_info_cache.get(video_id)
+        if not entry:
+            return None
+        if time.time() - entry['time'] > VIDEO_INFO_CACHE_TTL:
+            del self.video_info_cache[video_id]
+            return None
+        # نسخة سطحية حتى لا تعدل الجلسات على نسخة الكاش مباشرة
+        return dict(entry['info'])
+
+    def _cache_video_info(self, video_id: str, video_info: Dict):
+        """حفظ معلومات الفيديو في الكاش مع حذف الأقدم عند امتلائه"""
+        self.video_info_cache.pop(video_id, None)
+        self.video_info_cache[video_id] = {'info': dict(video_info), 'time': time.time()}
+        while len(self.video_info_cache) > VIDEO_INFO_CACHE_SIZE:
+            del self.video_info_cache[next(iter(self.video_info_cache))]
+
+    def _get_cached_file(self, video_id: str, choice: str) -> Optional[Dict]:
+        """البحث عن file_id لملف أرسل سابقاً بنفس الخيار"""
+        return self.file_id_cache.get(f"{video_id}:{choice}")
+
+    def _pick_prefetch_choice(self, video_info: Dict, keyboard: InlineKeyboardMarkup) -> Optional[str]:
+        """اختيار الزر الأكثر استخداماً المتاح في لوحة المفاتيح وحجمه معروف ضمن حد تلجرام"""
+        if sum(self.selection_stats.values()) < PREFETCH_MIN_SAMPLES:
+            return None
+        if video_info.get('no_direct_download'):
+            return None
+        
+        video_id = video_info.get('id')
+        formats = video_info.get('formats', [])
+        choices = {button.callback_data for row in keyboard.inline_keyboard for button in row}
+        
+        for choice, _ in sorted(self.selection_stats.items(), key=lambda item: item[1], reverse=True):
+            if choice not in choices:
+                continue
+            # الملف في الكاش يرسل فوراً فلا داعي لتحميله
+            if video_id and self._get_cached_file(video_id, choice):
+                return None
+            
+            if choice.startswith('video_'):
+                fmt = self._select_video_format(formats, choice.split('_')[1])
+            else:
+                fmt = self._select_audio_format(formats)
+            if not fmt or fmt.get('fallback'):
+                continue
+            
+            try:
+                filesize = int(fmt.get('filesize') or 0)
+            except (TypeError, ValueError):
+                filesize = 0
+            if 0 < filesize <= TELEGRAM_FILE_LIMIT:
+                return choice
+        
+        return None
+    
+    def _start_prefetch(self, session: Dict, keyboard: InlineKeyboardMarkup):
+        """بدء تحميل مسبق بسرعة محدودة يمكن للضغطة المطابقة أن تلتحق به"""
+        video_info = session['video_info']
+        choice = self._pick_prefetch_choice(video_info, keyboard)
+        if not choice:
+            return
+        
+        job = {'rate_limiter': self.prefetch_limiter, 'progress_callback': None, 'weight': PREFETCH_WEIGHT}
+        if choice.startswith('video_'):
+            coro = self.download_direct_video(video_info, choice.split('_')[1], job=job)
+        else:
+            coro = self.download_direct_audio(video_info, job=job)
+        
+        session['prefetch'] = {'choice': choice, 'task': asyncio.create_task(coro), 'job': job}
+        logger.info(f"بدء التحميل المسبق: {video_info.get('id')} ({choice})")
+    
+    async def _join_prefetch(self, prefetch: Dict, progress_callback) -> Optional[str]:
+        """الالتحاق بتحميل مسبق جارٍ: رفع حد السرعة وربط رسالة التقدم ثم انتظار الملف"""
+        job = prefetch['job']
+        job['rate_limiter'] = None
+        job['weight'] = 1.0
+        job['progress_callback'] = progress_callback
+        try:
+            return await prefetch['task']
+        except Exception as e:
+            logger.warning(f"فشل التحميل المسبق، جاري التحميل من جديد: {e}")
+            return None
+    
+    def _cancel_prefetch(self, session: Dict):
+        """إلغاء التحميل المسبق للجلسة وحذف ملفه إن اكتمل"""
+        prefetch = session.pop('prefetch', None)
+        if not prefetch:
+            return
+        
+        task = prefetch['task']
+        if not task.done():
+            task.cancel()
+        elif not task.cancelled() and task.exception() is None:
+            file_path = task.result()
+            if file_path and os.path.exists(file_path):
+                os.remove(file_path)
+    
+    def create_quality_keyboard(self, video_info: Dict, playlist_id: Optional[str] = None) -> InlineKeyboardMarkup:
         """إنشاء لوحة مفاتيح اختيار الجودة"""
         keyboard = []
         
@@ -1119,6 +3420,8 @@ class YouTubeTelegramBot:
         # إضافة أزرار الجودة
         for quality in sorted_qualities[:6]:  # أول 6 جودات
             quality_text = f"📹 {quality}p"
+            if video_formats[quality].get('live'):
+                quality_text += f" 🔴 آخر {LIVE_WINDOW_MINUTES:g} دقيقة"
             callback_data = f"video_{quality}"
             keyboard.append([InlineKeyboardButton(quality_text, callback_data=callback_data)])
         
@@ -1142,27 +3445,396 @@ class YouTubeTelegramBot:
                 ])
         
         # إضافة خيار الصوت فقط
-        keyboard.append([InlineKeyboardButton("🎵 صوت فقط (MP3)", callback_data="audio_mp3")])
+        keyboard.append([InlineKeyboardButton(f"🎵 صوت فقط ({AUDIO_FORMAT.upper()})", callback_data="audio_mp3")])
+        
+        # الفيديو جزء من قائمة تشغيل
+        if playlist_id:
+            keyboard.append([InlineKeyboardButton("📃 تحميل قائمة التشغيل كاملة", callback_data="playlist_open")])
         
         # إضافة زر الإلغاء
         keyboard.append([InlineKeyboardButton("❌ إلغاء", callback_data="cancel")])
         
         return InlineKeyboardMarkup(keyboard)
 
+    async def get_playlist_entries(self, playlist_id: str) -> Optional[Dict]:
+        """استخراج عناصر قائمة التشغيل من صفحة القائمة مع متابعة الصفحات (continuation)"""
+        try:
+            url = f"https://www.youtube.com/playlist?list={playlist_id}"
+            
+            proxies = {'http': PROXY_URL, 'https': PROXY_URL} if USE_PROXY and PROXY_URL else None
+            headers = {
+                'User-Agent': random.choice(USER_AGENTS),
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+                'Accept-Language': 'en-US,en;q=0.9,ar;q=0.8',
+                'Accept-Encoding': 'gzip, deflate',
+            }
+            
+            response = await asyncio.to_thread(
+                requests.get, url,
+                proxies=proxies,
+                headers=headers,
+                timeout=15
+            )
+            
+            if response.status_code != 200:
+                logger.error(f"فشل في الحصول على صفحة قائمة التشغيل: {response.status_code}")
+                return None
+            
+            html = response.text
+            
+            initial_data = None
+            for pattern in [
+                r'var ytInitialData\s*=\s*({.+?});</script>',
+                r'window\["ytInitialData"\]\s*=\s*({.+?});',
+            ]:
+                match = re.search(pattern, html, re.DOTALL)
+                if match:
+                    try:
+                        initial_data = json.loads(match.group(1))
+                        break
+                    except json.JSONDecodeError:
+                        continue
+            
+            if not initial_data:
+                logger.error("فشل في العثور على بيانات قائمة التشغيل")
+                return None
+            
+            # عنوان القائمة
+            title = (
+                initial_data.get('metadata', {}).get('playlistMetadataRenderer', {}).get('title')
+                or 'قائمة تشغيل'
+            )
+            
+            entries, continuation = self._parse_playlist_items(initial_data)
+            
+            # متابعة الصفحات التالية عبر youtubei/v1/browse
+            api_key_match = re.search(r'"INNERTUBE_API_KEY":"([^"]+)"', html)
+            version_match = re.search(r'"INNERTUBE_CLIENT_VERSION":"([^"]+)"', html)
+            client_version = version_match.group(1) if version_match else '2.20240101.00.00'
+            browse_url = "https://www.youtube.com/youtubei/v1/browse?prettyPrint=false"
+            if api_key_match:
+                browse_url += f"&key={api_key_match.group(1)}"
+            
+            while continuation and len(entries) < PLAYLIST_MAX_ITEMS:
+                payload = {
+                    'context': {'client': {'clientName': 'WEB', 'clientVersion': client_version, 'hl': 'en'}},
+                    'continuation': continuation,
+                }
+                response = await asyncio.to_thread(
+                    requests.post, browse_url,
+                    json=payload,
+                    proxies=proxies,
+                    headers={'User-Agent': headers['User-Agent']},
+                    timeout=15
+                )
+                if response.status_code != 200:
+                    logger.warning(f"فشل في جلب الصفحة التالية من قائمة التشغيل: {response.status_code}")
+                    break
+                more, continuation = self._parse_playlist_items(response.json())
+                if not more:
+                    break
+                entries.extend(more)
+            
+            # إزالة التكرارات مع الحفاظ على الترتيب
+            unique_entries = []
+            seen_ids = set()
+            for entry in entries:
+                if entry['id'] not in seen_ids:
+                    unique_entries.append(entry)
+                    seen_ids.add(entry['id'])
+            
+            truncated = len(unique_entries) > PLAYLIST_MAX_ITEMS or bool(continuation)
+            unique_entries = unique_entries[:PLAYLIST_MAX_ITEMS]
+            logger.info(f"تم استخراج {len(unique_entries)} عنصر من قائمة التشغيل {playlist_id}")
+            
+            return {
+                'id': playlist_id,
+                'title': title,
+                'entries': unique_entries,
+                'truncated': truncated
+            }
+            
+        except Exception as e:
+            logger.error(f"خطأ في استخراج قائمة التشغيل: {e}")
+            return None
+
+    def _parse_playlist_items(self, data) -> Tuple[List[Dict], Optional[str]]:
+        """البحث عن playlistVideoRenderer ورمز الصفحة التالية في أي مكان من JSON"""
+        entries = []
+        continuation = None
+        stack = [data]
+        
+        while stack:
+            node = stack.pop()
+            if isinstance(node, list):
+                stack.extend(reversed(node))
+                continue
+            if not isinstance(node, dict):
+                continue
+            
+            renderer = node.get('playlistVideoRenderer')
+            if renderer:
+                video_id = renderer.get('videoId')
+                # تجاهل الفيديوهات المحذوفة أو الخاصة
+                if video_id and renderer.get('isPlayable', True):
+                    title_data = renderer.get('title', {})
+                    title = title_data.get('simpleText') or ''.join(
+                        run.get('text', '') for run in title_data.get('runs', [])
+                    )
+                    entries.append({
+                        'id': video_id,
+                        'title': title or video_id,
+                        'duration': int(renderer.get('lengthSeconds', 0) or 0)
+                    })
+                continue
+            
+            continuation_renderer = node.get('continuationItemRenderer')
+            if continuation_renderer:
+                token = (
+                    continuation_renderer.get('continuationEndpoint', {})
+                    .get('continuationCommand', {}).get('token')
+                )
+                if token:
+                    continuation = token
+                continue
+            
+            stack.extend(reversed(list(node.values())))
+        
+        return entries, continuation
+
+    async def open_playlist(self, edit_message, user_id: int, url: str, playlist_id: str):
+        """تحليل قائمة التشغيل وعرض خيارات تحميلها"""
+        await edit_message("🔍 جاري تحليل قائمة التشغيل...\nيرجى الانتظار...")
+        
+        playlist = await self.get_playlist_entries(playlist_id)
+        if not playlist or not playlist['entries']:
+            await edit_message(
+                "❌ فشل في تحليل قائمة التشغيل!\n"
+                "قد تكون القائمة خاصة أو فارغة."
+            )
+            return
+        
+        self.user_sessions[user_id] = {
+            'url': url,
+            'playlist': playlist
+        }
+        
+        entries = playlist['entries']
+        total_duration = sum(entry.get('duration', 0) for entry in entries)
+        limit_note = f"\n⚠️ سيتم تحميل أول {PLAYLIST_MAX_ITEMS} فيديو فقط" if playlist.get('truncated') else ""
+        
+        info_text = (
+            f"📃 قائمة التشغيل: {playlist['title'][:60]}\n\n"
+            f"🎬 عدد الفيديوهات: {len(entries)}\n"
+            f"⏱️ المدة الكلية: {self.format_duration(total_duration)}"
+            f"{limit_note}\n\n"
+            f"📊 اختر طريقة التحميل:"
+        )
+        
+        await edit_message(info_text, reply_markup=self.create_batch_keyboard())
+
+    async def open_batch(self, edit_message, user_id: int, video_ids: List[str], ignored: int = 0):
+        """تحليل عدة فيديوهات من رسالة واحدة بالتوازي وعرض خيار موحد للتحميل
+        
+        ignored: عدد الروابط الزائدة عن BATCH_MAX_LINKS التي لم تحلل، يظهر للمستخدم مع النتيجة.
+        """
+        await edit_message(f"🔍 جاري تحليل {len(video_ids)} فيديو...\nيرجى الانتظار...")
+        
+        semaphore = asyncio.Semaphore(PLAYLIST_EXTRACT_CONCURRENCY)
+        
+        async def fetch_info(video_id: str) -> Optional[Dict]:
+            async with semaphore:
+                return await self.get_video_info_by_id(video_id)
+        
+        results = await asyncio.gather(*(fetch_info(video_id) for video_id in video_ids), return_exceptions=True)
+        
+        entries = []
+        failed = 0
+        for video_id, video_info in zip(video_ids, results):
+            if isinstance(video_info, Exception) or not video_info or 'error' in video_info:
+                failed += 1
+                continue
+            entries.append({
+                'id': video_id,
+                'title': video_info.get('title', video_id),
+                'duration': video_info.get('duration', 0)
+            })
+        
+        if not entries:
+            await edit_message(
+                "❌ فشل في تحليل الفيديوهات!\n"
+                "يرجى التأكد من صحة الروابط والمحاولة مرة أخرى."
+            )
+            return
+        
+        self.user_sessions[user_id] = {
+            'url': None,
+            'playlist': {
+                'id': None,
+                'title': f"{len(entries)} فيديو",
+                'entries': entries,
+                'batch': True
+            }
+        }
+        
+        lines = [f"📦 تم العثور على {len(entries)} فيديو:\n"]
+        for index, entry in enumerate(entries, 1):
+            lines.append(f"{index}. {entry['title'][:45]} ({self.format_duration(entry['duration'])})")
+        if failed:
+            lines.append(f"\n⚠️ فشل تحليل {failed} رابط")
+        if ignored:
+            lines.append(f"⚠️ تم تجاهل {ignored} رابط (الحد {BATCH_MAX_LINKS} روابط في الرسالة)")
+        lines.append("\n📊 اختر طريقة التحميل للكل:")
+        
+        await edit_message("\n".join(lines), reply_markup=self.create_batch_keyboard())
+
+    def create_batch_keyboard(self) -> InlineKeyboardMarkup:
+        """أزرار تحميل مجموعة فيديوهات (قائمة تشغيل أو عدة روابط) دفعة واحدة"""
+        return InlineKeyboardMarkup([
+            [InlineKeyboardButton("📹 الكل فيديو 720p", callback_data="pl_video_720")],
+            [InlineKeyboardButton("📹 الكل فيديو 360p", callback_data="pl_video_360")],
+            [InlineKeyboardButton("🎵 الكل صوت فقط (MP3)", callback_data="pl_audio_mp3")],
+            [InlineKeyboardButton("❌ إلغاء", callback_data="cancel")]
+        ])
+
+    async def show_playlist_menu(self, query, session: Dict):
+        """الانتقال من فيديو داخل قائمة تشغيل إلى خيارات القائمة كاملة"""
+        playlist_id = session.get('playlist_id')
+        if not playlist_id:
+            await query.edit_message_text("❌ خيار غير صحيح!")
+            return
+        await self.open_playlist(query.edit_message_text, query.from_user.id, session.get('url', ''), playlist_id)
+
+    async def download_playlist(self, query, session: Dict, choice: str):
+        """تحميل عناصر قائمة التشغيل بتوازٍ محدود وإرسالها بالترتيب مع رسالة تقدم واحدة"""
+        playlist = session['playlist']
+        entries = playlist['entries']
+        total = len(entries)
+        message = query.message
+        stats = {'sent': 0, 'cached': 0, 'failed': 0, 'too_large': 0}
+        
+        extract_semaphore = asyncio.Semaphore(PLAYLIST_EXTRACT_CONCURRENCY)
+        finished = [asyncio.Event() for _ in entries]
+        
+        async def fetch_info(video_id: str) -> Optional[Dict]:
+            async with extract_semaphore:
+                return await self.get_video_info_by_id(video_id)
+        
+        # جلب المعلومات مسبقاً بالتوازي حتى تكون جاهزة عند دور كل عنصر
+        info_tasks = [
+            None if self._get_cached_file(entry['id'], choice) else asyncio.create_task(fetch_info(entry['id']))
+            for entry in entries
+        ]
+        
+        async def process(index: int, entry: Dict):
+            file_path = None
+            try:
+                # لا يبدأ تحميل العنصر قبل انتهاء العنصر الذي يسبقه بـ PLAYLIST_DOWNLOAD_CONCURRENCY
+                if index >= PLAYLIST_DOWNLOAD_CONCURRENCY:
+                    await finished[index - PLAYLIST_DOWNLOAD_CONCURRENCY].wait()
+                
+                cached_file = self._get_cached_file(entry['id'], choice)
+                if not cached_file:
+                    video_info = await info_tasks[index] if info_tasks[index] else None
+                    if not video_info or 'error' in video_info:
+                        stats['failed'] += 1
+                        return
+                    item_session = {'video_info': video_info, 'job': {'user_id': query.from_user.id}}
+                    if choice.startswith('audio_'):
+                        file_path = await self.download_audio_with_fallback(item_session)
+                    else:
+                        file_path = await self.download_video_with_fallback(item_session, choice.split('_')[1])
+                
+                # الإرسال بنفس ترتيب القائمة
+                if index > 0:
+                    await finished[index - 1].wait()
+                
+                caption = f"{index + 1}/{total} • {entry['title'][:200]}"
+                if cached_file:
+                    await self.send_cached_file(message, cached_file, caption)
+                    stats['cached'] += 1
+                elif not file_path or not os.path.exists(file_path):
+                    stats['failed'] += 1
+                elif os.path.getsize(file_path) > TELEGRAM_FILE_LIMIT:
+                    stats['too_large'] += 1
+                else:
+                    await self.upload_file(message, file_path, f"{entry['id']}:{choice}", caption,
+                                           kind='audio' if choice.startswith('audio_') else 'video')
+                    stats['sent'] += 1
+            except Exception as e:
+                logger.error(f"خطأ في تحميل عنصر قائمة التشغيل {entry['id']}: {e}")
+                stats['failed'] += 1
+            finally:
+                if file_path and os.path.exists(file_path):
+                    os.remove(file_path)
+                finished[index].set()
+        
+        def progress_text(final: bool = False) -> str:
+            done = sum(stats.values())
+            percent = done / total * 100 if total else 100
+            if playlist.get('batch'):
+                header = "✅ اكتمل تحميل الفيديوهات" if final else "📥 جاري تحميل الفيديوهات..."
+            else:
+                header = "✅ اكتمل تحميل قائمة التشغيل" if final else "📥 جاري تحميل قائمة التشغيل..."
+            lines = [
+                header,
+                f"{'📦' if playlist.get('batch') else '📃'} {playlist['title'][:60]}",
+                f"{self.create_progress_bar(percent)} {done}/{total}",
+                f"✅ تم الإرسال: {stats['sent']}",
+            ]
+            if stats['cached']:
+                lines.append(f"♻️ من الكاش: {stats['cached']}")
+            if stats['too_large']:
+                lines.append(f"📦 أكبر من 50 ميجا: {stats['too_large']}")
+            if stats['failed']:
+                lines.append(f"❌ فشل: {stats['failed']}")
+            return "\n".join(lines)
+        
+        async def report_progress():
+            last_text = None
+            while True:
+                text = progress_text()
+                if text != last_text:
+                    try:
+                        await query.edit_message_text(text, reply_markup=self.create_cancel_keyboard())
+                        last_text = text
+                    except Exception as e:
+                        if "message is not modified" not in str(e).lower():
+                            logger.warning(f"خطأ في تحديث رسالة تقدم القائمة: {e}")
+                await asyncio.sleep(3)
+        
+        reporter = asyncio.create_task(report_progress())
+        workers = [asyncio.create_task(process(i, entry)) for i, entry in enumerate(entries)]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            reporter.cancel()
+            for task in workers + [t for t in info_tasks if t]:
+                if not task.done():
+                    task.cancel()
+        
+        await query.edit_message_text(progress_text(final=True))
+
     async def handle_callback(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """معالج الأزرار"""
+        self.admission.attach()
         query = update.callback_query
-        await query.answer()
-        
         user_id = query.from_user.id
         data = query.data
         
+        # زر الإلغاء في رسالة التقدم مرتبط بالرسالة وليس بالجلسة الحالية
+        if data == "cancel_job":
+            await self.cancel_job(query)
+            return
+        
+        await query.answer()
+        
         if user_id not in self.user_sessions:
             await query.edit_message_text("❌ انتهت صلاحية الجلسة. يرجى إرسال رابط جديد.")
             return
         
         if data == "cancel":
-            del self.user_sessions[user_id]
+            self._cancel_prefetch(self.user_sessions.pop(user_id))
             await query.edit_message_text("❌ تم إلغاء العملية.")
             return
         
@@ -1177,10 +3849,65 @@ class YouTubeTelegramBot:
         
         session = self.user_sessions[user_id]
         
-        # إنشاء callback لتحديث التقدم
+        # التحميل المسبق ينفع فقط إذا طابق الخيار المضغوط
+        prefetch = session.get('prefetch')
+        if prefetch and prefetch['choice'] == data:
+            session.pop('prefetch')
+        else:
+            self._cancel_prefetch(session)
+            prefetch = None
+        
+        if data.startswith(("video_", "audio_")):
+            self.selection_stats[data] = self.selection_stats.get(data, 0) + 1
+        
+        if data == "playlist_open":
+            await self.show_playlist_menu(query, session)
+            return
+        
+        # إرسال الملف من الكاش إذا أرسل سابقاً بنفس الخيار
+        video_id = session.get('video_info', {}).get('id')
+        cached_file = self._get_cached_file(video_id, data) if video_id else None
+        if cached_file:
+            try:
+                if prefetch:
+                    self._cancel_prefetch({'prefetch': prefetch})
+                    prefetch = None
+                await self.send_cached_file(query.message, cached_file)
+                await query.edit_message_text("✅ تم إرسال الملف بنجاح!")
+                self.user_sessions.pop(user_id, None)
+                return
+            except Exception as e:
+                logger.warning(f"فشل في إرسال الملف من الكاش، جاري التحميل من جديد: {e}")
+                self.file_id_cache.pop(f"{video_id}:{data}", None)
+        
+        # البوت يتوقف: لا مهام جديدة (الملفات من الكاش أعلاه ما زالت ترسل)
+        if self.draining:
+            await query.message.reply_text("🔄 البوت يعيد التشغيل الآن، أعد الضغط على الزر بعد دقيقة.")
+            return
+        
+        # مهمة جديدة فقط إذا سمحت الموارد (الالتحاق بتحميل مسبق جارٍ لا يضيف حملاً)
+        if not prefetch:
+            busy = self.admission.check(list(self.active_jobs.values()))
+            if busy:
+                await self.notify_busy(query, *busy)
+                return
+        
+        await self.run_download_job(query, user_id, session, data, prefetch)
+    
+    async def run_download_job(self, query, user_id: int, session: Dict, data: str, prefetch: Optional[Dict] = None,
+                               resume: Optional[Dict] = None, attempts: int = 1, replaces: Optional[int] = None):
+        """تشغيل مهمة تحميل مسجلة في JobJournal مع رسالة تقدم وزر إلغاء
+        
+        resume ({'path', 'itag'}) والمحاولة replaces تمرر عند استئناف مهمة من السجل بعد إعادة التشغيل.
+        """
+        video_id = session.get('video_info', {}).get('id')
+        
+        # إنشاء callback لتحديث التقدم مع زر إلغاء التحميل
+        cancel_keyboard = self.create_cancel_keyboard()
+        
         async def progress_callback(message: str):
             try:
-                await query.edit_message_text(message)
+                await query.edit_message_text(message, reply_markup=cancel_keyboard)
             except Exception as e:
                 # تجاهل أخطاء التحديث السريع للرسائل
                 if "message is not modified" not in str(e).lower():
@@ -1189,100 +3916,559 @@ class YouTubeTelegramBot:
         # إضافة callback للجلسة
         session['progress_callback'] = progress_callback
         
-        # رسالة البداية
-        await progress_callback("⬇️ جاري التحضير للتحميل...")
-        
-        try:
-            if data.startswith("video_"):
-                quality = data.split("_")[1]
-                file_path = await self.download_video_with_fallback(session, quality)
-            elif data.startswith("audio_"):
-                file_path = await self.download_audio_with_fallback(session)
-            else:
-                await query.edit_message_text("❌ خيار غير صحيح!")
-                return
-            
-            if file_path and os.path.exists(file_path):
-                # تحديث الرسالة قبل الإرسال
-                await progress_callback("📤 جاري إرسال الملف...")
+        async def run_job() -> bool:
+            file_path = None
+            try:
+                self._set_stage(job, 'download')
+                # رسالة البداية
+                await progress_callback("⬇️ جاري التحضير للتحميل...")
                 
-                # إرسال الملف
-                await self.send_file(query, file_path)
+                if data.startswith("pl_"):
+                    await self.download_playlist(query, session, data[3:])
+                    return True
                 
-                # حذف الملف بعد الإرسال
-                os.remove(file_path)
-            else:
-                # رسائل خطأ محسنة
-                video_info = session.get('video_info', {})
-                if video_info.get('no_direct_download'):
-                    await query.edit_message_text(
-                        "❌ **فشل في التحميل**\n\n"
-                        "🔒 هذا الفيديو محمي أو يتطلب معالجة خاصة.\n"
-                        "💡 **جرب:**\n"
-                        "• فيديو آخر من نفس القناة\n"
-                        "• استخدام VPN إذا كان متاحاً\n"
-                        "• المحاولة لاحقاً",
-                        parse_mode=ParseMode.MARKDOWN
-                    )
+                file_path = await self._join_prefetch(prefetch, progress_callback) if prefetch else None
+                if file_path:
+                    logger.info(f"تم استخدام التحميل المسبق: {video_id} ({data})")
+                    if data.startswith("audio_"):
+                        file_path = await self.convert_audio(file_path, session['video_info'], progress_callback, job)
+                elif data.startswith("video_"):
+                    quality = data.split("_")[1]
+                    file_path = await self.download_video_with_fallback(session, quality)
+                elif data.startswith("audio_"):
+                    file_path = await self.download_audio_with_fallback(session)
                 else:
-                    await query.edit_message_text(
-                        "❌ **فشل في تحميل الملف**\n\n"
-                        "💡 **الأسباب المحتملة:**\n"
-                        "• مشكلة مؤقتة في الخادم\n"
-                        "• انتهاء صلاحية الرابط\n"
-                        "• مشكلة في الاتصال\n\n"
-                        "🔄 جرب إعادة إرسال الرابط",
-                        parse_mode=ParseMode.MARKDOWN
+                    await query.edit_message_text("❌ خيار غير صحيح!")
+                    return False
+                
+                if file_ready(file_path) and self._needs_transcode(file_path, session['video_info'], data):
+                    file_path = await self.transcode_to_fit(
+                        file_path, session['video_info'], 'audio' if data.startswith("audio_") else 'video',
+                        progress_callback, job
                     )
                 
+                if file_ready(file_path):
+                    # تحديث الرسالة قبل الإرسال
+                    self._set_stage(job, 'upload')
+                    await progress_callback("📤 جاري إرسال الملف...")
+                    
+                    # إرسال الملف
+                    return await self.send_file(
+                        query, file_path,
+                        cache_key=f"{video_id}:{data}" if video_id else None,
+                        kind='audio' if data.startswith("audio_") else 'video',
+                        duration=session['video_info'].get('duration')
+                    )
+                else:
+                    # رسائل خطأ محسنة
+                    video_info = session.get('video_info', {})
+                    if video_info.get('no_direct_download'):
+                        await query.edit_message_text(
+                            "❌ **فشل في التحميل**\n\n"
+                            "🔒 هذا الفيديو محمي أو يتطلب معالجة خاصة.\n"
+                            "💡 **جرب:**\n"
+                            "• فيديو آخر من نفس القناة\n"
+                            "• استخدام VPN إذا كان متاحاً\n"
+                            "• المحاولة لاحقاً",
+                            parse_mode=ParseMode.MARKDOWN
+                        )
+                    else:
+                        await query.edit_message_text(
+                            "❌ **فشل في تحميل الملف**\n\n"
+                            "💡 **الأسباب المحتملة:**\n"
+                            "• مشكلة مؤقتة في الخادم\n"
+                            "• انتهاء صلاحية الرابط\n"
+                            "• مشكلة في الاتصال\n\n"
+                            "🔄 جرب إعادة إرسال الرابط",
+                            parse_mode=ParseMode.MARKDOWN
+                        )
+                    return False
+            
+            finally:
+                # حذف الملف (أو إرجاع مخزن الذاكرة) بعد الإرسال أو عند الإلغاء
+                discard_file(file_path)
+        
+        # كل تحميل مهمة مستقلة يمكن إلغاؤها من زر الإلغاء في رسالة التقدم
+        job_key = (query.message.chat_id, query.message.message_id)
+        job = {'user_id': user_id, 'stage': 'download', 'in_memory': MEMORY_FILE_MAX_MB > 0,
+               'task': asyncio.create_task(run_job())}
+        job['journal_id'] = self.journal.add(job_key[0], job_key[1], user_id, video_id, session.get('url'),
+                                             data, attempts)
+        self.journal.update(replaces, state='resumed')
+        if resume:
+            job['resume'] = resume
+        self.active_jobs[job_key] = job
+        session['job'] = job
+        
+        state = 'failed'
+        try:
+            state = 'done' if await job['task'] else 'failed'
+        
+        except asyncio.CancelledError:
+            if job.get('checkpoint'):
+                # إيقاف البوت (SIGTERM) بعد انتهاء مهلة الانتظار: الملف الجزئي يبقى للاستئناف
+                if self._resumable(data, attempts):
+                    state = 'interrupted'
+                    await query.edit_message_text("⏸️ البوت يعيد التشغيل، سيكمل التحميل تلقائياً بعد عودته.")
+                else:
+                    await query.edit_message_text("⏹️ توقف البوت لإعادة التشغيل.\n🔄 أعد إرسال الرابط بعد دقيقة.")
+                return
+            if 'cancel_requested' not in job:
+                # إلغاء من خارج المهمة (إغلاق البوت): تبقى المهمة بدون حالة نهائية لتستعاد عند التشغيل
+                state = None
+                raise
+            state = 'cancelled'
+            logger.info(
+                f"تم إلغاء التحميل أثناء مرحلة {job['stage']} خلال "
+                f"{(time.perf_counter() - job['cancel_requested']) * 1000:.0f} ms"
+            )
+            await query.edit_message_text("❌ تم إلغاء التحميل.")
+        
         except Exception as e:
             logger.error(f"خطأ في التحميل: {e}")
             await query.edit_message_text("❌ حدث خطأ أثناء التحميل!")
         
         finally:
-            # تنظيف الجلسة
-            if user_id in self.user_sessions:
+            if state:
+                self.journal.update(job['journal_id'], state=state)
+            self.active_jobs.pop(job_key, None)
+            # تنظيف الجلسة إذا لم تستبدلها جلسة أحدث
+            if self.user_sessions.get(user_id) is session:
                 del self.user_sessions[user_id]
+    
+    def _needs_transcode(self, file_path: Union[str, MemoryFile], video_info: Dict, choice: str) -> bool:
+        """الملف أكبر من حد تلجرام ولا يوجد تنسيق فيديو أصغر معروف الحجم يمكن اختياره بدله
+        
+        إذا وجد تنسيق يناسب الحد يبقى السلوك المعتاد (رسالة اختيار جودة أقل). الصوت يضغط دائماً لأن
+        كل التنسيقات الصوتية تحول إلى AUDIO_FORMAT بنفس معدل البت.
+        """
+        if (not TRANSCODE_TO_FIT or isinstance(file_path, MemoryFile)
+                or os.path.getsize(file_path) <= TELEGRAM_FILE_LIMIT):
+            return False
+        if choice.startswith("audio_"):
+            return True
+        for fmt in video_info.get('formats', []):
+            if fmt.get('type') != 'video' or not fmt.get('height'):
+                continue
+            try:
+                filesize = int(fmt.get('filesize') or 0)
+            except (TypeError, ValueError):
+                filesize = 0
+            if 0 < filesize <= TELEGRAM_FILE_LIMIT:
+                return False
+        return True
+    
+    def _set_stage(self, job: Dict, stage: str):
+        """تغيير مرحلة المهمة في الذاكرة وفي السجل"""
+        job['stage'] = stage
+        self.journal.update(job.get('journal_id'), state=stage)
+    
+    def _resumable(self, choice: str, attempts: int) -> bool:
+        """قوائم التشغيل لا تستأنف (كل عنصر رسالة مستقلة)، ولا المهام التي استؤنفت سابقاً"""
+        return choice.startswith(("video_", "audio_")) and attempts < JOB_MAX_ATTEMPTS
+    
+    async def notify_busy(self, query, reason: str, retry_after: int):
+        """إبلاغ المستخدم بأن البوت مشغول مع إبقاء أزرار الاختيار ليعيد الضغط لاحقاً"""
+        self.admission.rejected[reason] = self.admission.rejected.get(reason, 0) + 1
+        logger.warning(f"رفض مهمة جديدة بسبب {reason}: {self.admission.usage(list(self.active_jobs.values()))}")
+        await query.message.reply_text(
+            f"⏳ البوت مشغول حالياً ({BUSY_REASONS.get(reason, reason)} وصل للحد).\n"
+            f"🔄 أعد الضغط على الزر بعد {retry_after} ثانية تقريباً."
+        )
+    
+    def create_cancel_keyboard(self) -> InlineKeyboardMarkup:
+        """زر إلغاء التحميل الجاري في رسائل التقدم"""
+        return InlineKeyboardMarkup([[InlineKeyboardButton("❌ إلغاء التحميل", callback_data="cancel_job")]])
+    
+    async def cancel_job(self, query):
+        """إلغاء مهمة التحميل المرتبطة برسالة التقدم"""
+        job = self.active_jobs.get((query.message.chat_id, query.message.message_id))
+        if not job or job['user_id'] != query.from_user.id or job['task'].done():
+            await query.answer("لا يوجد تحميل جارٍ لإلغائه.")
+            return
+        
+        job.setdefault('cancel_requested', time.perf_counter())
+        job['task'].cancel()
+        await query.answer("⏹️ جاري إلغاء التحميل...")
+    
 
-
-
-    async def send_file(self, query, file_path: str):
-        """إرسال الملف للمستخدم"""
-        file_size = os.path.getsize(file_path)
+    async def on_startup(self, application: Application):
+        """بعد تهيئة التطبيق: إيقاف منظم عند SIGTERM/SIGINT واستعادة المهام التي قطعها التوقف السابق"""
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            try:
+                loop.add_signal_handler(sig, lambda: asyncio.ensure_future(self.shutdown(application)))
+            except (NotImplementedError, RuntimeError):
+                # Windows: Ctrl+C يوقف run_polling مباشرة بدون انتظار المهام
+                pass
+        # تشخيص من الخادم بدون تلجرام: kill -USR1 يبدأ/يوقف قياس المعالج و kill -USR2 لقطة ذاكرة
+        if hasattr(signal, 'SIGUSR1'):
+            loop.add_signal_handler(signal.SIGUSR1, self.toggle_profile)
+            loop.add_signal_handler(signal.SIGUSR2, lambda: asyncio.ensure_future(self.memory_signal()))
+        self.journal.prune()
+        await self.workers.start()
+        await self.recover_jobs(application.bot)
+    
+    async def shutdown(self, application: Application):
+        """إيقاف البوت بعد إنهاء أو حفظ المهام الجارية"""
+        if self.draining:
+            return
+        await self.drain()
+        self.workers.shutdown()
+        application.stop_running()
+    
+    async def drain(self, timeout: float = JOB_DRAIN_TIMEOUT):
+        """رفض المهام الجديدة وانتظار الجارية حتى timeout، ثم إيقاف الباقي مع حفظ ملفاته الجزئية
         
-        # التحقق من حجم الملف (حد تلجرام 50 ميجا)
-        if file_size > 50 * 1024 * 1024:
-            await query.edit_message_text(
-                "❌ حجم الملف كبير جداً (أكثر من 50 ميجا)!\n"
-                "يرجى اختيار جودة أقل."
+        المهام الموقوفة تبقى في السجل بحالة interrupted وتستأنف عند التشغيل التالي (recover_jobs).
+        """
+        self.draining = True
+        logger.warning(f"إيقاف البوت: انتظار {len(self.active_jobs)} مهمة جارية حتى {timeout:.0f} ث")
+        
+        # العمل التخميني والتجهيز في الخلفية لا يستحق الانتظار
+        for session in list(self.user_sessions.values()):
+            self._cancel_prefetch(session)
+        for task in list(self.background_tasks.values()) + list(self.recovery_tasks):
+            task.cancel()
+        
+        deadline = time.monotonic() + timeout
+        tasks = [job['task'] for job in self.active_jobs.values()]
+        if tasks:
+            await asyncio.wait(tasks, timeout=timeout)
+        
+        remaining = [job for job in self.active_jobs.values() if not job['task'].done()]
+        for job in remaining:
+            job['checkpoint'] = True
+            job['task'].cancel()
+        # انتظار المعالجات حتى تسجل الحالة وتعدل رسائل التقدم
+        while self.active_jobs and time.monotonic() < deadline + 5:
+            await asyncio.sleep(0.05)
+        logger.warning(f"تم الإيقاف: {len(tasks) - len(remaining)} مهمة اكتملت، {len(remaining)} حفظت للاستئناف")
+    
+    async def recover_jobs(self, bot):
+        """استئناف أو إنهاء المهام التي بقيت بدون حالة نهائية في السجل بعد إعادة التشغيل"""
+        for row in self.journal.unfinished():
+            resumable = (
+                self._resumable(row['choice'] or '', row['attempts'])
+                and row['video_id'] and time.time() - row['created'] < JOB_RESUME_MAX_AGE
             )
+            if not resumable:
+                self._remove_partial_files(row['partial_path'])
+                self.journal.update(row['id'], state='failed')
+                logger.info(f"مهمة غير مكتملة من التشغيل السابق لن تستأنف: {row['id']} ({row['state']})")
+                with contextlib.suppress(Exception):
+                    await bot.edit_message_text(
+                        "❌ توقف البوت أثناء هذا التحميل ولم يكتمل.\n🔄 أعد إرسال الرابط للمحاولة مرة أخرى.",
+                        chat_id=row['chat_id'], message_id=row['message_id']
+                    )
+                continue
+            
+            logger.info(f"استئناف مهمة من التشغيل السابق: {row['id']} ({row['state']}, {row['choice']})")
+            task = asyncio.create_task(self._resume_job(bot, row))
+            self.recovery_tasks.add(task)
+            task.add_done_callback(self.recovery_tasks.discard)
+    
+    async def _resume_job(self, bot, row: Dict):
+        """إعادة تشغيل مهمة من السجل على نفس رسالة التقدم"""
+        query = RecoveredQuery(bot, row['chat_id'], row['message_id'], row['user_id'])
+        try:
+            await query.edit_message_text("🔄 أعيد تشغيل البوت، جاري استئناف التحميل...")
+            video_info = await self.get_video_info_by_id(row['video_id'])
+            if not video_info or 'error' in video_info:
+                self._remove_partial_files(row['partial_path'])
+                self.journal.update(row['id'], state='failed')
+                await query.edit_message_text("❌ تعذر استئناف التحميل بعد إعادة التشغيل.\n🔄 أعد إرسال الرابط.")
+                return
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"فشل في استئناف المهمة {row['id']}: {e}")
+            return
+        
+        session = {'url': row['url'], 'video_info': video_info, 'playlist_id': None, 'message_id': row['message_id']}
+        resume = None
+        if row['partial_path'] and row['itag'] is not None:
+            resume = {'path': row['partial_path'], 'itag': row['itag']}
+        else:
+            # التحميل كان قد اكتمل (أو لم يبدأ): البدء من جديد بدون بقايا المحاولة السابقة
+            self._remove_partial_files(row['partial_path'])
+        await self.run_download_job(query, row['user_id'], session, row['choice'], resume=resume,
+                                    attempts=row['attempts'] + 1, replaces=row['id'])
+    
+    def _remove_partial_files(self, partial_path: Optional[str]):
+        """حذف الملف الجزئي وما اشتق منه (الصوت المحول يحمل نفس الاسم بامتداد آخر)"""
+        if not partial_path:
+            return
+        stem = os.path.splitext(partial_path)[0]
+        directory = os.path.dirname(partial_path) or '.'
+        with contextlib.suppress(OSError):
+            for name in os.listdir(directory):
+                path = os.path.join(directory, name)
+                if path == partial_path or path.startswith(stem + '.'):
+                    os.remove(path)
+    
+    async def handle_inline_query(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """معالج الوضع المضمن: @bot <رابط يوتيوب>
+
+        الرد يكون فورياً من الكاش فقط. عند عدم وجود ملف في الكاش يرجع نتيجة "جاري التجهيز"
+        ويكمل الاستخراج (والرفع المسبق إن كان INLINE_CACHE_CHAT_ID مضبوطاً) في الخلفية.
+        """
+        self.admission.attach()
+        inline_query = update.inline_query
+        text = inline_query.query.strip()
+        
+        video_id = self.extract_video_id(text) if text and self.is_valid_youtube_url(text) else None
+        if not video_id:
+            await inline_query.answer([], cache_time=5)
+            return
+        
+        cached_info = self._get_cached_video_info(video_id)
+        title = cached_info.get('title', 'فيديو يوتيوب') if cached_info else 'فيديو يوتيوب'
+        
+        results = []
+        prefix = f"{video_id}:"
+        for key, cached_file in list(self.file_id_cache.items()):
+            if not key.startswith(prefix):
+                continue
+            if cached_file.get('parts'):
+                # الملفات المقسمة مجموعة وسائط، والنتيجة المضمنة تحمل ملفاً واحداً فقط
+                continue
+            choice = key[len(prefix):]
+            if cached_file['kind'] == 'audio':
+                results.append(InlineQueryResultCachedAudio(
+                    id=key[:64],
+                    audio_file_id=cached_file['file_id'],
+                    caption=f"🎵 {title[:200]}"
+                ))
+            else:
+                quality = choice.split('_')[-1]
+                results.append(InlineQueryResultCachedVideo(
+                    id=key[:64],
+                    video_file_id=cached_file['file_id'],
+                    title=f"📹 {title[:60]} ({quality}p)",
+                    caption=f"📹 {title[:200]}"
+                ))
+        
+        if results:
+            await inline_query.answer(results, cache_time=300)
             return
         
-        filename = os.path.basename(file_path)
+        # لا يوجد ملف جاهز: نتيجة خفيفة مع زر لفتح الفيديو في البوت
+        results.append(InlineQueryResultArticle(
+            id=f"processing:{video_id}",
+            title=f"⏳ {title[:60]}" if cached_info else "⏳ جاري تجهيز الفيديو...",
+            description="اضغط لإرسال الرابط، أو افتح البوت لاختيار الجودة",
+            input_message_content=InputTextMessageContent(f"https://www.youtube.com/watch?v={video_id}"),
+            reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton(
+                "🤖 تحميل عبر البوت",
+                url=f"https://t.me/{context.bot.username}?start={video_id}"
+            )]]),
+            thumbnail_url=f"https://i.ytimg.com/vi/{video_id}/hqdefault.jpg"
+        ))
+        await inline_query.answer(results, cache_time=5, is_personal=True)
         
+        # إكمال التجهيز في الخلفية بدون انتظار، إلا إذا كانت الموارد مشغولة بمهام المستخدمين
+        if video_id not in self.background_tasks and not self.admission.check(list(self.active_jobs.values())):
+            task = asyncio.create_task(self.prepare_inline_video(context.bot, video_id))
+            self.background_tasks[video_id] = task
+            task.add_done_callback(lambda _: self.background_tasks.pop(video_id, None))
+
+    async def prepare_inline_video(self, bot, video_id: str):
+        """تجهيز الفيديو في الخلفية للوضع المضمن: استخراج المعلومات ثم رفع الصوت مسبقاً إن أمكن"""
         try:
-            if file_path.endswith('.mp3'):
-                # إرسال كملف صوتي
+            video_info = await self.get_video_info_by_id(video_id)
+            if not video_info or 'error' in video_info or not INLINE_CACHE_CHAT_ID:
+                return
+            
+            choice = 'audio_mp3'
+            if self._get_cached_file(video_id, choice):
+                return
+            
+            file_path = await self.download_audio_with_fallback({'video_info': video_info})
+            if not file_path or not os.path.exists(file_path):
+                return
+            
+            try:
+                if os.path.getsize(file_path) > TELEGRAM_FILE_LIMIT:
+                    return
                 with open(file_path, 'rb') as audio_file:
-                    await query.message.reply_audio(
+                    sent = await bot.send_audio(
+                        chat_id=INLINE_CACHE_CHAT_ID,
                         audio=audio_file,
-                        caption="🎵 تم تحميل الملف الصوتي بنجاح!",
-                        filename=filename
+                        caption=f"🎵 {video_info.get('title', video_id)[:200]}",
+                        filename=os.path.basename(file_path)
                     )
+                if sent.audio:
+                    self.file_id_cache[f"{video_id}:{choice}"] = {'file_id': sent.audio.file_id, 'kind': 'audio'}
+                    logger.info(f"تم تجهيز الفيديو للوضع المضمن: {video_id}")
+            finally:
+                os.remove(file_path)
+                
+        except Exception as e:
+            logger.error(f"خطأ في تجهيز الفيديو للوضع المضمن: {e}")
+
+    async def send_file(self, query, file_path: Union[str, MemoryFile], cache_key: Optional[str] = None,
+                        kind: Optional[str] = None, duration: Optional[float] = None):
+        """إرسال الملف للمستخدم، ويرجع True إذا وصل
+        
+        الملف الأكبر من حد تلجرام يقسم إلى أجزاء ترسل كمجموعة وسائط (SPLIT_TO_FIT) إذا كانت مدته معروفة.
+        """
+        file_size = file_path.size if isinstance(file_path, MemoryFile) else os.path.getsize(file_path)
+        
+        # التحقق من حجم الملف (حد تلجرام 50 ميجا)
+        parts = None
+        if file_size > TELEGRAM_FILE_LIMIT:
+            if SPLIT_TO_FIT and duration and not isinstance(file_path, MemoryFile):
+                await query.edit_message_text(
+                    "✂️ الملف أكبر من 50 ميجا، جاري تقسيمه إلى أجزاء...",
+                    reply_markup=self.create_cancel_keyboard()
+                )
+                parts = await self.split_to_fit(file_path, duration)
+            if not parts:
+                await query.edit_message_text(
+                    "❌ حجم الملف كبير جداً (أكثر من 50 ميجا)!\n"
+                    "يرجى اختيار جودة أقل."
+                )
+                return False
+        
+        try:
+            if parts:
+                await query.edit_message_text(
+                    f"📤 جاري إرسال الملف في {len(parts)} أجزاء...",
+                    reply_markup=self.create_cancel_keyboard()
+                )
+                await self.upload_parts(query.message, parts, cache_key, kind=kind)
+            else:
+                await self.upload_file(query.message, file_path, cache_key, kind=kind)
+            await query.edit_message_text("✅ تم إرسال الملف بنجاح!")
+            return True
+            
+        except Exception as e:
+            logger.error(f"خطأ في إرسال الملف: {e}")
+            await query.edit_message_text("❌ فشل في إرسال الملف!")
+            return False
+        finally:
+            for part in parts or []:
+                discard_file(part)
+
+    async def _reserve_upload(self, chat_id: int, size: int):
+        """حجز رصيد الرفع (UPLOAD_BANDWIDTH) لملف قبل إرساله"""
+        if self.egress.rate <= 0:
+            return
+        # python-telegram-bot يرسل الملف في طلب واحد، لذلك يحجز رصيد الرفع قبله على دفعات
+        # حتى تتقدم الملفات الصغيرة والمستخدمون الآخرون في الدور بدل انتظار ملف كبير كاملاً
+        flow = self.egress.open_flow(chat_id, size)
+        try:
+            for offset in range(0, size, UPLOAD_SHAPING_CHUNK):
+                await self.egress.consume(flow, min(UPLOAD_SHAPING_CHUNK, size - offset))
+        finally:
+            self.egress.close_flow(flow)
+
+    async def upload_file(self, message, file_path: Union[str, MemoryFile], cache_key: Optional[str] = None,
+                          caption: Optional[str] = None, kind: Optional[str] = None):
+        """رفع الملف كرد على الرسالة وحفظ file_id في الكاش لإعادة استخدامه
+        
+        kind ('audio' أو 'video') يحدد طريقة الإرسال، وإذا لم يمرر يستنتج من امتداد الملف.
+        file_path قد يكون MemoryFile فيرسل محتواه مباشرة بدون قراءته من القرص.
+        """
+        in_memory = isinstance(file_path, MemoryFile)
+        filename = file_path.name if in_memory else os.path.basename(file_path)
+        if kind is None:
+            kind = 'audio' if filename.lower().endswith(AUDIO_EXTENSIONS) else 'video'
+        
+        await self._reserve_upload(message.chat_id, file_path.size if in_memory else os.path.getsize(file_path))
+        
+        with contextlib.nullcontext(file_path.getvalue()) if in_memory else open(file_path, 'rb') as content:
+            if kind == 'audio':
+                # إرسال كملف صوتي
+                sent = await message.reply_audio(
+                    audio=content,
+                    caption=caption or "🎵 تم تحميل الملف الصوتي بنجاح!",
+                    filename=filename
+                )
+                media, kind = sent.audio, 'audio'
             else:
                 # إرسال كفيديو
-                with open(file_path, 'rb') as video_file:
-                    await query.message.reply_video(
-                        video=video_file,
-                        caption="📹 تم تحميل الفيديو بنجاح!",
-                        filename=filename
-                    )
+                sent = await message.reply_video(
+                    video=content,
+                    caption=caption or "📹 تم تحميل الفيديو بنجاح!",
+                    filename=filename
+                )
+                media, kind = sent.video, 'video'
+        
+        if cache_key and media:
+            self.file_id_cache[cache_key] = {'file_id': media.file_id, 'kind': kind}
+        
+        return sent
+
+    async def upload_parts(self, message, parts: List[str], cache_key: Optional[str] = None,
+                           caption: Optional[str] = None, kind: Optional[str] = None):
+        """رفع أجزاء ملف مقسم وإرسالها كمجموعة وسائط مرتبة، وحفظ file_id كل جزء في الكاش
+        
+        مع INLINE_CACHE_CHAT_ID ترفع الأجزاء بالتوازي إلى محادثة التخزين ثم ترسل المجموعة للمستخدم
+        بالـ file_id بدون رفع ثانٍ، وبدونها ترفع كلها في طلب sendMediaGroup واحد.
+        """
+        if kind is None:
+            kind = 'audio' if parts[0].lower().endswith(AUDIO_EXTENSIONS) else 'video'
+        captions = part_captions(kind, len(parts), caption)
+        
+        if INLINE_CACHE_CHAT_ID:
+            bot = message.get_bot()
             
-            await query.edit_message_text("✅ تم إرسال الملف بنجاح!")
+            async def upload(part: str, part_caption: str) -> str:
+                await self._reserve_upload(message.chat_id, os.path.getsize(part))
+                with open(part, 'rb') as content:
+                    if kind == 'audio':
+                        sent = await bot.send_audio(chat_id=INLINE_CACHE_CHAT_ID, audio=content,
+                                                    caption=part_caption, filename=os.path.basename(part))
+                        return sent.audio.file_id
+                    sent = await bot.send_video(chat_id=INLINE_CACHE_CHAT_ID, video=content,
+                                                caption=part_caption, filename=os.path.basename(part))
+                    return sent.video.file_id
             
-        except Exception as e:
-            logger.error(f"خطأ في إرسال الملف: {e}")
-            await query.edit_message_text("❌ فشل في إرسال الملف!")
+            tasks = [asyncio.create_task(upload(part, part_caption)) for part, part_caption in zip(parts, captions)]
+            try:
+                file_ids = await asyncio.gather(*tasks)
+            finally:
+                # عند فشل جزء لا داعي لإكمال رفع البقية
+                for task in tasks:
+                    task.cancel()
+            sent = await self.send_cached_file(message, {'file_id': file_ids[0], 'kind': kind, 'parts': file_ids},
+                                               caption)
+        else:
+            await self._reserve_upload(message.chat_id, sum(os.path.getsize(part) for part in parts))
+            media_class = InputMediaAudio if kind == 'audio' else InputMediaVideo
+            with contextlib.ExitStack() as stack:
+                sent = await message.reply_media_group([
+                    media_class(stack.enter_context(open(part, 'rb')), caption=part_caption,
+                                filename=os.path.basename(part))
+                    for part, part_caption in zip(parts, captions)
+                ])
+            file_ids = [(item.audio if kind == 'audio' else item.video).file_id for item in sent]
+        
+        if cache_key and all(file_ids):
+            self.file_id_cache[cache_key] = {'file_id': file_ids[0], 'kind': kind, 'parts': list(file_ids)}
+        logger.info(f"تم إرسال {len(parts)} أجزاء كمجموعة وسائط")
+        return sent
+
+    async def send_cached_file(self, message, cached_file: Dict, caption: Optional[str] = None):
+        """إعادة إرسال ملف موجود على خوادم تلجرام باستخدام file_id بدون تحميل"""
+        if cached_file.get('parts'):
+            # ملف مقسم: نفس الأجزاء كمجموعة وسائط بنفس الترتيب
+            media_class = InputMediaAudio if cached_file['kind'] == 'audio' else InputMediaVideo
+            return await message.reply_media_group([
+                media_class(file_id, caption=part_caption) for file_id, part_caption in
+                zip(cached_file['parts'], part_captions(cached_file['kind'], len(cached_file['parts']), caption))
+            ])
+        if cached_file['kind'] == 'audio':
+            return await message.reply_audio(
+                audio=cached_file['file_id'],
+                caption=caption or "🎵 تم تحميل الملف الصوتي بنجاح!"
+            )
+        return await message.reply_video(
+            video=cached_file['file_id'],
+            caption=caption or "📹 تم تحميل الفيديو بنجاح!"
+        )
 
     def format_duration(self, seconds: int) -> str:
         """تنسيق مدة الفيديو"""
@@ -1325,8 +4511,8 @@ class YouTubeTelegramBot:
         logger.info("جاري التحميل المباشر باستخدام الروابط المستخرجة...")
         
         # إنشاء callback للتقدم إذا كان متاحاً
-        progress_callback = getattr(session, 'progress_callback', None)
-        return await self.download_direct_video(video_info, quality, progress_callback)
+        progress_callback = session.get('progress_callback')
+        return await self.download_direct_video(video_info, quality, progress_callback, job=session.get('job'))
     
     async def download_audio_with_fallback(self, session: Dict) -> Optional[str]:
         """تحميل الصوت باستخدام الروابط المستخرجة بـ regex فقط"""
@@ -1349,32 +4535,813 @@ class YouTubeTelegramBot:
         logger.info("جاري تحميل الصوت المباشر باستخدام الروابط المستخرجة...")
         
         # إنشاء callback للتقدم إذا كان متاحاً
-        progress_callback = getattr(session, 'progress_callback', None)
-        return await self.download_direct_audio(video_info, progress_callback)
+        progress_callback = session.get('progress_callback')
+        file_path = await self.download_direct_audio(video_info, progress_callback, job=session.get('job'))
+        if not file_path:
+            return None
+        return await self.convert_audio(file_path, video_info, progress_callback, session.get('job'))
+    
+    async def run_ffmpeg(self, args: List[str], stdin: Optional[memoryview] = None,
+                         stats: Optional[Dict] = None) -> Optional[bytes]:
+        """تشغيل ffmpeg ضمن مجمع عمليات محدود، مع قتل العملية عند إلغاء المهمة
+        
+        stdin يمرر كمدخل pipe:0 للملفات الموجودة في الذاكرة. يرجع مخرج stdout (فارغ عند الكتابة
+        إلى ملف) أو None عند الفشل. مع stats يضاف إلى stats['cpu'] زمن المعالج للعملية (من -benchmark).
+        """
+        if self.ffmpeg_missing:
+            return None
+        
+        # سطر bench يطبع بمستوى info، و-nostats يخفي سطور التقدم
+        log_args = ['-loglevel', 'info', '-nostats', '-benchmark'] if stats is not None else ['-loglevel', 'error']
+        async with self.ffmpeg_slots:
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    FFMPEG_PATH, '-hide_banner', *log_args, '-nostdin', '-y', *args,
+                    stdin=asyncio.subprocess.PIPE if stdin is not None else asyncio.subprocess.DEVNULL,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
+            except FileNotFoundError:
+                self.ffmpeg_missing = True
+                logger.warning(f"لم يتم العثور على ffmpeg ({FFMPEG_PATH})، سيتم إرسال الملفات بدون معالجة")
+                return None
+            
+            try:
+                stdout, stderr = await process.communicate(stdin)
+            except asyncio.CancelledError:
+                if process.returncode is None:
+                    process.kill()
+                # انتظار انتهاء العملية حتى لا تبقى zombie حتى جمع القمامة (محمي من إلغاء ثانٍ وبمهلة قصيرة)
+                try:
+                    await asyncio.wait_for(asyncio.shield(process.wait()), 5)
+                except (asyncio.TimeoutError, asyncio.CancelledError):
+                    pass
+                raise
+            
+            if process.returncode != 0:
+                logger.error(f"فشل ffmpeg ({process.returncode}): {stderr.decode(errors='replace')[-300:]}")
+                return None
+            if stats is not None:
+                for utime, stime in re.findall(rb'bench: utime=([\d.]+)s stime=([\d.]+)s', stderr):
+                    stats['cpu'] = stats.get('cpu', 0.0) + float(utime) + float(stime)
+            return stdout
+    
+    async def _download_thumbnail(self, video_info: Dict) -> Optional[str]:
+        """تحميل الصورة المصغرة من معلومات الفيديو لاستخدامها كغلاف"""
+        thumbnail = video_info.get('thumbnail')
+        if not thumbnail:
+            return None
+        
+        try:
+            proxies = {'http': PROXY_URL, 'https': PROXY_URL} if USE_PROXY and PROXY_URL else None
+            response = await asyncio.to_thread(
+                requests.get, thumbnail,
+                proxies=proxies,
+                headers={'User-Agent': random.choice(USER_AGENTS)},
+                timeout=10
+            )
+            if response.status_code != 200 or not response.content:
+                return None
+            
+            ext = os.path.splitext(urllib.parse.urlparse(thumbnail).path)[1] or '.jpg'
+            file_path = os.path.join(DOWNLOAD_PATH, f"cover_{video_info.get('id', 'unknown')}_{time.time_ns()}{ext}")
+            with open(file_path, 'wb') as f:
+                f.write(response.content)
+            return file_path
+        except Exception as e:
+            logger.warning(f"فشل في تحميل الصورة المصغرة: {e}")
+            return None
+    
+    async def convert_audio(self, source_path: Union[str, MemoryFile], video_info: Dict, progress_callback=None,
+                            job: Optional[Dict] = None) -> Union[str, MemoryFile]:
+        """تحويل الصوت إلى AUDIO_FORMAT مع الوسوم وصورة الغلاف
+        
+        ينسخ الصوت بدون إعادة ترميز عندما تسمح الحاوية بذلك (opus من webm و aac من m4a)،
+        ويرجع الملف الأصلي إذا فشل التحويل أو لم يكن ffmpeg متاحاً.
+        الملف الموجود في الذاكرة (MemoryFile) يمرر إلى ffmpeg عبر pipe ويرجع الناتج في الذاكرة أيضاً.
+        """
+        if self.ffmpeg_missing:
+            return source_path
+        
+        if isinstance(source_path, MemoryFile) and AUDIO_FORMAT == 'm4a':
+            # حاوية mp4 تحتاج مخرجاً يمكن التنقل فيه، فلا تكتب إلى pipe
+            source_path = await self._spill_to_disk(source_path)
+        memory_source = source_path if isinstance(source_path, MemoryFile) else None
+        source_name = memory_source.name if memory_source else source_path
+        
+        source_ext = os.path.splitext(source_name)[1].lower()
+        target_path = os.path.splitext(source_name)[0] + f".{AUDIO_FORMAT}"
+        if target_path == source_name:
+            target_path = os.path.splitext(source_name)[0] + f".tagged.{AUDIO_FORMAT}"
+        
+        if AUDIO_FORMAT == 'opus':
+            codec_args = ['-c:a', 'copy'] if source_ext == '.webm' else ['-c:a', 'libopus', '-b:a', AUDIO_BITRATE]
+        elif AUDIO_FORMAT == 'm4a':
+            codec_args = ['-c:a', 'copy'] if source_ext == '.m4a' else ['-c:a', 'aac', '-b:a', AUDIO_BITRATE]
+        else:
+            codec_args = ['-c:a', 'libmp3lame', '-b:a', AUDIO_BITRATE, '-id3v2_version', '3']
+        
+        if job is not None:
+            self._set_stage(job, 'convert')
+        if progress_callback:
+            action = "نسخ" if codec_args[1] == 'copy' else "تحويل"
+            await progress_callback(f"🎛️ جاري {action} الصوت إلى {AUDIO_FORMAT.upper()}...")
+        
+        # حاوية ogg لا تدعم صورة الغلاف عبر ffmpeg، لذلك تكتفي بالوسوم
+        cover_path = await self._download_thumbnail(video_info) if AUDIO_FORMAT != 'opus' else None
+        
+        args = ['-i', 'pipe:0' if memory_source else source_path]
+        if cover_path:
+            args += ['-i', cover_path, '-map', '0:a', '-map', '1:v',
+                     '-c:v', 'copy' if cover_path.endswith('.jpg') else 'mjpeg',
+                     '-disposition:v', 'attached_pic',
+                     '-metadata:s:v', 'title=Album cover', '-metadata:s:v', 'comment=Cover (front)']
+        else:
+            args += ['-map', '0:a']
+        args += codec_args
+        args += ['-map_metadata', '-1',
+                 '-metadata', f"title={video_info.get('title', '')}",
+                 '-metadata', f"artist={video_info.get('uploader', '')}",
+                 '-metadata', f"comment=https://www.youtube.com/watch?v={video_info.get('id', '')}"]
+        
+        if memory_source:
+            args += ['-f', AUDIO_FORMAT, 'pipe:1']
+            try:
+                output = await self.run_ffmpeg(args, stdin=memory_source.view)
+            except BaseException:
+                memory_source.release()
+                raise
+            finally:
+                if cover_path and os.path.exists(cover_path):
+                    os.remove(cover_path)
+            if not output:
+                return memory_source
+            memory_source.release()
+            logger.info(f"تمت معالجة الصوت في الذاكرة: {source_name} ({len(output)} بايت)")
+            return MemoryFile(os.path.splitext(source_name)[0] + f".{AUDIO_FORMAT}", output, len(output))
+        
+        args.append(target_path)
+        try:
+            converted = await self.run_ffmpeg(args) is not None
+        except BaseException:
+            # عند الإلغاء نحذف الملفين فوراً
+            for path in (target_path, source_path):
+                if os.path.exists(path):
+                    os.remove(path)
+            raise
+        finally:
+            if cover_path and os.path.exists(cover_path):
+                os.remove(cover_path)
+        
+        if not converted:
+            if os.path.exists(target_path):
+                os.remove(target_path)
+            return source_path
+        
+        if target_path.endswith(f".tagged.{AUDIO_FORMAT}"):
+            # نفس الحاوية: استبدال الملف الأصلي بالنسخة الموسومة
+            os.replace(target_path, source_path)
+            target_path = source_path
+        else:
+            os.remove(source_path)
+        logger.info(f"تمت معالجة الصوت: {target_path}")
+        return target_path
+    
+    async def transcode_to_fit(self, source_path: str, video_info: Dict, kind: str, progress_callback=None,
+                               job: Optional[Dict] = None) -> str:
+        """إعادة ترميز الملف ليصبح أصغر من حد تلجرام بمعدل بت محسوب من مدة الفيديو
+        
+        الفيديو بـ libx264 (TRANSCODE_PRESET) بمرورين إذا كان أقصر من TRANSCODE_TWO_PASS_MAX_SECONDS
+        ولا توجد مهام تنتظر دورها، وإلا بمرور واحد. إذا تجاوز الناتج الحد يعاد مرة بمعدل أقل.
+        يرجع مسار الملف الجديد (ويحذف الأصلي)، أو الملف الأصلي إذا تعذر ذلك.
+        """
+        if self.ffmpeg_missing:
+            return source_path
+        source_size = os.path.getsize(source_path)
+        plan = plan_transcode(kind, video_info.get('duration') or 0, TELEGRAM_FILE_LIMIT)
+        if not plan:
+            logger.warning(f"لا يمكن ضغط {source_path} ليناسب حد تلجرام (المدة {video_info.get('duration')} ث)")
+            return source_path
+        
+        base, ext = os.path.splitext(source_path)
+        target_path = f"{base}.fit{ext if kind == 'audio' else '.mp4'}"
+        passlog = f"{base}.passlog"
+        if job is not None:
+            self._set_stage(job, 'convert')
+        if progress_callback:
+            await progress_callback(
+                f"🗜️ الملف {source_size / (1024 * 1024):.0f} MB أكبر من حد تلجرام، "
+                f"جاري ضغطه إلى أقل من {TELEGRAM_FILE_LIMIT // (1024 * 1024)} MB..."
+            )
+        
+        queued = time.perf_counter()
+        self.transcode_waiting += 1
+        try:
+            await self.transcode_slots.acquire()
+        finally:
+            self.transcode_waiting -= 1
+        started = time.perf_counter()
+        # المرور الأول يضاعف تقريباً زمن المعالج، فلا يستخدم إذا كانت هناك مهام تنتظر دورها
+        two_pass = (kind == 'video' and self.transcode_waiting == 0
+                    and video_info['duration'] <= TRANSCODE_TWO_PASS_MAX_SECONDS)
+        stats = {'cpu': 0.0}
+        output_size = None
+        try:
+            for attempt in range(2):
+                if not await self._run_transcode(source_path, target_path, passlog, kind, plan,
+                                                 two_pass and attempt == 0, stats):
+                    break
+                output_size = os.path.getsize(target_path)
+                if output_size <= TELEGRAM_FILE_LIMIT:
+                    break
+                # معدل البت الناتج أعلى من المطلوب: إعادة بمعدل أقل بنفس النسبة
+                logger.warning(f"ناتج الضغط {output_size} بايت أكبر من الحد، إعادة بمعدل أقل")
+                scale = TELEGRAM_FILE_LIMIT * TRANSCODE_SIZE_MARGIN / output_size
+                plan = {key: int(value * scale) if key.endswith('_kbps') else value for key, value in plan.items()}
+                output_size = None
+        except BaseException:
+            # عند الإلغاء نحذف الناتج الجزئي فوراً (الملف الأصلي يحذفه صاحب المهمة)
+            discard_file(target_path)
+            raise
+        finally:
+            self.transcode_slots.release()
+            for path in (f"{passlog}-0.log", f"{passlog}-0.log.mbtree"):
+                discard_file(path)
+        
+        wall = time.perf_counter() - started
+        self.transcode_stats.append({
+            'kind': kind, 'duration': video_info.get('duration'), 'passes': 2 if two_pass else 1,
+            'preset': TRANSCODE_PRESET, **plan, 'input_bytes': source_size, 'output_bytes': output_size,
+            'queue_s': started - queued, 'wall_s': wall, 'cpu_s': stats['cpu'],
+        })
+        if output_size is None:
+            discard_file(target_path)
+            logger.error(f"فشل ضغط {source_path} ليناسب حد تلجرام")
+            return source_path
+        logger.info(
+            f"تم ضغط {kind}: {source_size / 1e6:.1f} → {output_size / 1e6:.1f} MB "
+            f"({2 if two_pass else 1} مرور، {TRANSCODE_PRESET}) في {wall:.1f} ث، "
+            f"معالج {stats['cpu']:.1f} ث، انتظار {started - queued:.1f} ث"
+        )
+        os.remove(source_path)
+        return target_path
+    
+    async def _run_transcode(self, source_path: str, target_path: str, passlog: str, kind: str, plan: Dict,
+                             two_pass: bool, stats: Dict) -> bool:
+        """تشغيل ffmpeg لخطة plan_transcode (مرور أول للتحليل فقط ثم الترميز عند two_pass)"""
+        if kind == 'audio':
+            ext = os.path.splitext(source_path)[1].lower()
+            codec = {'.mp3': 'libmp3lame', '.m4a': 'aac', '.mp4': 'aac'}.get(ext, 'libopus')
+            # صورة الغلاف تنسخ كما هي (حاوية ogg/webm لا تدعمها عبر ffmpeg)
+            cover = ['-map', '0:v?', '-c:v', 'copy'] if codec != 'libopus' else []
+            return await self.run_ffmpeg(
+                ['-i', source_path, '-map', '0:a:0', *cover, '-c:a', codec, '-b:a', f"{plan['audio_kbps']}k",
+                 '-map_metadata', '0', target_path],
+                stats=stats
+            ) is not None
+        
+        video_args = ['-c:v', 'libx264', '-preset', TRANSCODE_PRESET, '-b:v', f"{plan['video_kbps']}k",
+                      '-pix_fmt', 'yuv420p', '-threads', str(max(1, (os.cpu_count() or 1) // max(1, TRANSCODE_WORKERS)))]
+        if plan['max_height']:
+            video_args += ['-vf', f"scale=-2:'min(ih,{plan['max_height']})'"]
+        if two_pass:
+            first = await self.run_ffmpeg(
+                ['-i', source_path, '-map', '0:v:0', *video_args, '-pass', '1', '-passlogfile', passlog,
+                 '-an', '-f', 'null', os.devnull],
+                stats=stats
+            )
+            if first is None:
+                return False
+            video_args += ['-pass', '2', '-passlogfile', passlog]
+        return await self.run_ffmpeg(
+            ['-i', source_path, '-map', '0:v:0', '-map', '0:a:0?', *video_args,
+             '-c:a', 'aac', '-b:a', f"{plan['audio_kbps']}k", '-movflags', '+faststart', target_path],
+            stats=stats
+        ) is not None
+    
+    async def split_to_fit(self, source_path: str, duration: float) -> Optional[List[str]]:
+        """تقسيم الملف إلى أجزاء أصغر من حد تلجرام عند الإطارات المفتاحية بدون إعادة ترميز
+        
+        مدة الجزء محسوبة من نسبة الحد إلى حجم الملف، وإذا تجاوز جزء الحد (إطارات مفتاحية متباعدة
+        أو معدل بت غير ثابت) يعاد التقسيم بمدة أقصر. يرجع مسارات الأجزاء بالترتيب، أو None.
+        """
+        if self.ffmpeg_missing:
+            return None
+        source_size = os.path.getsize(source_path)
+        target = TELEGRAM_FILE_LIMIT * SPLIT_SIZE_MARGIN
+        if source_size > target * SPLIT_MAX_PARTS:
+            logger.warning(f"الملف {source_path} يحتاج أكثر من {SPLIT_MAX_PARTS} أجزاء، لن يقسم")
+            return None
+        
+        base, ext = os.path.splitext(source_path)
+        audio = ext.lower() in AUDIO_EXTENSIONS
+        # صورة غلاف الصوت لا تكرر في كل جزء، فينسخ الصوت فقط
+        streams = ['-map', '0:a:0'] if audio else ['-map', '0:v:0', '-map', '0:a:0?']
+        if ext.lower() in ('.mp4', '.m4a'):
+            streams += ['-segment_format_options', 'movflags=+faststart']
+        segment_time = duration * target / source_size
+        started = time.perf_counter()
+        
+        def existing_parts() -> List[str]:
+            found = []
+            while os.path.exists(f"{base}.part{len(found):03d}{ext}"):
+                found.append(f"{base}.part{len(found):03d}{ext}")
+            return found
+        
+        try:
+            for attempt in range(3):
+                output = await self.run_ffmpeg([
+                    '-i', source_path, *streams, '-c', 'copy', '-f', 'segment',
+                    '-segment_time', f"{segment_time:.3f}", '-reset_timestamps', '1', f"{base}.part%03d{ext}"
+                ])
+                parts = existing_parts()
+                if output is None or not parts:
+                    break
+                largest = max(os.path.getsize(part) for part in parts)
+                if largest <= TELEGRAM_FILE_LIMIT and len(parts) <= SPLIT_MAX_PARTS:
+                    logger.info(
+                        f"تم تقسيم {source_path} ({source_size / 1e6:.1f} MB) إلى {len(parts)} أجزاء "
+                        f"في {time.perf_counter() - started:.1f} ث"
+                    )
+                    return parts
+                logger.warning(f"جزء بحجم {largest} بايت أكبر من الحد، إعادة التقسيم بمدة أقصر")
+                for part in parts:
+                    discard_file(part)
+                segment_time *= target / largest
+        except BaseException:
+            # عند الإلغاء تحذف الأجزاء التي كتبها ffmpeg حتى لحظتها
+            for part in existing_parts():
+                discard_file(part)
+            raise
+        for part in existing_parts():
+            discard_file(part)
+        logger.error(f"فشل تقسيم {source_path} إلى أجزاء أصغر من حد تلجرام")
+        return None
+    
+    async def _spill_to_disk(self, memory_file: MemoryFile) -> str:
+        """كتابة ملف من الذاكرة إلى DOWNLOAD_PATH (للمعالجة التي تحتاج ملفاً حقيقياً) وإرجاع المخزن"""
+        file_path = os.path.join(DOWNLOAD_PATH, memory_file.name)
+        try:
+            async with aiofiles.open(file_path, 'wb') as f:
+                await f.write(memory_file.view)
+        finally:
+            memory_file.release()
+        return file_path
+    
+    def _select_video_format(self, formats: List[Dict], quality: str) -> Optional[Dict]:
+        """اختيار أقرب تنسيق فيديو للجودة المطلوبة"""
+        target_quality = int(quality)
+        
+        # البحث عن أفضل تنسيق فيديو
+        best_format = None
+        best_score = -1
+        
+        for fmt in formats:
+            if fmt.get('type') == 'video' and fmt.get('height'):
+                height = fmt.get('height')
+                # حساب نقاط الجودة (كلما قرب من الجودة المطلوبة كان أفضل)
+                score = 1000 - abs(height - target_quality)
+                
+                # إضافة نقاط إضافية للتنسيقات الأفضل
+                if fmt.get('ext') == 'mp4':
+                    score += 100
+                
+                if score > best_score:
+                    best_score = score
+                    best_format = fmt
+        
+        return best_format
+    
+    def _select_audio_format(self, formats: List[Dict]) -> Optional[Dict]:
+        """اختيار أفضل تنسيق صوتي"""
+        best_format = None
+        best_score = -1
+        
+        # تفضيل المصدر الذي يمكن نسخه بدون إعادة ترميز إلى التنسيق المطلوب
+        preferred_exts = ['webm'] if AUDIO_FORMAT == 'opus' else ['m4a', 'mp3']
+        
+        for fmt in formats:
+            if fmt.get('type') == 'audio' or (fmt.get('vcodec') == 'none' and fmt.get('acodec') != 'none'):
+                score = 0
+                
+                # تفضيل التنسيقات الأفضل
+                if fmt.get('ext') in preferred_exts:
+                    score += 100
+                
+                # تفضيل البت ريت الأعلى
+                if fmt.get('abr'):
+                    score += fmt.get('abr', 0)
+                
+                if score > best_score:
+                    best_score = score
+                    best_format = fmt
+        
+        return best_format
     
-    async def download_direct_video(self, video_info: Dict, quality: str, progress_callback=None) -> Optional[str]:
-        """تحميل الفيديو مباشرة من الروابط المستخرجة مع شريط التقدم"""
+    async def _stream_to_file(self, download_url: str, file_path: str, kind: str,
+                              progress_callback=None, job: Optional[Dict] = None) -> Optional[int]:
+        """تحميل رابط إلى ملف على دفعات بدون حجب حلقة الأحداث
+        
+        job قاموس تحكم اختياري يُقرأ عند كل دفعة: 'rate_limiter' لتحديد السرعة و
+        'progress_callback' لتحديث التقدم، حتى يمكن تغييرهما أثناء التحميل.
+        إذا كان job['in_memory'] مفعلاً والحجم لا يتجاوز MEMORY_FILE_MAX_MB يقرأ الرد مباشرة
+        (readinto) إلى مخزن من المجمع بدل الملف، ويضع الناتج في job['memory_file'].
+        يرجع عدد البايتات المحملة أو None عند الفشل، ويحذف الملف الجزئي عند الخطأ أو الإلغاء
+        إلا إذا كان job['checkpoint'] مفعلاً (إيقاف البوت). job['resume'] بنفس المسار و itag يكمل
+        الملف الجزئي الموجود بطلب Range بدل البدء من الصفر.
+        """
+        job = job if job is not None else {}
+        
+        proxies = {'http': PROXY_URL, 'https': PROXY_URL} if USE_PROXY and PROXY_URL else None
+        headers = {'User-Agent': random.choice(USER_AGENTS)}
+        
+        resume = job.pop('resume', None)
+        offset = 0
+        if (resume and resume.get('path') == file_path and resume.get('itag') == job.get('itag')
+                and os.path.exists(file_path)):
+            offset = os.path.getsize(file_path)
+            headers['Range'] = f"bytes={offset}-"
+            logger.info(f"استئناف التحميل من {offset} بايت: {file_path}")
+        
+        request = asyncio.ensure_future(asyncio.to_thread(
+            requests.get, download_url,
+            proxies=proxies,
+            headers=headers,
+            stream=True,
+            timeout=30
+        ))
+        try:
+            response = await asyncio.shield(request)
+        except asyncio.CancelledError:
+            # الطلب يكمل في الـ thread، نغلق الاتصال فور وصول الرد حتى لا يبقى معلقاً
+            request.add_done_callback(
+                lambda f: f.result().close() if not f.cancelled() and f.exception() is None else None
+            )
+            raise
+        
+        reading = False
+        flow = None
+        memory_file = None
         try:
-            formats = video_info.get('formats', [])
-            target_quality = int(quality)
+            if response.status_code == 200:
+                offset = 0  # الخادم تجاهل Range: البدء من الصفر
+            elif not (offset and response.status_code == 206):
+                logger.error(f"فشل في التحميل: {response.status_code}")
+                return None
             
-            # البحث عن أفضل تنسيق فيديو
-            best_format = None
-            best_score = -1
+            # الحصول على حجم الملف
+            total_size = offset + int(response.headers.get('content-length', 0))
+            downloaded_size = offset
+            # التقدم في قاموس المهمة يستخدمه التحكم بالقبول لحجز المساحة وتقدير وقت الانتهاء
+            job['bytes_total'] = total_size
+            job['bytes_done'] = offset
+            job['stream_started'] = time.monotonic()
+            flow = self.ingress.open_flow(job.get('user_id'), total_size - offset, job)
+            update_interval = 2 if kind == 'video' else 1.5
             
-            for fmt in formats:
-                if fmt.get('type') == 'video' and fmt.get('height'):
-                    height = fmt.get('height')
-                    # حساب نقاط الجودة (كلما قرب من الجودة المطلوبة كان أفضل)
-                    score = 1000 - abs(height - target_quality)
+            callback = job.get('progress_callback', progress_callback)
+            if callback:
+                size_mb = total_size / (1024 * 1024) if total_size > 0 else 0
+                start_text = "📥 بدء التحميل..." if kind == 'video' else "🎵 بدء تحميل الصوت..."
+                await callback(f"{start_text} ({size_mb:.1f} MB)")
+            
+            readinto = self._raw_readinto(response)
+            if (job.get('in_memory') and readinto and not offset
+                    and 0 < total_size <= MEMORY_FILE_MAX_MB * 1024 * 1024):
+                memory_file = MemoryFile(os.path.basename(file_path), self.buffers.acquire(total_size),
+                                         pool=self.buffers)
+                buffer_view = memoryview(memory_file.buffer)
+            else:
+                chunks = response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE)
+                # مسار الملف الجزئي في السجل حتى يستأنف أو يحذف بعد تعطل البوت
+                self.journal.update(job.get('journal_id'), partial_path=file_path, itag=job.get('itag'))
+            
+            mode = 'ab' if offset else 'wb'
+            with open(file_path, mode) if memory_file is None else contextlib.nullcontext() as f:
+                start_time = time.time()
+                last_update_time = start_time
+                last_downloaded_size = downloaded_size
+                
+                while True:
+                    # القراءة من الشبكة في thread حتى لا تتوقف حلقة الأحداث
+                    reading = True
+                    if memory_file is not None:
+                        # مباشرة إلى مكان الدفعة في المخزن بدون إنشاء bytes لكل دفعة
+                        end = min(total_size, downloaded_size + DOWNLOAD_CHUNK_SIZE)
+                        size = await asyncio.to_thread(readinto, buffer_view[downloaded_size:end]) if end > downloaded_size else 0
+                        reading = False
+                        if not size:
+                            break
+                    else:
+                        chunk = await asyncio.to_thread(next, chunks, None)
+                        reading = False
+                        if chunk is None:
+                            break
+                        size = len(chunk)
+                        if not size:
+                            continue
                     
-                    # إضافة نقاط إضافية للتنسيقات الأفضل
-                    if fmt.get('ext') == 'mp4':
-                        score += 100
+                    rate_limiter = job.get('rate_limiter')
+                    if rate_limiter:
+                        await rate_limiter.consume(size)
+                    await self.ingress.consume(flow, size)
                     
-                    if score > best_score:
-                        best_score = score
-                        best_format = fmt
+                    if f is not None:
+                        f.write(chunk)
+                    downloaded_size += size
+                    job['bytes_done'] = downloaded_size
+                    self.admission.record(size)
+                    
+                    current_time = time.time()
+                    callback = job.get('progress_callback', progress_callback)
+                    
+                    # تحديث التقدم كل update_interval ثانية
+                    if callback and (current_time - last_update_time) >= update_interval and total_size > 0:
+                        progress_percent = (downloaded_size / total_size) * 100
+                        downloaded_mb = downloaded_size / (1024 * 1024)
+                        total_mb = total_size / (1024 * 1024)
+                        
+                        # حساب سرعة التحميل
+                        elapsed_time = current_time - last_update_time
+                        speed_bytes = (downloaded_size - last_downloaded_size) / elapsed_time
+                        speed_mb = speed_bytes / (1024 * 1024)
+                        
+                        # تقدير الوقت المتبقي
+                        remaining_bytes = total_size - downloaded_size
+                        eta_seconds = remaining_bytes / speed_bytes if speed_bytes > 0 else 0
+                        eta_minutes = eta_seconds / 60
+                        
+                        # إنشاء شريط التقدم
+                        progress_bar = self.create_progress_bar(progress_percent)
+                        
+                        if kind == 'video':
+                            header = "📥 جاري التحميل..."
+                            eta_text = f"⏱️ {eta_minutes:.1f} دقيقة متبقية" if eta_minutes > 1 else f"⏱️ {eta_seconds:.0f} ثانية متبقية"
+                        else:
+                            header = "🎵 جاري تحميل الصوت..."
+                            eta_text = f"⏱️ {eta_seconds:.0f} ثانية متبقية" if eta_seconds > 0 else "⏱️ اكتمل تقريباً"
+                        
+                        await callback(
+                            f"{header}\n"
+                            f"{progress_bar} {progress_percent:.1f}%\n"
+                            f"📊 {downloaded_mb:.1f} MB / {total_mb:.1f} MB\n"
+                            f"🚀 {speed_mb:.1f} MB/s\n"
+                            f"{eta_text}"
+                        )
+                        
+                        last_update_time = current_time
+                        last_downloaded_size = downloaded_size
+            
+            if memory_file is not None:
+                # readinto ترجع 0 عند إغلاق الخادم للاتصال مبكراً بدل IncompleteRead كما في مسار الملف
+                if downloaded_size < total_size:
+                    raise requests.exceptions.ChunkedEncodingError(
+                        f"انقطع الاتصال بعد {downloaded_size} من {total_size} بايت"
+                    )
+                memory_file.size = downloaded_size
+                job['memory_file'] = memory_file
+            else:
+                # الملف اكتمل والمعالجة اللاحقة قد تغيره في مكانه، فلا يصلح للاستئناف بـ Range
+                self.journal.update(job.get('journal_id'), itag=None)
+            return downloaded_size
+            
+        except BaseException:
+            # حذف الملف الجزئي (أو إرجاع المخزن) عند أي خطأ أو إلغاء
+            if memory_file is not None:
+                memory_file.release()
+            if job.get('checkpoint') and memory_file is None:
+                logger.info(f"حفظ الملف الجزئي للاستئناف بعد إعادة التشغيل: {file_path} ({job.get('bytes_done', 0)} بايت)")
+            elif os.path.exists(file_path):
+                os.remove(file_path)
+            raise
+        
+        finally:
+            if flow:
+                self.ingress.close_flow(flow)
+            if reading:
+                # قراءة جارية في thread: إغلاق الرد هنا ينتظرها ويحجب حلقة الأحداث،
+                # لذلك نقطع المقبس لإيقاظها ثم نكمل الإغلاق خارج الحلقة
+                self._abort_response(response)
+                asyncio.get_running_loop().run_in_executor(None, response.close)
+            else:
+                response.close()
+    
+    def _raw_readinto(self, response) -> Optional[Callable]:
+        """دالة readinto تقرأ جسم الرد مباشرة إلى مخزن، أو None إذا كان الجسم مضغوطاً
+        
+        readinto في urllib3 تنشئ bytes مؤقتة ثم تنسخها، لذلك نستخدم رد http.client الداخلي
+        الذي يقرأ إلى المخزن مباشرة (ويتعامل مع content-length و chunked).
+        """
+        if response.headers.get('content-encoding', 'identity').lower() != 'identity':
+            return None
+        fp = getattr(response.raw, '_fp', None)
+        return getattr(fp, 'readinto', None) or getattr(response.raw, 'readinto', None)
+    
+    def _abort_response(self, response):
+        """قطع اتصال تحميل جارٍ فوراً حتى لو كان thread آخر ينتظر القراءة منه"""
+        connection = getattr(response.raw, 'connection', None)
+        sock = getattr(connection, 'sock', None)
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+    
+    async def download_manifest(self, video_info: Dict, fmt: Dict, file_path: str, kind: str,
+                                progress_callback=None, job: Optional[Dict] = None) -> Optional[str]:
+        """تحميل تنسيق HLS/DASH مقطعاً مقطعاً ودمجه في ملف واحد
+        
+        المقاطع تحمل بالتوازي (MANIFEST_CONCURRENCY) عبر segment_session وتكتب بالترتيب، ومن البث
+        الجاري تؤخذ آخر LIVE_WINDOW_MINUTES دقيقة فقط. فيديو DASH يحمل مع أفضل صوت ويدمجان بـ ffmpeg
+        بدون إعادة ترميز، ومقاطع HLS (ts) تنقل إلى mp4. يرجع مسار الناتج أو None.
+        """
+        job = job if job is not None else {}
+        job.pop('resume', None)  # المقاطع لا تستأنف بـ Range، التحميل يبدأ من جديد
+        try:
+            tracks = await self._manifest_tracks(fmt, kind)
+        except (requests.RequestException, ValueError, ElementTree.ParseError) as e:
+            logger.error(f"فشل في تحميل قائمة المقاطع: {e}")
+            return None
+        if not tracks:
+            return None
+        
+        live = any(track['live'] for track in tracks)
+        if live:
+            for track in tracks:
+                track['segments'] = live_window(track['segments'], LIVE_WINDOW_MINUTES * 60)
+        duration = sum(segment['duration'] for segment in tracks[0]['segments'])
+        if live and not video_info.get('duration'):
+            # تقسيم الملف إلى أجزاء يحتاج مدة ما تم تحميله فعلاً
+            video_info['duration'] = int(duration)
+        
+        base = os.path.splitext(file_path)[0]
+        track_paths = [f"{base}.track{index}{track['ext']}" for index, track in enumerate(tracks)]
+        # الحجم غير معروف مسبقاً: تقدير من معدل البت للتحكم بالقبول وشريط التقدم
+        estimate = int(sum(track['bandwidth'] / 8 * duration for track in tracks))
+        job['bytes_total'] = estimate
+        job['bytes_done'] = 0
+        job['stream_started'] = time.monotonic()
+        progress = {
+            'segments': sum(len(track['segments']) + bool(track['init']) for track in tracks), 'done': 0,
+            'started': time.time(), 'updated': time.time(), 'callback': progress_callback,
+        }
+        flow = self.ingress.open_flow(job.get('user_id'), estimate, job)
+        callback = job.get('progress_callback', progress_callback)
+        if callback:
+            window = f"آخر {duration / 60:.0f} دقيقة من البث" if live else f"{duration / 60:.0f} دقيقة"
+            await callback(f"📡 بدء تحميل {progress['segments']} مقطع ({window})...")
+        
+        output = None
+        try:
+            for track, path in zip(tracks, track_paths):
+                await self._download_segments(track, path, flow, job, progress)
+            output = await self._join_tracks(track_paths, file_path, [track['ext'] for track in tracks])
+            if output is None:
+                return None
+            logger.info(
+                f"تم تحميل {progress['segments']} مقطع ({job['bytes_done'] / 1e6:.1f} MB) في "
+                f"{time.time() - progress['started']:.1f} ث{' من بث مباشر' if live else ''}"
+            )
+            return output
+        except Exception as e:
+            logger.error(f"خطأ في تحميل المقاطع: {e}")
+            discard_file(file_path)
+            return None
+        except BaseException:
+            discard_file(file_path)
+            raise
+        finally:
+            self.ingress.close_flow(flow)
+            for path in track_paths:
+                if path != output:
+                    discard_file(path)
+    
+    async def _manifest_tracks(self, fmt: Dict, kind: str) -> List[Dict]:
+        """المسارات المطلوب تحميلها لتنسيق من قائمة (قائمة حديثة لأن البث يضيف مقاطع جديدة)
+        
+        كل مسار {'init', 'segments', 'live', 'bandwidth', 'ext'}: مسار HLS واحد، أو فيديو DASH وصوته.
+        """
+        if fmt['protocol'] == 'hls':
+            playlist = await self.workers.run(parse_hls_playlist, await self._fetch_manifest(fmt['url']), fmt['url'])
+            if playlist.get('encrypted'):
+                raise ValueError("مقاطع HLS مشفرة غير مدعومة")
+            return [{
+                'init': playlist.get('init'), 'segments': playlist.get('segments', []), 'live': playlist.get('live'),
+                'bandwidth': (fmt.get('tbr') or 0) * 1000, 'ext': '.mp4' if playlist.get('init') else '.ts',
+            }]
+        
+        manifest = await self.workers.run(parse_dash_manifest, await self._fetch_manifest(fmt['url']), fmt['url'])
+        representations = manifest['representations']
+        chosen = [next((rep for rep in representations if rep['id'] == str(fmt['itag'])), None)]
+        if chosen[0] is None:
+            raise ValueError(f"التمثيل {fmt['itag']} غير موجود في ملف DASH")
+        if kind == 'video' and chosen[0]['type'] == 'video':
+            audio = [rep for rep in representations if rep['type'] == 'audio']
+            if audio:
+                # صوت mp4 يدمج مع فيديو mp4 بدون إعادة ترميز
+                chosen.append(max(audio, key=lambda rep: ('mp4' in rep['mime'], rep['bandwidth'])))
+        return [{
+            'init': rep['init'], 'segments': rep['segments'], 'live': manifest['live'], 'bandwidth': rep['bandwidth'],
+            'ext': f".{self._get_extension_from_mime(rep['mime'])}",
+        } for rep in chosen]
+    
+    async def _download_segments(self, track: Dict, path: str, flow, job: Dict, progress: Dict):
+        """تحميل مقاطع مسار بالتوازي وكتابتها بالترتيب
+        
+        نافذة منزلقة من MANIFEST_CONCURRENCY طلباً: المقطع التالي يبدأ عندما يكتب أقدمها، فلا يبقى في
+        الذاكرة أكثر من MANIFEST_CONCURRENCY مقطعاً.
+        """
+        urls = ([track['init']] if track['init'] else []) + [segment['url'] for segment in track['segments']]
+        window: deque = deque()
+        
+        async def write(f, task):
+            content = await task
+            rate_limiter = job.get('rate_limiter')
+            if rate_limiter:
+                await rate_limiter.consume(len(content))
+            await self.ingress.consume(flow, len(content))
+            await f.write(content)
+            job['bytes_done'] = job.get('bytes_done', 0) + len(content)
+            self.admission.record(len(content))
+            progress['done'] += 1
+            await self._report_segments(job, progress)
+        
+        try:
+            async with aiofiles.open(path, 'wb') as f:
+                for url in urls:
+                    window.append(asyncio.create_task(self._fetch_segment(url)))
+                    if len(window) >= max(1, MANIFEST_CONCURRENCY):
+                        await write(f, window.popleft())
+                while window:
+                    await write(f, window.popleft())
+        finally:
+            for task in window:
+                task.cancel()
+    
+    async def _fetch_segment(self, url: str) -> bytes:
+        """تحميل مقطع واحد مع إعادة المحاولة (المقاطع صغيرة فتقرأ كاملة في thread)"""
+        proxies = {'http': PROXY_URL, 'https': PROXY_URL} if USE_PROXY and PROXY_URL else None
+        error = None
+        for attempt in range(MANIFEST_SEGMENT_RETRIES):
+            if attempt:
+                await asyncio.sleep(0.5 * 2 ** (attempt - 1))
+            try:
+                response = await asyncio.to_thread(
+                    self.segment_session.get, url,
+                    proxies=proxies,
+                    headers={'User-Agent': random.choice(USER_AGENTS)},
+                    timeout=30
+                )
+                with response:
+                    if response.status_code == 200:
+                        return response.content
+                    error = f"HTTP {response.status_code}"
+            except requests.RequestException as e:
+                error = str(e)
+        raise ConnectionError(f"فشل تحميل المقطع بعد {MANIFEST_SEGMENT_RETRIES} محاولات: {error}")
+    
+    async def _report_segments(self, job: Dict, progress: Dict):
+        """تحديث رسالة التقدم كل ثانيتين أثناء تحميل المقاطع"""
+        callback = job.get('progress_callback', progress['callback'])
+        now = time.time()
+        if not callback or now - progress['updated'] < 2:
+            return
+        progress['updated'] = now
+        percent = progress['done'] / progress['segments'] * 100
+        speed_mb = job['bytes_done'] / max(now - progress['started'], 1e-6) / (1024 * 1024)
+        await callback(
+            f"📡 جاري تحميل المقاطع...\n"
+            f"{self.create_progress_bar(percent)} {percent:.1f}%\n"
+            f"🧩 {progress['done']} / {progress['segments']} مقطع\n"
+            f"📊 {job['bytes_done'] / (1024 * 1024):.1f} MB\n"
+            f"🚀 {speed_mb:.1f} MB/s"
+        )
+    
+    async def _join_tracks(self, track_paths: List[str], file_path: str, exts: List[str]) -> Optional[str]:
+        """دمج مسارات الفيديو والصوت (أو نقل ts) إلى mp4 بدون إعادة ترميز
+        
+        مسار واحد غير ts يرجع كما هو (الصوت يحوله convert_audio لاحقاً). إذا لم يكن ffmpeg متاحاً أو
+        فشل الدمج يرجع None: فيديو بدون صوت أو ts خام لا يرسل كأنه نجح.
+        """
+        if len(track_paths) == 1 and exts[0] != '.ts':
+            target_path = os.path.splitext(file_path)[0] + exts[0]
+            os.replace(track_paths[0], target_path)
+            return target_path
+        args = []
+        for path in track_paths:
+            args += ['-i', path]
+        args += ['-map', '0:v:0?', '-map', f"{len(track_paths) - 1}:a:0?", '-c', 'copy', '-movflags', '+faststart',
+                 file_path]
+        if await self.run_ffmpeg(args) is not None and os.path.exists(file_path):
+            return file_path
+        logger.error("تعذر دمج المسارات بـ ffmpeg")
+        return None
+    
+    async def download_direct_video(self, video_info: Dict, quality: str, progress_callback=None,
+                                    job: Optional[Dict] = None) -> Optional[Union[str, MemoryFile]]:
+        """تحميل الفيديو مباشرة من الروابط المستخرجة مع شريط التقدم (MemoryFile للملفات الصغيرة مع job['in_memory'])"""
+        try:
+            best_format = self._select_video_format(video_info.get('formats', []), quality)
             
             if not best_format:
                 logger.error("لم يتم العثور على تنسيق فيديو مناسب")
@@ -1387,6 +5354,8 @@ class YouTubeTelegramBot:
             
             # تحميل الملف مع شريط التقدم
             download_url = best_format['url']
+            if job is not None:
+                job['itag'] = best_format.get('itag')  # الاستئناف بعد إعادة التشغيل يحتاج نفس التنسيق
             filename = f"video_{quality}p_{video_info.get('id', 'unknown')}.{best_format.get('ext', 'mp4')}"
             file_path = os.path.join(DOWNLOAD_PATH, filename)
             
@@ -1395,82 +5364,23 @@ class YouTubeTelegramBot:
             if progress_callback:
                 await progress_callback("🔗 الاتصال بالخادم...")
             
-            proxies = {'http': PROXY_URL, 'https': PROXY_URL} if USE_PROXY and PROXY_URL else None
-            headers = {'User-Agent': random.choice(USER_AGENTS)}
-            
-            response = await asyncio.to_thread(
-                requests.get, download_url,
-                proxies=proxies,
-                headers=headers,
-                stream=True,
-                timeout=30
-            )
+            if best_format.get('protocol'):
+                # بث مباشر أو إعادة بث: مقاطع من قائمة HLS/DASH بدل رابط واحد
+                return await self.download_manifest(video_info, best_format, file_path, 'video', progress_callback, job)
             
-            if response.status_code == 200:
-                # الحصول على حجم الملف
-                total_size = int(response.headers.get('content-length', 0))
-                downloaded_size = 0
-                
-                if progress_callback:
-                    size_mb = total_size / (1024 * 1024) if total_size > 0 else 0
-                    await progress_callback(f"📥 بدء التحميل... ({size_mb:.1f} MB)")
-                
-                with open(file_path, 'wb') as f:
-                    chunk_count = 0
-                    start_time = time.time()
-                    last_update_time = start_time
-                    last_downloaded_size = 0
-                    
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
-                            downloaded_size += len(chunk)
-                            chunk_count += 1
-                            
-                            current_time = time.time()
-                            
-                            # تحديث التقدم كل 100 chunk أو كل 2 ثانية (حوالي 800KB)
-                            if progress_callback and (chunk_count % 100 == 0 or (current_time - last_update_time) >= 2) and total_size > 0:
-                                progress_percent = (downloaded_size / total_size) * 100
-                                downloaded_mb = downloaded_size / (1024 * 1024)
-                                total_mb = total_size / (1024 * 1024)
-                                
-                                # حساب سرعة التحميل
-                                elapsed_time = current_time - last_update_time
-                                if elapsed_time > 0:
-                                    speed_bytes = (downloaded_size - last_downloaded_size) / elapsed_time
-                                    speed_mb = speed_bytes / (1024 * 1024)
-                                    
-                                    # تقدير الوقت المتبقي
-                                    remaining_bytes = total_size - downloaded_size
-                                    eta_seconds = remaining_bytes / speed_bytes if speed_bytes > 0 else 0
-                                    eta_minutes = eta_seconds / 60
-                                    
-                                    # إنشاء شريط التقدم
-                                    progress_bar = self.create_progress_bar(progress_percent)
-                                    
-                                    eta_text = f"⏱️ {eta_minutes:.1f} دقيقة متبقية" if eta_minutes > 1 else f"⏱️ {eta_seconds:.0f} ثانية متبقية"
-                                    
-                                    await progress_callback(
-                                        f"📥 جاري التحميل...\n"
-                                        f"{progress_bar} {progress_percent:.1f}%\n"
-                                        f"📊 {downloaded_mb:.1f} MB / {total_mb:.1f} MB\n"
-                                        f"🚀 {speed_mb:.1f} MB/s\n"
-                                        f"{eta_text}"
-                                    )
-                                    
-                                    last_update_time = current_time
-                                    last_downloaded_size = downloaded_size
-                
-                if progress_callback:
-                    final_size_mb = downloaded_size / (1024 * 1024)
-                    await progress_callback(f"✅ تم التحميل بنجاح! ({final_size_mb:.1f} MB)")
-                
-                logger.info(f"تم تحميل الفيديو بنجاح: {file_path}")
-                return file_path
-            else:
-                logger.error(f"فشل في تحميل الفيديو: {response.status_code}")
+            downloaded_size = await self._stream_to_file(download_url, file_path, 'video', progress_callback, job)
+            if downloaded_size is None:
+                logger.error("فشل في تحميل الفيديو")
                 return None
+            memory_file = job.pop('memory_file', None) if job is not None else None
+            
+            progress_callback = (job or {}).get('progress_callback', progress_callback)
+            if progress_callback:
+                final_size_mb = downloaded_size / (1024 * 1024)
+                await progress_callback(f"✅ تم التحميل بنجاح! ({final_size_mb:.1f} MB)")
+            
+            logger.info(f"تم تحميل الفيديو بنجاح: {file_path}{' (في الذاكرة)' if memory_file else ''}")
+            return memory_file or file_path
                 
         except Exception as e:
             logger.error(f"خطأ في التحميل المباشر للفيديو: {e}")
@@ -1478,30 +5388,15 @@ class YouTubeTelegramBot:
                 await progress_callback(f"❌ خطأ في التحميل: {str(e)[:50]}...")
             return None
     
-    async def download_direct_audio(self, video_info: Dict, progress_callback=None) -> Optional[str]:
-        """تحميل الصوت مباشرة من الروابط المستخرجة مع شريط التقدم"""
+    async def download_direct_audio(self, video_info: Dict, progress_callback=None,
+                                    job: Optional[Dict] = None) -> Optional[Union[str, MemoryFile]]:
+        """تحميل الصوت مباشرة من الروابط المستخرجة مع شريط التقدم (MemoryFile للملفات الصغيرة مع job['in_memory'])"""
         try:
-            formats = video_info.get('formats', [])
-            
-            # البحث عن أفضل تنسيق صوتي
-            best_format = None
-            best_score = -1
-            
-            for fmt in formats:
-                if fmt.get('type') == 'audio' or (fmt.get('vcodec') == 'none' and fmt.get('acodec') != 'none'):
-                    score = 0
-                    
-                    # تفضيل التنسيقات الأفضل
-                    if fmt.get('ext') in ['m4a', 'mp3']:
-                        score += 100
-                    
-                    # تفضيل البت ريت الأعلى
-                    if fmt.get('abr'):
-                        score += fmt.get('abr', 0)
-                    
-                    if score > best_score:
-                        best_score = score
-                        best_format = fmt
+            best_format = self._select_audio_format(video_info.get('formats', []))
+            if not best_format:
+                # HLS بدون مسار صوت منفصل: أقل جودة فيديو ثم يستخرج الصوت منها convert_audio
+                best_format = min((fmt for fmt in video_info.get('formats', []) if fmt.get('protocol') == 'hls'),
+                                  key=lambda fmt: fmt.get('tbr') or 0, default=None)
             
             if not best_format:
                 logger.error("لم يتم العثور على تنسيق صوتي مناسب")
@@ -1514,6 +5409,8 @@ class YouTubeTelegramBot:
             
             # تحميل الملف مع شريط التقدم
             download_url = best_format['url']
+            if job is not None:
+                job['itag'] = best_format.get('itag')
             filename = f"audio_{video_info.get('id', 'unknown')}.{best_format.get('ext', 'm4a')}"
             file_path = os.path.join(DOWNLOAD_PATH, filename)
             
@@ -1522,81 +5419,22 @@ class YouTubeTelegramBot:
             if progress_callback:
                 await progress_callback("🔗 الاتصال بالخادم...")
             
-            proxies = {'http': PROXY_URL, 'https': PROXY_URL} if USE_PROXY and PROXY_URL else None
-            headers = {'User-Agent': random.choice(USER_AGENTS)}
-            
-            response = await asyncio.to_thread(
-                requests.get, download_url,
-                proxies=proxies,
-                headers=headers,
-                stream=True,
-                timeout=30
-            )
+            if best_format.get('protocol'):
+                return await self.download_manifest(video_info, best_format, file_path, 'audio', progress_callback, job)
             
-            if response.status_code == 200:
-                # الحصول على حجم الملف
-                total_size = int(response.headers.get('content-length', 0))
-                downloaded_size = 0
-                
-                if progress_callback:
-                    size_mb = total_size / (1024 * 1024) if total_size > 0 else 0
-                    await progress_callback(f"🎵 بدء تحميل الصوت... ({size_mb:.1f} MB)")
-                
-                with open(file_path, 'wb') as f:
-                    chunk_count = 0
-                    start_time = time.time()
-                    last_update_time = start_time
-                    last_downloaded_size = 0
-                    
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
-                            downloaded_size += len(chunk)
-                            chunk_count += 1
-                            
-                            current_time = time.time()
-                            
-                            # تحديث التقدم كل 50 chunk أو كل 1.5 ثانية للصوت
-                            if progress_callback and (chunk_count % 50 == 0 or (current_time - last_update_time) >= 1.5) and total_size > 0:
-                                progress_percent = (downloaded_size / total_size) * 100
-                                downloaded_mb = downloaded_size / (1024 * 1024)
-                                total_mb = total_size / (1024 * 1024)
-                                
-                                # حساب سرعة التحميل
-                                elapsed_time = current_time - last_update_time
-                                if elapsed_time > 0:
-                                    speed_bytes = (downloaded_size - last_downloaded_size) / elapsed_time
-                                    speed_mb = speed_bytes / (1024 * 1024)
-                                    
-                                    # تقدير الوقت المتبقي
-                                    remaining_bytes = total_size - downloaded_size
-                                    eta_seconds = remaining_bytes / speed_bytes if speed_bytes > 0 else 0
-                                    
-                                    # إنشاء شريط التقدم
-                                    progress_bar = self.create_progress_bar(progress_percent)
-                                    
-                                    eta_text = f"⏱️ {eta_seconds:.0f} ثانية متبقية" if eta_seconds > 0 else "⏱️ اكتمل تقريباً"
-                                    
-                                    await progress_callback(
-                                        f"🎵 جاري تحميل الصوت...\n"
-                                        f"{progress_bar} {progress_percent:.1f}%\n"
-                                        f"📊 {downloaded_mb:.1f} MB / {total_mb:.1f} MB\n"
-                                        f"🚀 {speed_mb:.1f} MB/s\n"
-                                        f"{eta_text}"
-                                    )
-                                    
-                                    last_update_time = current_time
-                                    last_downloaded_size = downloaded_size
-                
-                if progress_callback:
-                    final_size_mb = downloaded_size / (1024 * 1024)
-                    await progress_callback(f"✅ تم تحميل الصوت بنجاح! ({final_size_mb:.1f} MB)")
-                
-                logger.info(f"تم تحميل الصوت بنجاح: {file_path}")
-                return file_path
-            else:
-                logger.error(f"فشل في تحميل الصوت: {response.status_code}")
+            downloaded_size = await self._stream_to_file(download_url, file_path, 'audio', progress_callback, job)
+            if downloaded_size is None:
+                logger.error("فشل في تحميل الصوت")
                 return None
+            memory_file = job.pop('memory_file', None) if job is not None else None
+            
+            progress_callback = (job or {}).get('progress_callback', progress_callback)
+            if progress_callback:
+                final_size_mb = downloaded_size / (1024 * 1024)
+                await progress_callback(f"✅ تم تحميل الصوت بنجاح! ({final_size_mb:.1f} MB)")
+            
+            logger.info(f"تم تحميل الصوت بنجاح: {file_path}{' (في الذاكرة)' if memory_file else ''}")
+            return memory_file or file_path
                 
         except Exception as e:
             logger.error(f"خطأ في التحميل المباشر للصوت: {e}")
@@ -1604,6 +5442,34 @@ class YouTubeTelegramBot:
                 await progress_callback(f"❌ خطأ في تحميل الصوت: {str(e)[:50]}...")
             return None
 
+def build_application(bot: YouTubeTelegramBot, builder=None) -> Application:
+    """إنشاء تطبيق تلجرام وتسجيل معالجات البوت
+
+    يمكن تمرير builder مخصص (مثلاً مع base_url لخادم Bot API محلي في اختبارات التحميل)
+    """
+    if builder is None:
+        builder = Application.builder().token(BOT_TOKEN)
+    # معالجة التحديثات بالتوازي حتى لا ينتظر الرد المضمن أو /start انتهاء تحميل طويل
+    builder = builder.concurrent_updates(CONCURRENT_UPDATES if CONCURRENT_UPDATES > 1 else False)
+    # الإيقاف المنظم واستعادة المهام بعد إعادة التشغيل (تعمل مع run_polling فقط)
+    application = builder.post_init(bot.on_startup).build()
+    
+    # إضافة معالجات الأوامر
+    application.add_handler(CommandHandler("start", bot.start_command))
+    application.add_handler(CommandHandler("test", bot.test_command))
+    application.add_handler(CommandHandler("proxy", bot.proxy_command))
+    application.add_handler(CommandHandler("profile", bot.profile_command))
+    # تعليقات الوسائط فقط إذا احتوت رابطاً، حتى لا ترد الصور والفيديوهات المعاد توجيهها بخطأ "رابط غير صحيح"
+    caption_links = filters.CAPTION & (
+        filters.CaptionEntity(MessageEntity.URL) | filters.CaptionEntity(MessageEntity.TEXT_LINK)
+        | filters.CaptionRegex(YOUTUBE_LINK_RE)
+    )
+    application.add_handler(MessageHandler((filters.TEXT & ~filters.COMMAND) | caption_links, bot.handle_url))
+    application.add_handler(CallbackQueryHandler(bot.handle_callback))
+    application.add_handler(InlineQueryHandler(bot.handle_inline_query))
+    
+    return application
+
 def main():
     """تشغيل البوت"""
     if not BOT_TOKEN:
@@ -1612,20 +5478,14 @@ def main():
     
     # إنشاء البوت
     bot = YouTubeTelegramBot()
-    application = Application.builder().token(BOT_TOKEN).build()
-    
-    # إضافة معالجات الأوامر
-    application.add_handler(CommandHandler("start", bot.start_command))
-    application.add_handler(CommandHandler("test", bot.test_command))
-    application.add_handler(CommandHandler("proxy", bot.proxy_command))
-    application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, bot.handle_url))
-    application.add_handler(CallbackQueryHandler(bot.handle_callback))
+    application = build_application(bot)
     
     print("🚀 بدء تشغيل البوت...")
     print("📝 أرسل /start للبدء")
     
     # تشغيل البوت
-    application.run_polling(allowed_updates=Update.ALL_TYPES)
+    # إشارات الإيقاف يعالجها on_startup حتى تكتمل المهام الجارية أولاً
+    application.run_polling(allowed_updates=Update.ALL_TYPES, stop_signals=None)
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,1805 @@
+"""مفسر JavaScript مصغر لتشغيل دوال ملف مشغل يوتيوب (مثل تحويل المعامل n)
+
+يدعم فقط المجموعة الفرعية المستخدمة في هذه الدوال:
+- التصريحات var/let/const والدوال (بما فيها الدوال السهمية البسيطة) والإغلاق (closures)
+- if / for / for-in / while / do-while / switch / try-catch-finally / throw / break / continue
+- المصفوفات والنصوص والكائنات البسيطة مع أشهر دوالها (splice و push و split و charCodeAt ...)
+- String.fromCharCode و Math و parseInt وتعابير regex البسيطة
+
+لا يوجد DOM ولا Date ولا Promise. أي شيء غير مدعوم يرفع JSError حتى يتراجع
+المستدعي إلى السلوك الآمن (استخدام الرابط بدون تحويل).
+"""
+import math
+import re
+from typing import Callable, Dict, List, Optional, Tuple
+
+MAX_STEPS = 2_000_000  # حد العمليات لكل استدعاء حتى لا تعلق حلقة لا نهائية البوت
+
+
+class JSError(Exception):
+    """خطأ في تحليل الكود أو ميزة غير مدعومة أو تجاوز حد العمليات"""
+
+
+class _Undefined:
+    __slots__ = ()
+
+    def __repr__(self):
+        return 'undefined'
+
+    def __bool__(self):
+        return False
+
+
+UNDEFINED = _Undefined()
+NULL = None
+
+
+class JSThrow(Exception):
+    """استثناء JavaScript (throw أو خطأ تشغيل) يمكن للكود التقاطه بـ catch"""
+
+    def __init__(self, value):
+        super().__init__(value)
+        self.value = value
+
+
+class _Break(Exception):
+    def __init__(self, label=None):
+        self.label = label
+
+
+class _Continue(Exception):
+    def __init__(self, label=None):
+        self.label = label
+
+
+class _Return(Exception):
+    def __init__(self, value):
+        self.value = value
+
+
+def _js_error(name: str, message: str) -> JSThrow:
+    return JSThrow({'name': name, 'message': message})
+
+
+# ---------------------------------------------------------------- التحليل اللفظي
+
+_KEYWORDS_BEFORE_REGEX = {
+    'return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'new', 'delete', 'void', 'throw', 'instanceof',
+}
+_PUNCTUATORS = [
+    '>>>=', '...', '===', '!==', '**=', '<<=', '>>=', '>>>',
+    '=>', '==', '!=', '<=', '>=', '&&', '||', '??', '?.', '++', '--', '+=', '-=', '*=', '/=', '%=',
+    '&=', '|=', '^=', '<<', '>>', '**',
+    '{', '}', '(', ')', '[', ']', ';', ',', '<', '>', '+', '-', '*', '/', '%', '&', '|', '^',
+    '!', '~', '?', ':', '=', '.',
+]
+_TOKEN_RE = re.compile(
+    r'(?P<ws>(?:\s+|//[^\n]*|/\*.*?\*/)+)'
+    r'|(?P<num>0[xX][0-9a-fA-F]+|(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)'
+    r'|(?P<str>"(?:[^"\\\n]|\\.)*"|\'(?:[^\'\\\n]|\\.)*\')'
+    r'|(?P<tpl>`(?:[^`\\$]|\\.|\$(?!\{))*`)'
+    r'|(?P<name>[A-Za-z_$][\w$]*)'
+    r'|(?P<punc>' + '|'.join(re.escape(p) for p in _PUNCTUATORS) + ')',
+    re.DOTALL,
+)
+_REGEX_RE = re.compile(r'/((?:[^/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+)/([a-z]*)')
+_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0'}
+
+
+def _unescape(body: str) -> str:
+    if '\\' not in body:
+        return body
+    out = []
+    i = 0
+    while i < len(body):
+        ch = body[i]
+        if ch != '\\':
+            out.append(ch)
+            i += 1
+            continue
+        nxt = body[i + 1]
+        if nxt == 'x':
+            out.append(chr(int(body[i + 2:i + 4], 16)))
+            i += 4
+        elif nxt == 'u':
+            if body[i + 2] == '{':
+                end = body.index('}', i)
+                out.append(chr(int(body[i + 3:end], 16)))
+                i = end + 1
+            else:
+                out.append(chr(int(body[i + 2:i + 6], 16)))
+                i += 6
+        elif nxt == '\n':
+            i += 2
+        else:
+            out.append(_ESCAPES.get(nxt, nxt))
+            i += 2
+    return ''.join(out)
+
+
+class _Lexer:
+    """محلل لفظي كسول: يقرأ الرموز عند الحاجة فقط حتى يمكن تحليل جزء من ملف كبير"""
+
+    def __init__(self, code: str, pos: int = 0):
+        self.code = code
+        self.pos = pos
+        self.prev: Optional[Tuple[str, object, int, int]] = None
+
+    def _regex_allowed(self) -> bool:
+        prev = self.prev
+        if prev is None:
+            return True
+        kind, value = prev[0], prev[1]
+        if kind in ('num', 'str', 'regex', 'tpl'):
+            return False
+        if kind == 'name':
+            return value in _KEYWORDS_BEFORE_REGEX
+        return value not in (')', ']', '}')
+
+    def next(self) -> Tuple[str, object, int, int]:
+        """يرجع (النوع، القيمة، البداية، النهاية)"""
+        code = self.code
+        while True:
+            if self.pos >= len(code):
+                token = ('eof', None, self.pos, self.pos)
+                self.prev = token
+                return token
+            if code[self.pos] == '/' and self._regex_allowed():
+                match = _REGEX_RE.match(code, self.pos)
+                if match:
+                    token = ('regex', (match.group(1), match.group(2)), match.start(), match.end())
+                    self.pos = match.end()
+                    self.prev = token
+                    return token
+            match = _TOKEN_RE.match(code, self.pos)
+            if not match:
+                raise JSError(f"رمز غير متوقع عند {self.pos}: {code[self.pos:self.pos + 20]!r}")
+            self.pos = match.end()
+            kind = match.lastgroup
+            if kind == 'ws':
+                continue
+            text = match.group()
+            if kind == 'num':
+                value = int(text, 16) if text[:2] in ('0x', '0X') else _parse_number_literal(text)
+            elif kind in ('str', 'tpl'):
+                value = _unescape(text[1:-1])
+                kind = 'str'
+            else:
+                value = text
+            token = (kind, value, match.start(), match.end())
+            self.prev = token
+            return token
+
+
+def _parse_number_literal(text: str):
+    if re.fullmatch(r'\d+', text):
+        return int(text)
+    value = float(text)
+    return int(value) if value.is_integer() and abs(value) < 2 ** 53 else value
+
+
+# ---------------------------------------------------------------- التحليل النحوي
+
+_BINARY_PRECEDENCE = {
+    '??': 1, '||': 2, '&&': 3, '|': 4, '^': 5, '&': 6,
+    '==': 7, '!=': 7, '===': 7, '!==': 7,
+    '<': 8, '>': 8, '<=': 8, '>=': 8, 'instanceof': 8, 'in': 8,
+    '<<': 9, '>>': 9, '>>>': 9,
+    '+': 10, '-': 10,
+    '*': 11, '/': 11, '%': 11,
+    '**': 12,
+}
+_ASSIGN_OPS = {'=', '+=', '-=', '*=', '/=', '%=', '**=', '<<=', '>>=', '>>>=', '&=', '|=', '^='}
+
+
+class _Parser:
+    def __init__(self, code: str, pos: int = 0):
+        self.lexer = _Lexer(code, pos)
+        self.buffer: List[Tuple[str, object, int, int]] = []
+        self.last_end = pos
+        self.no_in = False
+
+    # --- أدوات الرموز
+    def peek(self, offset: int = 0):
+        while len(self.buffer) <= offset:
+            self.buffer.append(self.lexer.next())
+        return self.buffer[offset]
+
+    def advance(self):
+        token = self.peek()
+        self.buffer.pop(0)
+        self.last_end = token[3]
+        return token
+
+    def at(self, value, offset: int = 0) -> bool:
+        token = self.peek(offset)
+        return token[0] in ('punc', 'name') and token[1] == value
+
+    def accept(self, value) -> bool:
+        if self.at(value):
+            self.advance()
+            return True
+        return False
+
+    def expect(self, value):
+        token = self.advance()
+        if token[0] not in ('punc', 'name') or token[1] != value:
+            raise JSError(f"متوقع {value!r} عند {token[2]} ووجد {token[1]!r}")
+        return token
+
+    def expect_name(self) -> str:
+        token = self.advance()
+        if token[0] != 'name':
+            raise JSError(f"متوقع اسم عند {token[2]} ووجد {token[1]!r}")
+        return token[1]
+
+    def end_statement(self):
+        self.accept(';')
+
+    # --- الجمل
+    def parse_program(self) -> List:
+        body = []
+        while self.peek()[0] != 'eof':
+            body.append(self.parse_statement())
+        return body
+
+    def parse_block(self) -> List:
+        self.expect('{')
+        body = []
+        while not self.at('}'):
+            body.append(self.parse_statement())
+        self.expect('}')
+        return body
+
+    def parse_statement(self):
+        token = self.peek()
+        kind, value = token[0], token[1]
+        if kind == 'punc':
+            if value == '{':
+                return ('block', self.parse_block())
+            if value == ';':
+                self.advance()
+                return ('empty',)
+        if kind == 'name':
+            if value in ('var', 'let', 'const'):
+                node = self.parse_var()
+                self.end_statement()
+                return node
+            if value == 'function':
+                self.advance()
+                name = self.expect_name()
+                return ('func_decl', name, self.parse_function_rest(name))
+            if value == 'return':
+                self.advance()
+                arg = None
+                if not self.at(';') and not self.at('}') and self.peek()[0] != 'eof':
+                    arg = self.parse_expression()
+                self.end_statement()
+                return ('return', arg)
+            if value == 'if':
+                self.advance()
+                self.expect('(')
+                test = self.parse_expression()
+                self.expect(')')
+                consequent = self.parse_statement()
+                alternate = self.parse_statement() if self.accept('else') else None
+                return ('if', test, consequent, alternate)
+            if value == 'for':
+                return self.parse_for()
+            if value == 'while':
+                self.advance()
+                self.expect('(')
+                test = self.parse_expression()
+                self.expect(')')
+                return ('while', test, self.parse_statement())
+            if value == 'do':
+                self.advance()
+                body = self.parse_statement()
+                self.expect('while')
+                self.expect('(')
+                test = self.parse_expression()
+                self.expect(')')
+                self.end_statement()
+                return ('do', body, test)
+            if value in ('break', 'continue'):
+                self.advance()
+                label = None
+                if self.peek()[0] == 'name' and self.peek()[1] not in ('case', 'default'):
+                    label = self.advance()[1]
+                self.end_statement()
+                return (value, label)
+            if value == 'switch':
+                return self.parse_switch()
+            if value == 'try':
+                return self.parse_try()
+            if value == 'throw':
+                self.advance()
+                arg = self.parse_expression()
+                self.end_statement()
+                return ('throw', arg)
+            if self.at(':', 1):
+                self.advance()
+                self.advance()
+                return ('labeled', value, self.parse_statement())
+        expr = self.parse_expression()
+        self.end_statement()
+        return ('expr', expr)
+
+    def parse_var(self):
+        self.advance()
+        declarations = []
+        while True:
+            name = self.expect_name()
+            init = self.parse_assignment() if self.accept('=') else None
+            declarations.append((name, init))
+            if not self.accept(','):
+                break
+        return ('var', declarations)
+
+    def parse_for(self):
+        self.expect('for')
+        self.expect('(')
+        init = None
+        if not self.at(';'):
+            self.no_in = True
+            if self.at('var') or self.at('let') or self.at('const'):
+                init = self.parse_var()
+            else:
+                init = ('expr', self.parse_expression())
+            self.no_in = False
+            if self.at('in') or self.at('of'):
+                is_of = self.advance()[1] == 'of'
+                if init[0] == 'var':
+                    target = ('ident', init[1][0][0])
+                else:
+                    target = init[1]
+                obj = self.parse_expression()
+                self.expect(')')
+                return ('for_in', target, obj, self.parse_statement(), is_of)
+        self.expect(';')
+        test = None if self.at(';') else self.parse_expression()
+        self.expect(';')
+        update = None if self.at(')') else self.parse_expression()
+        self.expect(')')
+        return ('for', init, test, update, self.parse_statement())
+
+    def parse_switch(self):
+        self.expect('switch')
+        self.expect('(')
+        discriminant = self.parse_expression()
+        self.expect(')')
+        self.expect('{')
+        cases = []
+        while not self.accept('}'):
+            if self.accept('default'):
+                test = None
+            else:
+                self.expect('case')
+                test = self.parse_expression()
+            self.expect(':')
+            body = []
+            while not (self.at('case') or self.at('default') or self.at('}')):
+                body.append(self.parse_statement())
+            cases.append((test, body))
+        return ('switch', discriminant, cases)
+
+    def parse_try(self):
+        self.expect('try')
+        block = self.parse_block()
+        param = handler = finalizer = None
+        if self.accept('catch'):
+            if self.accept('('):
+                param = self.expect_name()
+                self.expect(')')
+            handler = self.parse_block()
+        if self.accept('finally'):
+            finalizer = self.parse_block()
+        return ('try', block, param, handler, finalizer)
+
+    def parse_function_rest(self, name: Optional[str]):
+        self.expect('(')
+        params = []
+        while not self.accept(')'):
+            params.append(self.expect_name())
+            if self.accept('='):
+                raise JSError("القيم الافتراضية للمعاملات غير مدعومة")
+            self.accept(',')
+        return ('function', name, params, self.parse_block())
+
+    # --- التعابير
+    def parse_expression(self):
+        expr = self.parse_assignment()
+        if self.at(','):
+            exprs = [expr]
+            while self.accept(','):
+                exprs.append(self.parse_assignment())
+            return ('seq', exprs)
+        return expr
+
+    def _arrow_ahead(self) -> bool:
+        """هل يبدأ هنا تعبير دالة سهمية: x => أو (a, b) =>"""
+        token = self.peek()
+        if token[0] == 'name' and self.at('=>', 1):
+            return True
+        if not self.at('('):
+            return False
+        depth = 0
+        offset = 0
+        while True:
+            token = self.peek(offset)
+            if token[0] == 'eof':
+                return False
+            if token[0] == 'punc' and token[1] == '(':
+                depth += 1
+            elif token[0] == 'punc' and token[1] == ')':
+                depth -= 1
+                if depth == 0:
+                    return self.at('=>', offset + 1)
+            offset += 1
+
+    def parse_arrow(self):
+        if self.at('('):
+            self.advance()
+            params = []
+            while not self.accept(')'):
+                params.append(self.expect_name())
+                self.accept(',')
+        else:
+            params = [self.expect_name()]
+        self.expect('=>')
+        if self.at('{'):
+            body = self.parse_block()
+        else:
+            body = [('return', self.parse_assignment())]
+        return ('function', None, params, body)
+
+    def parse_assignment(self):
+        if self._arrow_ahead():
+            return self.parse_arrow()
+        left = self.parse_conditional()
+        token = self.peek()
+        if token[0] == 'punc' and token[1] in _ASSIGN_OPS:
+            if left[0] not in ('ident', 'member'):
+                raise JSError(f"هدف إسناد غير صالح عند {token[2]}")
+            self.advance()
+            return ('assign', token[1], left, self.parse_assignment())
+        return left
+
+    def parse_conditional(self):
+        test = self.parse_binary(0)
+        if self.accept('?'):
+            no_in, self.no_in = self.no_in, False
+            consequent = self.parse_assignment()
+            self.no_in = no_in
+            self.expect(':')
+            return ('cond', test, consequent, self.parse_assignment())
+        return test
+
+    def parse_binary(self, min_precedence: int):
+        left = self.parse_unary()
+        while True:
+            token = self.peek()
+            op = token[1]
+            if token[0] not in ('punc', 'name') or op not in _BINARY_PRECEDENCE:
+                return left
+            if op == 'in' and self.no_in:
+                return left
+            precedence = _BINARY_PRECEDENCE[op]
+            if precedence <= min_precedence and not (op == '**' and precedence == min_precedence):
+                return left
+            self.advance()
+            right = self.parse_binary(precedence - 1 if op == '**' else precedence)
+            kind = 'logical' if op in ('&&', '||', '??') else 'binary'
+            left = (kind, op, left, right)
+
+    def parse_unary(self):
+        token = self.peek()
+        if token[0] in ('punc', 'name'):
+            op = token[1]
+            if op in ('!', '-', '+', '~') and token[0] == 'punc' or op in ('typeof', 'void', 'delete'):
+                self.advance()
+                return ('unary', op, self.parse_unary())
+            if op in ('++', '--') and token[0] == 'punc':
+                self.advance()
+                return ('update', op, True, self.parse_unary())
+        expr = self.parse_postfix()
+        if self.at('**'):
+            self.advance()
+            return ('binary', '**', expr, self.parse_unary())
+        return expr
+
+    def parse_postfix(self):
+        expr = self.parse_call()
+        token = self.peek()
+        if token[0] == 'punc' and token[1] in ('++', '--'):
+            self.advance()
+            return ('update', token[1], False, expr)
+        return expr
+
+    def parse_arguments(self) -> List:
+        args = []
+        while not self.accept(')'):
+            if self.accept('...'):
+                args.append(('spread', self.parse_assignment()))
+            else:
+                args.append(self.parse_assignment())
+            self.accept(',')
+        return args
+
+    def parse_call(self):
+        if self.accept('new'):
+            callee = self.parse_member_only()
+            args = self.parse_arguments() if self.accept('(') else []
+            expr = ('new', callee, args)
+        else:
+            expr = self.parse_primary()
+        return self.parse_suffixes(expr, allow_call=True)
+
+    def parse_member_only(self):
+        return self.parse_suffixes(self.parse_primary(), allow_call=False)
+
+    def parse_suffixes(self, expr, allow_call: bool):
+        while True:
+            if self.at('.') or self.at('?.'):
+                self.advance()
+                if self.at('('):
+                    self.advance()
+                    expr = ('call', expr, self.parse_arguments())
+                    continue
+                if self.at('['):
+                    continue
+                name_token = self.advance()
+                expr = ('member', expr, ('str', name_token[1]))
+            elif self.at('['):
+                self.advance()
+                no_in, self.no_in = self.no_in, False
+                prop = self.parse_expression()
+                self.no_in = no_in
+                self.expect(']')
+                expr = ('member', expr, prop)
+            elif allow_call and self.at('('):
+                self.advance()
+                expr = ('call', expr, self.parse_arguments())
+            else:
+                return expr
+
+    def parse_primary(self):
+        token = self.advance()
+        kind, value = token[0], token[1]
+        if kind == 'num':
+            return ('num', value)
+        if kind == 'str':
+            return ('str', value)
+        if kind == 'regex':
+            return ('regex', value[0], value[1])
+        if kind == 'name':
+            if value == 'function':
+                name = self.expect_name() if self.peek()[0] == 'name' else None
+                return self.parse_function_rest(name)
+            if value == 'true':
+                return ('const', True)
+            if value == 'false':
+                return ('const', False)
+            if value == 'null':
+                return ('const', NULL)
+            if value == 'this':
+                return ('this',)
+            return ('ident', value)
+        if kind == 'punc':
+            if value == '(':
+                no_in, self.no_in = self.no_in, False
+                expr = self.parse_expression()
+                self.no_in = no_in
+                self.expect(')')
+                return expr
+            if value == '[':
+                elements = []
+                while not self.accept(']'):
+                    if self.at(','):
+                        self.advance()
+                        elements.append(None)
+                        continue
+                    if self.accept('...'):
+                        elements.append(('spread', self.parse_assignment()))
+                    else:
+                        elements.append(self.parse_assignment())
+                    if not self.at(']'):
+                        self.expect(',')
+                return ('array', elements)
+            if value == '{':
+                properties = []
+                while not self.accept('}'):
+                    key_token = self.advance()
+                    if key_token[0] not in ('name', 'str', 'num'):
+                        raise JSError(f"مفتاح كائن غير مدعوم عند {key_token[2]}")
+                    key = _to_string(key_token[1])
+                    if self.at('('):
+                        value_node = self.parse_function_rest(key)
+                    elif self.accept(':'):
+                        value_node = self.parse_assignment()
+                    else:
+                        value_node = ('ident', key)
+                    properties.append((key, value_node))
+                    if not self.at('}'):
+                        self.expect(',')
+                return ('object', properties)
+        raise JSError(f"تعبير غير متوقع عند {token[2]}: {value!r}")
+
+
+def parse_expression_at(code: str, pos: int) -> Tuple[tuple, int]:
+    """تحليل تعبير واحد (إسناد أو أقل) يبدأ عند pos، ويرجع (الشجرة، موضع النهاية)"""
+    parser = _Parser(code, pos)
+    node = parser.parse_assignment()
+    return node, parser.last_end
+
+
+# ---------------------------------------------------------------- القيم والتحويلات
+
+class JSFunction:
+    __slots__ = ('name', 'params', 'body', 'scope', 'interpreter', 'props', 'hoisted')
+
+    def __init__(self, node, scope, interpreter):
+        _, self.name, self.params, self.body = node
+        self.scope = scope
+        self.interpreter = interpreter
+        self.props: Dict[str, object] = {}
+        self.hoisted = interpreter.hoist(node)
+
+    def __call__(self, this, args):
+        return self.interpreter.call_function(self, this, args)
+
+
+class NativeFunction:
+    __slots__ = ('name', 'fn', 'props')
+
+    def __init__(self, name: str, fn: Callable, props: Optional[Dict] = None):
+        self.name = name
+        self.fn = fn
+        self.props = props or {}
+
+    def __call__(self, this, args):
+        return self.fn(this, args)
+
+
+class JSRegExp:
+    __slots__ = ('source', 'flags', 'pattern')
+
+    def __init__(self, source: str, flags: str):
+        self.source = source
+        self.flags = flags
+        py_flags = (re.IGNORECASE if 'i' in flags else 0) | (re.MULTILINE if 'm' in flags else 0)
+        try:
+            self.pattern = re.compile(source.replace('(?<', '(?P<') if '(?<' in source and '(?<=' not in source
+                                      and '(?<!' not in source else source, py_flags)
+        except re.error as e:
+            raise JSError(f"تعبير regex غير مدعوم: /{source}/ ({e})")
+
+
+def _is_callable(value) -> bool:
+    return isinstance(value, (JSFunction, NativeFunction))
+
+
+def _typeof(value) -> str:
+    if value is UNDEFINED:
+        return 'undefined'
+    if value is NULL:
+        return 'object'
+    if isinstance(value, bool):
+        return 'boolean'
+    if isinstance(value, (int, float)):
+        return 'number'
+    if isinstance(value, str):
+        return 'string'
+    if _is_callable(value):
+        return 'function'
+    return 'object'
+
+
+def _number_to_string(value) -> str:
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, int):
+        return str(value)
+    if math.isnan(value):
+        return 'NaN'
+    if math.isinf(value):
+        return 'Infinity' if value > 0 else '-Infinity'
+    if value.is_integer() and abs(value) < 1e21:
+        return str(int(value))
+    text = repr(value)
+    if 'e' in text:
+        mantissa, exponent = text.split('e')
+        exponent = int(exponent)
+        text = f"{mantissa}e{'+' if exponent > 0 else '-'}{abs(exponent)}"
+    return text
+
+
+def _to_string(value) -> str:
+    if isinstance(value, str):
+        return value
+    if value is UNDEFINED:
+        return 'undefined'
+    if value is NULL:
+        return 'null'
+    if isinstance(value, (bool, int, float)):
+        return _number_to_string(value)
+    if isinstance(value, list):
+        return ','.join('' if item is UNDEFINED or item is NULL else _to_string(item) for item in value)
+    if isinstance(value, JSRegExp):
+        return f'/{value.source}/{value.flags}'
+    if _is_callable(value):
+        return f'function {value.name or ""}() {{ [native code] }}'
+    if isinstance(value, dict) and 'name' in value and 'message' in value:
+        return f"{_to_string(value['name'])}: {_to_string(value['message'])}"
+    return '[object Object]'
+
+
+def _to_number(value):
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, (int, float)):
+        return value
+    if value is UNDEFINED:
+        return math.nan
+    if value is NULL:
+        return 0
+    if isinstance(value, str):
+        text = value.strip()
+        if not text:
+            return 0
+        try:
+            if text[:2] in ('0x', '0X'):
+                return int(text, 16)
+            return _parse_number_literal(text.lstrip('+')) if re.fullmatch(r'[+]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?', text) \
+                else -_to_number(text[1:]) if text.startswith('-') and len(text) > 1 and text[1] != '-' \
+                else float(text.replace('Infinity', 'inf')) if 'Infinity' in text else math.nan
+        except ValueError:
+            return math.nan
+    if isinstance(value, list):
+        return _to_number(_to_string(value))
+    return math.nan
+
+
+def _to_boolean(value) -> bool:
+    if isinstance(value, bool):
+        return value
+    if value is UNDEFINED or value is NULL:
+        return False
+    if isinstance(value, (int, float)):
+        return not (value == 0 or (isinstance(value, float) and math.isnan(value)))
+    if isinstance(value, str):
+        return bool(value)
+    return True
+
+
+def _to_int32(value) -> int:
+    number = _to_number(value)
+    if isinstance(number, float):
+        if math.isnan(number) or math.isinf(number):
+            return 0
+        number = int(number)
+    number &= 0xFFFFFFFF
+    return number - 0x100000000 if number & 0x80000000 else number
+
+
+def _to_uint32(value) -> int:
+    return _to_int32(value) & 0xFFFFFFFF
+
+
+def _normalize_number(value):
+    if isinstance(value, float) and value.is_integer() and abs(value) < 2 ** 53:
+        return int(value)
+    return value
+
+
+def _to_primitive(value):
+    if isinstance(value, (list, dict, JSRegExp)) or _is_callable(value):
+        return _to_string(value)
+    return value
+
+
+def _strict_equals(a, b) -> bool:
+    if isinstance(a, bool) or isinstance(b, bool):
+        return isinstance(a, bool) and isinstance(b, bool) and a == b
+    if isinstance(a, (int, float)) and isinstance(b, (int, float)):
+        return a == b
+    if isinstance(a, str) and isinstance(b, str):
+        return a == b
+    return a is b
+
+
+def _loose_equals(a, b) -> bool:
+    if (a is UNDEFINED or a is NULL) and (b is UNDEFINED or b is NULL):
+        return True
+    if a is UNDEFINED or a is NULL or b is UNDEFINED or b is NULL:
+        return False
+    if type(a) is type(b) or (isinstance(a, (int, float)) and isinstance(b, (int, float))
+                              and not isinstance(a, bool) and not isinstance(b, bool)):
+        return _strict_equals(a, b)
+    a, b = _to_primitive(a), _to_primitive(b)
+    if isinstance(a, str) and isinstance(b, str):
+        return a == b
+    return _to_number(a) == _to_number(b)
+
+
+def _to_index(value) -> Optional[int]:
+    """تحويل مفتاح خاصية إلى فهرس مصفوفة صالح أو None"""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value if value >= 0 else None
+    if isinstance(value, float):
+        return int(value) if value.is_integer() and value >= 0 else None
+    if isinstance(value, str) and value.isdigit() and (value == '0' or not value.startswith('0')):
+        return int(value)
+    return None
+
+
+def _relative_index(value, length: int, default: int) -> int:
+    if value is UNDEFINED:
+        return default
+    number = _to_number(value)
+    if isinstance(number, float):
+        if math.isnan(number):
+            return 0
+        if math.isinf(number):
+            return length if number > 0 else 0
+        number = int(number)
+    return max(0, length + number) if number < 0 else min(number, length)
+
+
+# ---------------------------------------------------------------- الدوال المدمجة
+
+def _array_method(name: str, arr: list):
+    def splice(this, args):
+        start = _relative_index(args[0] if args else UNDEFINED, len(arr), 0)
+        if len(args) < 2:
+            delete_count = len(arr) - start
+        else:
+            delete_count = max(0, min(_to_int32(args[1]), len(arr) - start))
+        removed = arr[start:start + delete_count]
+        arr[start:start + delete_count] = list(args[2:])
+        return removed
+
+    def join(this, args):
+        sep = ',' if not args or args[0] is UNDEFINED else _to_string(args[0])
+        return sep.join('' if item is UNDEFINED or item is NULL else _to_string(item) for item in arr)
+
+    def index_of(this, args):
+        target = args[0] if args else UNDEFINED
+        start = _relative_index(args[1], len(arr), 0) if len(args) > 1 else 0
+        for i in range(start, len(arr)):
+            if _strict_equals(arr[i], target):
+                return i
+        return -1
+
+    def slice_(this, args):
+        start = _relative_index(args[0] if args else UNDEFINED, len(arr), 0)
+        end = _relative_index(args[1] if len(args) > 1 else UNDEFINED, len(arr), len(arr))
+        return arr[start:end]
+
+    def concat(this, args):
+        result = list(arr)
+        for arg in args:
+            result.extend(arg if isinstance(arg, list) else [arg])
+        return result
+
+    def iterate(kind):
+        def run(this, args):
+            fn = args[0] if args else UNDEFINED
+            if not _is_callable(fn):
+                raise _js_error('TypeError', f"{_to_string(fn)} is not a function")
+            this_arg = args[1] if len(args) > 1 else UNDEFINED
+            results = []
+            for i in range(len(arr)):
+                if i >= len(arr):
+                    break
+                value = fn(this_arg, [arr[i], i, arr])
+                if kind == 'map':
+                    results.append(value)
+                elif kind == 'filter' and _to_boolean(value):
+                    results.append(arr[i])
+                elif kind == 'some' and _to_boolean(value):
+                    return True
+                elif kind == 'every' and not _to_boolean(value):
+                    return False
+            if kind in ('map', 'filter'):
+                return results
+            if kind == 'some':
+                return False
+            if kind == 'every':
+                return True
+            return UNDEFINED
+        return run
+
+    def push(this, args):
+        arr.extend(args)
+        return len(arr)
+
+    def unshift(this, args):
+        arr[0:0] = args
+        return len(arr)
+
+    def reverse(this, args):
+        arr.reverse()
+        return arr
+
+    methods = {
+        'push': push,
+        'pop': lambda this, args: arr.pop() if arr else UNDEFINED,
+        'shift': lambda this, args: arr.pop(0) if arr else UNDEFINED,
+        'unshift': unshift,
+        'splice': splice,
+        'slice': slice_,
+        'reverse': reverse,
+        'join': join,
+        'toString': lambda this, args: join(this, []),
+        'indexOf': index_of,
+        'includes': lambda this, args: index_of(this, args) != -1,
+        'concat': concat,
+        'forEach': iterate('forEach'),
+        'map': iterate('map'),
+        'filter': iterate('filter'),
+        'some': iterate('some'),
+        'every': iterate('every'),
+    }
+    fn = methods.get(name)
+    return NativeFunction(name, fn) if fn else UNDEFINED
+
+
+def _string_method(name: str, text: str):
+    def split(this, args):
+        sep = args[0] if args else UNDEFINED
+        if sep is UNDEFINED:
+            parts = [text]
+        elif isinstance(sep, JSRegExp):
+            parts = sep.pattern.split(text) if sep.source else list(text)
+            parts = [UNDEFINED if part is None else part for part in parts]
+        else:
+            sep = _to_string(sep)
+            parts = list(text) if sep == '' else text.split(sep)
+        if len(args) > 1 and args[1] is not UNDEFINED:
+            parts = parts[:_to_uint32(args[1])]
+        return parts
+
+    def char_code_at(this, args):
+        index = _to_number(args[0]) if args else 0
+        index = 0 if isinstance(index, float) and math.isnan(index) else int(index)
+        return ord(text[index]) if 0 <= index < len(text) else math.nan
+
+    def char_at(this, args):
+        index = _to_number(args[0]) if args else 0
+        index = 0 if isinstance(index, float) and math.isnan(index) else int(index)
+        return text[index] if 0 <= index < len(text) else ''
+
+    def index_of(this, args):
+        start = min(max(int(_to_number(args[1])), 0), len(text)) if len(args) > 1 and args[1] is not UNDEFINED else 0
+        return text.find(_to_string(args[0] if args else UNDEFINED), start)
+
+    def slice_(this, args):
+        start = _relative_index(args[0] if args else UNDEFINED, len(text), 0)
+        end = _relative_index(args[1] if len(args) > 1 else UNDEFINED, len(text), len(text))
+        return text[start:end]
+
+    def substring(this, args):
+        def clamp(value, default):
+            if value is UNDEFINED:
+                return default
+            number = _to_number(value)
+            if isinstance(number, float) and math.isnan(number):
+                return 0
+            return min(max(int(number) if not math.isinf(number) else (len(text) if number > 0 else 0), 0), len(text))
+        start = clamp(args[0] if args else UNDEFINED, 0)
+        end = clamp(args[1] if len(args) > 1 else UNDEFINED, len(text))
+        return text[min(start, end):max(start, end)]
+
+    def substr(this, args):
+        start = _relative_index(args[0] if args else UNDEFINED, len(text), 0)
+        length = len(text) - start if len(args) < 2 or args[1] is UNDEFINED else max(0, int(_to_number(args[1])))
+        return text[start:start + length]
+
+    def replace(this, args):
+        pattern = args[0] if args else UNDEFINED
+        replacement = args[1] if len(args) > 1 else UNDEFINED
+
+        def substitute(match_text, groups, offset):
+            if _is_callable(replacement):
+                return _to_string(replacement(UNDEFINED, [match_text, *groups, offset, text]))
+            result = _to_string(replacement)
+            return result.replace('$&', match_text)
+
+        if isinstance(pattern, JSRegExp):
+            count = 0 if 'g' in pattern.flags else 1
+            return pattern.pattern.sub(
+                lambda m: substitute(m.group(), [UNDEFINED if g is None else g for g in m.groups()], m.start()),
+                text, count=count)
+        pattern = _to_string(pattern)
+        index = text.find(pattern)
+        if index < 0:
+            return text
+        return text[:index] + substitute(pattern, [], index) + text[index + len(pattern):]
+
+    methods = {
+        'split': split,
+        'charCodeAt': char_code_at,
+        'codePointAt': char_code_at,
+        'charAt': char_at,
+        'indexOf': index_of,
+        'lastIndexOf': lambda this, args: text.rfind(_to_string(args[0] if args else UNDEFINED)),
+        'includes': lambda this, args: _to_string(args[0] if args else UNDEFINED) in text,
+        'startsWith': lambda this, args: text.startswith(_to_string(args[0] if args else UNDEFINED)),
+        'endsWith': lambda this, args: text.endswith(_to_string(args[0] if args else UNDEFINED)),
+        'slice': slice_,
+        'substring': substring,
+        'substr': substr,
+        'concat': lambda this, args: text + ''.join(_to_string(arg) for arg in args),
+        'replace': replace,
+        'toUpperCase': lambda this, args: text.upper(),
+        'toLowerCase': lambda this, args: text.lower(),
+        'trim': lambda this, args: text.strip(),
+        'repeat': lambda this, args: text * int(_to_number(args[0] if args else 0)),
+        'toString': lambda this, args: text,
+        'valueOf': lambda this, args: text,
+    }
+    fn = methods.get(name)
+    return NativeFunction(name, fn) if fn else UNDEFINED
+
+
+def _parse_int(this, args):
+    text = _to_string(args[0] if args else UNDEFINED).strip()
+    radix = _to_int32(args[1]) if len(args) > 1 and args[1] is not UNDEFINED else 10
+    sign = -1 if text.startswith('-') else 1
+    text = text.lstrip('+-')
+    if radix in (0, 16) and text[:2].lower() == '0x':
+        text, radix = text[2:], 16
+    radix = radix or 10
+    digits = '0123456789abcdefghijklmnopqrstuvwxyz'[:radix]
+    end = 0
+    while end < len(text) and text[end].lower() in digits:
+        end += 1
+    return sign * int(text[:end], radix) if end else math.nan
+
+
+def _make_globals() -> Dict[str, object]:
+    def from_char_code(this, args):
+        return ''.join(chr(_to_uint32(arg) & 0xFFFF) for arg in args)
+
+    def math_fn(fn):
+        return lambda this, args: _normalize_number(fn(*[_to_number(arg) for arg in args]))
+
+    def make_array(this, args):
+        if len(args) == 1 and isinstance(args[0], (int, float)) and not isinstance(args[0], bool):
+            return [UNDEFINED] * int(args[0])
+        return list(args)
+
+    string = NativeFunction('String', lambda this, args: _to_string(args[0]) if args else '',
+                            {'fromCharCode': NativeFunction('fromCharCode', from_char_code)})
+    math_obj = {
+        'floor': NativeFunction('floor', math_fn(math.floor)),
+        'ceil': NativeFunction('ceil', math_fn(math.ceil)),
+        'abs': NativeFunction('abs', math_fn(abs)),
+        'round': NativeFunction('round', math_fn(lambda x: math.floor(x + 0.5))),
+        'pow': NativeFunction('pow', math_fn(lambda x, y: x ** y)),
+        'max': NativeFunction('max', math_fn(lambda *xs: max(xs) if xs else -math.inf)),
+        'min': NativeFunction('min', math_fn(lambda *xs: min(xs) if xs else math.inf)),
+        'PI': math.pi,
+    }
+    return {
+        'undefined': UNDEFINED,
+        'NaN': math.nan,
+        'Infinity': math.inf,
+        'String': string,
+        'Math': math_obj,
+        'Array': NativeFunction('Array', make_array),
+        'Number': NativeFunction('Number', lambda this, args: _to_number(args[0]) if args else 0),
+        'Boolean': NativeFunction('Boolean', lambda this, args: _to_boolean(args[0]) if args else False),
+        'parseInt': NativeFunction('parseInt', _parse_int),
+        'isNaN': NativeFunction('isNaN', lambda this, args: math.isnan(_to_number(args[0]) if args else math.nan)),
+    }
+
+
+# ---------------------------------------------------------------- التنفيذ
+
+class _Scope:
+    __slots__ = ('vars', 'parent')
+
+    def __init__(self, parent: Optional['_Scope'] = None, variables: Optional[Dict] = None):
+        self.vars = variables if variables is not None else {}
+        self.parent = parent
+
+    def find(self, name: str) -> Optional['_Scope']:
+        scope = self
+        while scope is not None:
+            if name in scope.vars:
+                return scope
+            scope = scope.parent
+        return None
+
+
+_MISSING = object()
+
+
+class JSInterpreter:
+    """تنفيذ كود JavaScript مصغر
+
+    global_resolver (اختياري) يستدعى عند قراءة اسم غير معرف، ويرجع قيمة JavaScript
+    أو يرفع KeyError. يستخدم لتحميل المتغيرات العامة من ملف المشغل عند الحاجة فقط.
+    """
+
+    def __init__(self, global_resolver: Optional[Callable[[str], object]] = None, max_steps: int = MAX_STEPS):
+        self.globals = _Scope(variables=_make_globals())
+        self.global_resolver = global_resolver
+        self.max_steps = max_steps
+        self.steps = 0
+        self._hoist_cache: Dict[int, Tuple[List[str], List]] = {}
+
+    # --- واجهة الاستخدام
+    def evaluate(self, code: str):
+        """تنفيذ برنامج كامل وإرجاع قيمة آخر تعبير"""
+        body = _Parser(code).parse_program()
+        result = UNDEFINED
+        self.steps = 0
+        self._declare_hoisted(body, self.globals)
+        for statement in body:
+            if statement[0] == 'expr':
+                result = self.eval_expr(statement[1], self.globals)
+            else:
+                self.exec_stmt(statement, self.globals)
+        return result
+
+    def evaluate_expression(self, source: str):
+        """حساب تعبير واحد في النطاق العام (لا يعيد تصفير عداد العمليات)"""
+        node, _ = parse_expression_at(source, 0)
+        return self.eval_expr(node, self.globals)
+
+    def compile_function(self, source: str) -> JSFunction:
+        """تحويل نص دالة (function(a){...}) إلى دالة قابلة للاستدعاء"""
+        node, end = parse_expression_at(source, 0)
+        if node[0] != 'function':
+            raise JSError("النص ليس دالة")
+        return JSFunction(node, self.globals, self)
+
+    def define_global(self, name: str, value):
+        self.globals.vars[name] = value
+
+    def call(self, fn, *args):
+        """استدعاء دالة JavaScript بقيم بايثون (str/int/list ...)"""
+        self.steps = 0
+        try:
+            return fn(UNDEFINED, list(args))
+        except JSThrow as e:
+            raise JSError(f"استثناء غير معالج: {_to_string(e.value)}")
+        except RecursionError:
+            raise JSError("تجاوز عمق الاستدعاء")
+
+    # --- الرفع (hoisting)
+    def hoist(self, function_node) -> Tuple[List[str], List]:
+        key = id(function_node)
+        cached = self._hoist_cache.get(key)
+        if cached is None:
+            names: List[str] = []
+            functions: List = []
+            self._collect_hoisted(function_node[3], names, functions)
+            cached = (names, functions)
+            self._hoist_cache[key] = cached
+        return cached
+
+    def _collect_hoisted(self, statements, names, functions):
+        for statement in statements:
+            if statement is None:
+                continue
+            kind = statement[0]
+            if kind == 'var':
+                names.extend(name for name, _ in statement[1])
+            elif kind == 'func_decl':
+                functions.append(statement)
+            elif kind == 'block':
+                self._collect_hoisted(statement[1], names, functions)
+            elif kind == 'if':
+                self._collect_hoisted([statement[2], statement[3]], names, functions)
+            elif kind == 'for':
+                self._collect_hoisted([statement[1], statement[4]], names, functions)
+            elif kind == 'for_in':
+                if statement[1][0] == 'ident':
+                    names.append(statement[1][1])
+                self._collect_hoisted([statement[3]], names, functions)
+            elif kind in ('while',):
+                self._collect_hoisted([statement[2]], names, functions)
+            elif kind == 'do':
+                self._collect_hoisted([statement[1]], names, functions)
+            elif kind == 'labeled':
+                self._collect_hoisted([statement[2]], names, functions)
+            elif kind == 'switch':
+                for _, body in statement[2]:
+                    self._collect_hoisted(body, names, functions)
+            elif kind == 'try':
+                for block in (statement[1], statement[3], statement[4]):
+                    if block:
+                        self._collect_hoisted(block, names, functions)
+
+    def _declare_hoisted(self, body, scope: _Scope):
+        names: List[str] = []
+        functions: List = []
+        self._collect_hoisted(body, names, functions)
+        for name in names:
+            scope.vars.setdefault(name, UNDEFINED)
+        for _, name, node in functions:
+            scope.vars[name] = JSFunction(node, scope, self)
+
+    def call_function(self, fn: JSFunction, this, args):
+        variables = {'this': this, 'arguments': list(args)}
+        names, functions = fn.hoisted
+        for name in names:
+            variables[name] = UNDEFINED
+        for i, param in enumerate(fn.params):
+            variables[param] = args[i] if i < len(args) else UNDEFINED
+        scope = _Scope(fn.scope, variables)
+        for _, name, node in functions:
+            variables[name] = JSFunction(node, scope, self)
+        try:
+            for statement in fn.body:
+                self.exec_stmt(statement, scope)
+        except _Return as r:
+            return r.value
+        return UNDEFINED
+
+    # --- الجمل
+    def exec_block(self, statements, scope):
+        for statement in statements:
+            self.exec_stmt(statement, scope)
+
+    def exec_stmt(self, node, scope, labels=()):
+        self.steps += 1
+        if self.steps > self.max_steps:
+            raise JSError("تجاوز حد العمليات المسموح")
+        kind = node[0]
+        if kind == 'expr':
+            self.eval_expr(node[1], scope)
+        elif kind == 'var':
+            for name, init in node[1]:
+                if init is not None:
+                    target = scope.find(name) or scope
+                    target.vars[name] = self.eval_expr(init, scope)
+                elif scope.find(name) is None:
+                    scope.vars[name] = UNDEFINED
+        elif kind == 'return':
+            raise _Return(UNDEFINED if node[1] is None else self.eval_expr(node[1], scope))
+        elif kind == 'if':
+            if _to_boolean(self.eval_expr(node[1], scope)):
+                self.exec_stmt(node[2], scope)
+            elif node[3] is not None:
+                self.exec_stmt(node[3], scope)
+        elif kind == 'block':
+            self.exec_block(node[1], scope)
+        elif kind == 'for':
+            self.exec_for(node, scope, labels)
+        elif kind in ('while', 'do'):
+            self.exec_while(node, scope, labels)
+        elif kind == 'for_in':
+            self.exec_for_in(node, scope, labels)
+        elif kind == 'switch':
+            self.exec_switch(node, scope, labels)
+        elif kind == 'try':
+            self.exec_try(node, scope)
+        elif kind == 'break':
+            raise _Break(node[1])
+        elif kind == 'continue':
+            raise _Continue(node[1])
+        elif kind == 'throw':
+            raise JSThrow(self.eval_expr(node[1], scope))
+        elif kind == 'labeled':
+            try:
+                self.exec_stmt(node[2], scope, labels + (node[1],))
+            except _Break as b:
+                if b.label != node[1]:
+                    raise
+        elif kind == 'func_decl':
+            pass  # معرفة مسبقاً بالرفع
+        elif kind == 'empty':
+            pass
+        else:
+            raise JSError(f"جملة غير مدعومة: {kind}")
+
+    def _loop_body(self, body, scope, labels) -> bool:
+        """تنفيذ جسم الحلقة، ويرجع False إذا طلب break"""
+        try:
+            self.exec_stmt(body, scope)
+        except _Break as b:
+            if b.label is None or b.label in labels:
+                return False
+            raise
+        except _Continue as c:
+            if c.label is not None and c.label not in labels:
+                raise
+        return True
+
+    def exec_for(self, node, scope, labels):
+        _, init, test, update, body = node
+        if init is not None:
+            self.exec_stmt(init, scope)
+        while test is None or _to_boolean(self.eval_expr(test, scope)):
+            if not self._loop_body(body, scope, labels):
+                break
+            if update is not None:
+                self.eval_expr(update, scope)
+
+    def exec_while(self, node, scope, labels):
+        if node[0] == 'while':
+            _, test, body = node
+            while _to_boolean(self.eval_expr(test, scope)):
+                if not self._loop_body(body, scope, labels):
+                    break
+        else:
+            _, body, test = node
+            while True:
+                if not self._loop_body(body, scope, labels):
+                    break
+                if not _to_boolean(self.eval_expr(test, scope)):
+                    break
+
+    def exec_for_in(self, node, scope, labels):
+        _, target, obj_node, body, is_of = node
+        obj = self.eval_expr(obj_node, scope)
+        if isinstance(obj, list):
+            keys = list(obj) if is_of else [str(i) for i in range(len(obj))]
+        elif isinstance(obj, str):
+            keys = list(obj) if is_of else [str(i) for i in range(len(obj))]
+        elif isinstance(obj, dict):
+            if is_of:
+                raise _js_error('TypeError', 'object is not iterable')
+            keys = list(obj)
+        else:
+            keys = []
+        for key in keys:
+            self.assign(target, key, scope)
+            if not self._loop_body(body, scope, labels):
+                break
+
+    def exec_switch(self, node, scope, labels):
+        _, discriminant_node, cases = node
+        discriminant = self.eval_expr(discriminant_node, scope)
+        start = None
+        for i, (test, _) in enumerate(cases):
+            if test is not None and _strict_equals(self.eval_expr(test, scope), discriminant):
+                start = i
+                break
+        if start is None:
+            start = next((i for i, (test, _) in enumerate(cases) if test is None), None)
+        if start is None:
+            return
+        try:
+            for _, body in cases[start:]:
+                self.exec_block(body, scope)
+        except _Break as b:
+            if b.label is not None and b.label not in labels:
+                raise
+
+    def exec_try(self, node, scope):
+        _, block, param, handler, finalizer = node
+        try:
+            try:
+                self.exec_block(block, scope)
+            except JSThrow as e:
+                if handler is None:
+                    raise
+                self._run_handler(handler, param, e.value, scope)
+            except RecursionError:
+                if handler is None:
+                    raise
+                self._run_handler(handler, param, {'name': 'RangeError', 'message': 'Maximum call stack size exceeded'}, scope)
+        finally:
+            if finalizer is not None:
+                self.exec_block(finalizer, scope)
+
+    def _run_handler(self, handler, param, value, scope):
+        handler_scope = _Scope(scope, {param: value} if param else {})
+        self.exec_block(handler, handler_scope)
+
+    # --- التعابير
+    def eval_expr(self, node, scope):
+        kind = node[0]
+        if kind == 'num' or kind == 'str' or kind == 'const':
+            return node[1]
+        if kind == 'ident':
+            return self.lookup(node[1], scope)
+        if kind == 'member':
+            return self.get_member(self.eval_expr(node[1], scope), self.eval_expr(node[2], scope))
+        if kind == 'call':
+            return self.eval_call(node, scope)
+        if kind == 'assign':
+            return self.eval_assign(node, scope)
+        if kind == 'binary':
+            return self.binary(node[1], self.eval_expr(node[2], scope), self.eval_expr(node[3], scope))
+        if kind == 'logical':
+            left = self.eval_expr(node[2], scope)
+            op = node[1]
+            if op == '&&':
+                return self.eval_expr(node[3], scope) if _to_boolean(left) else left
+            if op == '||':
+                return left if _to_boolean(left) else self.eval_expr(node[3], scope)
+            return self.eval_expr(node[3], scope) if left is UNDEFINED or left is NULL else left
+        if kind == 'unary':
+            return self.eval_unary(node, scope)
+        if kind == 'update':
+            return self.eval_update(node, scope)
+        if kind == 'cond':
+            return self.eval_expr(node[2] if _to_boolean(self.eval_expr(node[1], scope)) else node[3], scope)
+        if kind == 'seq':
+            result = UNDEFINED
+            for expr in node[1]:
+                result = self.eval_expr(expr, scope)
+            return result
+        if kind == 'array':
+            result = []
+            for element in node[1]:
+                if element is None:
+                    result.append(UNDEFINED)
+                elif element[0] == 'spread':
+                    result.extend(self._spread(self.eval_expr(element[1], scope)))
+                else:
+                    result.append(self.eval_expr(element, scope))
+            return result
+        if kind == 'object':
+            return {key: self.eval_expr(value, scope) for key, value in node[1]}
+        if kind == 'function':
+            return JSFunction(node, scope, self)
+        if kind == 'regex':
+            return JSRegExp(node[1], node[2])
+        if kind == 'this':
+            found = scope.find('this')
+            return found.vars['this'] if found else UNDEFINED
+        if kind == 'new':
+            return self.eval_new(node, scope)
+        raise JSError(f"تعبير غير مدعوم: {kind}")
+
+    def _spread(self, value) -> list:
+        if isinstance(value, list):
+            return list(value)
+        if isinstance(value, str):
+            return list(value)
+        raise _js_error('TypeError', f"{_to_string(value)} is not iterable")
+
+    def lookup(self, name: str, scope, missing=_MISSING):
+        found = scope.find(name)
+        if found is not None:
+            return found.vars[name]
+        if self.global_resolver is not None:
+            try:
+                value = self.global_resolver(name)
+            except KeyError:
+                pass
+            else:
+                self.globals.vars[name] = value
+                return value
+        if missing is not _MISSING:
+            return missing
+        raise _js_error('ReferenceError', f"{name} is not defined")
+
+    def get_member(self, obj, key):
+        if isinstance(obj, list):
+            index = _to_index(key)
+            if index is not None:
+                return obj[index] if index < len(obj) else UNDEFINED
+            name = _to_string(key)
+            if name == 'length':
+                return len(obj)
+            return _array_method(name, obj)
+        if isinstance(obj, str):
+            index = _to_index(key)
+            if index is not None:
+                return obj[index] if index < len(obj) else UNDEFINED
+            name = _to_string(key)
+            if name == 'length':
+                return len(obj)
+            return _string_method(name, obj)
+        if isinstance(obj, dict):
+            return obj.get(_to_string(key), UNDEFINED)
+        if _is_callable(obj):
+            name = _to_string(key)
+            if name in obj.props:
+                return obj.props[name]
+            if name == 'length':
+                return len(obj.params) if isinstance(obj, JSFunction) else 0
+            if name == 'name':
+                return obj.name or ''
+            if name == 'call':
+                return NativeFunction('call', lambda this, args: obj(args[0] if args else UNDEFINED, list(args[1:])))
+            if name == 'apply':
+                return NativeFunction('apply', lambda this, args: obj(
+                    args[0] if args else UNDEFINED, list(args[1]) if len(args) > 1 and isinstance(args[1], list) else []))
+            return UNDEFINED
+        if isinstance(obj, (int, float)) and not isinstance(obj, bool):
+            name = _to_string(key)
+            if name == 'toString':
+                return NativeFunction('toString', lambda this, args: _number_to_string(obj) if not args
+                                      else _int_to_radix(int(obj), _to_int32(args[0])))
+            return UNDEFINED
+        if isinstance(obj, JSRegExp):
+            name = _to_string(key)
+            if name == 'source':
+                return obj.source
+            if name == 'test':
+                return NativeFunction('test', lambda this, args: obj.pattern.search(
+                    _to_string(args[0] if args else UNDEFINED)) is not None)
+            return UNDEFINED
+        if obj is UNDEFINED or obj is NULL:
+            raise _js_error('TypeError', f"Cannot read properties of {_to_string(obj)} (reading '{_to_string(key)}')")
+        return UNDEFINED
+
+    def set_member(self, obj, key, value):
+        if isinstance(obj, list):
+            index = _to_index(key)
+            if index is not None:
+                if index >= len(obj):
+                    obj.extend([UNDEFINED] * (index + 1 - len(obj)))
+                obj[index] = value
+            elif _to_string(key) == 'length':
+                length = _to_uint32(value)
+                if length < len(obj):
+                    del obj[length:]
+                else:
+                    obj.extend([UNDEFINED] * (length - len(obj)))
+            return value
+        if isinstance(obj, dict):
+            obj[_to_string(key)] = value
+            return value
+        if _is_callable(obj):
+            obj.props[_to_string(key)] = value
+            return value
+        if obj is UNDEFINED or obj is NULL:
+            raise _js_error('TypeError', f"Cannot set properties of {_to_string(obj)}")
+        return value  # الكتابة على القيم الأولية تُهمل كما في JavaScript
+
+    def assign(self, target, value, scope):
+        if target[0] == 'ident':
+            name = target[1]
+            found = scope.find(name)
+            (found or self.globals).vars[name] = value
+            return value
+        if target[0] == 'member':
+            return self.set_member(self.eval_expr(target[1], scope), self.eval_expr(target[2], scope), value)
+        raise JSError("هدف إسناد غير صالح")
+
+    def eval_assign(self, node, scope):
+        _, op, target, value_node = node
+        if op == '=':
+            if target[0] == 'member':
+                obj = self.eval_expr(target[1], scope)
+                key = self.eval_expr(target[2], scope)
+                return self.set_member(obj, key, self.eval_expr(value_node, scope))
+            return self.assign(target, self.eval_expr(value_node, scope), scope)
+        binary_op = op[:-1]
+        if target[0] == 'member':
+            obj = self.eval_expr(target[1], scope)
+            key = self.eval_expr(target[2], scope)
+            value = self.binary(binary_op, self.get_member(obj, key), self.eval_expr(value_node, scope))
+            return self.set_member(obj, key, value)
+        value = self.binary(binary_op, self.lookup(target[1], scope), self.eval_expr(value_node, scope))
+        return self.assign(target, value, scope)
+
+    def eval_update(self, node, scope):
+        _, op, prefix, target = node
+        delta = 1 if op == '++' else -1
+        if target[0] == 'member':
+            obj = self.eval_expr(target[1], scope)
+            key = self.eval_expr(target[2], scope)
+            old = _to_number(self.get_member(obj, key))
+            self.set_member(obj, key, _normalize_number(old + delta))
+        elif target[0] == 'ident':
+            old = _to_number(self.lookup(target[1], scope))
+            self.assign(target, _normalize_number(old + delta), scope)
+        else:
+            raise JSError("هدف ++/-- غير صالح")
+        return _normalize_number(old + delta) if prefix else old
+
+    def eval_unary(self, node, scope):
+        _, op, arg = node
+        if op == 'typeof':
+            if arg[0] == 'ident':
+                return _typeof(self.lookup(arg[1], scope, missing=UNDEFINED))
+            return _typeof(self.eval_expr(arg, scope))
+        if op == 'delete':
+            if arg[0] == 'member':
+                obj = self.eval_expr(arg[1], scope)
+                key = self.eval_expr(arg[2], scope)
+                if isinstance(obj, dict):
+                    obj.pop(_to_string(key), None)
+                elif isinstance(obj, list):
+                    index = _to_index(key)
+                    if index is not None and index < len(obj):
+                        obj[index] = UNDEFINED
+            return True
+        value = self.eval_expr(arg, scope)
+        if op == '!':
+            return not _to_boolean(value)
+        if op == '-':
+            number = _to_number(value)
+            return -number if number != 0 or isinstance(number, float) else -0.0
+        if op == '+':
+            return _to_number(value)
+        if op == '~':
+            return ~_to_int32(value)
+        if op == 'void':
+            return UNDEFINED
+        raise JSError(f"عامل أحادي غير مدعوم: {op}")
+
+    def eval_call(self, node, scope):
+        _, callee, arg_nodes = node
+        if callee[0] == 'member':
+            this = self.eval_expr(callee[1], scope)
+            fn = self.get_member(this, self.eval_expr(callee[2], scope))
+        else:
+            this = UNDEFINED
+            fn = self.eval_expr(callee, scope)
+        args = []
+        for arg in arg_nodes:
+            if arg[0] == 'spread':
+                args.extend(self._spread(self.eval_expr(arg[1], scope)))
+            else:
+                args.append(self.eval_expr(arg, scope))
+        if not _is_callable(fn):
+            raise _js_error('TypeError', f"{_describe(callee)} is not a function")
+        return fn(this, args)
+
+    def eval_new(self, node, scope):
+        _, callee, arg_nodes = node
+        fn = self.eval_expr(callee, scope)
+        args = [self.eval_expr(arg, scope) for arg in arg_nodes]
+        if isinstance(fn, NativeFunction):
+            if fn.name in ('Array', 'String', 'Number', 'Boolean'):
+                return fn(UNDEFINED, args)
+            raise JSError(f"المُنشئ {fn.name} غير مدعوم")
+        if isinstance(fn, JSFunction):
+            obj: Dict[str, object] = {}
+            result = fn(obj, args)
+            return result if isinstance(result, (dict, list)) or _is_callable(result) else obj
+        raise _js_error('TypeError', f"{_describe(callee)} is not a constructor")
+
+    def binary(self, op, a, b):
+        if op == '+':
+            if isinstance(a, (int, float)) and isinstance(b, (int, float)) \
+                    and not isinstance(a, bool) and not isinstance(b, bool):
+                return a + b
+            a, b = _to_primitive(a), _to_primitive(b)
+            if isinstance(a, str) or isinstance(b, str):
+                return _to_string(a) + _to_string(b)
+            return _normalize_number(_to_number(a) + _to_number(b))
+        if op in ('-', '*', '/', '%', '**'):
+            x, y = _to_number(a), _to_number(b)
+            if op == '-':
+                return _normalize_number(x - y)
+            if op == '*':
+                return _normalize_number(x * y)
+            if op == '/':
+                if y == 0:
+                    if x == 0 or (isinstance(x, float) and math.isnan(x)):
+                        return math.nan
+                    negative = (x < 0) != (math.copysign(1, y) < 0)
+                    return -math.inf if negative else math.inf
+                return _normalize_number(x / y)
+            if op == '%':
+                if y == 0 or (isinstance(x, float) and (math.isnan(x) or math.isinf(x))) \
+                        or (isinstance(y, float) and math.isnan(y)):
+                    return math.nan
+                if isinstance(x, int) and isinstance(y, int):
+                    remainder = abs(x) % abs(y)
+                    return -remainder if x < 0 else remainder
+                return _normalize_number(math.fmod(x, y))
+            return _normalize_number(x ** y)
+        if op in ('<', '>', '<=', '>='):
+            a, b = _to_primitive(a), _to_primitive(b)
+            if not (isinstance(a, str) and isinstance(b, str)):
+                a, b = _to_number(a), _to_number(b)
+                if (isinstance(a, float) and math.isnan(a)) or (isinstance(b, float) and math.isnan(b)):
+                    return False
+            if op == '<':
+                return a < b
+            if op == '>':
+                return a > b
+            if op == '<=':
+                return a <= b
+            return a >= b
+        if op == '===':
+            return _strict_equals(a, b)
+        if op == '!==':
+            return not _strict_equals(a, b)
+        if op == '==':
+            return _loose_equals(a, b)
+        if op == '!=':
+            return not _loose_equals(a, b)
+        if op == '&':
+            return _to_int32(a) & _to_int32(b)
+        if op == '|':
+            return _to_int32(_to_int32(a) | _to_int32(b))
+        if op == '^':
+            return _to_int32(_to_int32(a) ^ _to_int32(b))
+        if op == '<<':
+            return _to_int32(_to_int32(a) << (_to_uint32(b) & 31))
+        if op == '>>':
+            return _to_int32(a) >> (_to_uint32(b) & 31)
+        if op == '>>>':
+            return _to_uint32(a) >> (_to_uint32(b) & 31)
+        if op == 'in':
+            if isinstance(b, list):
+                index = _to_index(a)
+                return (index is not None and index < len(b)) or _to_string(a) == 'length'
+            if isinstance(b, dict):
+                return _to_string(a) in b
+            raise _js_error('TypeError', "Cannot use 'in' operator")
+        if op == 'instanceof':
+            return False
+        raise JSError(f"عامل غير مدعوم: {op}")
+
+
+def _int_to_radix(number: int, radix: int) -> str:
+    if not 2 <= radix <= 36:
+        raise _js_error('RangeError', 'toString() radix must be between 2 and 36')
+    digits = '0123456789abcdefghijklmnopqrstuvwxyz'
+    if number == 0:
+        return '0'
+    sign = '-' if number < 0 else ''
+    number = abs(number)
+    out = []
+    while number:
+        number, remainder = divmod(number, radix)
+        out.append(digits[remainder])
+    return sign + ''.join(reversed(out))
+
+
+def _describe(node) -> str:
+    if node[0] == 'ident':
+        return node[1]
+    if node[0] == 'member' and node[2][0] in ('str', 'num'):
+        return f"{_describe(node[1])}.{node[2][1]}"
+    return 'expression'
+
+
+def free_identifiers(function_source: str) -> List[str]:
+    """أسماء المتغيرات العامة التي تستخدمها دالة ولا تعرفها بنفسها (تقريبي)"""
+    node, _ = parse_expression_at(function_source, 0)
+    used: List[str] = []
+    declared = set(_make_globals()) | {'arguments'}
+
+    def walk(item):
+        if isinstance(item, tuple):
+            if not item:
+                return
+            kind = item[0]
+            if kind == 'ident':
+                if item[1] not in used:
+                    used.append(item[1])
+                return
+            if kind == 'function':
+                if item[1]:
+                    declared.add(item[1])
+                declared.update(item[2])
+                walk(item[3])
+                return
+            if kind == 'var':
+                for name, init in item[1]:
+                    declared.add(name)
+                    walk(init)
+                return
+            if kind == 'func_decl':
+                declared.add(item[1])
+                walk(item[2])
+                return
+            if kind == 'try' and item[2]:
+                declared.add(item[2])
+            if kind == 'member':
+                walk(item[1])
+                if item[2][0] != 'str':
+                    walk(item[2])
+                return
+            if kind == 'object':
+                for _, value in item[1]:
+                    walk(value)
+                return
+            for child in item[1:]:
+                walk(child)
+        elif isinstance(item, list):
+            for child in item:
+                walk(child)
+
+    walk(node)
+    return [name for name in used if name not in declared]